@@ -0,0 +1,224 @@
+# benchmarks/cases.py
+"""
+수집/파싱/적재/지표 핫패스 벤치마크 케이스
+- 입력은 payloads 의 합성 KIS 응답 (실제 규모: 종목 1~2,500 x 거래일 100~2,500)
+- DB 가 필요한 함수는 SQL 컴파일까지만 수행하는 세션으로 측정 (네트워크/서버 시간 제외)
+"""
+from datetime import date
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.dialects.postgresql import asyncpg as pg_asyncpg
+
+from benchmarks.harness import benchmark
+from benchmarks.payloads import KIS_PAGE_ROWS, make_daily_payload, make_tickers, trading_days
+
+_END = date(2025, 9, 30)
+_DIALECT = pg_asyncpg.dialect()
+
+
+class _CompileOnlySession:
+  """execute 시 문장을 asyncpg 방언으로 컴파일만 하는 세션 (upsert/DDL 문장 생성 비용 측정용)"""
+
+  def __init__(self) -> None:
+    self.statements = 0
+
+  async def execute(self, statement: Any, params: Any = None) -> None:
+    statement.compile(dialect=_DIALECT)
+    self.statements += 1
+
+
+# ------------------------- 파싱 -------------------------
+
+def _setup_payloads(*, tickers: int, days: int) -> list[tuple[str, dict]]:
+  """종목별 KIS 응답 (100행 페이지 단위로 분할 → 실제 호출 단위와 동일)"""
+  calendar = trading_days(_END, days)
+  pages = []
+  for ticker in make_tickers(tickers):
+    payload = make_daily_payload(ticker, calendar)
+    rows = payload["output2"]
+    for i in range(0, len(rows), KIS_PAGE_ROWS):
+      pages.append((ticker, { **payload, "output2": rows[i:i + KIS_PAGE_ROWS] }))
+  return pages
+
+
+@benchmark(
+    "parse.to_daily_price_dtos",
+    setup=_setup_payloads,
+    quick={ "tickers": [1, 100], "days": [100] },
+    full={ "tickers": [1, 100, 2500], "days": [100, 2500] },
+)
+def bench_to_daily_price_dtos(pages: list[tuple[str, dict]]) -> int:
+  from infrastructure.price.dto.daily_price_dto import to_daily_price_dtos
+
+  rows = 0
+  for ticker, payload in pages:
+    rows += len(to_daily_price_dtos(ticker, payload))
+  return rows
+
+
+# ------------------------- decimal_util -------------------------
+
+def _setup_numeric_strings(*, values: int) -> list[str]:
+  """KIS 숫자 문자열 (정수/소수/콤마/공백/빈값 혼합)"""
+  rng = np.random.default_rng(0)
+  numbers = rng.integers(0, 10_000_000, values)
+  out = []
+  for i, n in enumerate(numbers.tolist()):
+    kind = i % 10
+    if kind == 0:
+      out.append("")
+    elif kind == 1:
+      out.append(f"{n:,}")
+    elif kind == 2:
+      out.append(f" {n / 100:.2f} ")
+    else:
+      out.append(str(n))
+  return out
+
+
+@benchmark("decimal_util.to_decimal", setup=_setup_numeric_strings,
+           quick={ "values": [10_000] }, full={ "values": [10_000, 1_000_000] })
+def bench_to_decimal(values: list[str]) -> int:
+  from utils.decimal_util import to_decimal
+
+  for v in values:
+    to_decimal(v)
+  return len(values)
+
+
+@benchmark("decimal_util.to_float", setup=_setup_numeric_strings,
+           quick={ "values": [10_000] }, full={ "values": [10_000, 1_000_000] })
+def bench_to_float(values: list[str]) -> int:
+  from utils.decimal_util import to_float
+
+  for v in values:
+    to_float(v)
+  return len(values)
+
+
+@benchmark("decimal_util.to_int", setup=_setup_numeric_strings,
+           quick={ "values": [10_000] }, full={ "values": [10_000, 1_000_000] })
+def bench_to_int(values: list[str]) -> int:
+  from utils.decimal_util import to_int
+
+  for v in values:
+    to_int(v)
+  return len(values)
+
+
+@benchmark("decimal_util.to_date8", setup=lambda *, values: [f"2025{(i % 12) + 1:02d}{(i % 28) + 1:02d}"
+                                                            for i in range(values)],
+           quick={ "values": [10_000] }, full={ "values": [10_000, 1_000_000] })
+def bench_to_date8(values: list[str]) -> int:
+  from utils.decimal_util import to_date8
+
+  for v in values:
+    to_date8(v)
+  return len(values)
+
+
+# ------------------------- 적재 -------------------------
+
+def _setup_upsert_rows(*, rows: int) -> list[tuple[int, Any]]:
+  """(stock_id, DailyPriceDTO) 배치 (종목당 100 거래일)"""
+  from infrastructure.price.dto.daily_price_dto import to_daily_price_dtos
+
+  tickers = max(rows // KIS_PAGE_ROWS, 1)
+  calendar = trading_days(_END, min(rows, KIS_PAGE_ROWS))
+  out: list[tuple[int, Any]] = []
+  for stock_id, ticker in enumerate(make_tickers(tickers), start=1):
+    out.extend((stock_id, dto) for dto in to_daily_price_dtos(ticker, make_daily_payload(ticker, calendar)))
+  return out[:rows]
+
+
+@benchmark(
+    "upsert.upsert_daily_prices",
+    setup=_setup_upsert_rows,
+    # 13 컬럼 x 행 수 ≤ 바인딩 파라미터 한도(32767) → 배치 최대 약 2,500 행
+    quick={ "rows": [100, 1000] },
+    full={ "rows": [100, 1000, 2500] },
+)
+async def bench_upsert_daily_prices(rows: list[tuple[int, Any]]) -> int:
+  from infrastructure.price.repository.price_repository import upsert_daily_prices
+
+  return await upsert_daily_prices(_CompileOnlySession(), rows)
+
+
+@benchmark(
+    "partition.ensure_daily_price_partitions",
+    setup=lambda *, days: trading_days(_END, days),
+    quick={ "days": [100] },
+    full={ "days": [100, 2500] },
+)
+async def bench_ensure_daily_price_partitions(calendar: list[date]) -> int:
+  from utils.partition import ensure_daily_price_partitions
+
+  session = _CompileOnlySession()
+  await ensure_daily_price_partitions(session, start=calendar[0], end=calendar[-1])
+  return session.statements
+
+
+# ------------------------- 지표 -------------------------
+
+def _setup_indicator_inputs(*, tickers: int, days: int) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+  """종가 + 분기/사업보고서 재무제표 + 상장주식수 (계산 입력 DataFrame)"""
+  from infrastructure.financial.repository.investment_indicator_repository import STATEMENT_VALUE_COLUMNS
+
+  rng = np.random.default_rng(0)
+  calendar = trading_days(_END, days)
+  stock_ids = np.arange(1, tickers + 1)
+  closes = pd.DataFrame({
+    "stock_id": np.repeat(stock_ids, days),
+    "trade_date": np.tile(np.array(calendar, dtype=object), tickers),
+    "close_price": rng.uniform(1_000, 100_000, tickers * days),
+  })
+  quarter_ends = { "Q1": (3, 31), "Q2": (6, 30), "Q3": (9, 30), "Q4": (12, 31) }
+  records = []
+  for year in range(calendar[0].year - 2, calendar[-1].year + 1):
+    for period, (month, day) in quarter_ends.items():
+      for sid in stock_ids.tolist():
+        records.append((sid, date(year, month, day), period, year))
+  statements = pd.DataFrame(records, columns=["stock_id", "report_date", "period_type", "fiscal_year"])
+  values = rng.uniform(1e9, 1e12, (len(statements), len(STATEMENT_VALUE_COLUMNS)))
+  statements[STATEMENT_VALUE_COLUMNS] = values
+  listing_shares = pd.DataFrame({ "stock_id": stock_ids, "listing_shares": rng.integers(1e6, 1e9, tickers) })
+  return closes, statements, listing_shares
+
+
+@benchmark(
+    "indicator.compute_investment_indicators",
+    setup=_setup_indicator_inputs,
+    quick={ "tickers": [100], "days": [250] },
+    full={ "tickers": [100, 2500], "days": [250, 2500] },
+)
+def bench_compute_investment_indicators(inputs: tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]) -> int:
+  from infrastructure.financial.service.investment_indicator_calculator import compute_investment_indicators
+
+  return len(compute_investment_indicators(*inputs))
+
+
+def _setup_returns_panel(*, tickers: int, days: int) -> Any:
+  from ml.risk.panel import ReturnsPanel
+
+  rng = np.random.default_rng(0)
+  returns = rng.normal(0, 0.02, (days, tickers))
+  return ReturnsPanel(
+      dates=np.array(trading_days(_END, days), dtype="datetime64[D]"),
+      stock_ids=np.arange(1, tickers + 1, dtype=np.int64),
+      returns=returns,
+      observed=np.ones_like(returns, dtype=bool),
+  )
+
+
+@benchmark(
+    "indicator.risk_build_state",
+    setup=_setup_returns_panel,
+    quick={ "tickers": [500], "days": [60] },
+    full={ "tickers": [500, 2500], "days": [60, 250] },
+)
+def bench_risk_build_state(panel: Any) -> int:
+  from ml.risk.engine import build_state
+
+  return build_state(panel, panel.returns.shape[0]).size
@@ -0,0 +1,216 @@
+# benchmarks/fake_kis.py
+"""
+부하 테스트용 가짜 KIS 서버 (ASGI)
+- POST /oauth2/tokenP: 고정 형식 토큰 발급
+- GET  /uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice: 종목별 고정 합성 일봉
+  (같은 종목/구간이면 항상 같은 값, 실제 API 처럼 최신 일자부터 최대 max_rows 행)
+- 지연(평균 + 지터), 오류율(HTTP 500), 초당 요청 한도 초과 시 EGW00201 응답
+- GET /stats: 요청/오류/제한 카운터
+
+    python -m benchmarks.fake_kis --port 18080 --latency-ms 30 --rate-limit 20
+    KIS_BASE_URL=http://127.0.0.1:18080 ...
+"""
+import argparse
+import asyncio
+import os
+import random
+import secrets
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Any, Optional
+
+import numpy as np
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from benchmarks.payloads import KIS_PAGE_ROWS, format_daily_rows, synthetic_ohlcv
+
+DAILY_PRICE_PATH = "/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice"
+TOKEN_PATH = "/oauth2/tokenP"
+
+# 합성 시계열 기준 구간 (모든 요청 구간은 이 안에서 잘라냄)
+_SERIES_START = date(2010, 1, 4)
+_SERIES_END = date(2030, 12, 31)
+
+
+@dataclass(frozen=True)
+class FakeKISConfig:
+  """
+  가짜 서버 동작 설정
+    latency_ms / jitter_ms: 응답 지연 평균 / 표준편차 (ms)
+    error_rate: HTTP 500 (일반 오류) 비율 0~1
+    rate_limit: 초당 허용 요청 수 (0 이면 무제한, 초과 시 EGW00201)
+    max_rows: 1회 응답 최대 행 수
+    seed: 합성 시세 seed
+  """
+  latency_ms: float = 0.0
+  jitter_ms: float = 0.0
+  error_rate: float = 0.0
+  rate_limit: int = 0
+  max_rows: int = KIS_PAGE_ROWS
+  seed: int = 0
+
+  @classmethod
+  def from_env(cls) -> "FakeKISConfig":
+    """FAKE_KIS_* 환경변수 (uvicorn 으로 app 을 직접 띄울 때)"""
+    return cls(
+        latency_ms=float(os.getenv("FAKE_KIS_LATENCY_MS", "0")),
+        jitter_ms=float(os.getenv("FAKE_KIS_JITTER_MS", "0")),
+        error_rate=float(os.getenv("FAKE_KIS_ERROR_RATE", "0")),
+        rate_limit=int(os.getenv("FAKE_KIS_RATE_LIMIT", "0")),
+        max_rows=int(os.getenv("FAKE_KIS_MAX_ROWS", str(KIS_PAGE_ROWS))),
+        seed=int(os.getenv("FAKE_KIS_SEED", "0")),
+    )
+
+  def to_env(self) -> dict[str, str]:
+    return {
+      "FAKE_KIS_LATENCY_MS": str(self.latency_ms),
+      "FAKE_KIS_JITTER_MS": str(self.jitter_ms),
+      "FAKE_KIS_ERROR_RATE": str(self.error_rate),
+      "FAKE_KIS_RATE_LIMIT": str(self.rate_limit),
+      "FAKE_KIS_MAX_ROWS": str(self.max_rows),
+      "FAKE_KIS_SEED": str(self.seed),
+    }
+
+
+def _business_days(start: date, end: date) -> list[date]:
+  days = []
+  cur = start
+  while cur <= end:
+    if cur.weekday() < 5:
+      days.append(cur)
+    cur += timedelta(days=1)
+  return days
+
+
+_CALENDAR = _business_days(_SERIES_START, _SERIES_END)
+_CALENDAR_ORDINALS = np.array([d.toordinal() for d in _CALENDAR], dtype=np.int64)
+
+
+class _RateWindow:
+  """최근 1초 요청 시각 (초당 한도 판정)"""
+
+  def __init__(self, limit: int) -> None:
+    self._limit = limit
+    self._stamps: deque[float] = deque()
+
+  def allow(self) -> bool:
+    if self._limit <= 0:
+      return True
+    now = time.monotonic()
+    while self._stamps and now - self._stamps[0] >= 1.0:
+      self._stamps.popleft()
+    if len(self._stamps) >= self._limit:
+      return False
+    self._stamps.append(now)
+    return True
+
+
+def _kis_error(msg_cd: str, msg1: str, status_code: int = 500) -> JSONResponse:
+  return JSONResponse({ "rt_cd": "1", "msg_cd": msg_cd, "msg1": msg1 }, status_code=status_code)
+
+
+def create_app(config: Optional[FakeKISConfig] = None) -> FastAPI:
+  """가짜 KIS ASGI 앱 생성"""
+  config = config or FakeKISConfig()
+  app = FastAPI(title="fake-kis")
+  rng = random.Random(config.seed)
+  window = _RateWindow(config.rate_limit)
+  stats: dict[str, int] = { "requests": 0, "tokens": 0, "throttled": 0, "errors": 0, "rows": 0 }
+
+  @lru_cache(maxsize=8192)
+  def series(ticker: str) -> dict[str, np.ndarray]:
+    return synthetic_ohlcv(ticker, len(_CALENDAR), seed=config.seed)
+
+  async def delay() -> None:
+    if config.latency_ms > 0 or config.jitter_ms > 0:
+      await asyncio.sleep(max(0.0, rng.gauss(config.latency_ms, config.jitter_ms)) / 1000)
+
+  @app.get("/health")
+  async def health() -> dict[str, str]:
+    return { "status": "ok" }
+
+  @app.get("/stats")
+  async def get_stats() -> dict[str, Any]:
+    return { **stats, "config": config.__dict__ }
+
+  @app.post(TOKEN_PATH)
+  async def issue_token() -> dict[str, Any]:
+    stats["tokens"] += 1
+    await delay()
+    expires = datetime.now() + timedelta(days=1)
+    return {
+      "access_token": f"fake-{secrets.token_hex(16)}",
+      "token_type": "Bearer",
+      "expires_in": 86400,
+      "access_token_token_expired": expires.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+  @app.get(DAILY_PRICE_PATH)
+  async def daily_price(request: Request) -> Any:
+    stats["requests"] += 1
+    if not window.allow():
+      stats["throttled"] += 1
+      return _kis_error("EGW00201", "초당 거래건수를 초과하였습니다.")
+    await delay()
+    if not request.headers.get("authorization", "").startswith("Bearer "):
+      stats["errors"] += 1
+      return _kis_error("EGW00123", "기간이 만료된 token 입니다.")
+    if config.error_rate > 0 and rng.random() < config.error_rate:
+      stats["errors"] += 1
+      return _kis_error("EGW00500", "서버 내부 오류입니다.")
+
+    params = request.query_params
+    ticker = params.get("FID_INPUT_ISCD", "")
+    try:
+      start = datetime.strptime(params.get("FID_INPUT_DATE_1", ""), "%Y%m%d").date()
+      end = datetime.strptime(params.get("FID_INPUT_DATE_2", ""), "%Y%m%d").date()
+    except ValueError:
+      return _kis_error("OPSQ2001", "입력 일자 형식이 올바르지 않습니다.", status_code=200)
+
+    # 구간 내 최신 max_rows 거래일 (실제 API 와 같이 최신 일자부터)
+    lo = int(np.searchsorted(_CALENDAR_ORDINALS, start.toordinal(), side="left"))
+    hi = int(np.searchsorted(_CALENDAR_ORDINALS, end.toordinal(), side="right"))
+    lo = max(lo, hi - config.max_rows)
+    rows = format_daily_rows(_CALENDAR, series(ticker), range(lo, hi)) if ticker else []
+    stats["rows"] += len(rows)
+    return {
+      "rt_cd": "0",
+      "msg_cd": "MCA00000",
+      "msg1": "정상처리 되었습니다.",
+      "output1": { "stck_shrn_iscd": ticker, "hts_kor_isnm": f"종목{ticker}", "lstn_stcn": "100000000" },
+      "output2": rows,
+    }
+
+  return app
+
+
+# uvicorn benchmarks.fake_kis:app (설정은 FAKE_KIS_* 환경변수)
+app = create_app(FakeKISConfig.from_env())
+
+
+def main() -> None:
+  import uvicorn
+
+  parser = argparse.ArgumentParser(description="부하 테스트용 가짜 KIS 서버")
+  parser.add_argument("--host", default="127.0.0.1")
+  parser.add_argument("--port", type=int, default=18080)
+  parser.add_argument("--latency-ms", type=float, default=0.0)
+  parser.add_argument("--jitter-ms", type=float, default=0.0)
+  parser.add_argument("--error-rate", type=float, default=0.0)
+  parser.add_argument("--rate-limit", type=int, default=0, help="초당 허용 요청 수 (0 = 무제한)")
+  parser.add_argument("--max-rows", type=int, default=KIS_PAGE_ROWS)
+  parser.add_argument("--seed", type=int, default=0)
+  args = parser.parse_args()
+  config = FakeKISConfig(
+      latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+      rate_limit=args.rate_limit, max_rows=args.max_rows, seed=args.seed,
+  )
+  uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,220 @@
+# benchmarks/harness.py
+"""
+마이크로 벤치마크 하네스
+- @benchmark 로 케이스(이름 + 파라미터 격자) 등록, setup 은 측정 밖에서 1회
+- 시간: min_time 을 채울 때까지 반복 후 min/median (GC 비활성화)
+- 메모리: 별도 1회 실행을 tracemalloc 으로 감싸 peak 측정 (시간 측정과 분리)
+- 결과는 JSON (케이스 키 → 지표), --compare 로 기준 파일 대비 변화율 계산
+"""
+import asyncio
+import gc
+import inspect
+import itertools
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+
+_REGISTRY: list["Benchmark"] = []
+
+
+@dataclass(frozen=True)
+class Benchmark:
+  """
+  벤치마크 케이스
+    name: 'group.case' 형식
+    func: func(state) → 처리 행 수 (동기/비동기)
+    setup: setup(**params) → state (측정 제외)
+    profiles: 프로파일별 파라미터 격자 { 'quick': { 'rows': [100, 1000] }, 'full': {...} }
+  """
+  name: str
+  func: Callable[[Any], Any]
+  setup: Callable[..., Any]
+  profiles: dict[str, dict[str, list[Any]]] = field(default_factory=dict)
+
+  def params(self, profile: str) -> list[dict[str, Any]]:
+    grid = self.profiles.get(profile) or self.profiles.get("quick", {})
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+
+
+def benchmark(
+    name: str,
+    *,
+    setup: Callable[..., Any],
+    quick: dict[str, list[Any]],
+    full: Optional[dict[str, list[Any]]] = None,
+) -> Callable[[Callable[[Any], Any]], Callable[[Any], Any]]:
+  """벤치마크 케이스 등록 데코레이터"""
+  def decorator(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    _REGISTRY.append(Benchmark(name=name, func=func, setup=setup, profiles={ "quick": quick, "full": full or quick }))
+    return func
+  return decorator
+
+
+def registered(pattern: Optional[str] = None) -> list[Benchmark]:
+  """등록 케이스 (pattern 이 이름에 포함된 것만)"""
+  return [b for b in _REGISTRY if pattern is None or pattern in b.name]
+
+
+def case_key(name: str, params: dict[str, Any]) -> str:
+  """결과 키: name[k=v,...]"""
+  if not params:
+    return name
+  return f"{name}[{','.join(f'{k}={v}' for k, v in params.items())}]"
+
+
+class _Runner:
+  """동기/비동기 케이스 공통 호출 (이벤트 루프는 1개 재사용)"""
+
+  def __init__(self) -> None:
+    self._loop = asyncio.new_event_loop()
+
+  def call(self, func: Callable[[Any], Any], state: Any) -> Any:
+    if inspect.iscoroutinefunction(func):
+      return self._loop.run_until_complete(func(state))
+    return func(state)
+
+  def close(self) -> None:
+    self._loop.close()
+
+
+def measure(
+    bench: Benchmark,
+    params: dict[str, Any],
+    *,
+    runner: _Runner,
+    min_time: float,
+    max_repeat: int,
+) -> dict[str, Any]:
+  """케이스 1개 측정 → { rows, repeat, seconds_min, seconds_median, rows_per_second, peak_kib }"""
+  state = bench.setup(**params)
+  rows = runner.call(bench.func, state)  # 워밍업 (임포트/캐시)
+
+  timings: list[float] = []
+  gc_enabled = gc.isenabled()
+  gc.disable()
+  try:
+    total = 0.0
+    while len(timings) < max_repeat and (len(timings) < 3 or total < min_time):
+      begin = time.perf_counter()
+      runner.call(bench.func, state)
+      elapsed = time.perf_counter() - begin
+      timings.append(elapsed)
+      total += elapsed
+  finally:
+    if gc_enabled:
+      gc.enable()
+
+  tracemalloc.start()
+  try:
+    runner.call(bench.func, state)
+    _, peak = tracemalloc.get_traced_memory()
+  finally:
+    tracemalloc.stop()
+
+  median = statistics.median(timings)
+  rows = int(rows or 0)
+  return {
+    "rows": rows,
+    "repeat": len(timings),
+    "seconds_min": min(timings),
+    "seconds_median": median,
+    "rows_per_second": rows / median if rows and median > 0 else None,
+    "peak_kib": round(peak / 1024, 1),
+  }
+
+
+def _git_revision() -> Optional[str]:
+  try:
+    out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5)
+    return out.stdout.strip() or None
+  except (OSError, subprocess.SubprocessError):
+    return None
+
+
+def run_all(
+    benches: list[Benchmark],
+    *,
+    profile: str,
+    min_time: float,
+    max_repeat: int,
+    max_rows: int,
+    on_result: Optional[Callable[[str, dict[str, Any]], None]] = None,
+    on_error: Optional[Callable[[str, str], None]] = None,
+) -> dict[str, Any]:
+  """전체 측정 → 결과 문서 (meta + results)"""
+  import numpy as np
+  import pandas as pd
+
+  runner = _Runner()
+  results: dict[str, dict[str, Any]] = {}
+  errors: dict[str, str] = {}
+  try:
+    for bench in benches:
+      for params in bench.params(profile):
+        # tickers x days 가 max_rows 를 넘는 조합은 건너뜀 (full 프로파일 상한)
+        if params.get("tickers", 1) * params.get("days", 1) > max_rows:
+          continue
+        key = case_key(bench.name, params)
+        try:
+          results[key] = measure(bench, params, runner=runner, min_time=min_time, max_repeat=max_repeat)
+        except Exception as e:
+          # 설정/의존성 누락 등으로 실패한 케이스는 결과에서 빼고 계속 진행
+          errors[key] = f"{type(e).__name__}: {e}".splitlines()[0]
+          if on_error is not None:
+            on_error(key, errors[key])
+          continue
+        if on_result is not None:
+          on_result(key, results[key])
+  finally:
+    runner.close()
+  return {
+    "meta": {
+      "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+      "git": _git_revision(),
+      "profile": profile,
+      "python": platform.python_version(),
+      "platform": platform.platform(),
+      "numpy": np.__version__,
+      "pandas": pd.__version__,
+    },
+    "results": results,
+    "errors": errors,
+  }
+
+
+def _change(before: Optional[float], after: Optional[float]) -> Optional[float]:
+  if before is None or after is None or before == 0:
+    return None
+  return (after - before) / before
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], *, threshold: float) -> list[dict[str, Any]]:
+  """
+  기준 대비 변화율 (양수 = 증가)
+  - time: seconds_median, throughput: rows_per_second, memory: peak_kib
+  - regression: 시간 증가율 또는 메모리 증가율이 threshold 초과
+  """
+  rows = []
+  for key, after in current["results"].items():
+    before = baseline.get("results", {}).get(key)
+    if before is None:
+      rows.append({ "case": key, "status": "new", **{ k: None for k in ("time", "throughput", "memory") } })
+      continue
+    time_change = _change(before["seconds_median"], after["seconds_median"])
+    memory_change = _change(before["peak_kib"], after["peak_kib"])
+    regressed = any(c is not None and c > threshold for c in (time_change, memory_change))
+    improved = time_change is not None and time_change < -threshold
+    rows.append({
+      "case": key,
+      "status": "regression" if regressed else ("improved" if improved else "ok"),
+      "time": time_change,
+      "throughput": _change(before["rows_per_second"], after["rows_per_second"]),
+      "memory": memory_change,
+    })
+  return rows
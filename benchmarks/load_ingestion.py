@@ -0,0 +1,215 @@
+# benchmarks/load_ingestion.py
+"""
+일봉 수집 부하 테스트 드라이버 (가짜 KIS 서버 대상)
+
+    # 가짜 서버를 자식 프로세스로 띄우고 KIS 호출 + 파싱 경로만 부하 (DB/Redis 불필요)
+    python -m benchmarks.load_ingestion --serve --tickers 2500 --days 100 --latency-ms 30 --rate-limit 20
+
+    # 실제 수집 스택 전체(collect_daily_prices: 토큰/Redis → KIS → 파싱 → UPSERT/enrich/rollup)
+    python -m benchmarks.load_ingestion --serve --mode full --days 20
+
+보고: tickers/sec, 요청 지연 p50/p99 (httpx 이벤트 훅으로 측정), 실패 종목 수, 최대 RSS
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from datetime import date, timedelta
+from typing import Any, Optional
+
+import numpy as np
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# 측정 중 span 파일 기록으로 결과가 왜곡되지 않도록 트레이싱 기본 비활성화 (TRACING_ENABLED=true 로 재정의)
+os.environ.setdefault("TRACING_ENABLED", "false")
+for _path in (os.path.join(_ROOT, "src"), _ROOT):
+  if _path not in sys.path:
+    sys.path.insert(0, _path)
+
+from benchmarks.fake_kis import FakeKISConfig  # noqa: E402
+from benchmarks.payloads import make_tickers  # noqa: E402
+
+
+def _start_server(config: FakeKISConfig, port: int) -> subprocess.Popen:
+  """가짜 KIS 서버를 별도 프로세스로 기동 (드라이버 RSS 에 서버 메모리가 섞이지 않도록)"""
+  import httpx
+
+  env = { **os.environ, **config.to_env(), "PYTHONPATH": _ROOT }
+  proc = subprocess.Popen(
+      [sys.executable, "-m", "uvicorn", "benchmarks.fake_kis:app",
+       "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+      cwd=_ROOT, env=env,
+  )
+  deadline = time.monotonic() + 15
+  while time.monotonic() < deadline:
+    try:
+      if httpx.get(f"http://127.0.0.1:{port}/health", timeout=0.5).status_code == 200:
+        return proc
+    except httpx.HTTPError:
+      time.sleep(0.1)
+  proc.terminate()
+  raise RuntimeError("가짜 KIS 서버 기동 실패")
+
+
+class _LatencyRecorder:
+  """httpx 요청/응답 이벤트 훅으로 요청별 지연 기록 (KISClient 코드 변경 없음)"""
+
+  def __init__(self) -> None:
+    self.latencies: list[float] = []
+    self.status: dict[int, int] = {}
+    self.tickers: set[str] = set()
+
+  async def on_request(self, request: Any) -> None:
+    request.extensions["load_begin"] = time.perf_counter()
+    ticker = request.url.params.get("FID_INPUT_ISCD")
+    if ticker:
+      self.tickers.add(ticker)
+
+  async def on_response(self, response: Any) -> None:
+    begin = response.request.extensions.get("load_begin")
+    if begin is not None:
+      self.latencies.append(time.perf_counter() - begin)
+    self.status[response.status_code] = self.status.get(response.status_code, 0) + 1
+
+  def install(self) -> None:
+    from infrastructure.kis.http.http_client import get_http_client
+
+    client = get_http_client()
+    client.event_hooks = {
+      "request": [*client.event_hooks["request"], self.on_request],
+      "response": [*client.event_hooks["response"], self.on_response],
+    }
+
+
+async def _run_client_mode(*, tickers: list[str], start: date, end: date, concurrency: int) -> dict[str, Any]:
+  """KISClient → KISPriceAPI → to_daily_price_dtos (종목당 1회 조회, 동시 concurrency 개)"""
+  from infrastructure.kis.http.http_client import KISClient
+  from infrastructure.price.service.price_api import KISPriceAPI
+
+  token: dict[str, str] = {}
+
+  async def token_provider() -> str:
+    if "value" not in token:
+      body = await KISClient().post("/oauth2/tokenP", auth=False, json={ "grant_type": "client_credentials" })
+      token["value"] = body["access_token"]
+    return token["value"]
+
+  api = KISPriceAPI(KISClient(token_provider=token_provider))
+  semaphore = asyncio.Semaphore(concurrency)
+  counters = { "rows": 0, "failed": 0 }
+
+  async def fetch(ticker: str) -> None:
+    async with semaphore:
+      try:
+        dtos = await api.fetch_domestic_daily(ticker=ticker, start=start, end=end)
+      except Exception:
+        counters["failed"] += 1
+        return
+      counters["rows"] += len(dtos)
+
+  await asyncio.gather(*(fetch(t) for t in tickers))
+  return counters
+
+
+async def _run_full_mode(*, start: date, end: date) -> dict[str, Any]:
+  """실제 수집 스택 (DB 활성 종목 전체, KIS_BASE_URL 은 가짜 서버)"""
+  from core.models import MarketType
+  from infrastructure.price.service.price_service import collect_daily_prices
+
+  result = await collect_daily_prices(market_codes=[MarketType.KOSPI, MarketType.KOSDAQ], start=start, end=end)
+  return { "rows": result.upserted, "failed": len(result.failed_stock_ids) }
+
+
+async def _drive(args: argparse.Namespace) -> dict[str, Any]:
+  from infrastructure.kis.http.http_client import close_http_client
+
+  recorder = _LatencyRecorder()
+  recorder.install()
+  end = date.today()
+  start = end - timedelta(days=int(args.days * 7 / 5))
+  tickers = make_tickers(args.tickers)
+
+  begin = time.perf_counter()
+  try:
+    if args.mode == "client":
+      counters = await _run_client_mode(tickers=tickers, start=start, end=end, concurrency=args.concurrency)
+      processed = len(tickers)
+    else:
+      counters = await _run_full_mode(start=start, end=end)
+      processed = len(recorder.tickers)
+  finally:
+    await close_http_client()
+  elapsed = time.perf_counter() - begin
+
+  latencies = np.array(recorder.latencies) * 1000
+  return {
+    "mode": args.mode,
+    "tickers": processed,
+    "seconds": round(elapsed, 3),
+    "tickers_per_second": round(processed / elapsed, 2) if elapsed > 0 else None,
+    "requests": int(latencies.shape[0]),
+    "latency_ms_p50": round(float(np.percentile(latencies, 50)), 2) if latencies.size else None,
+    "latency_ms_p99": round(float(np.percentile(latencies, 99)), 2) if latencies.size else None,
+    "status": { str(k): v for k, v in sorted(recorder.status.items()) },
+    "rows": counters["rows"],
+    "failed_tickers": counters["failed"],
+    # Linux ru_maxrss 단위는 KiB
+    "peak_rss_mib": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+  }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+  parser = argparse.ArgumentParser(description="가짜 KIS 서버 대상 일봉 수집 부하 테스트")
+  parser.add_argument("--mode", choices=["client", "full"], default="client",
+                      help="client: KIS 호출+파싱만 / full: collect_daily_prices 전체 (DB/Redis 필요)")
+  parser.add_argument("--tickers", type=int, default=500, help="client 모드 종목 수")
+  parser.add_argument("--days", type=int, default=100, help="조회 거래일 수")
+  parser.add_argument("--concurrency", type=int, default=1, help="client 모드 동시 요청 수 (수집 서비스는 1)")
+  parser.add_argument("--serve", action="store_true", help="가짜 KIS 서버를 자식 프로세스로 기동")
+  parser.add_argument("--port", type=int, default=18080)
+  parser.add_argument("--base-url", default=None, help="이미 떠 있는 가짜 서버 주소 (--serve 미사용 시)")
+  parser.add_argument("--latency-ms", type=float, default=20.0)
+  parser.add_argument("--jitter-ms", type=float, default=5.0)
+  parser.add_argument("--error-rate", type=float, default=0.0)
+  parser.add_argument("--rate-limit", type=int, default=0, help="초당 허용 요청 수 (0 = 무제한, 초과 시 EGW00201)")
+  parser.add_argument("--max-rows", type=int, default=100)
+  parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+  args = parser.parse_args(argv)
+
+  server: Optional[subprocess.Popen] = None
+  if args.serve:
+    config = FakeKISConfig(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+        rate_limit=args.rate_limit, max_rows=args.max_rows,
+    )
+    server = _start_server(config, args.port)
+    base_url = f"http://127.0.0.1:{args.port}"
+  else:
+    base_url = args.base_url or f"http://127.0.0.1:{args.port}"
+  # 설정 로드 전에 KIS 주소 교체 (settings 는 임포트 시점에 환경변수를 읽음)
+  os.environ["KIS_BASE_URL"] = base_url
+  os.environ.setdefault("KIS_APP_KEY", "fake")
+  os.environ.setdefault("KIS_APP_SECRET", "fake")
+  # 반복 실행 시 응답 캐시 적중으로 KIS 경로 측정이 왜곡되지 않도록 기본 비활성화
+  os.environ.setdefault("KIS_CACHE_ENABLED", "false")
+
+  try:
+    report = asyncio.run(_drive(args))
+  finally:
+    if server is not None:
+      server.terminate()
+      server.wait(timeout=10)
+
+  print(json.dumps(report, indent=2, ensure_ascii=False))
+  if args.output:
+    with open(args.output, "w", encoding="utf-8") as fh:
+      json.dump(report, fh, indent=2, ensure_ascii=False)
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main())
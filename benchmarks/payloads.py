@@ -0,0 +1,90 @@
+# benchmarks/payloads.py
+"""
+합성 KIS 응답 생성기 (벤치마크/부하 테스트 공용)
+- 실제 응답과 같은 필드/문자열 형식 (숫자도 문자열, 일자 YYYYMMDD, 최신 일자가 앞)
+- seed 가 같으면 같은 값 → 실행 간 비교 가능
+"""
+import zlib
+from datetime import date, timedelta
+
+import numpy as np
+
+# KIS 일봉 1회 조회 최대 행 수
+KIS_PAGE_ROWS = 100
+
+
+def make_tickers(count: int) -> list[str]:
+  """6자리 종목코드 목록"""
+  return [f"{i:06d}" for i in range(5930, 5930 + count)]
+
+
+def trading_days(end: date, count: int) -> list[date]:
+  """end 이전(포함) 평일 count 개 (오래된 순)"""
+  days: list[date] = []
+  cur = end
+  while len(days) < count:
+    if cur.weekday() < 5:
+      days.append(cur)
+    cur -= timedelta(days=1)
+  return days[::-1]
+
+
+def synthetic_ohlcv(ticker: str, count: int, *, seed: int = 0) -> dict[str, np.ndarray]:
+  """종목별 고정 OHLCV 시계열 count 개 (기하 랜덤워크, 같은 ticker/seed 면 같은 값)"""
+  rng = np.random.default_rng(seed + zlib.crc32(ticker.encode()))
+  close = np.maximum(np.round(50_000 * np.exp(np.cumsum(rng.normal(0, 0.02, count))), -1), 10)
+  open_ = np.maximum(np.round(close * (1 + rng.normal(0, 0.005, count)), -1), 10)
+  return {
+    "close": close,
+    "open": open_,
+    "high": np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.01, count))),
+    "low": np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.01, count))),
+    "volume": rng.integers(10_000, 5_000_000, count),
+  }
+
+
+def format_daily_rows(days: list[date], ohlcv: dict[str, np.ndarray], positions: range) -> list[dict[str, str]]:
+  """
+  시계열 positions 구간 → 일봉 output2 행 (최신 일자가 앞)
+  - days[i] 가 ohlcv[*][i] 의 거래일, 전일 대비는 i-1 기준
+  """
+  close, open_, high, low, volume = (ohlcv[k] for k in ("close", "open", "high", "low", "volume"))
+  rows = []
+  for i in reversed(positions):
+    diff = close[i] - close[i - 1] if i > 0 else 0.0
+    rows.append({
+      "stck_bsop_date": days[i].strftime("%Y%m%d"),
+      "stck_clpr": f"{close[i]:.0f}",
+      "stck_oprc": f"{open_[i]:.0f}",
+      "stck_hgpr": f"{high[i]:.0f}",
+      "stck_lwpr": f"{low[i]:.0f}",
+      "acml_vol": str(int(volume[i])),
+      "acml_tr_pbmn": str(int(volume[i] * close[i])),
+      "flng_cls_code": "00",
+      "prtt_rate": "0.00",
+      "mod_yn": "N",
+      "prdy_vrss_sign": "2" if diff > 0 else ("5" if diff < 0 else "3"),
+      "prdy_vrss": f"{abs(diff):.0f}",
+      "revl_issu_reas": "",
+    })
+  return rows
+
+
+def make_daily_rows(ticker: str, days: list[date], *, seed: int = 0) -> list[dict[str, str]]:
+  """일봉 output2 행 (days 전체, 최신 일자가 앞)"""
+  return format_daily_rows(days, synthetic_ohlcv(ticker, len(days), seed=seed), range(len(days)))
+
+
+def make_daily_payload(ticker: str, days: list[date], *, seed: int = 0) -> dict:
+  """국내주식 기간별 시세(일봉) 응답 본문"""
+  return {
+    "rt_cd": "0",
+    "msg_cd": "MCA00000",
+    "msg1": "정상처리 되었습니다.",
+    "output1": {
+      "stck_shrn_iscd": ticker,
+      "hts_kor_isnm": f"종목{ticker}",
+      "lstn_stcn": "100000000",
+    },
+    "output2": make_daily_rows(ticker, days, seed=seed),
+  }
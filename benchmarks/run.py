@@ -0,0 +1,96 @@
+# benchmarks/run.py
+"""
+벤치마크 실행 CLI (저장소 루트에서 실행)
+
+    python -m benchmarks.run                               # quick 프로파일, 표 출력
+    python -m benchmarks.run --output bench/base.json      # 결과를 기준 파일로 저장
+    python -m benchmarks.run --compare bench/base.json     # 기준 대비 시간/처리량/메모리 변화율
+    python -m benchmarks.run --profile full -k parse       # 실제 최대 규모, 이름 필터
+
+--compare 시 threshold 를 넘는 시간/메모리 증가가 있으면 종료 코드 1
+DB 모델을 임포트하는 케이스(upsert 등)는 애플리케이션 설정(.env 또는 환경변수)이 필요
+"""
+import argparse
+import json
+import os
+import sys
+from typing import Any, Optional
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# 측정 중 span 파일 기록으로 결과가 왜곡되지 않도록 트레이싱 기본 비활성화 (TRACING_ENABLED=true 로 재정의)
+os.environ.setdefault("TRACING_ENABLED", "false")
+# core.models 가 'src.' 경로로 임포트하므로 저장소 루트와 src 모두 추가
+for _path in (os.path.join(_ROOT, "src"), _ROOT):
+  if _path not in sys.path:
+    sys.path.insert(0, _path)
+
+from benchmarks import cases  # noqa: E402,F401 (케이스 등록)
+from benchmarks.harness import compare, registered, run_all  # noqa: E402
+
+
+def _fmt_pct(value: Optional[float]) -> str:
+  return "-" if value is None else f"{value * 100:+.1f}%"
+
+
+def _print_result(key: str, result: dict[str, Any]) -> None:
+  throughput = result["rows_per_second"]
+  print(
+      f"{key:<70} {result['seconds_median'] * 1e3:>10.3f} ms"
+      f" {'-' if throughput is None else f'{throughput:,.0f}':>14} rows/s"
+      f" {result['peak_kib']:>12,.1f} KiB  (x{result['repeat']})",
+      flush=True,
+  )
+
+
+def _print_error(key: str, error: str) -> None:
+  print(f"{key:<70} 실패 - {error}", flush=True)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+  parser = argparse.ArgumentParser(description="수집/파싱/적재/지표 핫패스 마이크로 벤치마크")
+  parser.add_argument("-k", "--filter", default=None, help="케이스 이름에 포함된 문자열")
+  parser.add_argument("--profile", choices=["quick", "full"], default="quick")
+  parser.add_argument("--min-time", type=float, default=0.5, help="케이스당 최소 측정 시간(초)")
+  parser.add_argument("--max-repeat", type=int, default=50)
+  parser.add_argument("--max-rows", type=int, default=1_000_000, help="tickers x days 상한 (초과 조합 생략)")
+  parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+  parser.add_argument("--compare", default=None, help="비교할 기준 결과 JSON")
+  parser.add_argument("--threshold", type=float, default=0.10, help="회귀 판정 증가율 (0.10 = 10%%)")
+  args = parser.parse_args(argv)
+
+  benches = registered(args.filter)
+  if not benches:
+    print(f"일치하는 벤치마크가 없습니다: {args.filter}", file=sys.stderr)
+    return 2
+
+  print(f"{'case':<70} {'median':>13} {'throughput':>21} {'peak':>16}")
+  document = run_all(
+      benches, profile=args.profile, min_time=args.min_time, max_repeat=args.max_repeat,
+      max_rows=args.max_rows, on_result=_print_result, on_error=_print_error,
+  )
+
+  if args.output:
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as fh:
+      json.dump(document, fh, indent=2, ensure_ascii=False)
+    print(f"\n결과 저장: {args.output}")
+
+  if not args.compare:
+    return 0
+  with open(args.compare, encoding="utf-8") as fh:
+    baseline = json.load(fh)
+  rows = compare(baseline, document, threshold=args.threshold)
+  print(f"\n기준: {args.compare} (git={baseline.get('meta', {}).get('git')})")
+  print(f"{'case':<70} {'time':>9} {'throughput':>11} {'memory':>9}  status")
+  for row in rows:
+    print(f"{row['case']:<70} {_fmt_pct(row['time']):>9} {_fmt_pct(row['throughput']):>11}"
+          f" {_fmt_pct(row['memory']):>9}  {row['status']}")
+  regressions = [r for r in rows if r["status"] == "regression"]
+  if regressions:
+    print(f"\n회귀 {len(regressions)} 건 (threshold={args.threshold:.0%})")
+    return 1
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,36 @@
+# src/app/compression.py
+"""
+응답 gzip 압축 ASGI 미들웨어
+- Starlette GZipMiddleware 를 감싸 이미 압축된 바이너리 스트림 경로는 건너뜀
+  (/export 의 Arrow IPC(zstd 버퍼)/npz(deflate zip) 는 재압축해도 크기 이득 없이 CPU 만 소모)
+"""
+from typing import Any, Awaitable, Callable, MutableMapping, Sequence
+
+from starlette.middleware.gzip import GZipMiddleware
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+# gzip 을 적용하지 않을 경로 prefix
+UNCOMPRESSED_PATH_PREFIXES: tuple[str, ...] = ("/export",)
+
+
+class SelectiveGZipMiddleware:
+  def __init__(
+      self,
+      app: Callable[[Scope, Receive, Send], Awaitable[None]],
+      *,
+      minimum_size: int = 1024,
+      exclude_prefixes: Sequence[str] = UNCOMPRESSED_PATH_PREFIXES,
+  ) -> None:
+    self.app = app
+    self.gzip = GZipMiddleware(app, minimum_size=minimum_size)
+    self.exclude_prefixes = tuple(exclude_prefixes)
+
+  async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+    if scope["type"] == "http" and scope.get("path", "").startswith(self.exclude_prefixes):
+      await self.app(scope, receive, send)
+      return
+    await self.gzip(scope, receive, send)
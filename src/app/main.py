@@ -7,19 +7,39 @@ from zoneinfo import ZoneInfo
 
 from fastapi import FastAPI
 
+from app.compression import SelectiveGZipMiddleware
+from app.profiling import ProfilingMiddleware
+from app.responses import ORJSONResponse
+from app.routers.admin import router as admin_router
+from app.routers.collection import router as collection_router
 from app.routers.db import router as db_router
+from app.routers.export import router as export_router
 from app.routers.health import router as health_router
+from app.routers.metrics import router as metrics_router
+from app.routers.pipeline import router as pipeline_router
+from app.routers.price import router as price_router
+from app.routers.risk import router as risk_router
 from app.routers.scheduler import router as scheduler_router
+from app.routers.screener import router as screener_router
+from app.routers.snapshot import router as snapshot_router
 from config.settings import settings
 from core.models import MarketType
+from infrastructure.collection.service.collection_log_writer import collection_log_writer
 from infrastructure.db.session import db_ping, create_tables, get_table_info
+from infrastructure.index.service.index_service import (
+  seed_default_indices, save_daily_index_prices, warm_index_series_cache
+)
+from infrastructure.kis.archive.raw_archive import raw_archive
 from infrastructure.kis.service.token_service import KISTokenService
 from infrastructure.market.service.market_service import seed_default_markets
 from infrastructure.price.service.price_service import save_daily_prices
+from infrastructure.realtime.service.realtime_service import realtime_minute_bar_service
 from infrastructure.redis.redis_client import RedisClient
 from infrastructure.scheduler.manager import manager
 from infrastructure.scheduler.registry import load_modules, schedule_registered_jobs
+from infrastructure.snapshot.service.snapshot_cache import snapshot_cache
 from infrastructure.stock.service.stock_service import seed_kospi_top30
+from infrastructure.tracing.tracer import flush_spans
 
 log = logging.getLogger(__name__)
 
@@ -33,6 +53,12 @@ async def lifespan(app: FastAPI):
   # Postgres 연결 확인 (ping)
   await _init_postgres()
 
+  # 수집 로그 write-behind 버퍼 시작
+  collection_log_writer.start()
+
+  # KIS 원본 응답 보관 write-behind 시작
+  raw_archive.start()
+
   # Redis 연결 확인 (ping)
   await _init_redis()
 
@@ -48,13 +74,31 @@ async def lifespan(app: FastAPI):
   # KOSPI daily_price 데이터 저장
   await _init_kospi_daily_price()
 
+  # 시장지수 daily_index_price 데이터 저장 및 캐시 적재
+  await _init_market_indices()
+
+  # 종목별 최신 스냅샷 캐시 재구성
+  await _init_snapshot()
+
   # 스케줄러 등록
   _init_schedule()
+
+  # 실시간 체결 → 1분봉 집계 시작 (설정 시)
+  await _init_realtime()
   try:
     yield  # 애플리케이션 실행
   finally:
+    if settings.realtime_enabled:
+      await realtime_minute_bar_service.shutdown()
+      log.info("[애플리케이션 종료] - 실시간 1분봉 flush 완료")
     manager.shutdown_schedule()
+    await manager.release_leadership()
     log.info("[애플리케이션 종료] - 스케줄러 정리 완료")
+    await collection_log_writer.stop()
+    log.info("[애플리케이션 종료] - 수집 로그 flush 완료")
+    await raw_archive.stop()
+    log.info("[애플리케이션 종료] - KIS 원본 응답 보관 flush 완료")
+    flush_spans(wait=True)
 
 
 def _init_logger():
@@ -150,11 +194,39 @@ async def _init_kospi_daily_price():
     raise
 
 
+async def _init_market_indices():
+  """시장지수 시드 + daily_index_price 데이터 저장 (1달 전~현재) + 지수 시계열 캐시 적재"""
+  _timezone = ZoneInfo("Asia/Seoul")
+  _today = datetime.now(_timezone).date()
+  _start = _today - timedelta(days=31)
+  try:
+    await seed_default_indices()
+    upserted = await save_daily_index_prices(start=_start, end=_today)
+    log.info("[애플리케이션 시작] 시장지수 일봉 초기 저장 완료: %s 건 (%s ~ %s)", upserted, _start, _today)
+    await warm_index_series_cache()
+  except Exception:
+    log.exception("[애플리케이션 시작] 시장지수 일봉 초기 저장 실패")
+    raise
+
+
+async def _init_snapshot():
+  """최신 일봉/지표/추천 스냅샷 재구성 (DISTINCT ON 일괄 조회 → Redis + 인메모리)"""
+  try:
+    stocks = await snapshot_cache.rebuild()
+    log.info("[애플리케이션 시작] 스냅샷 캐시 재구성 완료: %s 종목", stocks)
+  except Exception:
+    log.exception("[애플리케이션 시작] 스냅샷 캐시 재구성 실패")
+    raise
+
+
 def _init_schedule():
   try:
     # 스케줄러 Job 모듈 로드
     load_modules([
-      "job.kis_scheduler"
+      "job.kis_scheduler",
+      "job.financial_scheduler",
+      "job.pipeline_scheduler",
+      "job.backtest_scheduler",
     ])
 
     # 등록된 Job들을 스케줄러에 추가
@@ -168,11 +240,39 @@ def _init_schedule():
     raise
 
 
+async def _init_realtime():
+  """실시간 체결 구독 + 1분봉 집계/적재 (스케줄러 리더 인스턴스에서만)"""
+  if not settings.realtime_enabled:
+    return
+  try:
+    realtime_minute_bar_service.run_as_leader(lambda: manager.is_leader)
+    log.info("[애플리케이션 시작] 실시간 1분봉 집계 리더 감시 시작")
+  except Exception:
+    log.exception("[애플리케이션 시작] 실시간 1분봉 집계 시작 실패")
+    raise
+
+
 app = FastAPI(
     title=os.getenv("APP_NAME", "stock-ml-platform"),
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+# 응답 압축 (Accept-Encoding: gzip 협상, 1KB 미만/이미 압축된 /export 스트림은 그대로)
+app.add_middleware(SelectiveGZipMiddleware, minimum_size=1024)
+# 요청 단위 프로파일링 (X-Profile 헤더/profile 쿼리, 비활성화 시 미등록)
+if settings.profiling_enabled:
+  app.add_middleware(ProfilingMiddleware)
+
 app.include_router(health_router)
 app.include_router(db_router)
 app.include_router(scheduler_router)
+app.include_router(collection_router)
+app.include_router(metrics_router)
+app.include_router(pipeline_router)
+app.include_router(price_router)
+app.include_router(snapshot_router)
+app.include_router(screener_router)
+app.include_router(export_router)
+app.include_router(risk_router)
+app.include_router(admin_router)
@@ -0,0 +1,48 @@
+# src/app/profiling.py
+"""
+요청 단위 프로파일링 ASGI 미들웨어
+- `X-Profile: 1` 헤더 또는 `?profile=1` 쿼리가 있는 HTTP 요청만 profile_session 으로 감쌈
+- 응답 헤더 `X-Profile-Id` 로 저장된 프로파일 id 반환 (GET /admin/profiles/{id})
+settings.profiling_enabled 일 때만 등록 (비활성화 시 미들웨어 자체가 없음)
+"""
+from typing import Any, Awaitable, Callable, MutableMapping
+from urllib.parse import parse_qs
+
+from infrastructure.profiling.profiler import profile_session
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+_TRUTHY = { "1", "true", "yes", "on" }
+
+
+def _requested(scope: Scope) -> bool:
+  for key, value in scope.get("headers", ()):
+    if key == b"x-profile":
+      return value.decode("latin-1").strip().lower() in _TRUTHY
+  query = scope.get("query_string", b"")
+  if b"profile=" not in query:
+    return False
+  values = parse_qs(query.decode("latin-1")).get("profile", [])
+  return any(v.lower() in _TRUTHY for v in values)
+
+
+class ProfilingMiddleware:
+  def __init__(self, app: Callable[[Scope, Receive, Send], Awaitable[None]]) -> None:
+    self.app = app
+
+  async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+    if scope["type"] != "http" or not _requested(scope):
+      await self.app(scope, receive, send)
+      return
+
+    # 동기 라우트/to_thread 작업은 스레드 풀에서 실행되므로 작업 중인 스레드 모두 샘플링
+    with profile_session("request", f"{scope['method']} {scope['path']}", all_threads=True) as handle:
+      async def send_with_id(message: Message) -> None:
+        if handle is not None and message["type"] == "http.response.start":
+          message["headers"] = [*message.get("headers", ()), (b"x-profile-id", handle.id.encode())]
+        await send(message)
+
+      await self.app(scope, receive, send_with_id)
@@ -0,0 +1,92 @@
+# src/app/responses.py
+"""
+공통 응답 계층
+- ORJSONResponse: orjson 직렬화 (date/datetime/Enum/numpy 는 orjson 기본 지원, Decimal 은 float)
+  엔드포인트가 직접 반환하면 FastAPI jsonable_encoder/응답 모델 검증을 거치지 않음
+- ndjson_response: 큰 행 목록을 한 줄에 한 행씩 묶음 단위로 스트리밍 (Accept: application/x-ndjson)
+- 압축은 앱 전역 GZipMiddleware 가 Accept-Encoding 협상 (스트리밍 응답 포함)
+"""
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, AsyncIterable, Iterable, Optional, Union
+
+import orjson
+from fastapi import Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+  """orjson 미지원 타입 인코딩 정책"""
+  if isinstance(obj, Decimal):
+    return float(obj)
+  if isinstance(obj, (set, frozenset, tuple)):
+    return list(obj)
+  # pandas.Timestamp 등 isoformat 을 가진 날짜형
+  if isinstance(obj, (date, datetime)) or hasattr(obj, "isoformat"):
+    return obj.isoformat()
+  raise TypeError(f"직렬화할 수 없는 타입입니다: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+  """orjson 직렬화 (공통 옵션/인코딩 정책 적용)"""
+  return orjson.dumps(content, default=_default, option=_OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+  """orjson 기반 JSON 응답 (앱 기본 응답 클래스)"""
+
+  def render(self, content: Any) -> bytes:
+    return dumps(content)
+
+
+def wants_ndjson(request: Request) -> bool:
+  """Accept 헤더로 NDJSON 스트리밍 요청 여부 판단"""
+  return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+async def _ndjson_lines(
+    rows: Union[Iterable[Any], AsyncIterable[Any]],
+    *,
+    header: Optional[dict[str, Any]],
+    batch_size: int,
+) -> AsyncIterable[bytes]:
+  buffer = bytearray()
+  if header is not None:
+    buffer += dumps(header) + b"\n"
+  count = 0
+  if isinstance(rows, AsyncIterable):
+    async for row in rows:
+      buffer += dumps(row) + b"\n"
+      count += 1
+      if count % batch_size == 0:
+        yield bytes(buffer)
+        buffer.clear()
+  else:
+    for row in rows:
+      buffer += dumps(row) + b"\n"
+      count += 1
+      if count % batch_size == 0:
+        yield bytes(buffer)
+        buffer.clear()
+  if buffer:
+    yield bytes(buffer)
+
+
+def ndjson_response(
+    rows: Union[Iterable[Any], AsyncIterable[Any]],
+    *,
+    header: Optional[dict[str, Any]] = None,
+    batch_size: int = 1000,
+) -> StreamingResponse:
+  """
+  NDJSON 스트리밍 응답
+  - header 지정 시 첫 줄에 메타데이터(티커/해상도 등) 1행
+  - batch_size 행마다 한 번씩 전송 (작은 write 반복 방지)
+  """
+  return StreamingResponse(
+      _ndjson_lines(rows, header=header, batch_size=batch_size), media_type=NDJSON_MEDIA_TYPE
+  )
@@ -0,0 +1,42 @@
+# src/app/routers/admin.py
+from typing import Any, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import FileResponse
+
+from config.settings import settings
+from infrastructure.profiling.profiler import list_profiles, load_profile, profile_stacks_path
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get("/profiles")
+async def admin_profiles(
+    kind: Optional[str] = None,
+    limit: int = Query(default=50, ge=1, le=500),
+) -> dict[str, Any]:
+  """저장된 요청/Job 프로파일 목록 (최신순)"""
+  profiles = list_profiles(kind=kind, limit=limit)
+  return {
+    "enabled": settings.profiling_enabled,
+    "count": len(profiles),
+    "profiles": profiles,
+  }
+
+
+@router.get("/profiles/{profile_id}")
+async def admin_profile(profile_id: str) -> dict[str, Any]:
+  """프로파일 상세 (CPU self/total 상위 함수, 메모리 증가 상위 줄)"""
+  summary = load_profile(profile_id)
+  if summary is None:
+    raise HTTPException(status_code=404, detail=f"프로파일을 찾을 수 없습니다: {profile_id}")
+  return summary
+
+
+@router.get("/profiles/{profile_id}/stacks")
+async def admin_profile_stacks(profile_id: str) -> FileResponse:
+  """collapsed stack 원본 (flamegraph.pl / speedscope 입력)"""
+  path = profile_stacks_path(profile_id)
+  if path is None:
+    raise HTTPException(status_code=404, detail=f"프로파일을 찾을 수 없습니다: {profile_id}")
+  return FileResponse(path, media_type="text/plain; charset=utf-8", filename=f"{profile_id}.folded")
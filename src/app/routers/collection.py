@@ -0,0 +1,64 @@
+# src/app/routers/collection.py
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Optional
+
+from fastapi import APIRouter, BackgroundTasks, Query
+
+from infrastructure.collection.repository.collection_log_repository import find_throughput_trend
+from infrastructure.collection.service.collection_tracker import recent_runs
+from infrastructure.db.session import get_session
+from infrastructure.price.service.price_replay_service import replay_daily_prices
+
+log = logging.getLogger(__name__)
+router = APIRouter(prefix="/collection", tags=["collection"])
+
+
+@router.get("/throughput")
+async def collection_throughput(
+    data_type: Optional[str] = None,
+    days: int = Query(default=30, ge=1, le=365),
+) -> dict[str, Any]:
+  """일자/데이터 유형별 수집 처리량 추이 조회 엔드포인트"""
+  since = datetime.now(timezone.utc) - timedelta(days=days)
+  try:
+    async with get_session() as session:
+      trend = await find_throughput_trend(session, since=since, data_type=data_type)
+    return {
+      "since": since.isoformat(),
+      "data_type": data_type,
+      "trend": trend,
+    }
+  except Exception as e:
+    log.exception("수집 처리량 조회 실패")
+    return {
+      "error": str(e)
+    }
+
+
+@router.get("/runs/recent")
+async def collection_recent_runs(data_type: Optional[str] = None) -> dict[str, Any]:
+  """최근 수집 실행 요약 (종목별 소요시간 분포, API 호출 수 포함)"""
+  runs = recent_runs(data_type)
+  return {
+    "count": len(runs),
+    "runs": runs,
+  }
+
+
+@router.post("/replay/daily_price")
+async def collection_replay_daily_price(
+    start: date,
+    end: date,
+    background_tasks: BackgroundTasks,
+    stock_ids: Optional[list[int]] = Query(default=None),
+    workers: Optional[int] = Query(default=None, ge=1),
+) -> dict[str, Any]:
+  """KIS 원본 응답 보관소로 daily_price 구간 재적재 (백그라운드, KIS 호출 없음)"""
+  background_tasks.add_task(replay_daily_prices, start=start, end=end, stock_ids=stock_ids, workers=workers)
+  return {
+    "start": start.isoformat(),
+    "end": end.isoformat(),
+    "stock_ids": stock_ids,
+    "accepted": True,
+  }
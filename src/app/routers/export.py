@@ -0,0 +1,63 @@
+# src/app/routers/export.py
+import logging
+from datetime import date, timedelta
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from core.models import MarketType
+from infrastructure.db.session import get_session
+from infrastructure.export.repository.export_repository import EXPORT_DATASETS
+from infrastructure.export.service.export_service import (
+  MEDIA_TYPES, ArrowCompression, ExportFormat, iter_export
+)
+from infrastructure.price.repository.price_repository import get_stock_id_map_by_market
+
+log = logging.getLogger(__name__)
+router = APIRouter(prefix="/export", tags=["export"])
+
+
+@router.get("/{dataset}")
+async def export_dataset(
+    dataset: str,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    tickers: Optional[str] = Query(default=None, description="쉼표로 구분한 종목코드 (미지정 시 시장 전체)"),
+    market: Optional[MarketType] = Query(default=None, description="시장코드 (미지정 시 KOSPI+KOSDAQ)"),
+    fmt: ExportFormat = Query(default="arrow", alias="format", description="arrow (IPC stream) / npz"),
+    compression: ArrowCompression = Query(default="zstd", description="arrow 버퍼 압축"),
+    adjusted: bool = Query(default=False, description="daily_price 수정주가 여부"),
+    chunk_rows: int = Query(default=50_000, ge=1_000, le=500_000),
+) -> StreamingResponse:
+  """daily_price/technical_indicator 구간 대량 내보내기 엔드포인트 (서버측 커서 → 청크 스트리밍)"""
+  spec = EXPORT_DATASETS.get(dataset)
+  if spec is None:
+    raise HTTPException(
+        status_code=404,
+        detail=f"지원하지 않는 데이터셋입니다: {dataset} (가능: {', '.join(EXPORT_DATASETS)})",
+    )
+  end = end or date.today()
+  start = start or end - timedelta(days=365)
+
+  markets = [market] if market is not None else [MarketType.KOSPI, MarketType.KOSDAQ]
+  async with get_session() as session:
+    ticker_to_id = await get_stock_id_map_by_market(session, market_codes=markets)
+  if tickers:
+    requested = [t.strip() for t in tickers.split(",") if t.strip()]
+    missing = [t for t in requested if t not in ticker_to_id]
+    if missing:
+      raise HTTPException(status_code=404, detail=f"종목을 찾을 수 없습니다. tickers={missing}")
+    stock_ids = [ticker_to_id[t] for t in requested]
+  else:
+    stock_ids = list(ticker_to_id.values())
+
+  filename = f"{dataset}_{start:%Y%m%d}_{end:%Y%m%d}.{fmt}"
+  return StreamingResponse(
+      iter_export(
+          spec, start=start, end=end, stock_ids=stock_ids, fmt=fmt, compression=compression,
+          adjusted=adjusted, chunk_rows=chunk_rows,
+      ),
+      media_type=MEDIA_TYPES[fmt],
+      headers={ "Content-Disposition": f'attachment; filename="{filename}"' },
+  )
@@ -0,0 +1,16 @@
+# src/app/routers/metrics.py
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from infrastructure.metrics.registry import registry
+
+router = APIRouter(tags=["metrics"])
+
+# Prometheus 텍스트 exposition 포맷
+_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+  """Prometheus 스크레이프 엔드포인트"""
+  return PlainTextResponse(registry.render(), media_type=_CONTENT_TYPE)
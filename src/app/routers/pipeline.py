@@ -0,0 +1,52 @@
+# src/app/routers/pipeline.py
+import logging
+from dataclasses import asdict
+from datetime import date
+from typing import Any, Optional
+
+from fastapi import APIRouter, BackgroundTasks, Query
+
+from infrastructure.scheduler.pipeline import load_pipeline_state, run_pipeline, stage_graph
+
+log = logging.getLogger(__name__)
+router = APIRouter(prefix="/pipeline", tags=["pipeline"])
+
+
+@router.get("/graph")
+async def pipeline_graph() -> dict[str, Any]:
+  """등록된 스테이지 의존관계 조회 엔드포인트"""
+  return {
+    "stages": stage_graph()
+  }
+
+
+@router.get("/{trade_date}")
+async def pipeline_status(trade_date: date) -> dict[str, Any]:
+  """거래일 파이프라인 스테이지별 실행 기록 조회 엔드포인트"""
+  state = await load_pipeline_state(trade_date)
+  return {
+    "trade_date": trade_date.isoformat(),
+    "stages": { name: asdict(record) for name, record in state.items() },
+  }
+
+
+@router.post("/{trade_date}/run")
+async def pipeline_run(
+    trade_date: date,
+    background_tasks: BackgroundTasks,
+    rerun: bool = False,
+    stages: Optional[list[str]] = Query(default=None),
+    stock_ids: Optional[list[int]] = Query(default=None),
+) -> dict[str, Any]:
+  """
+  파이프라인 수동 실행 (백그라운드)
+  - rerun=true: 실패/부분실패 스테이지와 하위 스테이지만 영향받은 종목으로 재실행
+  - stages: 특정 스테이지(+하위 스테이지)만 실행
+  """
+  background_tasks.add_task(run_pipeline, trade_date, rerun=rerun, stages=stages, stock_ids=stock_ids)
+  return {
+    "trade_date": trade_date.isoformat(),
+    "rerun": rerun,
+    "stages": stages,
+    "accepted": True,
+  }
@@ -0,0 +1,77 @@
+# src/app/routers/price.py
+import logging
+from datetime import date, timedelta
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response
+
+from app.responses import ORJSONResponse, ndjson_response, wants_ndjson
+from infrastructure.db.session import get_session
+from infrastructure.price.repository.price_repository import get_stock_id_by_ticker
+from infrastructure.price.service.price_read_service import load_daily_prices, load_price_bars
+
+log = logging.getLogger(__name__)
+router = APIRouter(prefix="/prices", tags=["price"])
+
+
+@router.get("/{ticker}/daily")
+async def daily_prices(
+    request: Request,
+    ticker: str,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    adjusted: bool = Query(default=True, description="수정주가 여부 (false 면 원주가)"),
+) -> Response:
+  """
+  종목 일봉 조회 엔드포인트 (수정주가는 조회 시점에 수정계수 적용)
+  - Accept: application/x-ndjson 이면 첫 줄 메타데이터 + 일봉 1행씩 스트리밍
+  """
+  end = end or date.today()
+  start = start or end - timedelta(days=365)
+  async with get_session() as session:
+    stock_id = await get_stock_id_by_ticker(session, ticker)
+  if stock_id is None:
+    raise HTTPException(status_code=404, detail=f"종목을 찾을 수 없습니다. ticker={ticker}")
+
+  frame = await load_daily_prices(start=start, end=end, stock_ids=[stock_id], adjusted=adjusted)
+  records = frame.drop(columns=["stock_id"]).to_dict(orient="records")
+  meta = { "ticker": ticker, "adjusted": adjusted, "count": len(records) }
+  if wants_ndjson(request):
+    return ndjson_response(records, header=meta)
+  return ORJSONResponse({ **meta, "prices": records })
+
+
+@router.get("/{ticker}/bars")
+async def price_bars(
+    request: Request,
+    ticker: str,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    resolution: str = Query(default="auto", description="auto/day/week/month/year"),
+    adjusted: bool = Query(default=True, description="수정주가 여부 (false 면 원주가)"),
+    max_bars: int = Query(default=500, ge=1, le=5000, description="auto 선택 시 최대 봉 수"),
+) -> Response:
+  """
+  종목 OHLCV 봉 조회 엔드포인트 (주/월/연 봉은 롤업 테이블, auto 는 구간 길이로 해상도 선택)
+  - Accept: application/x-ndjson 이면 첫 줄 메타데이터 + 봉 1행씩 스트리밍
+  """
+  end = end or date.today()
+  start = start or end - timedelta(days=365)
+  async with get_session() as session:
+    stock_id = await get_stock_id_by_ticker(session, ticker)
+  if stock_id is None:
+    raise HTTPException(status_code=404, detail=f"종목을 찾을 수 없습니다. ticker={ticker}")
+
+  try:
+    resolution, frame = await load_price_bars(
+        start=start, end=end, stock_ids=[stock_id], resolution=resolution, adjusted=adjusted, max_bars=max_bars
+    )
+  except ValueError as e:
+    raise HTTPException(status_code=400, detail=str(e)) from e
+  # 날짜는 orjson 이 ISO 문자열로, float NaN 은 null 로 직렬화
+  records = frame.drop(columns=["stock_id"]).to_dict(orient="records")
+  meta = { "ticker": ticker, "resolution": resolution, "adjusted": adjusted, "count": len(records) }
+  if wants_ndjson(request):
+    return ndjson_response(records, header=meta)
+  return ORJSONResponse({ **meta, "bars": records })
@@ -0,0 +1,36 @@
+# src/app/routers/risk.py
+import logging
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import Response
+
+from app.responses import ORJSONResponse
+from infrastructure.snapshot.service.snapshot_cache import snapshot_cache
+from ml.risk.service import correlated_stocks
+
+log = logging.getLogger(__name__)
+router = APIRouter(prefix="/risk", tags=["risk"])
+
+
+@router.get("/correlated/{ticker}")
+async def correlated_tickers(
+    ticker: str,
+    k: int = Query(default=10, ge=1, le=200, description="반환할 종목 수"),
+    window: Optional[int] = Query(default=None, ge=2, description="윈도우 거래일 수 (미지정 시 기본 윈도우)"),
+    as_of: Optional[date] = Query(default=None, description="기준일 (미지정 시 최신 기준일)"),
+) -> Response:
+  """수익률 상관계수 상위 종목 조회 엔드포인트 (mmap 리스크 행렬 한 행 + 인메모리 종목 메타)"""
+  await snapshot_cache.sync()
+  stock_id = snapshot_cache.stock_id_of(ticker)
+  if stock_id is None:
+    raise HTTPException(status_code=404, detail=f"종목을 찾을 수 없습니다. ticker={ticker}")
+  result = correlated_stocks(stock_id, k=k, window=window, as_of=as_of)
+  if result is None:
+    raise HTTPException(status_code=404, detail=f"리스크 행렬에 없는 종목입니다. ticker={ticker}")
+  for item in result["items"]:
+    snapshot = snapshot_cache.get(item["stock_id"])
+    item["ticker"] = snapshot["ticker"] if snapshot else None
+    item["stock_name"] = snapshot["stock_name"] if snapshot else None
+  return ORJSONResponse({ "ticker": ticker, **result })
@@ -21,5 +21,7 @@ async def scheduler_status():
   return {
     "scheduler_running": scheduler.running,
     "timezone": str(manager.timezone),
+    "instance_id": manager.instance_id,
+    "is_leader": manager.is_leader,
     "jobs": jobs
   }
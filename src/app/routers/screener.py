@@ -0,0 +1,34 @@
+# src/app/routers/screener.py
+import logging
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import Response
+
+from app.responses import ORJSONResponse
+from infrastructure.screener.service.screener_service import screen
+
+log = logging.getLogger(__name__)
+router = APIRouter(prefix="/screen", tags=["screener"])
+
+
+@router.get("")
+async def screen_universe(
+    trade_date: Optional[date] = Query(default=None, description="기준 거래일 (미지정 시 최신 거래일)"),
+    filters: Optional[str] = Query(
+        default=None, description="쉼표 구분 조건 (예: rsi_14<30,pbr<1,pct_volume_ratio>=0.9)"
+    ),
+    order_by: Optional[str] = Query(default=None, description="정렬 컬럼 (예: volume_ratio, pct_roe)"),
+    ascending: bool = Query(default=False, description="오름차순 여부 (기본 내림차순)"),
+    limit: int = Query(default=50, ge=1, le=1000),
+    market: Optional[str] = Query(default=None, description="시장코드 (예: KOSPI)"),
+) -> Response:
+  """전 종목 지표 스크리닝 엔드포인트 (거래일별 인메모리 컬럼 스냅샷 + 백분위 순위)"""
+  try:
+    result = await screen(
+        trade_date=trade_date, filters=filters, order_by=order_by, ascending=ascending, limit=limit, market=market
+    )
+  except ValueError as e:
+    raise HTTPException(status_code=400, detail=str(e)) from e
+  return ORJSONResponse(result)
@@ -0,0 +1,63 @@
+# src/app/routers/snapshot.py
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response
+
+from app.responses import ORJSONResponse, ndjson_response, wants_ndjson
+from infrastructure.snapshot.service.snapshot_cache import snapshot_cache
+
+log = logging.getLogger(__name__)
+router = APIRouter(prefix="/snapshot", tags=["snapshot"])
+
+
+@router.get("")
+async def universe_snapshot(
+    request: Request,
+    market: Optional[str] = Query(default=None, description="시장코드 (예: KOSPI)"),
+) -> Response:
+  """
+  전 종목 최신 스냅샷 조회 엔드포인트 (SQL 없이 인메모리 미러에서 응답)
+  - Accept: application/x-ndjson 이면 첫 줄 메타데이터 + 종목 1행씩 스트리밍
+  """
+  await snapshot_cache.sync()
+  items = snapshot_cache.all()
+  if market is not None:
+    items = [s for s in items if s["market_code"] == market]
+  meta = { "version": snapshot_cache.version, "count": len(items) }
+  if wants_ndjson(request):
+    return ndjson_response(items, header=meta)
+  return ORJSONResponse({ **meta, "items": items })
+
+
+@router.get("/watchlist")
+async def watchlist_snapshot(
+    tickers: str = Query(description="쉼표로 구분한 종목코드 목록"),
+) -> Response:
+  """관심종목 최신 스냅샷 일괄 조회 엔드포인트 (없는 종목은 missing 으로 반환)"""
+  await snapshot_cache.sync()
+  items, missing = [], []
+  for ticker in (t.strip() for t in tickers.split(",")):
+    if not ticker:
+      continue
+    snapshot = snapshot_cache.get_by_ticker(ticker)
+    if snapshot is None:
+      missing.append(ticker)
+    else:
+      items.append(snapshot)
+  return ORJSONResponse({
+    "version": snapshot_cache.version,
+    "items": items,
+    "missing": missing,
+  })
+
+
+@router.get("/{ticker}")
+async def ticker_snapshot(ticker: str) -> Response:
+  """종목 최신 일봉/지표/추천 스냅샷 조회 엔드포인트"""
+  await snapshot_cache.sync()
+  snapshot = snapshot_cache.get_by_ticker(ticker)
+  if snapshot is None:
+    raise HTTPException(status_code=404, detail=f"스냅샷이 없습니다. ticker={ticker}")
+  return ORJSONResponse(snapshot)
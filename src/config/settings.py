@@ -30,6 +30,53 @@ class Settings(BaseSettings):
   kis_app_key: str
   kis_app_secret: str
   kis_base_url: str
+  # KIS 실시간 WebSocket (모의투자: ws://ops.koreainvestment.com:31000)
+  kis_ws_url: str = "ws://ops.koreainvestment.com:21000"
+  # 연결별 수신 큐 크기 (가득 차면 소켓 읽기를 멈춰 backpressure)
+  realtime_queue_size: int = 10000
+  # KIS 실시간 등록 한도 (앱키 단위, 1분봉 수집 관심 종목 수 상한)
+  realtime_max_subscriptions_per_connection: int = 41
+  # 실시간 체결 → 1분봉 집계/적재 활성화 (스케줄러 리더 인스턴스에서만 수집)
+  realtime_enabled: bool = False
+  # 1분봉 수집 관심 종목 (콤마 구분 종목코드, 앞에서부터 등록 한도까지만 구독)
+  realtime_watchlist: str = ""
+  # 1분봉 Redis Stream 최대 길이 (근사 trim)
+  realtime_minute_bar_stream_maxlen: int = 100000
+  # KIS 원본 응답 보관 (storage_root/kis_raw, 재처리 replay 용) 및 write-behind 큐 크기
+  kis_raw_archive_enabled: bool = True
+  kis_raw_archive_queue_size: int = 10000
+  # KIS 조회 응답 캐시 (프로세스 LRU 항목 수, 마감된 과거 구간 / 당일 포함 구간 TTL 초)
+  kis_cache_enabled: bool = True
+  kis_cache_size: int = 1024
+  kis_cache_closed_ttl_seconds: int = 86400
+  kis_cache_open_ttl_seconds: int = 120
+
+  # Scheduler (다중 워커/레플리카 환경에서 Job 1회 실행 보장)
+  scheduler_leader_election: bool = True
+  scheduler_lease_ttl_seconds: int = 30
+  # Job executor 풀 크기 (process 0 이면 CPU 코어 수)
+  scheduler_thread_pool_size: int = 4
+  scheduler_process_pool_size: int = 0
+  # process Job 결과 파일(analytics_dir/job_results/{id}) Job 별 보관 개수
+  scheduler_job_results_keep: int = 10
+
+  # Screener (거래일별 컬럼 스냅샷 LRU 보관 개수)
+  screener_cache_size: int = 8
+
+  # Profiling (X-Profile 헤더/profile 쿼리 요청, scheduled_cron(profile=True) Job 을 log_dir/profiles 에 기록)
+  profiling_enabled: bool = False
+  profiling_interval_ms: float = 5.0
+  profiling_traceback_depth: int = 1
+  profiling_keep: int = 100
+
+  # Tracing (span → log_dir/traces OTLP/JSON, 수집 작업별 단계 시간 집계, 필요할 때만 활성화)
+  tracing_enabled: bool = False
+  # 보관할 traces-YYYYMMDD.jsonl 일수 (오늘 포함, 0 이면 삭제하지 않음)
+  tracing_keep_days: int = 7
+
+  # Risk (수익률 공분산 롤링 윈도우 거래일 수, analytics_dir/risk 아래 보관할 기준일 수)
+  risk_window: int = 60
+  risk_keep_snapshots: int = 5
 
   class Config:
     env_file = ".env"
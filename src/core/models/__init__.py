@@ -20,7 +20,7 @@ from src.core.models.index import MarketIndex, DailyIndexPrice
 from src.core.models.log import DataCollectionLog
 # 핵심 모델들
 from src.core.models.market import Market, Sector
-from src.core.models.price import DailyPrice, MinutePrice
+from src.core.models.price import DailyPrice, MinutePrice, PriceAdjustmentFactor, PriceRollup
 from src.core.models.recommendation import MLRecommendation
 from src.core.models.stock import Stock
 from src.core.models.technical import TechnicalIndicator
@@ -42,6 +42,8 @@ __all__ = [
   "Stock",
   "DailyPrice",
   "MinutePrice",
+  "PriceAdjustmentFactor",
+  "PriceRollup",
   "FinancialStatement",
   "InvestmentIndicator",
   "TechnicalIndicator",
@@ -2,7 +2,7 @@
 """
 주가 데이터 모델 (파티셔닝 적용)
 """
-from sqlalchemy import Column, Integer, Date, DateTime, DECIMAL, BigInteger, ForeignKey, Index
+from sqlalchemy import Column, Integer, String, Date, DateTime, DECIMAL, BigInteger, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from core.models.base import TimestampMixin
@@ -50,6 +50,63 @@ class DailyPrice(TimestampMixin, Base):
     return f"<DailyPrice(stock_id={self.stock_id}, date={self.trade_date})>"
 
 
+class PriceAdjustmentFactor(TimestampMixin, Base):
+  """
+  수정주가 계수 테이블 (액면분할/병합, 증자 등 기업행위)
+  합성 기본키 사용: (stock_id, ex_date)
+  - daily_price 는 원주가만 저장하고, ex_date 이전 가격에 ratio 를 누적 곱해서 수정주가를 계산
+  - 이벤트가 생겨도 이력 재작성 없이 이 테이블에 1행만 추가
+  """
+  __tablename__ = "price_adjustment_factor"
+
+  stock_id = Column(Integer, ForeignKey("stock.stock_id", ondelete="CASCADE"), primary_key=True)
+  ex_date = Column(Date, primary_key=True, comment="권리락/기준일 (이 날부터 새 기준 가격)")
+  ratio = Column(DECIMAL(20, 10), nullable=False, comment="ex_date 이전 가격에 곱할 계수 (ex. 1:5 분할 → 0.2)")
+  reason = Column(String(20), nullable=True, comment="수정 사유 코드 (KIS revl_issu_reas)")
+  source = Column(String(20), nullable=False, default="kis_compare", comment="계수 산출 방식")
+
+  __table_args__ = (
+    Index("idx_adjustment_factor_ex_date", "ex_date"),
+  )
+
+  def __repr__(self) -> str:
+    return f"<PriceAdjustmentFactor(stock_id={self.stock_id}, ex_date={self.ex_date}, ratio={self.ratio})>"
+
+
+class PriceRollup(TimestampMixin, Base):
+  """
+  주/월/연 OHLCV 롤업 테이블 (원주가 기준)
+  합성 기본키 사용: (stock_id, resolution, bucket_start)
+  - daily_price 적재 배치가 건드린 구간(bucket)만 재집계 (INSERT ... SELECT ... ON CONFLICT)
+  - 수정주가는 읽는 시점에 price_adjustment_factor 로 계산
+  """
+  __tablename__ = "price_rollup"
+
+  stock_id = Column(Integer, ForeignKey("stock.stock_id", ondelete="CASCADE"), primary_key=True)
+  resolution = Column(String(8), primary_key=True, comment="집계 단위 (week/month/year)")
+  bucket_start = Column(Date, primary_key=True, comment="구간 시작일 (주: 월요일, 월: 1일, 연: 1월 1일)")
+
+  # OHLCV 데이터
+  open_price = Column(DECIMAL(18, 6), nullable=False, comment="시가 (구간 첫 거래일)")
+  high_price = Column(DECIMAL(18, 6), nullable=False, comment="고가")
+  low_price = Column(DECIMAL(18, 6), nullable=False, comment="저가")
+  close_price = Column(DECIMAL(18, 6), nullable=False, comment="종가 (구간 마지막 거래일)")
+  volume = Column(BigInteger, nullable=False, default=0, comment="거래량")
+  trading_value = Column(DECIMAL(24, 2), nullable=True, comment="거래대금")
+
+  # 구간 정보
+  first_trade_date = Column(Date, nullable=False, comment="구간 첫 거래일")
+  last_trade_date = Column(Date, nullable=False, comment="구간 마지막 거래일")
+  bar_count = Column(Integer, nullable=False, comment="구간 거래일 수")
+
+  __table_args__ = (
+    Index("idx_price_rollup_resolution_bucket", "resolution", "bucket_start"),
+  )
+
+  def __repr__(self) -> str:
+    return f"<PriceRollup(stock_id={self.stock_id}, resolution={self.resolution}, bucket_start={self.bucket_start})>"
+
+
 class MinutePrice(TimestampMixin, Base):
   """
   분봉 주가 데이터 테이블 (일별 파티셔닝)
@@ -0,0 +1,55 @@
+# src/infrastructure/collection/repository/collection_log_repository.py
+from datetime import datetime
+from typing import Any, List, Optional
+
+from sqlalchemy import select, func, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models import DataCollectionLog
+
+
+async def insert_collection_logs(session: AsyncSession, rows: List[dict[str, Any]]) -> int:
+  """DataCollectionLog 일괄 INSERT (multi-row VALUES 한 번)"""
+  if not rows:
+    return 0
+  await session.execute(insert(DataCollectionLog).values(rows))
+  return len(rows)
+
+
+async def find_throughput_trend(
+    session: AsyncSession,
+    *,
+    since: datetime,
+    data_type: Optional[str] = None,
+) -> List[dict[str, Any]]:
+  """
+  일자/데이터 유형별 수집 처리량 추이
+  - 실행 횟수, 수집/실패 레코드 수, 총 실행시간(초), 초당 레코드 수
+  """
+  day = func.date_trunc("day", DataCollectionLog.start_time).label("day")
+  collected = func.coalesce(func.sum(DataCollectionLog.records_collected), 0).label("records_collected")
+  failed = func.coalesce(func.sum(DataCollectionLog.records_failed), 0).label("records_failed")
+  seconds = func.coalesce(func.sum(DataCollectionLog.execution_time_seconds), 0).label("execution_seconds")
+
+  query = (
+    select(day, DataCollectionLog.data_type, func.count().label("runs"), collected, failed, seconds)
+    .where(DataCollectionLog.start_time >= since)
+    .group_by(day, DataCollectionLog.data_type)
+    .order_by(day, DataCollectionLog.data_type)
+  )
+  if data_type:
+    query = query.where(DataCollectionLog.data_type == data_type)
+
+  out: List[dict[str, Any]] = []
+  for row in (await session.execute(query)).all():
+    out.append({
+      "day": row.day.date().isoformat(),
+      "data_type": row.data_type,
+      "runs": row.runs,
+      "records_collected": int(row.records_collected),
+      "records_failed": int(row.records_failed),
+      "execution_seconds": int(row.execution_seconds),
+      "records_per_second": round(int(row.records_collected) / row.execution_seconds, 2)
+      if row.execution_seconds else None,
+    })
+  return out
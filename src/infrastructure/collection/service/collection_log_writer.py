@@ -0,0 +1,110 @@
+# src/infrastructure/collection/service/collection_log_writer.py
+import asyncio
+import logging
+from typing import Any, List, Optional
+
+from infrastructure.collection.repository.collection_log_repository import insert_collection_logs
+from infrastructure.db.session import get_session
+
+log = logging.getLogger(__name__)
+
+
+class CollectionLogWriter:
+  """
+  DataCollectionLog write-behind 버퍼
+  - submit() 은 큐에 넣기만 하고 즉시 반환 (수집 hot path 에 DB 지연 없음)
+  - 백그라운드 태스크가 batch_size 또는 flush_interval 마다 한 번에 INSERT
+  """
+
+  def __init__(self, *, batch_size: int = 200, flush_interval: float = 2.0, max_queue: int = 10000) -> None:
+    self._batch_size = batch_size
+    self._flush_interval = flush_interval
+    self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=max_queue)
+    self._task: Optional[asyncio.Task[None]] = None
+    self._stopping = asyncio.Event()
+
+  def submit(self, row: dict[str, Any]) -> None:
+    """로그 행 등록 (논블로킹, 큐가 가득 차면 버림)"""
+    try:
+      self._queue.put_nowait(row)
+    except asyncio.QueueFull:
+      log.warning("[COLLECTION LOG] 버퍼 초과로 로그 유실 data_type=%s", row.get("data_type"))
+
+  def start(self) -> None:
+    """백그라운드 flush 태스크 시작 (이벤트 루프 안에서 호출)"""
+    if self._task is None or self._task.done():
+      self._stopping.clear()
+      self._task = asyncio.get_running_loop().create_task(self._run(), name="collection-log-writer")
+      log.info("[COLLECTION LOG] write-behind 버퍼 시작 (batch=%s, interval=%ss)",
+               self._batch_size, self._flush_interval)
+
+  async def stop(self) -> None:
+    """종료 신호 후 태스크가 들고 있던 행과 큐에 남은 로그까지 기록하고 끝날 때까지 대기"""
+    if self._task is not None:
+      # 취소하면 큐에서 이미 꺼낸 행(flush_interval 대기 중/쓰는 중 배치)이 유실되므로 신호만 보냄
+      self._stopping.set()
+      await self._task
+      self._task = None
+    await self.flush()
+
+  async def flush(self) -> int:
+    """큐에 쌓인 로그를 모두 기록"""
+    written = 0
+    while not self._queue.empty():
+      batch = self._drain()
+      written += await self._write(batch)
+    return written
+
+  def _drain(self, first: Optional[dict[str, Any]] = None) -> List[dict[str, Any]]:
+    batch: List[dict[str, Any]] = [first] if first is not None else []
+    while len(batch) < self._batch_size:
+      try:
+        batch.append(self._queue.get_nowait())
+      except asyncio.QueueEmpty:
+        break
+    return batch
+
+  async def _run(self) -> None:
+    while True:
+      first = await self._next()
+      if first is None:
+        break
+      # 첫 행 도착 후 flush_interval 동안 모아서 한 번에 기록 (종료 신호가 오면 바로 기록)
+      if self._queue.qsize() < self._batch_size - 1 and not self._stopping.is_set():
+        try:
+          await asyncio.wait_for(self._stopping.wait(), timeout=self._flush_interval)
+        except asyncio.TimeoutError:
+          pass
+      await self._write(self._drain(first))
+    await self.flush()
+
+  async def _next(self) -> Optional[dict[str, Any]]:
+    """다음 로그 행 (종료 신호가 먼저 오면 None)"""
+    if self._stopping.is_set():
+      return None
+    getter = asyncio.ensure_future(self._queue.get())
+    stopper = asyncio.ensure_future(self._stopping.wait())
+    try:
+      await asyncio.wait({ getter, stopper }, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+      stopper.cancel()
+      if not getter.done():
+        getter.cancel()
+    return getter.result() if getter.done() and not getter.cancelled() else None
+
+  async def _write(self, batch: List[dict[str, Any]]) -> int:
+    if not batch:
+      return 0
+    async with get_session() as session:
+      try:
+        written = await insert_collection_logs(session, batch)
+        await session.commit()
+        return written
+      except Exception:
+        await session.rollback()
+        log.exception("[COLLECTION LOG] 수집 로그 기록 실패 (%s 건 유실)", len(batch))
+        return 0
+
+
+# 외부에서 바로 import 가능하도록 싱글톤 인스턴스 노출
+collection_log_writer = CollectionLogWriter()
@@ -0,0 +1,206 @@
+# src/infrastructure/collection/service/collection_tracker.py
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from datetime import date, datetime, timezone
+from typing import Any, AsyncIterator, Deque, Iterator, List, Optional
+
+from core.models import DataCollectionStatus
+from infrastructure.collection.service.collection_log_writer import collection_log_writer
+from infrastructure.tracing.tracer import StageBreakdown, flush_spans, record_breakdown, span
+
+log = logging.getLogger(__name__)
+
+# 현재 실행 중인 수집 작업 (API 호출 수 집계용)
+_current_run: ContextVar[Optional["CollectionRun"]] = ContextVar("collection_run", default=None)
+# 현재 처리 중인 종목 (동시 실행 태스크별로 분리)
+_current_item: ContextVar[Optional["ItemTiming"]] = ContextVar("collection_item", default=None)
+
+# 최근 실행 요약 (종목별 소요시간 등 DB 스키마에 없는 상세 정보)
+_RECENT_RUNS: Deque[dict[str, Any]] = deque(maxlen=100)
+
+# error_message 에 남길 실패 항목 최대 개수
+_MAX_FAILED_KEYS = 20
+
+
+class ItemTiming:
+  """종목(또는 파일) 단위 처리 결과"""
+  __slots__ = ("key", "seconds", "records", "api_calls", "failed")
+
+  def __init__(self, key: str) -> None:
+    self.key = key
+    self.seconds = 0.0
+    self.records = 0
+    self.api_calls = 0
+    self.failed = False
+
+
+class CollectionRun:
+  """
+  수집 작업 1회 실행 계측
+  - records_collected / records_failed / api_calls 누적
+  - track_item() 으로 종목 단위 소요시간/실패 기록
+  - stages: 실행 중 종료된 span(kis.request/parse/db) 이름별 시간 집계
+  """
+
+  def __init__(self, data_type: str, *, source_api: Optional[str], collection_date: date) -> None:
+    self.data_type = data_type
+    self.source_api = source_api
+    self.collection_date = collection_date
+    self.started_at = datetime.now(timezone.utc)
+    self.records_collected = 0
+    self.records_failed = 0
+    self.api_calls = 0
+    self.items: List[ItemTiming] = []
+    self.failed_keys: List[str] = []
+    self.stages = StageBreakdown()
+    self.trace_id: Optional[str] = None
+
+  def add_records(self, count: int) -> None:
+    self.records_collected += count
+
+  def add_failure(self, key: str, count: int = 1) -> None:
+    self.records_failed += count
+    if len(self.failed_keys) < _MAX_FAILED_KEYS:
+      self.failed_keys.append(key)
+
+  def record_api_call(self) -> None:
+    self.api_calls += 1
+    item = _current_item.get()
+    if item is not None:
+      item.api_calls += 1
+
+  @contextmanager
+  def track_item(self, key: str) -> Iterator[ItemTiming]:
+    """종목 단위 소요시간 측정 (예외 발생 시 실패로 기록 후 그대로 전파)"""
+    item = ItemTiming(key)
+    token = _current_item.set(item)
+    begin = time.perf_counter()
+    try:
+      yield item
+    except Exception:
+      item.failed = True
+      self.add_failure(key)
+      raise
+    finally:
+      item.seconds = time.perf_counter() - begin
+      _current_item.reset(token)
+      self.items.append(item)
+
+  def summary(self, *, status: DataCollectionStatus, seconds: float) -> dict[str, Any]:
+    """최근 실행 요약 (종목별 소요시간 분포 포함)"""
+    durations = sorted(i.seconds for i in self.items)
+
+    def _pct(p: float) -> Optional[float]:
+      if not durations:
+        return None
+      return round(durations[min(len(durations) - 1, int(p * len(durations)))], 4)
+
+    slowest = sorted(self.items, key=lambda i: i.seconds, reverse=True)[:5]
+    return {
+      "data_type": self.data_type,
+      "source_api": self.source_api,
+      "collection_date": self.collection_date.isoformat(),
+      "started_at": self.started_at.isoformat(),
+      "status": status.value,
+      "seconds": round(seconds, 3),
+      "records_collected": self.records_collected,
+      "records_failed": self.records_failed,
+      "api_calls": self.api_calls,
+      "items": len(self.items),
+      "item_seconds": { "p50": _pct(0.5), "p95": _pct(0.95), "max": _pct(1.0) },
+      "slowest_items": [{ "key": i.key, "seconds": round(i.seconds, 4)} for i in slowest],
+      "failed_keys": list(self.failed_keys),
+      "trace_id": self.trace_id,
+      "stages": self.stages.summary(seconds),
+    }
+
+
+def record_api_call() -> None:
+  """현재 수집 작업 컨텍스트에 외부 API 호출 1회 기록 (작업 밖이면 무시)"""
+  run = _current_run.get()
+  if run is not None:
+    run.record_api_call()
+
+
+def recent_runs(data_type: Optional[str] = None) -> List[dict[str, Any]]:
+  """최근 실행 요약 목록 (최신순)"""
+  return [r for r in reversed(_RECENT_RUNS) if data_type is None or r["data_type"] == data_type]
+
+
+def _status_of(run: CollectionRun, error: Optional[BaseException]) -> DataCollectionStatus:
+  if error is not None:
+    return DataCollectionStatus.FAILED
+  if run.records_failed and not run.records_collected:
+    return DataCollectionStatus.FAILED
+  if run.records_failed:
+    return DataCollectionStatus.PARTIAL
+  return DataCollectionStatus.SUCCESS
+
+
+@asynccontextmanager
+async def track_collection(
+    data_type: str,
+    *,
+    source_api: Optional[str] = None,
+    collection_date: Optional[date] = None,
+) -> AsyncIterator[CollectionRun]:
+  """
+  수집 작업 계측 컨텍스트
+  사용 예:
+      async with track_collection("daily_price", source_api="FHKST03010100", collection_date=end) as run:
+        with run.track_item(ticker):
+          ...
+        run.add_records(upserted)
+
+  종료 시 DataCollectionLog 행을 write-behind 버퍼에 등록 (DB 기록은 백그라운드)
+  실행 전체를 루트 span 으로 감싸고 하위 span 시간을 단계별로 집계 (recent_runs 의 stages)
+  """
+  run = CollectionRun(data_type, source_api=source_api, collection_date=collection_date or date.today())
+  token = _current_run.set(run)
+  begin = time.perf_counter()
+  error: Optional[BaseException] = None
+  try:
+    with span(f"collection.{data_type}", source_api=source_api,
+              collection_date=run.collection_date.isoformat()) as root, record_breakdown(run.stages):
+      run.trace_id = root.trace_id
+      try:
+        yield run
+      finally:
+        root.set_attribute("records.collected", run.records_collected)
+        root.set_attribute("records.failed", run.records_failed)
+        root.set_attribute("api_calls", run.api_calls)
+  except BaseException as e:
+    error = e
+    raise
+  finally:
+    _current_run.reset(token)
+    seconds = time.perf_counter() - begin
+    status = _status_of(run, error)
+
+    message: Optional[str] = None
+    if error is not None:
+      message = f"{type(error).__name__}: {error}"
+    elif run.failed_keys:
+      message = f"실패 항목: {', '.join(run.failed_keys)}"
+
+    collection_log_writer.submit({
+      "data_type": data_type,
+      "collection_date": run.collection_date,
+      "start_time": run.started_at,
+      "end_time": datetime.now(timezone.utc),
+      "status": status,
+      "records_collected": run.records_collected,
+      "records_failed": run.records_failed,
+      "error_message": message,
+      "source_api": source_api,
+      "execution_time_seconds": int(round(seconds)),
+    })
+    summary = run.summary(status=status, seconds=seconds)
+    _RECENT_RUNS.append(summary)
+    log.info("[COLLECTION] %s 실행 완료 status=%s, records=%s, failed=%s, api_calls=%s, %.2fs",
+             data_type, status.value, run.records_collected, run.records_failed, run.api_calls, seconds)
+    # 실행 단위 trace 를 바로 파일에 남김
+    flush_spans()
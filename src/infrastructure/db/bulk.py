@@ -0,0 +1,75 @@
+# src/infrastructure/db/bulk.py
+import logging
+from typing import Any, Iterable, Sequence
+from uuid import uuid4
+
+from sqlalchemy import Table
+from sqlalchemy.ext.asyncio import AsyncSession
+
+log = logging.getLogger(__name__)
+
+
+async def copy_upsert(
+    session: AsyncSession,
+    *,
+    table: Table,
+    columns: Sequence[str],
+    records: Iterable[Sequence[Any]],
+    conflict_columns: Sequence[str],
+    update_columns: Sequence[str] | None = None,
+    keep_existing_on_null: bool = False,
+) -> int:
+  """
+  COPY 기반 대량 UPSERT
+  - 임시 테이블에 asyncpg COPY(binary)로 적재 후 INSERT ... SELECT ... ON CONFLICT 한 번으로 반영
+  - VALUES 바인딩 파라미터 제한(32767) 없이 수십만 행을 한 번에 처리
+  - records 는 columns 순서와 동일한 튜플 시퀀스
+  - 한 배치 안에 conflict_columns 가 중복된 행이 있으면 안 됨 (호출 측에서 중복 제거)
+
+  Args:
+      table: 대상 테이블 (Model.__table__)
+      columns: 적재 컬럼 목록
+      records: 적재할 행 (columns 순서)
+      conflict_columns: ON CONFLICT 대상 컬럼 (유니크 키)
+      update_columns: 충돌 시 갱신할 컬럼 (None 이면 conflict_columns 제외 전체)
+      keep_existing_on_null: True 면 새 값이 NULL 인 컬럼은 기존 값 유지 (부분 행 병합용)
+  Returns:
+      COPY 한 행 수
+  """
+  records = records if isinstance(records, list) else list(records)
+  if not records:
+    return 0
+
+  if update_columns is None:
+    update_columns = [c for c in columns if c not in conflict_columns]
+
+  conn = await session.connection()
+  raw = await conn.get_raw_connection()
+  driver = raw.driver_connection  # asyncpg.Connection
+
+  tmp_name = f"_tmp_{table.name}_{uuid4().hex[:8]}"
+  col_sql = ", ".join(columns)
+  if keep_existing_on_null:
+    set_sql = ", ".join(f"{c} = COALESCE(EXCLUDED.{c}, {table.name}.{c})" for c in update_columns)
+  else:
+    set_sql = ", ".join(f"{c} = EXCLUDED.{c}" for c in update_columns)
+  if "updated_at" in table.columns and "updated_at" not in update_columns:
+    set_sql = f"{set_sql}, updated_at = now()" if set_sql else "updated_at = now()"
+  conflict_sql = (
+    f"ON CONFLICT ({', '.join(conflict_columns)}) DO UPDATE SET {set_sql}"
+    if set_sql else f"ON CONFLICT ({', '.join(conflict_columns)}) DO NOTHING"
+  )
+
+  # 세션 트랜잭션 안의 SAVEPOINT 로 실행 (커밋/롤백은 호출 측 세션이 결정)
+  # asyncpg driver.transaction() 은 세션이 아직 아무것도 실행하지 않았으면 독립 트랜잭션을 열고 커밋해 버리므로
+  # SQLAlchemy begin_nested 로 세션 트랜잭션 시작 + SAVEPOINT 를 보장 (실패 시 임시 테이블 생성도 함께 취소)
+  async with session.begin_nested():
+    await driver.execute(f"CREATE TEMP TABLE {tmp_name} (LIKE {table.name} INCLUDING DEFAULTS)")
+    await driver.copy_records_to_table(tmp_name, records=records, columns=list(columns))
+    await driver.execute(
+        f"INSERT INTO {table.name} ({col_sql}) SELECT {col_sql} FROM {tmp_name} {conflict_sql}"
+    )
+    await driver.execute(f"DROP TABLE {tmp_name}")
+
+  log.debug("COPY UPSERT 완료 table=%s, rows=%s", table.name, len(records))
+  return len(records)
@@ -1,13 +1,19 @@
 # src/infrastructure/db/session.py
 import logging
+import time
 from contextlib import asynccontextmanager
-from typing import Optional, AsyncIterator
+from typing import Any, Iterable, Optional, AsyncIterator
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from config.settings import settings
+from infrastructure.metrics.instruments import DB_POOL_CHECKOUT_WAIT_SECONDS, DB_POOL_CHECKOUT_ERRORS
+from infrastructure.metrics.registry import registry, CallbackGauge
+from infrastructure.tracing.tracer import span
 
 log = logging.getLogger(__name__)
 
@@ -20,11 +26,49 @@ class Base(DeclarativeBase):
   """모든 ORM 모델이 상속할 베이스 클래스"""
 
 
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+  """checkout 대기시간/실패를 메트릭으로 기록하는 커넥션 풀"""
+
+  def _do_get(self) -> Any:
+    begin = time.perf_counter()
+    try:
+      return super()._do_get()
+    except PoolTimeoutError:
+      DB_POOL_CHECKOUT_ERRORS.inc(reason="timeout")
+      raise
+    except Exception as e:
+      DB_POOL_CHECKOUT_ERRORS.inc(reason=type(e).__name__)
+      raise
+    finally:
+      DB_POOL_CHECKOUT_WAIT_SECONDS.observe(time.perf_counter() - begin)
+
+
+def _pool_stats() -> Iterable[tuple[tuple[str, ...], float]]:
+  """스크레이프 시점 커넥션 풀 상태 (엔진 생성 전이면 없음)"""
+  if _engine is None:
+    return []
+  pool = _engine.sync_engine.pool
+  if not isinstance(pool, AsyncAdaptedQueuePool):
+    return []
+  return [
+    (("size",), float(pool.size())),
+    (("checked_out",), float(pool.checkedout())),
+    (("checked_in",), float(pool.checkedin())),
+    (("overflow",), float(max(pool.overflow(), 0))),
+  ]
+
+
+registry.register(CallbackGauge(
+    "db_pool_connections", "커넥션 풀 상태별 연결 수", _pool_stats, ["state"],
+))
+
+
 def _create_engine() -> AsyncEngine:
   """AsyncEngine 생성"""
   return create_async_engine(
       settings.postgres_url,
       echo=False,  # SQL 로그 활성/비활성
+      poolclass=InstrumentedAsyncAdaptedQueuePool,
       pool_pre_ping=True,
       pool_size=10,
       max_overflow=30,
@@ -63,14 +107,17 @@ async def get_session() -> AsyncIterator[AsyncSession]:
   FastAPI 의존성 주입에서 사용
   """
   session = get_session_factory()()
-  try:
-    yield session
-  except Exception:
-    await session.rollback()
-    log.exception("DB 세션 오류로 롤백 수행")
-    raise
-  finally:
-    await session.close()
+  # 세션(트랜잭션) 구간 span (내부 UPSERT 등은 자식 span)
+  with span("db.session") as trace:
+    try:
+      yield session
+    except Exception:
+      trace.set_attribute("db.rollback", True)
+      await session.rollback()
+      log.exception("DB 세션 오류로 롤백 수행")
+      raise
+    finally:
+      await session.close()
 
 
 async def db_ping() -> bool:
@@ -89,7 +136,7 @@ async def create_tables() -> None:
   try:
     # 모든 모델을 import하여 메타데이터에 등록
     from core.models import (
-      Market, Sector, Stock, DailyPrice, MinutePrice,
+      Market, Sector, Stock, DailyPrice, MinutePrice, PriceAdjustmentFactor, PriceRollup,
       FinancialStatement, InvestmentIndicator, TechnicalIndicator,
       MarketIndex, DailyIndexPrice, MLRecommendation, DataCollectionLog
     )
@@ -107,7 +154,7 @@ async def drop_tables() -> None:
   """모든 테이블 삭제"""
   try:
     from core.models import (
-      Market, Sector, Stock, DailyPrice, MinutePrice,
+      Market, Sector, Stock, DailyPrice, MinutePrice, PriceAdjustmentFactor, PriceRollup,
       FinancialStatement, InvestmentIndicator, TechnicalIndicator,
       MarketIndex, DailyIndexPrice, MLRecommendation, DataCollectionLog
     )
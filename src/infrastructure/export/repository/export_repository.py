@@ -0,0 +1,76 @@
+# src/infrastructure/export/repository/export_repository.py
+from dataclasses import dataclass
+from datetime import date
+from typing import AsyncIterator, Optional, Sequence
+
+from sqlalchemy import Row, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.snapshot.repository.snapshot_repository import PRICE_SECTION, TECHNICAL_SECTION
+
+# 정수로 내보낼 컬럼 (나머지 숫자 컬럼은 float8)
+_INTEGER_COLUMNS = frozenset({ "volume", "volume_sma_20" })
+
+
+@dataclass(frozen=True)
+class ExportDataset:
+  """내보내기 대상 테이블 (키 컬럼 + 숫자 컬럼)"""
+  name: str
+  table: str
+  numeric_columns: tuple[str, ...]
+
+  @property
+  def columns(self) -> list[str]:
+    return ["stock_id", "ticker", "trade_date", *self.numeric_columns]
+
+  def is_integer(self, column: str) -> bool:
+    return column in _INTEGER_COLUMNS
+
+
+EXPORT_DATASETS: dict[str, ExportDataset] = {
+  "daily_price": ExportDataset(
+      name="daily_price", table="daily_price", numeric_columns=PRICE_SECTION.numeric_columns,
+  ),
+  "technical_indicator": ExportDataset(
+      name="technical_indicator", table="technical_indicator", numeric_columns=TECHNICAL_SECTION.numeric_columns,
+  ),
+}
+
+
+def _export_sql(dataset: ExportDataset) -> str:
+  select_columns = ",\n       ".join(
+      f"CAST(t.{c} AS {'bigint' if dataset.is_integer(c) else 'float8'}) AS {c}" for c in dataset.numeric_columns
+  )
+  # (stock_id, trade_date) 순서 → 종목별 시계열이 연속된 청크로 전달
+  return f"""
+SELECT t.stock_id,
+       s.ticker,
+       t.trade_date,
+       {select_columns}
+FROM {dataset.table} t
+JOIN stock s ON s.stock_id = t.stock_id
+WHERE t.trade_date BETWEEN :start AND :end
+  AND (CAST(:stock_ids AS integer[]) IS NULL OR t.stock_id = ANY(CAST(:stock_ids AS integer[])))
+ORDER BY t.stock_id, t.trade_date
+"""
+
+
+async def stream_export_rows(
+    session: AsyncSession,
+    dataset: ExportDataset,
+    *,
+    start: date,
+    end: date,
+    stock_ids: Optional[Sequence[int]] = None,
+    chunk_rows: int = 50_000,
+) -> AsyncIterator[list[Row]]:
+  """
+  서버측 커서로 chunk_rows 행씩 Row 목록 반환 (ORM 객체/Decimal 생성 없음)
+  - 행 순서는 dataset.columns
+  """
+  result = await session.stream(
+      text(_export_sql(dataset)).execution_options(yield_per=chunk_rows),
+      { "start": start, "end": end, "stock_ids": list(stock_ids) if stock_ids is not None else None },
+  )
+  async for partition in result.partitions(chunk_rows):
+    yield partition
@@ -0,0 +1,134 @@
+# src/infrastructure/export/service/export_service.py
+"""
+대량 시계열 내보내기 (연구용 패널 적재)
+- 서버측 커서 청크 → 컬럼 배열 → 바로 직렬화해 흘려보냄 (전체 결과를 메모리에 쌓지 않음)
+- arrow: Arrow IPC stream (레코드 배치 = 청크, zstd/lz4 버퍼 압축)
+    pyarrow.ipc.open_stream(resp.raw).read_pandas()
+- npz: 청크별 컬럼 .npy 를 담은 zip 스트림 (deflate)
+    np.load(BytesIO(resp.content)) → 'chunk_00000/close_price' ...
+"""
+import io
+import logging
+import zipfile
+from datetime import date
+from typing import AsyncIterator, Literal, Optional, Sequence
+
+import numpy as np
+import pyarrow as pa
+
+from infrastructure.db.session import get_session
+from infrastructure.export.repository.export_repository import ExportDataset, stream_export_rows
+from infrastructure.price.repository.adjustment_repository import PRICE_COLUMNS
+from infrastructure.price.service.price_read_service import adjustment_factor_cache
+
+log = logging.getLogger(__name__)
+
+ExportFormat = Literal["arrow", "npz"]
+ArrowCompression = Literal["zstd", "lz4", "none"]
+
+MEDIA_TYPES: dict[str, str] = {
+  "arrow": "application/vnd.apache.arrow.stream",
+  "npz": "application/zip",
+}
+
+
+def arrow_schema(dataset: ExportDataset) -> pa.Schema:
+  return pa.schema([
+    pa.field("stock_id", pa.int32()),
+    pa.field("ticker", pa.string()),
+    pa.field("trade_date", pa.date32()),
+    *(pa.field(c, pa.int64() if dataset.is_integer(c) else pa.float64()) for c in dataset.numeric_columns),
+  ])
+
+
+def _to_columns(dataset: ExportDataset, rows: Sequence[Sequence]) -> dict[str, np.ndarray]:
+  """청크 행 → 컬럼 배열 (NULL 은 float 컬럼 NaN(arrow 에서는 null), 정수 컬럼 0)"""
+  columns = list(zip(*rows))
+  out: dict[str, np.ndarray] = {
+    "stock_id": np.fromiter(columns[0], dtype=np.int32, count=len(rows)),
+    "ticker": np.array(columns[1], dtype=str),
+    "trade_date": np.array(columns[2], dtype="datetime64[D]"),
+  }
+  for name, values in zip(dataset.numeric_columns, columns[3:]):
+    if dataset.is_integer(name):
+      out[name] = np.array([0 if v is None else v for v in values], dtype=np.int64)
+    else:
+      out[name] = np.array(values, dtype=np.float64)  # None → NaN
+  return out
+
+
+class _ChunkSink(io.RawIOBase):
+  """직렬화 결과를 모았다가 청크 단위로 꺼내는 쓰기 전용 버퍼 (seek 불가 → zip 은 data descriptor 사용)"""
+
+  def __init__(self) -> None:
+    super().__init__()
+    self._buffer = bytearray()
+
+  def writable(self) -> bool:
+    return True
+
+  def write(self, data) -> int:
+    self._buffer += data
+    return len(data)
+
+  def drain(self) -> bytes:
+    data = bytes(self._buffer)
+    self._buffer.clear()
+    return data
+
+
+async def _adjust(columns: dict[str, np.ndarray]) -> None:
+  """원주가 컬럼에 누적 수정계수 적용 (제자리 변경)"""
+  table = await adjustment_factor_cache.get()
+  factor = table.factors(columns["stock_id"], columns["trade_date"])
+  for name in PRICE_COLUMNS:
+    columns[name] = columns[name] * factor
+  columns["volume"] = np.rint(columns["volume"] / factor).astype(np.int64)
+
+
+async def iter_export(
+    dataset: ExportDataset,
+    *,
+    start: date,
+    end: date,
+    stock_ids: Optional[Sequence[int]] = None,
+    fmt: ExportFormat = "arrow",
+    compression: ArrowCompression = "zstd",
+    adjusted: bool = False,
+    chunk_rows: int = 50_000,
+) -> AsyncIterator[bytes]:
+  """내보내기 바이트 스트림 (StreamingResponse body)"""
+  sink = _ChunkSink()
+  if fmt == "arrow":
+    options = pa.ipc.IpcWriteOptions(compression=None if compression == "none" else compression)
+    schema = arrow_schema(dataset)
+    writer = pa.ipc.new_stream(sink, schema, options=options)
+  else:
+    schema = None
+    writer = zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED, compresslevel=1)
+
+  rows_total = chunks = 0
+  try:
+    async with get_session() as session:
+      async for rows in stream_export_rows(
+          session, dataset, start=start, end=end, stock_ids=stock_ids, chunk_rows=chunk_rows
+      ):
+        columns = _to_columns(dataset, rows)
+        if adjusted and dataset.name == "daily_price":
+          await _adjust(columns)
+        if fmt == "arrow":
+          # from_pandas=True: float NaN → Arrow null
+          arrays = [pa.array(columns[f.name], type=f.type, from_pandas=True) for f in schema]
+          writer.write_batch(pa.record_batch(arrays, schema=schema))
+        else:
+          for name, values in columns.items():
+            with writer.open(f"chunk_{chunks:05d}/{name}.npy", mode="w", force_zip64=True) as fh:
+              np.lib.format.write_array(fh, values, allow_pickle=False)
+        rows_total += len(rows)
+        chunks += 1
+        yield sink.drain()
+    writer.close()
+    yield sink.drain()
+  finally:
+    log.info("[EXPORT] 내보내기 종료 dataset=%s, format=%s, 기간=%s~%s, rows=%s, chunks=%s",
+             dataset.name, fmt, start, end, rows_total, chunks)
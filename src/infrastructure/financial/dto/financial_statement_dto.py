@@ -0,0 +1,113 @@
+# src/infrastructure/financial/dto/financial_statement_dto.py
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+from core.models import PeriodType
+
+# 계정 코드(XBRL 태그) → financial_statement 컬럼 매핑
+# "_" 로 시작하는 항목은 파생 컬럼 계산용 보조 값 (적재하지 않음)
+ACCOUNT_CODE_MAP: dict[str, str] = {
+  # 손익계산서
+  "ifrs-full_Revenue": "revenue",
+  "ifrs_Revenue": "revenue",
+  "dart_OperatingIncomeLoss": "operating_income",
+  "ifrs-full_ProfitLoss": "net_income",
+  "ifrs_ProfitLoss": "net_income",
+  "ifrs-full_BasicEarningsLossPerShare": "eps",
+  "ifrs_BasicEarningsLossPerShare": "eps",
+  # 재무상태표
+  "ifrs-full_Assets": "total_assets",
+  "ifrs_Assets": "total_assets",
+  "ifrs-full_CurrentAssets": "current_assets",
+  "ifrs_CurrentAssets": "current_assets",
+  "ifrs-full_NoncurrentAssets": "non_current_assets",
+  "ifrs_NoncurrentAssets": "non_current_assets",
+  "ifrs-full_Liabilities": "total_liabilities",
+  "ifrs_Liabilities": "total_liabilities",
+  "ifrs-full_CurrentLiabilities": "current_liabilities",
+  "ifrs_CurrentLiabilities": "current_liabilities",
+  "ifrs-full_Equity": "shareholders_equity",
+  "ifrs_Equity": "shareholders_equity",
+  # 현금흐름표
+  "ifrs-full_CashFlowsFromUsedInOperatingActivities": "operating_cash_flow",
+  "ifrs_CashFlowsFromUsedInOperatingActivities": "operating_cash_flow",
+  "ifrs-full_CashFlowsFromUsedInInvestingActivities": "investing_cash_flow",
+  "ifrs_CashFlowsFromUsedInInvestingActivities": "investing_cash_flow",
+  "ifrs-full_CashFlowsFromUsedInFinancingActivities": "financing_cash_flow",
+  "ifrs_CashFlowsFromUsedInFinancingActivities": "financing_cash_flow",
+  # 파생 계산용 보조 값
+  "ifrs-full_PurchaseOfPropertyPlantAndEquipment": "_capex",
+  "ifrs_PurchaseOfPropertyPlantAndEquipment": "_capex",
+  "ifrs-full_DepreciationAndAmortisationExpense": "_depreciation_amortisation",
+  "ifrs-full_AdjustmentsForDepreciationAndAmortisationExpense": "_depreciation_amortisation",
+}
+
+# DART 보고서종류 → 기간 구분
+REPORT_PERIOD_MAP: dict[str, PeriodType] = {
+  "1분기보고서": PeriodType.Q1,
+  "반기보고서": PeriodType.Q2,
+  "3분기보고서": PeriodType.Q3,
+  "사업보고서": PeriodType.FY,
+}
+
+# financial_statement 적재 금액 컬럼
+STATEMENT_COLUMNS: list[str] = [
+  "revenue", "operating_income", "ebitda", "net_income", "eps",
+  "total_assets", "current_assets", "non_current_assets",
+  "total_liabilities", "current_liabilities", "shareholders_equity",
+  "operating_cash_flow", "investing_cash_flow", "financing_cash_flow", "free_cash_flow",
+]
+
+# 회계연도 누적(YTD) 값으로 저장되는 현금흐름 컬럼
+# DART 현금흐름표는 반기/3분기 금액을 기초부터 누적으로 공시 (손익계산서는 3개월 값 사용)
+# → 분기 단독 값은 지표 계산 시 같은 회계연도 직전 분기 누적값을 빼서 구함
+CUMULATIVE_COLUMNS: list[str] = [
+  "operating_cash_flow", "investing_cash_flow", "financing_cash_flow", "free_cash_flow",
+]
+
+# COPY 적재 컬럼 순서
+COPY_COLUMNS: list[str] = ["stock_id", "report_date", "period_type", "fiscal_year", *STATEMENT_COLUMNS]
+
+
+@dataclass
+class FinancialStatementDTO:
+  """
+  파일 한 개에서 모은 (종목, 기준일, 기간) 단위 재무제표
+  - 연결재무제표 값이 별도재무제표 값보다 우선
+  """
+  ticker: str
+  report_date: date
+  period_type: PeriodType
+  fiscal_year: int
+  values: Dict[str, Decimal] = field(default_factory=dict)
+  _priority: Dict[str, int] = field(default_factory=dict, repr=False)
+
+  def put(self, column: str, amount: Decimal, priority: int) -> None:
+    """우선순위가 같거나 높은 출처의 값만 반영"""
+    if priority >= self._priority.get(column, -1):
+      self.values[column] = amount
+      self._priority[column] = priority
+
+  def finalize(self) -> None:
+    """보조 값으로 EBITDA/FCF 파생 (원본 값이 있으면 유지)"""
+    v = self.values
+    if "ebitda" not in v and "operating_income" in v and "_depreciation_amortisation" in v:
+      v["ebitda"] = v["operating_income"] + abs(v["_depreciation_amortisation"])
+    if "free_cash_flow" not in v and "operating_cash_flow" in v and "_capex" in v:
+      v["free_cash_flow"] = v["operating_cash_flow"] - abs(v["_capex"])
+
+  def to_record(self, stock_id: int) -> tuple[Any, ...]:
+    """COPY_COLUMNS 순서의 튜플"""
+    return (
+      stock_id, self.report_date, self.period_type.value, self.fiscal_year,
+      *(self.values.get(c) for c in STATEMENT_COLUMNS),
+    )
+
+
+def fiscal_year_of(report_date: date, settlement_month: Optional[int]) -> int:
+  """결산월 기준 회계연도 (12월 결산이면 기준일 연도)"""
+  if not settlement_month or settlement_month == 12:
+    return report_date.year
+  return report_date.year if report_date.month <= settlement_month else report_date.year + 1
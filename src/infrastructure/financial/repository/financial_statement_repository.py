@@ -0,0 +1,33 @@
+# src/infrastructure/financial/repository/financial_statement_repository.py
+from typing import Any, Dict, List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models import FinancialStatement, Stock
+from infrastructure.db.bulk import copy_upsert
+from infrastructure.financial.dto.financial_statement_dto import COPY_COLUMNS
+
+
+async def get_stock_id_map(session: AsyncSession) -> Dict[str, int]:
+  """
+  ticker -> stock_id 매핑 반환 (전체 시장)
+  - 공시 파일에는 시장 구분 없이 종목코드만 있으므로 ticker 기준으로 매핑
+  """
+  rows = (await session.execute(select(Stock.ticker, Stock.stock_id))).all()
+  return { t: sid for (t, sid) in rows }
+
+
+async def upsert_financial_statements(session: AsyncSession, records: List[tuple[Any, ...]]) -> int:
+  """
+  FinancialStatement 대량 UPSERT (COPY + ON CONFLICT (stock_id, report_date, period_type))
+  - 재무상태표/손익계산서/현금흐름표가 서로 다른 파일로 들어오므로 NULL 값은 기존 값 유지
+  """
+  return await copy_upsert(
+      session,
+      table=FinancialStatement.__table__,
+      columns=COPY_COLUMNS,
+      records=records,
+      conflict_columns=["stock_id", "report_date", "period_type"],
+      keep_existing_on_null=True,
+  )
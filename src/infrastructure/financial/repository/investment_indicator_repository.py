@@ -0,0 +1,108 @@
+# src/infrastructure/financial/repository/investment_indicator_repository.py
+from datetime import date
+from typing import Any, List, Optional, Sequence
+
+import pandas as pd
+from sqlalchemy import select, func, Float, cast
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models import DailyPrice, FinancialStatement, InvestmentIndicator, Stock
+from infrastructure.db.bulk import copy_upsert
+
+# 재무제표 금액 컬럼 (재무제표 → 지표 계산 입력)
+STATEMENT_VALUE_COLUMNS: list[str] = [
+  "revenue", "operating_income", "ebitda", "net_income", "eps",
+  "total_assets", "current_assets", "non_current_assets",
+  "total_liabilities", "current_liabilities", "shareholders_equity",
+  "operating_cash_flow", "investing_cash_flow", "financing_cash_flow", "free_cash_flow",
+]
+
+# investment_indicator 적재 컬럼 (PK/타임스탬프 제외)
+INDICATOR_COLUMNS: list[str] = [
+  c.name for c in InvestmentIndicator.__table__.columns
+  if c.name not in ("investment_id", "created_at", "updated_at")
+]
+
+
+async def load_close_frame(
+    session: AsyncSession,
+    *,
+    start: date,
+    end: date,
+    stock_ids: Optional[Sequence[int]] = None,
+) -> pd.DataFrame:
+  """
+  daily_price 종가 조회 → DataFrame[stock_id, trade_date, close_price]
+  - Decimal 변환 비용을 피하기 위해 DB 에서 float8 로 캐스팅
+  """
+  query = (
+    select(DailyPrice.stock_id, DailyPrice.trade_date, cast(DailyPrice.close_price, Float).label("close_price"))
+    .where(DailyPrice.trade_date.between(start, end))
+  )
+  if stock_ids is not None:
+    query = query.where(DailyPrice.stock_id.in_(list(stock_ids)))
+  rows = (await session.execute(query)).all()
+  return pd.DataFrame(rows, columns=["stock_id", "trade_date", "close_price"])
+
+
+async def load_statement_frame(
+    session: AsyncSession,
+    *,
+    until: date,
+    stock_ids: Optional[Sequence[int]] = None,
+) -> pd.DataFrame:
+  """
+  until 이전(포함) 보고서 기준일의 재무제표 조회
+  → DataFrame[stock_id, report_date, period_type, fiscal_year, *STATEMENT_VALUE_COLUMNS]
+  """
+  value_cols = [cast(getattr(FinancialStatement, c), Float).label(c) for c in STATEMENT_VALUE_COLUMNS]
+  query = (
+    select(
+        FinancialStatement.stock_id,
+        FinancialStatement.report_date,
+        FinancialStatement.period_type,
+        FinancialStatement.fiscal_year,
+        *value_cols,
+    )
+    .where(FinancialStatement.report_date <= until)
+  )
+  if stock_ids is not None:
+    query = query.where(FinancialStatement.stock_id.in_(list(stock_ids)))
+  rows = (await session.execute(query)).all()
+  frame = pd.DataFrame(
+      rows, columns=["stock_id", "report_date", "period_type", "fiscal_year", *STATEMENT_VALUE_COLUMNS]
+  )
+  # Enum → 문자열 ("Q1".."FY")
+  frame["period_type"] = frame["period_type"].map(lambda p: getattr(p, "value", p))
+  return frame
+
+
+async def load_listing_shares_frame(session: AsyncSession) -> pd.DataFrame:
+  """상장주식수 조회 → DataFrame[stock_id, listing_shares]"""
+  query = select(Stock.stock_id, Stock.listing_shares).where(Stock.listing_shares.is_not(None))
+  rows = (await session.execute(query)).all()
+  return pd.DataFrame(rows, columns=["stock_id", "listing_shares"])
+
+
+async def find_latest_price_date(session: AsyncSession) -> Optional[date]:
+  """daily_price 최신 거래일"""
+  return (await session.execute(select(func.max(DailyPrice.trade_date)))).scalar_one_or_none()
+
+
+async def find_earliest_price_date(session: AsyncSession) -> Optional[date]:
+  """daily_price 최초 거래일"""
+  return (await session.execute(select(func.min(DailyPrice.trade_date)))).scalar_one_or_none()
+
+
+async def upsert_investment_indicators(session: AsyncSession, records: List[tuple[Any, ...]]) -> int:
+  """
+  InvestmentIndicator 대량 UPSERT (COPY + ON CONFLICT (stock_id, report_date))
+  - records 는 INDICATOR_COLUMNS 순서의 튜플
+  """
+  return await copy_upsert(
+      session,
+      table=InvestmentIndicator.__table__,
+      columns=INDICATOR_COLUMNS,
+      records=records,
+      conflict_columns=["stock_id", "report_date"],
+  )
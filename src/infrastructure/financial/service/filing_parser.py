@@ -0,0 +1,220 @@
+# src/infrastructure/financial/service/filing_parser.py
+"""
+재무 공시 일괄 파일 스트리밍 파서
+- zip / csv / tsv / txt 를 한 줄씩 읽어 (종목, 기준일, 기간) 단위로 집계
+- 파일 전체를 메모리에 올리지 않음 (메모리 사용량 = 파일 내 재무제표 수에 비례)
+- 프로세스 풀 워커에서 실행되므로 DB/네트워크 의존 없음
+- 현금흐름 컬럼(CUMULATIVE_COLUMNS)은 공시 그대로 회계연도 누적값 저장 (분기 환산은 지표 계산 시)
+"""
+import csv
+import io
+import logging
+import zipfile
+from datetime import date
+from pathlib import Path
+from typing import IO, Dict, Iterator, List, Optional, Tuple
+
+from core.models import PeriodType
+from infrastructure.financial.dto.financial_statement_dto import (
+  ACCOUNT_CODE_MAP, REPORT_PERIOD_MAP, STATEMENT_COLUMNS, FinancialStatementDTO, fiscal_year_of
+)
+from utils.decimal_util import to_decimal
+
+log = logging.getLogger(__name__)
+
+FILING_SUFFIXES = (".zip", ".csv", ".tsv", ".txt")
+_TEXT_SUFFIXES = (".csv", ".tsv", ".txt")
+
+# 표준화 CSV 헤더 (XBRL 변환 결과 등)
+_NORMALIZED_HEADER = { "ticker", "report_date", "period_type", "account_code", "amount" }
+_STATEMENT_COLUMN_SET = frozenset(STATEMENT_COLUMNS)
+# 현금흐름표 금액이 분기 단독 값과 다른(누적) 보고서
+_YTD_ONLY_PERIODS = frozenset({ PeriodType.Q2, PeriodType.Q3 })
+
+StatementKey = Tuple[str, date, PeriodType]
+
+
+def _detect_encoding(head: bytes) -> str:
+  """UTF-8(BOM 포함) 우선, 실패 시 CP949 (DART 일괄 다운로드 기본 인코딩)"""
+  try:
+    head.decode("utf-8")
+    return "utf-8-sig"
+  except UnicodeDecodeError as e:
+    # 샘플 끝에서 멀티바이트 문자가 잘린 경우는 UTF-8 로 간주
+    if e.start >= len(head) - 3:
+      return "utf-8-sig"
+    return "cp949"
+
+
+def _open_text(raw: IO[bytes]) -> io.TextIOWrapper:
+  """바이너리 스트림 → 인코딩 감지된 텍스트 스트림 (버퍼 단위 읽기)"""
+  # BufferedReader / ZipExtFile 모두 peek 지원 → 소비 없이 앞부분만 확인
+  head = raw.peek(4096)[:4096] if hasattr(raw, "peek") else b""
+  return io.TextIOWrapper(raw, encoding=_detect_encoding(head), errors="replace", newline="")
+
+
+def _parse_date(s: str) -> Optional[date]:
+  """'YYYY-MM-DD' / 'YYYYMMDD' / 'YYYY.MM.DD' → date"""
+  digits = "".join(ch for ch in s if ch.isdigit())
+  if len(digits) != 8:
+    return None
+  return date(int(digits[0:4]), int(digits[4:6]), int(digits[6:8]))
+
+
+def _parse_ticker(s: str) -> str:
+  """'[005930]' → '005930'"""
+  return s.strip().strip("[]").strip()
+
+
+def _iter_rows(text: io.TextIOWrapper) -> Iterator[List[str]]:
+  """구분자(탭/콤마) 감지 후 행 단위 순회"""
+  first = text.readline()
+  if not first:
+    return
+  delimiter = "\t" if first.count("\t") >= first.count(",") else ","
+  yield next(csv.reader([first], delimiter=delimiter))
+  yield from csv.reader(text, delimiter=delimiter)
+
+
+def _collect_dart(header: List[str], rows: Iterator[List[str]], out: Dict[StatementKey, FinancialStatementDTO]) -> int:
+  """DART 재무정보 일괄다운로드 형식 (재무제표종류/종목코드/결산기준일/보고서종류/항목코드/당기...)"""
+  idx = { name.strip(): i for i, name in enumerate(header) }
+  try:
+    i_kind, i_ticker = idx["재무제표종류"], idx["종목코드"]
+    i_date, i_report, i_code = idx["결산기준일"], idx["보고서종류"], idx["항목코드"]
+  except KeyError:
+    return 0
+  i_month = idx.get("결산월")
+  # 첫 번째 "당기" 컬럼 = 당기 금액
+  # 손익계산서는 "당기 반기 3개월" 이 먼저 와서 분기 값, 현금흐름표는 "당기 반기" 하나뿐이라 누적값
+  i_amount = next((i for i, name in enumerate(header) if name.strip().startswith("당기")), None)
+  if i_amount is None:
+    return 0
+
+  width = max(i_kind, i_ticker, i_date, i_report, i_code, i_amount) + 1
+  mapped = 0
+  for row in rows:
+    if len(row) < width:
+      continue
+    column = ACCOUNT_CODE_MAP.get(row[i_code].strip())
+    if column is None:
+      continue
+    period = REPORT_PERIOD_MAP.get(row[i_report].strip())
+    report_date = _parse_date(row[i_date])
+    amount = to_decimal(row[i_amount])
+    if period is None or report_date is None or amount is None:
+      continue
+
+    # 현금흐름표 감가상각비(조정항목)는 반기/3분기에 누적값이라 분기 영업이익과 더해 EBITDA 를 만들 수 없음
+    if column == "_depreciation_amortisation" and "현금흐름" in row[i_kind] and period in _YTD_ONLY_PERIODS:
+      continue
+
+    ticker = _parse_ticker(row[i_ticker])
+    key = (ticker, report_date, period)
+    dto = out.get(key)
+    if dto is None:
+      month = row[i_month].strip() if i_month is not None and i_month < len(row) else ""
+      dto = FinancialStatementDTO(
+          ticker=ticker, report_date=report_date, period_type=period,
+          fiscal_year=fiscal_year_of(report_date, int(month) if month.isdigit() else None),
+      )
+      out[key] = dto
+    # 연결재무제표 우선
+    dto.put(column, amount, priority=1 if "연결" in row[i_kind] else 0)
+    mapped += 1
+  return mapped
+
+
+def _collect_normalized(
+    header: List[str], rows: Iterator[List[str]], out: Dict[StatementKey, FinancialStatementDTO]
+) -> int:
+  """
+  표준화 CSV 형식 (ticker, report_date, period_type, account_code, amount[, fiscal_year])
+  - 현금흐름 계정은 DART 와 같이 회계연도 누적값이어야 함
+  """
+  idx = { name.strip().lower(): i for i, name in enumerate(header) }
+  i_ticker, i_date, i_period = idx["ticker"], idx["report_date"], idx["period_type"]
+  i_code, i_amount = idx["account_code"], idx["amount"]
+  i_year = idx.get("fiscal_year")
+  width = max(i_ticker, i_date, i_period, i_code, i_amount) + 1
+
+  mapped = 0
+  for row in rows:
+    if len(row) < width:
+      continue
+    code = row[i_code].strip()
+    # 컬럼명을 그대로 계정 코드로 쓴 경우도 허용
+    column = ACCOUNT_CODE_MAP.get(code) or (code if code in _STATEMENT_COLUMN_SET else None)
+    report_date = _parse_date(row[i_date])
+    amount = to_decimal(row[i_amount])
+    try:
+      period = PeriodType(row[i_period].strip().upper())
+    except ValueError:
+      continue
+    if column is None or report_date is None or amount is None:
+      continue
+
+    ticker = _parse_ticker(row[i_ticker])
+    key = (ticker, report_date, period)
+    dto = out.get(key)
+    if dto is None:
+      year = row[i_year].strip() if i_year is not None and i_year < len(row) else ""
+      dto = FinancialStatementDTO(
+          ticker=ticker, report_date=report_date, period_type=period,
+          fiscal_year=int(year) if year.isdigit() else report_date.year,
+      )
+      out[key] = dto
+    dto.put(column, amount, priority=0)
+    mapped += 1
+  return mapped
+
+
+def _collect_stream(name: str, raw: IO[bytes], out: Dict[StatementKey, FinancialStatementDTO]) -> int:
+  """텍스트 파일 한 개 스트리밍 파싱"""
+  text = _open_text(raw)
+  rows = _iter_rows(text)
+  header = next(rows, None)
+  if header is None:
+    return 0
+  names = { h.strip() for h in header }
+  if "항목코드" in names:
+    return _collect_dart(header, rows, out)
+  if _NORMALIZED_HEADER <= { h.lower() for h in names }:
+    return _collect_normalized(header, rows, out)
+  log.warning("[FILING PARSER] 지원하지 않는 파일 형식 skip: %s", name)
+  return 0
+
+
+def parse_filing_file(path: str) -> List[FinancialStatementDTO]:
+  """
+  공시 파일 한 개(zip 이면 내부 텍스트 파일 전체) → FinancialStatementDTO 목록
+  - ProcessPoolExecutor 워커 진입점 (인자/반환값 모두 pickle 가능)
+  """
+  out: Dict[StatementKey, FinancialStatementDTO] = { }
+  file_path = Path(path)
+  mapped = 0
+
+  if file_path.suffix.lower() == ".zip":
+    with zipfile.ZipFile(file_path) as archive:
+      for member in archive.infolist():
+        if member.is_dir() or not member.filename.lower().endswith(_TEXT_SUFFIXES):
+          continue
+        with archive.open(member) as raw:
+          mapped += _collect_stream(f"{path}:{member.filename}", raw, out)
+  else:
+    with open(file_path, "rb") as raw:
+      mapped += _collect_stream(path, raw, out)
+
+  for dto in out.values():
+    dto.finalize()
+  log.debug("[FILING PARSER] %s 파싱 완료 (계정 %s 건, 재무제표 %s 건)", path, mapped, len(out))
+  return list(out.values())
+
+
+def iter_filing_files(root: Path) -> Iterator[Path]:
+  """root 하위 공시 파일 순회 (이름순)"""
+  if not root.exists():
+    return
+  for p in sorted(root.rglob("*")):
+    if p.is_file() and p.suffix.lower() in FILING_SUFFIXES and not p.name.startswith("."):
+      yield p
@@ -0,0 +1,149 @@
+# src/infrastructure/financial/service/financial_statement_loader.py
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from config.settings import settings
+from infrastructure.collection.service.collection_tracker import track_collection
+from infrastructure.db.session import get_session
+from infrastructure.financial.dto.financial_statement_dto import FinancialStatementDTO
+from infrastructure.financial.repository.financial_statement_repository import (
+  get_stock_id_map, upsert_financial_statements
+)
+from infrastructure.financial.service.filing_parser import iter_filing_files, parse_filing_file
+
+log = logging.getLogger(__name__)
+
+# 공시 일괄 파일 적재 위치: {storage_root}/filings
+FILING_DIR_NAME = "filings"
+# 적재 완료 파일 기록 (파일 크기/수정시각이 같으면 재적재 skip)
+_MANIFEST_NAME = ".financial_loader_manifest.json"
+
+
+def _filing_root() -> Path:
+  return Path(settings.storage_root) / FILING_DIR_NAME
+
+
+def _load_manifest(root: Path) -> Dict[str, List[float]]:
+  path = root / _MANIFEST_NAME
+  if not path.exists():
+    return { }
+  try:
+    return json.loads(path.read_text(encoding="utf-8"))
+  except (OSError, ValueError):
+    log.warning("[FINANCIAL LOADER] manifest 읽기 실패, 전체 재적재: %s", path)
+    return { }
+
+
+def _save_manifest(root: Path, manifest: Dict[str, List[float]]) -> None:
+  path = root / _MANIFEST_NAME
+  tmp = path.with_suffix(".tmp")
+  tmp.write_text(json.dumps(manifest, ensure_ascii=False, indent=0), encoding="utf-8")
+  tmp.replace(path)
+
+
+def _signature(path: Path) -> List[float]:
+  stat = path.stat()
+  return [float(stat.st_size), stat.st_mtime]
+
+
+def _to_records(dtos: List[FinancialStatementDTO], ticker_to_id: Dict[str, int]) -> Tuple[List[tuple[Any, ...]], int]:
+  """DTO → COPY 레코드 (미등록 종목은 제외)"""
+  records: List[tuple[Any, ...]] = []
+  skipped = 0
+  for dto in dtos:
+    stock_id = ticker_to_id.get(dto.ticker)
+    if stock_id is None:
+      skipped += 1
+      continue
+    records.append(dto.to_record(stock_id))
+  return records, skipped
+
+
+async def load_financial_statements(
+    *,
+    root: Optional[str] = None,
+    workers: Optional[int] = None,
+    force: bool = False,
+) -> int:
+  """
+  {storage_root}/filings 하위 공시 일괄 파일 → financial_statement UPSERT
+  - 파일 단위로 프로세스 풀에서 병렬 파싱, 파싱이 끝난 파일부터 순서대로 COPY 적재
+  - 이미 적재한 파일(크기/수정시각 동일)은 skip (force=True 면 전체 재적재)
+
+  Returns:
+      UPSERT 한 재무제표 행 수
+  """
+  async with track_collection("financial_statement", source_api="filing_archive") as run:
+    root_path = Path(root) if root else _filing_root()
+    manifest = { } if force else _load_manifest(root_path)
+
+    pending: List[Path] = []
+    for path in iter_filing_files(root_path):
+      rel = str(path.relative_to(root_path))
+      if manifest.get(rel) == _signature(path):
+        continue
+      pending.append(path)
+
+    if not pending:
+      log.info("[FINANCIAL LOADER] 적재할 신규 공시 파일이 없습니다. root=%s", root_path)
+      return 0
+
+    async with get_session() as session:
+      ticker_to_id = await get_stock_id_map(session)
+
+    loop = asyncio.get_running_loop()
+    max_workers = workers or max(1, min(len(pending), (os.cpu_count() or 2) - 1))
+    total = 0
+    failed = 0
+
+    # 파싱 완료 후 적재 대기 중인 결과 수 제한 (메모리 상한)
+    window = asyncio.Semaphore(max_workers * 2)
+
+    # fork 시 이벤트 루프/DB·Redis 커넥션 풀이 복제되므로 spawn 사용 (scheduler process_runner 와 동일)
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+
+      async def _parse(path: Path) -> Tuple[Path, Optional[List[FinancialStatementDTO]]]:
+        await window.acquire()
+        try:
+          return path, await loop.run_in_executor(pool, parse_filing_file, str(path))
+        except Exception:
+          log.exception("[FINANCIAL LOADER] 파싱 실패 file=%s", path)
+          return path, None
+
+      for next_done in asyncio.as_completed([_parse(p) for p in pending]):
+        path, dtos = await next_done
+        if dtos is None:
+          failed += 1
+          run.add_failure(path.name)
+          window.release()
+          continue
+
+        records, skipped = _to_records(dtos, ticker_to_id)
+        del dtos
+        async with get_session() as session:
+          try:
+            upserted = await upsert_financial_statements(session, records)
+            await session.commit()
+          except Exception:
+            await session.rollback()
+            failed += 1
+            run.add_failure(path.name)
+            log.exception("[FINANCIAL LOADER] upsert 트랜잭션 실패 (rollback) file=%s", path)
+            continue
+          finally:
+            window.release()
+
+        total += upserted
+        run.add_records(upserted)
+        manifest[str(path.relative_to(root_path))] = _signature(path)
+        _save_manifest(root_path, manifest)
+        log.info("[FINANCIAL LOADER] %s 적재 완료 (upserted=%s, 미등록 종목 skip=%s)", path.name, upserted, skipped)
+
+    log.info("[FINANCIAL LOADER] 완료 files=%s, failed=%s, upserted=%s", len(pending), failed, total)
+    return total
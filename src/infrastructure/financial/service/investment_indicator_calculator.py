@@ -0,0 +1,237 @@
+# src/infrastructure/financial/service/investment_indicator_calculator.py
+"""
+투자지표 벡터 연산
+- 재무제표(보고서 기준일 as-of) × 일별 종가 × 상장주식수 를 전 종목 한 번에 조인/계산
+- 종목/일자 단위 파이썬 루프 없음 (pandas merge_asof + NumPy 연산)
+"""
+from typing import Any, List
+
+import numpy as np
+import pandas as pd
+
+from infrastructure.financial.dto.financial_statement_dto import CUMULATIVE_COLUMNS
+from infrastructure.financial.repository.investment_indicator_repository import (
+  STATEMENT_VALUE_COLUMNS, INDICATOR_COLUMNS
+)
+
+# 기간 합산(손익/현금흐름) 컬럼 → TTM 으로 연환산
+FLOW_COLUMNS: list[str] = [
+  "revenue", "operating_income", "ebitda", "net_income", "eps",
+  "operating_cash_flow", "investing_cash_flow", "financing_cash_flow", "free_cash_flow",
+]
+# 시점(재무상태표) 컬럼 → 보고서 기준일 값 그대로 사용
+STOCK_COLUMNS: list[str] = [c for c in STATEMENT_VALUE_COLUMNS if c not in FLOW_COLUMNS]
+
+_QUARTERS = ["Q1", "Q2", "Q3", "Q4"]
+
+# DECIMAL(p, s) 의 정수부 한계 → 초과 값은 NULL 처리
+_LIMIT_18_6 = 1e12
+_LIMIT_8_4 = 1e4
+
+
+def _quarterize_cumulative(statements: pd.DataFrame) -> pd.DataFrame:
+  """
+  누적(YTD) 저장 현금흐름 컬럼 → 분기 단독 값: Qn = Qn 누적 - Q(n-1) 누적 (같은 종목/회계연도)
+  - Q1 은 그대로, 직전 분기가 없으면 분기 값을 알 수 없으므로 NaN
+  - FY 는 연간 값 그대로 (_derive_q4 의 FY - (Q1+Q2+Q3) 가 Q3 누적을 빼는 것과 같아짐)
+  """
+  quarter = statements["period_type"].map({ q: n for n, q in enumerate(_QUARTERS, start=1) })
+  quarterly = statements[quarter.notna()].assign(_quarter=quarter)
+  if quarterly.empty:
+    return statements.copy()
+  quarterly = quarterly.sort_values(["stock_id", "fiscal_year", "_quarter"], kind="stable")
+  grouped = quarterly.groupby(["stock_id", "fiscal_year"], sort=False)
+  prev = grouped[CUMULATIVE_COLUMNS].shift(1)
+  prev_quarter = grouped["_quarter"].shift(1)
+
+  single = quarterly[CUMULATIVE_COLUMNS] - prev
+  first = quarterly["_quarter"] == 1
+  single[first] = quarterly.loc[first, CUMULATIVE_COLUMNS]
+  single[~first & (prev_quarter != quarterly["_quarter"] - 1)] = np.nan
+
+  out = statements.copy()
+  out.loc[single.index, CUMULATIVE_COLUMNS] = single
+  return out
+
+
+def _derive_q4(statements: pd.DataFrame) -> pd.DataFrame:
+  """
+  사업보고서(FY)만 있는 4분기를 보강: Q4 = FY - (Q1 + Q2 + Q3)
+  - 같은 회계연도 Q1~Q3 가 모두 있고 Q4 가 없는 경우만 생성
+  - 컬럼별로 Q1~Q3 값이 하나라도 비면 해당 컬럼 Q4 는 NaN (부분 합을 빼면 Q4 가 부풀려지므로)
+  """
+  fy = statements[statements["period_type"] == "FY"]
+  q123 = statements[statements["period_type"].isin(_QUARTERS[:3])]
+  has_q4 = statements.loc[statements["period_type"] == "Q4", ["stock_id", "fiscal_year"]]
+
+  grouped = q123.groupby(["stock_id", "fiscal_year"])
+  sums = grouped[FLOW_COLUMNS].sum(min_count=3)
+  counts = grouped.size().rename("n_quarters")
+  q123_sum = sums.join(counts).reset_index()
+  q123_sum = q123_sum[q123_sum["n_quarters"] == 3]
+
+  q4 = fy.merge(q123_sum, on=["stock_id", "fiscal_year"], suffixes=("", "_q123"))
+  q4 = q4.merge(has_q4, on=["stock_id", "fiscal_year"], how="left", indicator=True)
+  q4 = q4[q4["_merge"] == "left_only"]
+  for col in FLOW_COLUMNS:
+    q4[col] = q4[col] - q4[f"{col}_q123"]
+  q4["period_type"] = "Q4"
+  return q4[statements.columns]
+
+
+def annualize_statements(statements: pd.DataFrame) -> pd.DataFrame:
+  """
+  재무제표 → (stock_id, report_date) 별 연환산 재무 프레임
+  - 손익/현금흐름: 연속 4개 분기 합(TTM), 4개 분기가 없으면 사업보고서(FY) 값
+    (누적 저장된 현금흐름 컬럼은 먼저 분기 단독 값으로 환산)
+  - 재무상태표: 보고서 기준일 값
+  """
+  if statements.empty:
+    return pd.DataFrame(columns=["stock_id", "report_date", *STATEMENT_VALUE_COLUMNS])
+
+  statements = _quarterize_cumulative(statements)
+  statements["report_date"] = pd.to_datetime(statements["report_date"])
+
+  quarterly = pd.concat(
+      [statements[statements["period_type"].isin(_QUARTERS)], _derive_q4(statements)],
+      ignore_index=True,
+  ).sort_values(["stock_id", "report_date"], kind="stable")
+
+  # 연속 4개 분기 합산 (그룹 내 shift 로 벡터화)
+  grouped = quarterly.groupby("stock_id", sort=False)
+  ttm = quarterly[FLOW_COLUMNS].copy()
+  for lag in (1, 2, 3):
+    ttm += grouped[FLOW_COLUMNS].shift(lag)
+  # 중간 분기 누락(간격 > 약 1년) 구간은 TTM 무효
+  span = quarterly["report_date"] - grouped["report_date"].shift(3)
+  ttm.loc[~(span <= pd.Timedelta(days=300))] = np.nan
+
+  quarterly_annual = quarterly[["stock_id", "report_date", *STOCK_COLUMNS]].copy()
+  quarterly_annual[FLOW_COLUMNS] = ttm
+  quarterly_annual = quarterly_annual[ttm["revenue"].notna() | ttm["net_income"].notna()]
+
+  # TTM 이 없는 기준일은 사업보고서 값 사용
+  fy = statements.loc[statements["period_type"] == "FY", ["stock_id", "report_date", *STATEMENT_VALUE_COLUMNS]]
+  fy = fy.merge(quarterly_annual[["stock_id", "report_date"]], on=["stock_id", "report_date"],
+                how="left", indicator=True)
+  fy = fy[fy["_merge"] == "left_only"].drop(columns="_merge")
+
+  annual = pd.concat([quarterly_annual, fy], ignore_index=True)
+  annual = annual.sort_values(["stock_id", "report_date"], kind="stable")
+  return annual.drop_duplicates(["stock_id", "report_date"], keep="last").reset_index(drop=True)
+
+
+def _with_prior_year(annual: pd.DataFrame) -> pd.DataFrame:
+  """직전 연도(약 1년 전 기준일) 매출/순이익을 붙여 성장률 계산 입력 생성"""
+  prior = annual[["stock_id", "report_date", "revenue", "net_income"]].rename(
+      columns={ "revenue": "prior_revenue", "net_income": "prior_net_income", "report_date": "prior_date" }
+  )
+  left = annual.assign(lookup_date=annual["report_date"] - pd.Timedelta(days=365)).sort_values("lookup_date")
+  merged = pd.merge_asof(
+      left, prior.sort_values("prior_date"),
+      left_on="lookup_date", right_on="prior_date", by="stock_id",
+      direction="nearest", tolerance=pd.Timedelta(days=45),
+  )
+  return merged.drop(columns=["lookup_date", "prior_date"])
+
+
+def _ratio(num: np.ndarray, den: np.ndarray, *, scale: float = 1.0, positive_den: bool = True) -> np.ndarray:
+  """0/음수 분모를 NaN 처리한 나눗셈"""
+  valid = den > 0 if positive_den else den != 0
+  out = np.full(num.shape, np.nan, dtype=np.float64)
+  np.divide(num, den, out=out, where=valid)
+  return out * scale
+
+
+def compute_investment_indicators(
+    closes: pd.DataFrame,
+    statements: pd.DataFrame,
+    listing_shares: pd.DataFrame,
+) -> pd.DataFrame:
+  """
+  일별 투자지표 계산
+  Args:
+      closes: DataFrame[stock_id, trade_date, close_price]
+      statements: DataFrame[stock_id, report_date, period_type, fiscal_year, *STATEMENT_VALUE_COLUMNS]
+      listing_shares: DataFrame[stock_id, listing_shares]
+  Returns:
+      DataFrame[INDICATOR_COLUMNS] (report_date = 거래일)
+  """
+  if closes.empty:
+    return pd.DataFrame(columns=INDICATOR_COLUMNS)
+
+  annual = annualize_statements(statements)
+  if annual.empty:
+    return pd.DataFrame(columns=INDICATOR_COLUMNS)
+  annual = _with_prior_year(annual)
+
+  prices = closes.merge(listing_shares, on="stock_id", how="inner")
+  prices["trade_date"] = pd.to_datetime(prices["trade_date"])
+
+  # 거래일 기준 가장 최근(as-of) 재무 프레임 조인
+  frame = pd.merge_asof(
+      prices.sort_values("trade_date"),
+      annual.sort_values("report_date"),
+      left_on="trade_date", right_on="report_date", by="stock_id",
+      direction="backward",
+  )
+  frame = frame[frame["report_date"].notna()]
+  if frame.empty:
+    return pd.DataFrame(columns=INDICATOR_COLUMNS)
+
+  col = { c: frame[c].to_numpy(dtype=np.float64, na_value=np.nan) for c in [
+    "close_price", "listing_shares", *STATEMENT_VALUE_COLUMNS, "prior_revenue", "prior_net_income",
+  ] }
+  market_cap = col["close_price"] * col["listing_shares"]
+  # 현금성자산 컬럼이 없어 EV = 시가총액 + 총부채 로 근사
+  enterprise_value = market_cap + np.nan_to_num(col["total_liabilities"])
+  invested_capital = col["shareholders_equity"] + col["total_liabilities"] - col["current_liabilities"]
+
+  out = pd.DataFrame({
+    "stock_id": frame["stock_id"].to_numpy(),
+    "report_date": frame["trade_date"].dt.date.to_numpy(),
+    # 밸류에이션
+    "per": _ratio(market_cap, col["net_income"]),
+    "pbr": _ratio(market_cap, col["shareholders_equity"]),
+    "pcr": _ratio(market_cap, col["operating_cash_flow"]),
+    "psr": _ratio(market_cap, col["revenue"]),
+    "ev_ebitda": _ratio(enterprise_value, col["ebitda"]),
+    # 수익성 (%)
+    "roe": _ratio(col["net_income"], col["shareholders_equity"], scale=100),
+    "roa": _ratio(col["net_income"], col["total_assets"], scale=100),
+    "roic": _ratio(col["operating_income"], invested_capital, scale=100),
+    "gross_margin": np.nan,  # 매출총이익 컬럼 없음
+    "operating_margin": _ratio(col["operating_income"], col["revenue"], scale=100),
+    "net_margin": _ratio(col["net_income"], col["revenue"], scale=100),
+    # 안정성 (%)
+    "debt_ratio": _ratio(col["total_liabilities"], col["shareholders_equity"], scale=100),
+    "current_ratio": _ratio(col["current_assets"], col["current_liabilities"], scale=100),
+    "quick_ratio": np.nan,  # 재고자산 컬럼 없음
+    # 배당 (%) - 배당 데이터 없음
+    "dividend_yield": np.nan,
+    "dividend_payout_ratio": np.nan,
+    # 성장성 (%)
+    "revenue_growth_rate": _ratio(col["revenue"] - col["prior_revenue"], np.abs(col["prior_revenue"]), scale=100),
+    "profit_growth_rate": _ratio(col["net_income"] - col["prior_net_income"], np.abs(col["prior_net_income"]),
+                                 scale=100),
+  })
+
+  # DECIMAL 정밀도 초과 값 NULL 처리
+  valuation = ("per", "pbr", "pcr", "psr", "ev_ebitda")
+  for name in INDICATOR_COLUMNS:
+    if name in ("stock_id", "report_date"):
+      continue
+    limit = _LIMIT_18_6 if name in valuation else _LIMIT_8_4
+    out.loc[np.abs(out[name]) >= limit, name] = np.nan
+
+  return out[INDICATOR_COLUMNS]
+
+
+def to_records(indicators: pd.DataFrame) -> List[tuple[Any, ...]]:
+  """지표 DataFrame → COPY 적재용 튜플 목록 (NaN → None)"""
+  if indicators.empty:
+    return []
+  obj = indicators[INDICATOR_COLUMNS].astype(object)
+  obj = obj.where(indicators[INDICATOR_COLUMNS].notna(), None)
+  obj["stock_id"] = obj["stock_id"].astype(int)
+  return list(obj.itertuples(index=False, name=None))
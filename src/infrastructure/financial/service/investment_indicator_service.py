@@ -0,0 +1,83 @@
+# src/infrastructure/financial/service/investment_indicator_service.py
+import asyncio
+import logging
+from datetime import date
+from typing import Optional, Sequence
+
+from infrastructure.collection.service.collection_tracker import track_collection
+from infrastructure.db.session import get_session
+from infrastructure.financial.repository.investment_indicator_repository import (
+  load_close_frame, load_statement_frame, load_listing_shares_frame,
+  find_latest_price_date, find_earliest_price_date, upsert_investment_indicators
+)
+from infrastructure.financial.service.investment_indicator_calculator import (
+  compute_investment_indicators, to_records
+)
+from infrastructure.screener.service.screener_service import screen_frame_cache
+from infrastructure.snapshot.service.snapshot_cache import snapshot_cache
+
+log = logging.getLogger(__name__)
+
+
+async def calculate_investment_indicators(
+    *,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    stock_ids: Optional[Sequence[int]] = None,
+) -> int:
+  """
+  investment_indicator 일별 계산 후 UPSERT
+  - start/end 미지정: daily_price 최신 거래일 하루만 계산 (일일 증분)
+  - 전체 재계산: full_recalculate_investment_indicators() 사용
+  """
+  async with track_collection("investment_indicator", collection_date=end) as run:
+    async with get_session() as session:
+      if end is None:
+        end = await find_latest_price_date(session)
+        if end is None:
+          log.warning("[INDICATOR SERVICE] daily_price 데이터가 없습니다.")
+          return 0
+      start = start or end
+
+      closes = await load_close_frame(session, start=start, end=end, stock_ids=stock_ids)
+      statements = await load_statement_frame(session, until=end, stock_ids=stock_ids)
+      shares = await load_listing_shares_frame(session)
+
+    if closes.empty or statements.empty:
+      log.info("[INDICATOR SERVICE] 계산 대상이 없습니다. 기간=%s~%s (prices=%s, statements=%s)",
+               start, end, len(closes), len(statements))
+      return 0
+
+    # CPU 연산은 이벤트 루프 밖에서 수행
+    indicators = await asyncio.to_thread(compute_investment_indicators, closes, statements, shares)
+    records = await asyncio.to_thread(to_records, indicators)
+    if not records:
+      log.info("[INDICATOR SERVICE] 저장할 지표가 없습니다. 기간=%s~%s", start, end)
+      return 0
+
+    async with get_session() as session:
+      try:
+        upserted = await upsert_investment_indicators(session, records)
+        await session.commit()
+        run.add_records(upserted)
+      except Exception:
+        await session.rollback()
+        log.exception("[INDICATOR SERVICE] upsert 트랜잭션 실패 (rollback)")
+        raise
+
+    # 최신 투자지표 스냅샷 갱신 (records 는 INDICATOR_COLUMNS 순서: stock_id, report_date, ...)
+    await snapshot_cache.refresh({ r[0] for r in records }, sections=["valuation"], since=start)
+    await screen_frame_cache.invalidate()
+    log.info("[INDICATOR SERVICE] 완료 기간=%s~%s, upserted=%s", start, end, upserted)
+    return upserted
+
+
+async def full_recalculate_investment_indicators() -> int:
+  """daily_price 전체 구간 투자지표 재계산"""
+  async with get_session() as session:
+    start = await find_earliest_price_date(session)
+    end = await find_latest_price_date(session)
+  if start is None or end is None:
+    log.warning("[INDICATOR SERVICE] daily_price 데이터가 없습니다.")
+    return 0
+  return await calculate_investment_indicators(start=start, end=end)
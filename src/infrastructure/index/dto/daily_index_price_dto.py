@@ -0,0 +1,90 @@
+# src/infrastructure/index/dto/daily_index_price_dto.py
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional, List
+
+from pydantic import BaseModel, Field
+
+from utils.decimal_util import to_date8, to_float, to_int
+
+
+class IndexResponseBodyOutput2(BaseModel):
+  stck_bsop_date: str
+  bstp_nmix_prpr: str  # 업종 지수 현재가(종가)
+  bstp_nmix_oprc: str
+  bstp_nmix_hgpr: str
+  bstp_nmix_lwpr: str
+  acml_vol: str
+  acml_tr_pbmn: Optional[str] = None
+  mod_yn: Optional[str] = None
+
+  model_config = { "extra": "ignore" }
+
+
+class KISDomesticIndexDailyResponse(BaseModel):
+  """KIS 업종(지수) 일봉 응답 최상위 래퍼"""
+  rt_cd: Optional[str] = None
+  msg_cd: Optional[str] = None
+  msg1: Optional[str] = None
+  output2: List[IndexResponseBodyOutput2] = Field(default_factory=list)
+
+  model_config = { "extra": "ignore" }
+
+
+@dataclass(frozen=True)
+class DailyIndexPriceDTO:
+  """
+  daily_index_price upsert에 바로 넣기 위한 표준 스키마
+  """
+  index_code: str
+  trade_date: date
+  open_value: float
+  high_value: float
+  low_value: float
+  close_value: float
+  volume: int
+  change_rate: Optional[float] = None
+  change_amount: Optional[float] = None
+
+
+# ------------------------- DTO 변환기 -------------------------
+
+def to_daily_index_price_dtos(index_code: str, payload: dict) -> List[DailyIndexPriceDTO]:
+  """
+  KIS 업종 일봉 payload(dict) → 파싱 → DailyIndexPriceDTO 리스트로 변환
+  - output2 에는 전일대비 필드가 없으므로 응답 내 직전 거래일 종가로 등락폭/등락률 계산
+  - 응답 구간의 첫 거래일은 직전 종가를 알 수 없어 None
+  """
+  parsed = KISDomesticIndexDailyResponse.model_validate(payload)
+
+  # 빈 행(휴장일 패딩) 제거 후 거래일 오름차순 정렬
+  rows = sorted(
+      (row for row in parsed.output2 if row.stck_bsop_date.strip()),
+      key=lambda r: r.stck_bsop_date,
+  )
+
+  out: List[DailyIndexPriceDTO] = []
+  prev_close: Optional[float] = None
+  for row in rows:
+    close = to_float(row.bstp_nmix_prpr) or 0.0
+    change_amount: Optional[float] = None
+    change_rate: Optional[float] = None
+    if prev_close:
+      change_amount = round(close - prev_close, 6)
+      change_rate = round(change_amount / prev_close * 100, 4)
+
+    out.append(
+        DailyIndexPriceDTO(
+            index_code=index_code,
+            trade_date=to_date8(row.stck_bsop_date),
+            open_value=to_float(row.bstp_nmix_oprc) or 0.0,
+            high_value=to_float(row.bstp_nmix_hgpr) or 0.0,
+            low_value=to_float(row.bstp_nmix_lwpr) or 0.0,
+            close_value=close,
+            volume=to_int(row.acml_vol) or 0,
+            change_rate=change_rate,
+            change_amount=change_amount,
+        )
+    )
+    prev_close = close
+  return out
@@ -0,0 +1,113 @@
+# src/infrastructure/index/repository/index_repository.py
+from datetime import date
+from typing import Iterable, List, Dict, Tuple
+
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models import MarketIndex, DailyIndexPrice, Market, MarketType
+from infrastructure.index.dto.daily_index_price_dto import DailyIndexPriceDTO
+
+
+async def upsert_market_indices(session: AsyncSession, payloads: Iterable[dict]) -> int:
+  """시장지수 기본 정보 UPSERT (index_code 기준)"""
+  payloads = list(payloads)
+  if not payloads:
+    return 0
+
+  stmt = pg_insert(MarketIndex).values(payloads)
+
+  excluded = stmt.excluded
+  stmt = stmt.on_conflict_do_update(
+      index_elements=[MarketIndex.index_code],
+      set_={
+        "index_name": excluded.index_name,
+        "index_name_en": excluded.index_name_en,
+        "market_id": excluded.market_id,
+        "description": excluded.description,
+        "updated_at": func.now(),  # 항상 갱신
+      },
+  )
+  await session.execute(stmt)
+  return len(payloads)
+
+
+async def get_market_id_map(session: AsyncSession, market_codes: List[MarketType]) -> Dict[MarketType, int]:
+  """market_code -> market_id 매핑 반환"""
+  query = select(Market.market_code, Market.market_id).where(Market.market_code.in_(market_codes))
+  rows = (await session.execute(query)).all()
+  return { code: mid for (code, mid) in rows }
+
+
+async def get_index_id_map(session: AsyncSession, index_codes: List[str]) -> Dict[str, int]:
+  """index_code -> index_id 매핑 반환"""
+  query = select(MarketIndex.index_code, MarketIndex.index_id).where(MarketIndex.index_code.in_(index_codes))
+  rows = (await session.execute(query)).all()
+  return { code: iid for (code, iid) in rows }
+
+
+async def upsert_daily_index_prices(
+    session: AsyncSession,
+    rows: List[Tuple[int, DailyIndexPriceDTO]]
+) -> int:
+  """
+  DailyIndexPrice upsert (PostgreSQL ON CONFLICT UPDATE)
+  - 등락폭/등락률은 응답 구간 첫 거래일에 None 이므로 기존 값을 유지(COALESCE)
+  """
+  if not rows:
+    return 0
+
+  payload = []
+  for index_id, dto in rows:
+    payload.append(
+        dict(
+            index_id=index_id,
+            trade_date=dto.trade_date,
+            open_value=dto.open_value,
+            high_value=dto.high_value,
+            low_value=dto.low_value,
+            close_value=dto.close_value,
+            volume=dto.volume,
+            change_rate=dto.change_rate,
+            change_amount=dto.change_amount,
+        )
+    )
+
+  stmt = pg_insert(DailyIndexPrice).values(payload)
+
+  excluded = stmt.excluded
+  stmt = stmt.on_conflict_do_update(
+      index_elements=[DailyIndexPrice.index_id, DailyIndexPrice.trade_date],
+      set_={
+        "open_value": excluded.open_value,
+        "high_value": excluded.high_value,
+        "low_value": excluded.low_value,
+        "close_value": excluded.close_value,
+        "volume": excluded.volume,
+        "change_rate": func.coalesce(excluded.change_rate, DailyIndexPrice.change_rate),
+        "change_amount": func.coalesce(excluded.change_amount, DailyIndexPrice.change_amount),
+        "updated_at": func.now(),
+      },
+  )
+
+  await session.execute(stmt)
+  return len(payload)
+
+
+async def find_index_closes(
+    session: AsyncSession,
+    *,
+    index_id: int,
+    start: date,
+    end: date,
+) -> List[Tuple[date, float]]:
+  """지수 종가 시계열 조회 (거래일 오름차순)"""
+  query = (
+    select(DailyIndexPrice.trade_date, DailyIndexPrice.close_value)
+    .where(DailyIndexPrice.index_id == index_id)
+    .where(DailyIndexPrice.trade_date.between(start, end))
+    .order_by(DailyIndexPrice.trade_date)
+  )
+  rows = (await session.execute(query)).all()
+  return [(d, float(v)) for (d, v) in rows]
@@ -0,0 +1,34 @@
+# src/infrastructure/index/service/index_api.py
+from datetime import date
+from typing import List
+
+from infrastructure.index.dto.daily_index_price_dto import to_daily_index_price_dtos, DailyIndexPriceDTO
+from infrastructure.kis.http.http_client import KISClient
+
+
+class KISIndexAPI:
+  """
+  KIS 업종(지수) API 래퍼
+  """
+
+  def __init__(self, client: KISClient) -> None:
+    self._client = client
+
+  async def fetch_domestic_index_daily(
+      self, *, index_code: str, start: date, end: date
+  ) -> List[DailyIndexPriceDTO]:
+    """국내 업종 일봉(일자 구간)조회 -> DailyIndexPriceDTO 리스트 변환"""
+    path = "/uapi/domestic-stock/v1/quotations/inquire-daily-indexchartprice"
+    tr_id = "FHKUP03500100"
+
+    params = {
+      "FID_COND_MRKT_DIV_CODE": "U",  # 업종
+      "FID_INPUT_ISCD": index_code,
+      "FID_INPUT_DATE_1": start.strftime("%Y%m%d"),
+      "FID_INPUT_DATE_2": end.strftime("%Y%m%d"),
+      "FID_PERIOD_DIV_CODE": "D",
+    }
+
+    response = await self._client.get(path, tr_id=tr_id, auth=True, params=params)
+
+    return to_daily_index_price_dtos(index_code, response)
@@ -0,0 +1,88 @@
+# src/infrastructure/index/service/index_cache.py
+import logging
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from infrastructure.index.dto.daily_index_price_dto import DailyIndexPriceDTO
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class IndexSeries:
+  """
+  지수 종가 시계열 (거래일 오름차순)
+  - dates: datetime64[D] 배열
+  - closes: float64 배열
+  """
+  index_code: str
+  dates: np.ndarray
+  closes: np.ndarray
+
+  def returns(self) -> np.ndarray:
+    """일간 수익률 (첫 거래일 제외, 길이 = len(closes) - 1)"""
+    if self.closes.size < 2:
+      return np.empty(0, dtype=np.float64)
+    return self.closes[1:] / self.closes[:-1] - 1.0
+
+  def slice(self, start: date, end: date) -> "IndexSeries":
+    """[start, end] 구간 시계열 반환 (searchsorted 기반, 복사 없음)"""
+    lo = int(np.searchsorted(self.dates, np.datetime64(start, "D"), side="left"))
+    hi = int(np.searchsorted(self.dates, np.datetime64(end, "D"), side="right"))
+    return IndexSeries(index_code=self.index_code, dates=self.dates[lo:hi], closes=self.closes[lo:hi])
+
+
+class IndexSeriesCache:
+  """
+  베타/상대강도 계산용 지수 종가 시계열 인메모리 캐시
+  - 프로세스 단위 싱글톤으로 사용
+  - 지수 적재 후 merge 로 증분 반영 (DB 재조회 없음)
+  """
+
+  def __init__(self) -> None:
+    self._series: Dict[str, IndexSeries] = { }
+
+  def get(self, index_code: str) -> Optional[IndexSeries]:
+    """캐시된 지수 시계열 반환 (없으면 None)"""
+    return self._series.get(index_code)
+
+  def codes(self) -> List[str]:
+    """캐시된 지수코드 목록"""
+    return list(self._series.keys())
+
+  def replace(self, index_code: str, points: List[tuple[date, float]]) -> None:
+    """DB 에서 읽은 (거래일, 종가) 목록으로 시계열 전체 교체"""
+    dates = np.array([d for d, _ in points], dtype="datetime64[D]")
+    closes = np.array([c for _, c in points], dtype=np.float64)
+    self._series[index_code] = IndexSeries(index_code=index_code, dates=dates, closes=closes)
+
+  def merge(self, dtos: List[DailyIndexPriceDTO]) -> None:
+    """새로 적재한 지수 일봉을 캐시에 병합 (같은 거래일은 새 값 우선)"""
+    by_code: Dict[str, List[DailyIndexPriceDTO]] = { }
+    for dto in dtos:
+      by_code.setdefault(dto.index_code, []).append(dto)
+
+    for index_code, items in by_code.items():
+      new_dates = np.array([d.trade_date for d in items], dtype="datetime64[D]")
+      new_closes = np.array([d.close_value for d in items], dtype=np.float64)
+
+      cur = self._series.get(index_code)
+      if cur is not None and cur.dates.size:
+        # 새 값이 뒤에 오도록 이어붙인 뒤, 거래일별 마지막 값만 남김
+        dates = np.concatenate([cur.dates, new_dates])
+        closes = np.concatenate([cur.closes, new_closes])
+      else:
+        dates, closes = new_dates, new_closes
+
+      order = np.argsort(dates, kind="stable")
+      dates, closes = dates[order], closes[order]
+      keep = np.ones(dates.size, dtype=bool)
+      keep[:-1] = dates[1:] != dates[:-1]
+      self._series[index_code] = IndexSeries(index_code=index_code, dates=dates[keep], closes=closes[keep])
+
+
+# 외부에서 바로 import 가능하도록 싱글톤 인스턴스 노출
+index_series_cache = IndexSeriesCache()
@@ -0,0 +1,146 @@
+# src/infrastructure/index/service/index_service.py
+import asyncio
+import logging
+from datetime import date, timedelta
+from typing import Any, List, Optional, Tuple
+
+from core.models import MarketType
+from infrastructure.collection.service.collection_tracker import track_collection
+from infrastructure.db.session import get_session
+from infrastructure.index.dto.daily_index_price_dto import DailyIndexPriceDTO
+from infrastructure.index.repository.index_repository import (
+  upsert_market_indices, get_market_id_map, get_index_id_map, upsert_daily_index_prices, find_index_closes
+)
+from infrastructure.index.service.index_api import KISIndexAPI
+from infrastructure.index.service.index_cache import index_series_cache
+from infrastructure.kis.http.http_client import KISClient
+from infrastructure.kis.service.token_service import KISTokenService
+from utils.partition import ensure_daily_index_price_partitions
+
+log = logging.getLogger(__name__)
+
+# KIS 업종 코드 기준 기본 지수
+_DEFAULT_INDICES: list[dict[str, Any]] = [
+  { "index_code": "0001", "index_name": "코스피", "index_name_en": "KOSPI", "market_code": MarketType.KOSPI },
+  { "index_code": "1001", "index_name": "코스닥", "index_name_en": "KOSDAQ", "market_code": MarketType.KOSDAQ },
+  { "index_code": "2001", "index_name": "코스피200", "index_name_en": "KOSPI200", "market_code": MarketType.KOSPI },
+]
+
+DEFAULT_INDEX_CODES: list[str] = [i["index_code"] for i in _DEFAULT_INDICES]
+
+# 동시 KIS 호출 수 (초당 거래건수 제한 고려)
+_FETCH_CONCURRENCY = 3
+
+
+async def seed_default_indices() -> int:
+  """기본 시장지수(KOSPI/KOSDAQ/KOSPI200) UPSERT"""
+  async with get_session() as session:
+    try:
+      market_ids = await get_market_id_map(session, list({ i["market_code"] for i in _DEFAULT_INDICES }))
+      seeds = []
+      for item in _DEFAULT_INDICES:
+        market_id = market_ids.get(item["market_code"])
+        if market_id is None:
+          log.warning("[INDEX SERVICE] 시장 %s 가 없어 지수 %s 시드 생략",
+                      item["market_code"].value, item["index_code"])
+          continue
+        seeds.append({
+          "index_code": item["index_code"],
+          "index_name": item["index_name"],
+          "index_name_en": item["index_name_en"],
+          "market_id": market_id,
+          "description": None,
+        })
+      upserted = await upsert_market_indices(session, seeds)
+      await session.commit()
+      log.info("[INDEX SERVICE] 기본 시장지수 UPSERT 완료: %s 건", upserted)
+      return upserted
+    except Exception:
+      await session.rollback()
+      log.exception("[INDEX SERVICE] 기본 시장지수 UPSERT 중 오류 발생(rollback)")
+      raise
+
+
+async def save_daily_index_prices(
+    *,
+    start: date,
+    end: date,
+    index_codes: Optional[List[str]] = None,
+) -> int:
+  """daily_index_price UPSERT (지수별 KIS 호출은 동시 실행)"""
+  async with track_collection("daily_index_price", source_api="FHKUP03500100", collection_date=end) as run:
+    index_codes = index_codes or DEFAULT_INDEX_CODES
+    kis_token_service = KISTokenService()
+    kis_client = KISClient(token_provider=kis_token_service.get_token)
+    kis_index_api = KISIndexAPI(kis_client)
+
+    async with get_session() as session:
+      code_to_id = await get_index_id_map(session, index_codes)
+      # 파티션 미리 생성 (존재하면 skip)
+      await ensure_daily_index_price_partitions(session, start=start, end=end)
+      await session.commit()
+
+    if not code_to_id:
+      log.warning("[INDEX SERVICE] 등록된 지수가 없습니다. index_codes=%s", index_codes)
+      return 0
+
+    semaphore = asyncio.Semaphore(_FETCH_CONCURRENCY)
+
+    async def _fetch(index_code: str) -> List[DailyIndexPriceDTO]:
+      async with semaphore:
+        with run.track_item(index_code) as item:
+          dtos = await kis_index_api.fetch_domestic_index_daily(index_code=index_code, start=start, end=end)
+          item.records = len(dtos)
+          return dtos
+
+    codes = list(code_to_id.keys())
+    results = await asyncio.gather(*(_fetch(c) for c in codes), return_exceptions=True)
+
+    rows: List[Tuple[int, DailyIndexPriceDTO]] = []  # (index_id, dto) 누적 버퍼
+    for index_code, result in zip(codes, results):
+      if isinstance(result, BaseException):
+        log.error("[INDEX SERVICE] KIS fetch 실패 index_code=%s", index_code, exc_info=result)
+        continue
+      if not result:
+        log.info("[INDEX SERVICE] 데이터 없음 index_code=%s (%s~%s)", index_code, start, end)
+        continue
+      for dto in result:
+        rows.append((code_to_id[index_code], dto))
+
+    if not rows:
+      log.info("[INDEX SERVICE] 저장할 데이터가 없습니다. 기간=%s~%s", start, end)
+      return 0
+
+    async with get_session() as session:
+      try:
+        upserted = await upsert_daily_index_prices(session, rows)
+        await session.commit()
+        run.add_records(upserted)
+      except Exception:
+        await session.rollback()
+        log.exception("[INDEX SERVICE] upsert 트랜잭션 실패 (rollback)")
+        raise
+
+    # 적재 성공분을 인메모리 시계열 캐시에 반영
+    index_series_cache.merge([dto for _, dto in rows])
+
+    log.info("[INDEX SERVICE] 완료 index_codes=%s, upserted=%s", codes, upserted)
+    return upserted
+
+
+async def warm_index_series_cache(*, lookback_days: int = 730, index_codes: Optional[List[str]] = None) -> int:
+  """DB 에 저장된 지수 종가로 인메모리 캐시 채우기 (기본 2년)"""
+  index_codes = index_codes or DEFAULT_INDEX_CODES
+  end = date.today()
+  start = end - timedelta(days=lookback_days)
+
+  loaded = 0
+  async with get_session() as session:
+    code_to_id = await get_index_id_map(session, index_codes)
+    for index_code, index_id in code_to_id.items():
+      points = await find_index_closes(session, index_id=index_id, start=start, end=end)
+      index_series_cache.replace(index_code, points)
+      loaded += len(points)
+
+  log.info("[INDEX SERVICE] 지수 시계열 캐시 적재 완료: %s 건 (%s)", loaded, list(code_to_id.keys()))
+  return loaded
@@ -0,0 +1,239 @@
+# src/infrastructure/kis/archive/raw_archive.py
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Iterator, List, Mapping, Optional
+
+from config.settings import settings
+
+log = logging.getLogger(__name__)
+
+# 요청 파라미터 중 보관 키(종목/조회 구간)로 쓰는 필드
+_TICKER_PARAM = "FID_INPUT_ISCD"
+_START_PARAM = "FID_INPUT_DATE_1"
+_END_PARAM = "FID_INPUT_DATE_2"
+
+
+def default_archive_root() -> str:
+  """KIS 원본 응답 보관 경로 (storage_root/kis_raw)"""
+  return os.path.join(settings.storage_root, "kis_raw")
+
+
+def object_path(root: str, sha256: str) -> str:
+  """원본 응답 객체 경로 (내용 해시 기준, 동일 응답은 1개만 저장)"""
+  return os.path.join(root, "objects", sha256[:2], f"{sha256}.json.gz")
+
+
+def index_path(root: str, tr_id: str, ticker: str) -> str:
+  """tr_id/종목별 색인 경로 (행 = 조회 1회: 구간, 파라미터, 객체 해시, 수집 시각)"""
+  return os.path.join(root, "index", tr_id, f"{ticker}.jsonl")
+
+
+def archived_tickers(root: str, tr_id: str) -> List[str]:
+  """보관된 응답이 있는 종목 코드 목록"""
+  directory = os.path.join(root, "index", tr_id)
+  if not os.path.isdir(directory):
+    return []
+  return sorted(name[:-len(".jsonl")] for name in os.listdir(directory) if name.endswith(".jsonl"))
+
+
+def iter_index(root: str, tr_id: str, ticker: str) -> Iterator[dict[str, Any]]:
+  """종목 색인 행 순회 (기록 순서 = 수집 순서, 깨진 마지막 행은 건너뜀)"""
+  path = index_path(root, tr_id, ticker)
+  if not os.path.exists(path):
+    return
+  with open(path, "rb") as fh:
+    for line in fh:
+      try:
+        yield json.loads(line)
+      except ValueError:
+        log.warning("[RAW ARCHIVE] 색인 행 파싱 실패 path=%s", path)
+
+
+def read_object(root: str, sha256: str) -> bytes:
+  """원본 응답 본문 (압축 해제)"""
+  with gzip.open(object_path(root, sha256), "rb") as fh:
+    return fh.read()
+
+
+def _write_object(root: str, sha256: str, content: bytes) -> bool:
+  """객체 저장 (이미 있으면 skip, 임시 파일 → rename 으로 원자적 교체)"""
+  path = object_path(root, sha256)
+  if os.path.exists(path):
+    return False
+  directory = os.path.dirname(path)
+  os.makedirs(directory, exist_ok=True)
+  fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+  try:
+    with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6, mtime=0) as fh:
+      fh.write(content)
+    os.replace(tmp, path)
+  except BaseException:
+    if os.path.exists(tmp):
+      os.remove(tmp)
+    raise
+  return True
+
+
+def persist_responses(root: str, batch: List[dict[str, Any]]) -> int:
+  """
+  응답 배치 저장 (동기, 스레드에서 실행)
+  - 객체: 내용 sha256 으로 중복 제거
+  - 색인: tr_id/종목 파일별로 모아 한 번에 append
+  반환: 새로 저장된 객체 수
+  """
+  created = 0
+  lines: dict[str, List[bytes]] = defaultdict(list)
+  for item in batch:
+    content: bytes = item["content"]
+    sha256 = hashlib.sha256(content).hexdigest()
+    if _write_object(root, sha256, content):
+      created += 1
+    params = item["params"]
+    entry = {
+      "tr_id": item["tr_id"],
+      "ticker": params.get(_TICKER_PARAM),
+      "start": params.get(_START_PARAM),
+      "end": params.get(_END_PARAM),
+      "params": params,
+      "sha256": sha256,
+      "bytes": len(content),
+      "fetched_at": item["fetched_at"],
+    }
+    path = index_path(root, item["tr_id"], params.get(_TICKER_PARAM) or "_")
+    lines[path].append(json.dumps(entry, ensure_ascii=False, separators=(",", ":")).encode() + b"\n")
+
+  for path, chunk in lines.items():
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "ab") as fh:
+      fh.write(b"".join(chunk))
+  return created
+
+
+class RawResponseArchive:
+  """
+  KIS 원본 응답 보관소 (content-addressed, gzip)
+  - submit() 은 큐에 넣기만 하고 즉시 반환 (수집 hot path 에 디스크 I/O 없음)
+  - 백그라운드 태스크가 batch_size 또는 flush_interval 마다 스레드에서 압축/저장
+  - 시작 전(start 미호출) 이거나 비활성화 설정이면 submit 은 무시
+  """
+
+  def __init__(
+      self,
+      root: Optional[str] = None,
+      *,
+      batch_size: int = 200,
+      flush_interval: float = 2.0,
+      max_queue: int = 10000,
+  ) -> None:
+    self._root = root
+    self._batch_size = batch_size
+    self._flush_interval = flush_interval
+    self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=max_queue)
+    self._task: Optional[asyncio.Task[None]] = None
+    self._stopping = asyncio.Event()
+
+  @property
+  def root(self) -> str:
+    return self._root or default_archive_root()
+
+  @property
+  def running(self) -> bool:
+    return self._task is not None and not self._task.done()
+
+  def submit(self, *, tr_id: str, params: Optional[Mapping[str, Any]], content: bytes) -> None:
+    """응답 본문 등록 (논블로킹, 큐가 가득 차면 버림)"""
+    if not self.running:
+      return
+    try:
+      self._queue.put_nowait({
+        "tr_id": tr_id,
+        "params": { k: str(v) for k, v in (params or {}).items() },
+        "content": content,
+        "fetched_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+      })
+    except asyncio.QueueFull:
+      log.warning("[RAW ARCHIVE] 버퍼 초과로 원본 응답 유실 tr_id=%s, ticker=%s",
+                  tr_id, (params or {}).get(_TICKER_PARAM))
+
+  def start(self) -> None:
+    """백그라운드 저장 태스크 시작 (이벤트 루프 안에서 호출)"""
+    if not settings.kis_raw_archive_enabled:
+      return
+    if self._task is None or self._task.done():
+      self._stopping.clear()
+      self._task = asyncio.get_running_loop().create_task(self._run(), name="kis-raw-archive")
+      log.info("[RAW ARCHIVE] 원본 응답 보관 시작 root=%s (batch=%s, interval=%ss)",
+               self.root, self._batch_size, self._flush_interval)
+
+  async def stop(self) -> None:
+    """종료 신호 후 태스크가 들고 있던 배치와 큐에 남은 응답까지 저장하고 끝날 때까지 대기"""
+    if self._task is not None:
+      # 취소하면 큐에서 이미 꺼낸 항목(대기 중/쓰는 중 배치)이 유실되므로 신호만 보냄
+      self._stopping.set()
+      await self._task
+      self._task = None
+    await self.flush()
+
+  async def flush(self) -> int:
+    """큐에 쌓인 응답을 모두 저장"""
+    written = 0
+    while not self._queue.empty():
+      written += await self._write(self._drain())
+    return written
+
+  def _drain(self, first: Optional[dict[str, Any]] = None) -> List[dict[str, Any]]:
+    batch: List[dict[str, Any]] = [first] if first is not None else []
+    while len(batch) < self._batch_size:
+      try:
+        batch.append(self._queue.get_nowait())
+      except asyncio.QueueEmpty:
+        break
+    return batch
+
+  async def _run(self) -> None:
+    while True:
+      first = await self._next()
+      if first is None:
+        break
+      if self._queue.qsize() < self._batch_size - 1 and not self._stopping.is_set():
+        # 배치가 찰 때까지 flush_interval 대기 (종료 신호가 오면 바로 저장)
+        try:
+          await asyncio.wait_for(self._stopping.wait(), timeout=self._flush_interval)
+        except asyncio.TimeoutError:
+          pass
+      await self._write(self._drain(first))
+    await self.flush()
+
+  async def _next(self) -> Optional[dict[str, Any]]:
+    """다음 응답 (종료 신호가 먼저 오면 None)"""
+    if self._stopping.is_set():
+      return None
+    getter = asyncio.ensure_future(self._queue.get())
+    stopper = asyncio.ensure_future(self._stopping.wait())
+    try:
+      await asyncio.wait({ getter, stopper }, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+      stopper.cancel()
+      if not getter.done():
+        getter.cancel()
+    return getter.result() if getter.done() and not getter.cancelled() else None
+
+  async def _write(self, batch: List[dict[str, Any]]) -> int:
+    if not batch:
+      return 0
+    try:
+      return await asyncio.to_thread(persist_responses, self.root, batch)
+    except Exception:
+      log.exception("[RAW ARCHIVE] 원본 응답 저장 실패 (%s 건 유실)", len(batch))
+      return 0
+
+
+# 외부에서 바로 import 가능하도록 싱글톤 인스턴스 노출
+raw_archive = RawResponseArchive(max_queue=settings.kis_raw_archive_queue_size)
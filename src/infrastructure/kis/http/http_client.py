@@ -1,10 +1,15 @@
 # src/infrastructure/kis/http/http_client.py
 import logging
+import time
 from typing import Optional, Mapping, Any, Callable, Awaitable
 
 import httpx
 
 from config.settings import settings
+from infrastructure.collection.service.collection_tracker import record_api_call
+from infrastructure.kis.archive.raw_archive import raw_archive
+from infrastructure.metrics.instruments import KIS_REQUEST_SECONDS, KIS_REQUEST_ERRORS
+from infrastructure.tracing.tracer import span
 
 log = logging.getLogger(__name__)
 
@@ -70,19 +75,42 @@ class KISClient:
       request_header.update(headers)
 
     client = get_http_client()
-    response = await client.request(
-        method=method.upper(),
-        url=path_or_url,
-        headers=request_header,
-        params=params,
-        json=json,
-        data=data,
-    )
-    response.raise_for_status()
+    record_api_call()
+    metric_label = tr_id or path_or_url
+    begin = time.perf_counter()
+    with span("kis.request", tr_id=tr_id, method=method.upper(), path=path_or_url,
+              ticker=(params or {}).get("FID_INPUT_ISCD")) as trace:
+      try:
+        response = await client.request(
+            method=method.upper(),
+            url=path_or_url,
+            headers=request_header,
+            params=params,
+            json=json,
+            data=data,
+        )
+        trace.set_attribute("http.status_code", response.status_code)
+        trace.set_attribute("response.bytes", len(response.content))
+        response.raise_for_status()
+      except httpx.HTTPStatusError as e:
+        KIS_REQUEST_ERRORS.inc(tr_id=metric_label, reason=str(e.response.status_code))
+        raise
+      except Exception as e:
+        KIS_REQUEST_ERRORS.inc(tr_id=metric_label, reason=type(e).__name__)
+        raise
+      finally:
+        KIS_REQUEST_SECONDS.observe(time.perf_counter() - begin, tr_id=metric_label)
 
     # json 우선 반환
     if "application/json" in response.headers.get("Content-Type", ""):
-      return response.json()
+      body = response.json()
+      # HTTP 200 이지만 업무 오류(rt_cd != "0")인 경우
+      if isinstance(body, dict) and body.get("rt_cd") not in (None, "0"):
+        KIS_REQUEST_ERRORS.inc(tr_id=metric_label, reason=str(body.get("msg_cd") or body.get("rt_cd")))
+      elif tr_id and method.upper() == "GET":
+        # 정상 조회 응답 원본 보관 (백그라운드 저장, replay 재처리용)
+        raw_archive.submit(tr_id=tr_id, params=params, content=response.content)
+      return body
     return response.text
 
   async def get(self, path_or_url: str, **kwargs: Any) -> Any:
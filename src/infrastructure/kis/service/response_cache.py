@@ -0,0 +1,126 @@
+# src/infrastructure/kis/service/response_cache.py
+"""
+KIS 조회 응답 캐시 (2단계 + 동일 요청 합치기)
+- 1단계: 프로세스 내 LRU (dict, 만료 시각 포함)
+- 2단계: Redis `kis:cache:{tr_id}:{파라미터 해시}` (워커/레플리카 공유, SETEX)
+- 같은 키로 동시에 들어온 요청은 진행 중인 1건의 결과를 함께 기다림 (KIS 호출 1회)
+- 업무 오류 응답(rt_cd != "0")은 저장하지 않음
+TTL 은 호출자가 데이터 신선도(마감된 과거 구간 / 당일 포함 구간)에 따라 지정
+"""
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Mapping
+
+import orjson
+
+from config.settings import settings
+from infrastructure.metrics.instruments import KIS_CACHE_REQUESTS
+from infrastructure.redis.redis_client import RedisClient
+
+log = logging.getLogger(__name__)
+
+_KEY_PREFIX = "kis:cache"
+
+
+def _cacheable(payload: Any) -> bool:
+  return isinstance(payload, dict) and payload.get("rt_cd") in (None, "0")
+
+
+class KISResponseCache:
+  """KIS 응답 캐시 (프로세스 단위 싱글톤, 반환 payload 는 호출자 간 공유되므로 수정 금지)"""
+
+  def __init__(self, capacity: int) -> None:
+    self._capacity = max(capacity, 1)
+    self._redis = RedisClient()
+    # key → (만료 epoch 초, payload)
+    self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+    self._inflight: dict[str, asyncio.Task[Any]] = {}
+
+  @staticmethod
+  def cache_key(tr_id: str, params: Mapping[str, Any]) -> str:
+    """tr_id + 정렬된 요청 파라미터 해시"""
+    canonical = orjson.dumps({ k: str(v) for k, v in params.items() }, option=orjson.OPT_SORT_KEYS)
+    return f"{_KEY_PREFIX}:{tr_id}:{hashlib.sha1(canonical).hexdigest()}"
+
+  def clear(self) -> None:
+    """프로세스 내 캐시 비우기 (Redis 항목은 TTL 로 만료)"""
+    self._entries.clear()
+
+  async def get_or_fetch(
+      self,
+      *,
+      tr_id: str,
+      params: Mapping[str, Any],
+      ttl: int,
+      fetch: Callable[[], Awaitable[Any]],
+  ) -> Any:
+    """
+    캐시 조회 → 없으면 fetch() 1회 호출 후 저장
+    :param ttl: 보관 시간(초), 0 이하면 캐시 미사용
+    """
+    if ttl <= 0:
+      return await fetch()
+    key = self.cache_key(tr_id, params)
+    payload = self._get_local(key)
+    if payload is not None:
+      KIS_CACHE_REQUESTS.inc(tr_id=tr_id, result="memory")
+      return payload
+
+    task = self._inflight.get(key)
+    if task is not None:
+      KIS_CACHE_REQUESTS.inc(tr_id=tr_id, result="coalesced")
+    else:
+      task = asyncio.get_running_loop().create_task(self._load(key, tr_id, ttl, fetch))
+      self._inflight[key] = task
+      task.add_done_callback(lambda done: self._release(key, done))
+    # 먼저 온 호출자가 취소되어도 공유 조회는 계속 진행
+    return await asyncio.shield(task)
+
+  def _release(self, key: str, task: asyncio.Task[Any]) -> None:
+    if self._inflight.get(key) is task:
+      del self._inflight[key]
+
+  def _get_local(self, key: str) -> Any:
+    entry = self._entries.get(key)
+    if entry is None:
+      return None
+    expires_at, payload = entry
+    if expires_at <= time.time():
+      del self._entries[key]
+      return None
+    self._entries.move_to_end(key)
+    return payload
+
+  def _put_local(self, key: str, payload: Any, expires_at: float) -> None:
+    self._entries[key] = (expires_at, payload)
+    self._entries.move_to_end(key)
+    while len(self._entries) > self._capacity:
+      self._entries.popitem(last=False)
+
+  async def _load(self, key: str, tr_id: str, ttl: int, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    raw = await self._redis.get_value(key)
+    if raw is not None:
+      try:
+        cached = orjson.loads(raw)
+        self._put_local(key, cached["payload"], cached["expires_at"])
+        KIS_CACHE_REQUESTS.inc(tr_id=tr_id, result="redis")
+        return cached["payload"]
+      except (orjson.JSONDecodeError, KeyError, TypeError):
+        log.warning("[KIS CACHE] Redis 캐시 항목 손상 key=%s (재조회)", key)
+
+    KIS_CACHE_REQUESTS.inc(tr_id=tr_id, result="miss")
+    payload = await fetch()
+    if not _cacheable(payload):
+      return payload
+    # 로컬 만료 시각을 Redis 와 맞춰 워커 간 신선도가 어긋나지 않도록 함께 저장
+    expires_at = time.time() + ttl
+    self._put_local(key, payload, expires_at)
+    await self._redis.set_value(key, orjson.dumps({ "expires_at": expires_at, "payload": payload }).decode(), ttl)
+    return payload
+
+
+# 외부에서 바로 import 가능하도록 싱글톤 인스턴스 노출
+kis_response_cache = KISResponseCache(settings.kis_cache_size)
@@ -0,0 +1,46 @@
+# src/infrastructure/kis/websocket/approval_service.py
+import logging
+from typing import Any, Optional
+
+from config.settings import settings
+from infrastructure.kis.http.http_client import KISClient
+from infrastructure.redis.redis_client import RedisClient
+
+log = logging.getLogger(__name__)
+
+# Redis KIS 실시간 접속키 Key
+KIS_APPROVAL_KEY_REDIS_KEY = "kis:ws_approval_key"
+# 접속키 유효기간 24시간 → 여유를 두고 23시간 보관
+_APPROVAL_KEY_TTL = 60 * 60 * 23
+
+
+class KISApprovalKeyService:
+  """KIS 실시간(WebSocket) 접속키 발급/캐시"""
+
+  def __init__(self) -> None:
+    self._redis = RedisClient()
+    self.client = KISClient()
+
+  async def get_approval_key(self) -> str:
+    """Redis에서 접속키 조회(비동기). 없으면 새로 발급"""
+    key = await self._redis.get_value(KIS_APPROVAL_KEY_REDIS_KEY)
+    if key:
+      return key
+    return await self.issue_and_save_approval_key()
+
+  async def issue_and_save_approval_key(self) -> str:
+    """KIS 실시간 접속키 신규 발급 후 Redis TTL 저장"""
+    log.info("KIS 실시간 접속키 발급 진행")
+    payload: dict[str, Any] = {
+      "grant_type": "client_credentials",
+      "appkey": settings.kis_app_key,
+      "secretkey": settings.kis_app_secret,
+    }
+    response = await self.client.post("/oauth2/Approval", auth=False, json=payload)
+    key: Optional[str] = response.get("approval_key") if isinstance(response, dict) else None
+    if not key or not isinstance(key, str):
+      log.error("KIS 실시간 접속키 발급 실패. 응답 스키마 확인 필요: %s", response)
+      raise RuntimeError("KIS 실시간 접속키 발급 실패: approval_key 없음")
+
+    await self._redis.set_value(KIS_APPROVAL_KEY_REDIS_KEY, key, _APPROVAL_KEY_TTL)
+    return key
@@ -0,0 +1,225 @@
+# src/infrastructure/kis/websocket/connection.py
+"""
+KIS 실시간 WebSocket 연결 1개 = reader task 1개 + consumer task 1개
+- reader: 소켓 수신 → 헤더만 파싱 → bounded queue 적재
+  큐가 가득 차면(block) 소켓 읽기를 멈춰 TCP 수준 backpressure, drop_oldest 면 오래된 프레임 버림
+- consumer: 큐에서 꺼내 on_frame 콜백으로 전달
+- 끊기면 지수 백오프로 재접속 후 구독 목록 재등록
+"""
+import asyncio
+import json
+import logging
+import time
+from typing import Awaitable, Callable, Literal, Optional
+
+from websockets.asyncio.client import ClientConnection, connect
+from websockets.exceptions import ConnectionClosed
+
+from infrastructure.kis.websocket.parser import RealtimeFrame, is_control, parse_control, parse_frame
+from infrastructure.metrics.instruments import (
+  REALTIME_MESSAGES, REALTIME_QUEUE_DEPTH, REALTIME_BACKPRESSURE_SECONDS, REALTIME_DROPPED, REALTIME_RECONNECTS
+)
+
+log = logging.getLogger(__name__)
+
+OverflowPolicy = Literal["block", "drop_oldest"]
+FrameHandler = Callable[[RealtimeFrame], Awaitable[None]]
+RawTap = Callable[[bytes], None]
+
+_BACKOFF_INITIAL = 1.0
+_BACKOFF_MAX = 30.0
+
+
+def subscribe_message(approval_key: str, tr_id: str, tr_key: str, *, register: bool = True) -> str:
+  """실시간 등록/해제 요청 메시지"""
+  return json.dumps({
+    "header": {
+      "approval_key": approval_key,
+      "custtype": "P",
+      "tr_type": "1" if register else "2",
+      "content-type": "utf-8",
+    },
+    "body": {
+      "input": { "tr_id": tr_id, "tr_key": tr_key }
+    },
+  })
+
+
+class KISRealtimeConnection:
+  """KIS 실시간 WebSocket 연결 (구독 다중화 단위)"""
+
+  def __init__(
+      self,
+      name: str,
+      *,
+      url: str,
+      approval_key_provider: Callable[[], Awaitable[str]],
+      on_frame: FrameHandler,
+      queue_size: int,
+      overflow: OverflowPolicy = "block",
+      raw_tap: Optional[RawTap] = None,
+  ) -> None:
+    self.name = name
+    self._url = url
+    self._approval_key_provider = approval_key_provider
+    self._on_frame = on_frame
+    self._overflow = overflow
+    self._raw_tap = raw_tap
+    self._queue: asyncio.Queue[RealtimeFrame] = asyncio.Queue(maxsize=queue_size)
+    self._subscriptions: set[tuple[str, str]] = set()
+    self._ws: Optional[ClientConnection] = None
+    self._approval_key: Optional[str] = None
+    self._reader_task: Optional[asyncio.Task[None]] = None
+    self._consumer_task: Optional[asyncio.Task[None]] = None
+    self._connected = asyncio.Event()
+    self.frames_received = 0
+
+  @property
+  def subscription_count(self) -> int:
+    return len(self._subscriptions)
+
+  @property
+  def queue_depth(self) -> int:
+    return self._queue.qsize()
+
+  @property
+  def connected(self) -> bool:
+    return self._connected.is_set()
+
+  def start(self) -> None:
+    """reader/consumer task 시작"""
+    if self._reader_task is None:
+      self._reader_task = asyncio.create_task(self._read_loop(), name=f"kis-ws-reader-{self.name}")
+      self._consumer_task = asyncio.create_task(self._consume_loop(), name=f"kis-ws-consumer-{self.name}")
+
+  async def stop(self) -> None:
+    """연결 종료 (남은 큐는 버림)"""
+    for task in (self._reader_task, self._consumer_task):
+      if task is not None:
+        task.cancel()
+    for task in (self._reader_task, self._consumer_task):
+      if task is not None:
+        try:
+          await task
+        except asyncio.CancelledError:
+          pass
+    self._reader_task = self._consumer_task = None
+    if self._ws is not None:
+      await self._ws.close()
+      self._ws = None
+    self._connected.clear()
+
+  async def subscribe(self, tr_id: str, tr_key: str) -> None:
+    """실시간 등록 (연결 전이면 접속 직후 일괄 등록)"""
+    if (tr_id, tr_key) in self._subscriptions:
+      return
+    self._subscriptions.add((tr_id, tr_key))
+    await self._send_subscription(tr_id, tr_key, register=True)
+
+  async def unsubscribe(self, tr_id: str, tr_key: str) -> None:
+    """실시간 해제"""
+    if (tr_id, tr_key) not in self._subscriptions:
+      return
+    self._subscriptions.discard((tr_id, tr_key))
+    await self._send_subscription(tr_id, tr_key, register=False)
+
+  async def _send_subscription(self, tr_id: str, tr_key: str, *, register: bool) -> None:
+    ws = self._ws
+    if ws is None or not self._connected.is_set():
+      return
+    try:
+      await ws.send(subscribe_message(self._approval_key or "", tr_id, tr_key, register=register))
+    except ConnectionClosed:
+      # 재접속 시 _subscriptions 기준으로 다시 등록
+      log.warning("[REALTIME] 구독 요청 중 연결 종료 connection=%s, tr_id=%s, tr_key=%s", self.name, tr_id, tr_key)
+
+  async def _read_loop(self) -> None:
+    backoff = _BACKOFF_INITIAL
+    first = True
+    while True:
+      try:
+        self._approval_key = await self._approval_key_provider()
+        async with connect(self._url, ping_interval=None, max_size=2 ** 20) as ws:
+          self._ws = ws
+          self._connected.set()
+          if not first:
+            REALTIME_RECONNECTS.inc(connection=self.name)
+          first = False
+          backoff = _BACKOFF_INITIAL
+          log.info("[REALTIME] 연결 성공 connection=%s, subscriptions=%s", self.name, len(self._subscriptions))
+          for tr_id, tr_key in list(self._subscriptions):
+            await ws.send(subscribe_message(self._approval_key, tr_id, tr_key, register=True))
+          await self._receive(ws)
+      except asyncio.CancelledError:
+        raise
+      except Exception as e:
+        log.warning("[REALTIME] 연결 종료 connection=%s, 재접속 대기 %.1fs (%s)", self.name, backoff, e)
+      finally:
+        self._connected.clear()
+        self._ws = None
+      await asyncio.sleep(backoff)
+      backoff = min(backoff * 2, _BACKOFF_MAX)
+
+  async def _receive(self, ws: ClientConnection) -> None:
+    """수신 루프 (텍스트 프레임도 디코딩 없이 bytes 로 수신)"""
+    while True:
+      raw = await ws.recv(decode=False)
+      if self._raw_tap is not None:
+        self._raw_tap(raw)
+      if is_control(raw):
+        await self._handle_control(ws, raw)
+        continue
+      try:
+        frame = parse_frame(raw)
+      except ValueError:
+        log.warning("[REALTIME] 프레임 파싱 실패 connection=%s, raw=%r", self.name, raw[:64])
+        continue
+      self.frames_received += 1
+      REALTIME_MESSAGES.inc(frame.count, tr_id=frame.tr_id)
+      await self._enqueue(frame)
+
+  async def _enqueue(self, frame: RealtimeFrame) -> None:
+    queue = self._queue
+    if not queue.full():
+      queue.put_nowait(frame)
+    elif self._overflow == "drop_oldest":
+      queue.get_nowait()
+      queue.task_done()
+      queue.put_nowait(frame)
+      REALTIME_DROPPED.inc(connection=self.name)
+    else:
+      # 소켓 읽기를 멈춰 송신측까지 backpressure 전파
+      begin = time.perf_counter()
+      await queue.put(frame)
+      REALTIME_BACKPRESSURE_SECONDS.observe(time.perf_counter() - begin)
+    REALTIME_QUEUE_DEPTH.set(queue.qsize(), connection=self.name)
+
+  async def _handle_control(self, ws: ClientConnection, raw: bytes) -> None:
+    try:
+      message = parse_control(raw)
+    except ValueError:
+      log.warning("[REALTIME] 제어 메시지 파싱 실패 connection=%s, raw=%r", self.name, raw[:64])
+      return
+    header = message.get("header") or {}
+    if header.get("tr_id") == "PINGPONG":
+      # 서버 heartbeat 는 그대로 회신
+      await ws.send(raw, text=True)
+      return
+    body = message.get("body") or {}
+    if body.get("rt_cd") not in (None, "0"):
+      log.error("[REALTIME] 구독 요청 실패 connection=%s, tr_id=%s, tr_key=%s, msg=%s",
+                self.name, header.get("tr_id"), header.get("tr_key"), body.get("msg1"))
+    else:
+      log.debug("[REALTIME] 구독 응답 connection=%s, tr_id=%s, tr_key=%s, msg=%s",
+                self.name, header.get("tr_id"), header.get("tr_key"), body.get("msg1"))
+
+  async def _consume_loop(self) -> None:
+    queue = self._queue
+    while True:
+      frame = await queue.get()
+      try:
+        await self._on_frame(frame)
+      except Exception:
+        log.exception("[REALTIME] 프레임 처리 실패 connection=%s, tr_id=%s", self.name, frame.tr_id)
+      finally:
+        queue.task_done()
@@ -0,0 +1,143 @@
+# src/infrastructure/kis/websocket/hub.py
+"""
+실시간 구독 다중화 허브
+- 같은 (tr_id, 종목) 을 여러 소비자가 구독해도 KIS 등록은 1회 (참조 카운트)
+- 세션당 등록 한도(기본 41)를 넘으면 연결을 추가로 열어 분산
+- 연결별 consumer 가 프레임을 종목별 handler 로 분배
+"""
+import asyncio
+import inspect
+import itertools
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional, Union
+
+from config.settings import settings
+from infrastructure.kis.websocket.connection import KISRealtimeConnection, OverflowPolicy, RawTap
+from infrastructure.kis.websocket.parser import RealtimeFrame, Tick
+
+log = logging.getLogger(__name__)
+
+TickHandler = Callable[[Tick], Union[None, Awaitable[None]]]
+
+
+@dataclass(frozen=True)
+class Subscription:
+  """구독 핸들 (unsubscribe 시 사용)"""
+  id: int
+  tr_id: str
+  tr_key: str
+
+
+class RealtimeHub:
+  """KIS 실시간 구독 다중화 허브"""
+
+  def __init__(
+      self,
+      *,
+      url: Optional[str] = None,
+      approval_key_provider: Optional[Callable[[], Awaitable[str]]] = None,
+      max_subscriptions_per_connection: Optional[int] = None,
+      queue_size: Optional[int] = None,
+      overflow: OverflowPolicy = "block",
+      raw_tap: Optional[RawTap] = None,
+  ) -> None:
+    if approval_key_provider is None:
+      from infrastructure.kis.websocket.approval_service import KISApprovalKeyService
+      approval_key_provider = KISApprovalKeyService().get_approval_key
+    self._url = url or settings.kis_ws_url
+    self._approval_key_provider = approval_key_provider
+    self._max_per_connection = max_subscriptions_per_connection or settings.realtime_max_subscriptions_per_connection
+    self._queue_size = queue_size or settings.realtime_queue_size
+    self._overflow = overflow
+    self._raw_tap = raw_tap
+    self._connections: list[KISRealtimeConnection] = []
+    self._routes: dict[tuple[str, str], dict[int, TickHandler]] = {}
+    self._owner: dict[tuple[str, str], KISRealtimeConnection] = {}
+    self._ids = itertools.count(1)
+    self._lock = asyncio.Lock()
+    self._started = False
+
+  async def start(self) -> None:
+    self._started = True
+    for conn in self._connections:
+      conn.start()
+
+  async def stop(self) -> None:
+    self._started = False
+    await asyncio.gather(*(conn.stop() for conn in self._connections), return_exceptions=True)
+
+  async def subscribe(self, tr_id: str, tr_key: str, handler: TickHandler) -> Subscription:
+    """(tr_id, 종목) 구독 → handler 로 Tick 전달"""
+    key = (tr_id, tr_key)
+    async with self._lock:
+      sub = Subscription(id=next(self._ids), tr_id=tr_id, tr_key=tr_key)
+      handlers = self._routes.setdefault(key, {})
+      handlers[sub.id] = handler
+      if key not in self._owner:
+        conn = self._connection_with_capacity()
+        self._owner[key] = conn
+        await conn.subscribe(tr_id, tr_key)
+      return sub
+
+  async def unsubscribe(self, sub: Subscription) -> None:
+    """구독 해제 (마지막 구독자면 KIS 등록도 해제)"""
+    key = (sub.tr_id, sub.tr_key)
+    async with self._lock:
+      handlers = self._routes.get(key)
+      if not handlers or handlers.pop(sub.id, None) is None:
+        return
+      if not handlers:
+        del self._routes[key]
+        conn = self._owner.pop(key)
+        await conn.unsubscribe(sub.tr_id, sub.tr_key)
+
+  def stats(self) -> dict[str, Any]:
+    """연결별 구독 수/큐 적재/수신 프레임 수"""
+    return {
+      "url": self._url,
+      "routes": len(self._routes),
+      "connections": [
+        {
+          "name": conn.name,
+          "connected": conn.connected,
+          "subscriptions": conn.subscription_count,
+          "queue_depth": conn.queue_depth,
+          "frames_received": conn.frames_received,
+        }
+        for conn in self._connections
+      ],
+    }
+
+  def _connection_with_capacity(self) -> KISRealtimeConnection:
+    for conn in self._connections:
+      if conn.subscription_count < self._max_per_connection:
+        return conn
+    conn = KISRealtimeConnection(
+        f"ws-{len(self._connections)}",
+        url=self._url,
+        approval_key_provider=self._approval_key_provider,
+        on_frame=self._dispatch,
+        queue_size=self._queue_size,
+        overflow=self._overflow,
+        raw_tap=self._raw_tap,
+    )
+    self._connections.append(conn)
+    if self._started:
+      conn.start()
+    log.info("[REALTIME] 연결 추가 connection=%s (세션당 한도 %s)", conn.name, self._max_per_connection)
+    return conn
+
+  async def _dispatch(self, frame: RealtimeFrame) -> None:
+    routes = self._routes
+    for tick in frame.records():
+      handlers = routes.get((frame.tr_id, tick.ticker))
+      if not handlers:
+        continue
+      for handler in list(handlers.values()):
+        try:
+          result = handler(tick)
+          if inspect.isawaitable(result):
+            await result
+        except Exception:
+          log.exception("[REALTIME] handler 실패 tr_id=%s, ticker=%s", frame.tr_id, tick.ticker)
@@ -0,0 +1,193 @@
+# src/infrastructure/kis/websocket/parser.py
+"""
+KIS 실시간 메시지 파서
+데이터 프레임: {암호화 0/1}|{tr_id}|{레코드 수 3자리}|{필드^필드^...}  (레코드들이 '^' 로 이어짐)
+제어 프레임: JSON (구독 응답, PINGPONG)
+
+- 프레임을 문자열로 디코딩/분할하지 않고 bytes 위에서 구분자 위치만 계산
+  ('^' 위치는 np.frombuffer 뷰에 대한 벡터 비교 한 번)
+- 필요한 필드만 잘라서 숫자로 변환
+"""
+import json
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional, Union
+
+import numpy as np
+
+_PIPE = 0x7C  # '|'
+_CARET = 0x5E  # '^'
+
+
+@dataclass(frozen=True)
+class FeedSpec:
+  """실시간 TR 정의 (레코드당 필드 수는 KIS 명세 기준)"""
+  tr_id: str
+  field_count: int
+  kind: str  # "execution" | "quote"
+
+
+# 국내주식 실시간체결가 / 실시간호가
+EXECUTION_TR_ID = "H0STCNT0"
+QUOTE_TR_ID = "H0STASP0"
+FEED_SPECS: dict[str, FeedSpec] = {
+  EXECUTION_TR_ID: FeedSpec(tr_id=EXECUTION_TR_ID, field_count=46, kind="execution"),
+  QUOTE_TR_ID: FeedSpec(tr_id=QUOTE_TR_ID, field_count=59, kind="quote"),
+}
+
+# H0STCNT0 필드 인덱스
+_EX_TICKER, _EX_TIME, _EX_PRICE, _EX_CHANGE_RATE = 0, 1, 2, 5
+_EX_OPEN, _EX_HIGH, _EX_LOW = 7, 8, 9
+_EX_VOLUME, _EX_CUM_VOLUME, _EX_CUM_VALUE = 12, 13, 14
+# H0STASP0 필드 인덱스 (매도호가 1~10, 매수호가 1~10, 매도잔량 1~10, 매수잔량 1~10, 총잔량)
+_QT_TICKER, _QT_TIME = 0, 1
+_QT_ASK, _QT_BID, _QT_ASK_SIZE, _QT_BID_SIZE = 3, 13, 23, 33
+_QT_TOTAL_ASK, _QT_TOTAL_BID = 43, 44
+
+
+@dataclass(frozen=True, slots=True)
+class ExecutionTick:
+  """실시간 체결"""
+  ticker: str
+  hhmmss: str
+  price: float
+  change_rate: float
+  open_price: float
+  high_price: float
+  low_price: float
+  volume: int  # 체결량
+  cum_volume: int  # 누적 거래량
+  cum_value: float  # 누적 거래대금
+
+
+@dataclass(frozen=True, slots=True)
+class QuoteTick:
+  """실시간 호가 (10단계)"""
+  ticker: str
+  hhmmss: str
+  ask_prices: tuple[float, ...]
+  bid_prices: tuple[float, ...]
+  ask_sizes: tuple[int, ...]
+  bid_sizes: tuple[int, ...]
+  total_ask_size: int
+  total_bid_size: int
+
+
+Tick = Union[ExecutionTick, QuoteTick]
+
+
+class RealtimeFrame:
+  """
+  데이터 프레임 1개 (레코드 N 개)
+  원본 bytes 를 그대로 참조하고, 필드 경계(ends)만 배열로 보관
+  """
+  __slots__ = ("tr_id", "encrypted", "count", "_buf", "_starts", "_ends", "_spec")
+
+  def __init__(self, buf: bytes, tr_id: str, encrypted: bool, count: int, body_start: int) -> None:
+    self._buf = buf
+    self.tr_id = tr_id
+    self.encrypted = encrypted
+    self.count = count
+    self._spec = FEED_SPECS.get(tr_id)
+    view = np.frombuffer(buf, dtype=np.uint8, offset=body_start)
+    ends = np.flatnonzero(view == _CARET) + body_start
+    self._ends = np.append(ends, len(buf))
+    self._starts = np.concatenate(([body_start], self._ends[:-1] + 1))
+
+  @property
+  def spec(self) -> Optional[FeedSpec]:
+    return self._spec
+
+  def field(self, record: int, index: int) -> bytes:
+    """레코드 record 의 index 번째 필드 원본 bytes"""
+    pos = record * self._spec.field_count + index
+    return self._buf[self._starts[pos]:self._ends[pos]]
+
+  def ticker(self, record: int) -> str:
+    return self.field(record, 0).decode("ascii")
+
+  def tickers(self) -> list[str]:
+    return [self.ticker(r) for r in range(self.count)]
+
+  def records(self) -> Iterator[Tick]:
+    """레코드 → 체결/호가 Tick (미지원 TR 이면 빈 iterator)"""
+    spec = self._spec
+    if spec is None or self.encrypted:
+      return
+    if self._ends.shape[0] < self.count * spec.field_count:
+      raise ValueError(f"필드 수가 부족한 실시간 프레임입니다. tr_id={self.tr_id}, count={self.count}")
+    build = _build_execution if spec.kind == "execution" else _build_quote
+    for r in range(self.count):
+      yield build(self, r)
+
+
+def _num(raw: bytes) -> float:
+  return float(raw) if raw else 0.0
+
+
+def _int(raw: bytes) -> int:
+  return int(raw) if raw else 0
+
+
+def _build_execution(frame: RealtimeFrame, r: int) -> ExecutionTick:
+  f = frame.field
+  return ExecutionTick(
+      ticker=f(r, _EX_TICKER).decode("ascii"),
+      hhmmss=f(r, _EX_TIME).decode("ascii"),
+      price=_num(f(r, _EX_PRICE)),
+      change_rate=_num(f(r, _EX_CHANGE_RATE)),
+      open_price=_num(f(r, _EX_OPEN)),
+      high_price=_num(f(r, _EX_HIGH)),
+      low_price=_num(f(r, _EX_LOW)),
+      volume=_int(f(r, _EX_VOLUME)),
+      cum_volume=_int(f(r, _EX_CUM_VOLUME)),
+      cum_value=_num(f(r, _EX_CUM_VALUE)),
+  )
+
+
+def _build_quote(frame: RealtimeFrame, r: int) -> QuoteTick:
+  f = frame.field
+  return QuoteTick(
+      ticker=f(r, _QT_TICKER).decode("ascii"),
+      hhmmss=f(r, _QT_TIME).decode("ascii"),
+      ask_prices=tuple(_num(f(r, _QT_ASK + i)) for i in range(10)),
+      bid_prices=tuple(_num(f(r, _QT_BID + i)) for i in range(10)),
+      ask_sizes=tuple(_int(f(r, _QT_ASK_SIZE + i)) for i in range(10)),
+      bid_sizes=tuple(_int(f(r, _QT_BID_SIZE + i)) for i in range(10)),
+      total_ask_size=_int(f(r, _QT_TOTAL_ASK)),
+      total_bid_size=_int(f(r, _QT_TOTAL_BID)),
+  )
+
+
+def is_control(buf: bytes) -> bool:
+  """JSON 제어 프레임 여부"""
+  return buf[:1] == b"{"
+
+
+def parse_control(buf: bytes) -> dict[str, Any]:
+  """JSON 제어 프레임 파싱 (구독 응답, PINGPONG)"""
+  return json.loads(buf)
+
+
+def parse_frame(buf: bytes) -> RealtimeFrame:
+  """
+  데이터 프레임 헤더 파싱 → RealtimeFrame (본문 필드는 접근 시점에 슬라이스)
+  :raises ValueError: 형식이 맞지 않는 프레임
+  """
+  p1 = buf.find(_PIPE)
+  p2 = buf.find(_PIPE, p1 + 1)
+  p3 = buf.find(_PIPE, p2 + 1)
+  if p1 != 1 or p2 < 0 or p3 < 0:
+    raise ValueError(f"KIS 실시간 프레임 형식 오류: {bytes(buf[:32])!r}")
+  return RealtimeFrame(
+      buf,
+      tr_id=buf[p1 + 1:p2].decode("ascii"),
+      encrypted=buf[0] == 0x31,  # '1'
+      count=int(buf[p2 + 1:p3]),
+      body_start=p3 + 1,
+  )
+
+
+def encode_frame(tr_id: str, records: list[list[str]]) -> bytes:
+  """레코드 → KIS 데이터 프레임 bytes (리플레이/합성 데이터 생성용)"""
+  body = "^".join("^".join(fields) for fields in records)
+  return f"0|{tr_id}|{len(records):03d}|{body}".encode("ascii")
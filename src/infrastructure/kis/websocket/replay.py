@@ -0,0 +1,274 @@
+# src/infrastructure/kis/websocket/replay.py
+"""
+실시간 시세 녹화/리플레이 (오프라인 부하 테스트용 KIS WebSocket 대역)
+
+녹화 파일 형식: [int64 수신시각(ns, 첫 프레임 기준 상대값)][uint32 길이][원본 프레임 bytes] 반복
+- TickRecorder: 허브 raw_tap 으로 연결해 실제 수신 프레임을 그대로 저장
+- ReplayServer: 녹화 파일을 mmap 으로 열어 구독된 종목 프레임만 원래 간격(speed 배속) 또는 최대 속도로 송신
+  KIS 와 같은 구독 응답/PINGPONG 형식을 흉내내므로 RealtimeHub 를 그대로 붙여 테스트 가능
+
+사용 예 (src 디렉토리 기준):
+  python -m infrastructure.kis.websocket.replay generate --out ticks.bin --tickers 005930,000660 --frames 200000
+  python -m infrastructure.kis.websocket.replay serve --file ticks.bin --port 8765 --speed 0
+  python -m infrastructure.kis.websocket.replay bench --url ws://127.0.0.1:8765 --tickers 005930,000660 --seconds 10
+"""
+import argparse
+import asyncio
+import json
+import logging
+import mmap
+import random
+import struct
+import time
+from typing import BinaryIO, Iterator, Optional
+
+from websockets.asyncio.server import ServerConnection, serve
+from websockets.exceptions import ConnectionClosed
+
+from infrastructure.kis.websocket.parser import (
+  EXECUTION_TR_ID, FEED_SPECS, QUOTE_TR_ID, encode_frame, is_control
+)
+
+log = logging.getLogger(__name__)
+
+_RECORD_HEADER = struct.Struct("<qI")
+
+
+class TickRecorder:
+  """수신 프레임 녹화기 (RealtimeHub(raw_tap=recorder.record))"""
+
+  def __init__(self, path: str, *, flush_bytes: int = 1 << 20) -> None:
+    self._file: BinaryIO = open(path, "ab")
+    self._buffer = bytearray()
+    self._flush_bytes = flush_bytes
+    self._origin: Optional[int] = None
+    self.frames = 0
+
+  def record(self, raw: bytes) -> None:
+    now = time.monotonic_ns()
+    if self._origin is None:
+      self._origin = now
+    self._buffer += _RECORD_HEADER.pack(now - self._origin, len(raw))
+    self._buffer += raw
+    self.frames += 1
+    if len(self._buffer) >= self._flush_bytes:
+      self.flush()
+
+  def flush(self) -> None:
+    if self._buffer:
+      self._file.write(self._buffer)
+      self._buffer.clear()
+      self._file.flush()
+
+  def close(self) -> None:
+    self.flush()
+    self._file.close()
+
+
+def iter_recording(path: str) -> Iterator[tuple[int, memoryview]]:
+  """
+  녹화 파일 → (상대시각 ns, 프레임 memoryview) (mmap 기반, 복사 없음)
+  yield 한 memoryview 가 살아 있을 수 있으므로 mmap 은 명시적으로 닫지 않고 GC 에 맡김
+  """
+  with open(path, "rb") as f:
+    if f.seek(0, 2) == 0:
+      return
+    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+  view = memoryview(mm)
+  pos, end = 0, len(mm)
+  while pos + _RECORD_HEADER.size <= end:
+    ts, length = _RECORD_HEADER.unpack_from(mm, pos)
+    pos += _RECORD_HEADER.size
+    yield ts, view[pos:pos + length]
+    pos += length
+
+
+def _route_key(raw: memoryview) -> Optional[tuple[str, str]]:
+  """프레임 앞부분만 읽어 (tr_id, 첫 레코드 종목코드) 추출"""
+  if is_control(raw):
+    return None
+  parts = bytes(raw[:48]).split(b"|", 3)
+  if len(parts) < 4:
+    return None
+  return parts[1].decode("ascii"), parts[3].split(b"^", 1)[0].decode("ascii")
+
+
+def _synthetic_fields(tr_id: str, ticker: str, hhmmss: str, price: float, cum_volume: int) -> list[str]:
+  """KIS 필드 수에 맞춘 합성 레코드"""
+  spec = FEED_SPECS[tr_id]
+  fields = ["0"] * spec.field_count
+  fields[0], fields[1] = ticker, hhmmss
+  if tr_id == EXECUTION_TR_ID:
+    volume = random.randint(1, 500)
+    fields[2] = f"{price:.0f}"
+    fields[5] = f"{random.uniform(-3, 3):.2f}"
+    fields[7] = fields[8] = fields[9] = f"{price:.0f}"
+    fields[12], fields[13] = str(volume), str(cum_volume + volume)
+    fields[14] = f"{(cum_volume + volume) * price:.0f}"
+  else:
+    for i in range(10):
+      fields[3 + i] = f"{price + (i + 1) * 100:.0f}"
+      fields[13 + i] = f"{price - (i + 1) * 100:.0f}"
+      fields[23 + i] = str(random.randint(1, 10_000))
+      fields[33 + i] = str(random.randint(1, 10_000))
+    fields[43] = fields[44] = str(random.randint(10_000, 100_000))
+  return fields
+
+
+def generate_synthetic_recording(path: str, *, tickers: list[str], frames: int, rate: float = 1000.0) -> int:
+  """합성 체결/호가 녹화 파일 생성 (rate: 초당 프레임 수 기준 타임스탬프 간격)"""
+  prices = { t: random.uniform(10_000, 100_000) for t in tickers }
+  volumes = { t: 0 for t in tickers }
+  interval_ns = int(1e9 / rate) if rate > 0 else 0
+  start = 9 * 3600
+  with open(path, "wb") as f:
+    for i in range(frames):
+      ticker = tickers[i % len(tickers)]
+      tr_id = EXECUTION_TR_ID if i % 3 else QUOTE_TR_ID
+      prices[ticker] *= 1 + random.gauss(0, 0.0005)
+      sec = start + (i * interval_ns) // 1_000_000_000
+      hhmmss = f"{sec // 3600:02d}{sec % 3600 // 60:02d}{sec % 60:02d}"
+      fields = _synthetic_fields(tr_id, ticker, hhmmss, prices[ticker], volumes[ticker])
+      if tr_id == EXECUTION_TR_ID:
+        volumes[ticker] = int(fields[13])
+      raw = encode_frame(tr_id, [fields])
+      f.write(_RECORD_HEADER.pack(i * interval_ns, len(raw)))
+      f.write(raw)
+  return frames
+
+
+class ReplayServer:
+  """녹화 파일을 KIS WebSocket 처럼 송신하는 로컬 서버"""
+
+  def __init__(self, path: str, *, host: str = "127.0.0.1", port: int = 8765,
+               speed: float = 1.0, loop: bool = False) -> None:
+    self._path = path
+    self._host = host
+    self._port = port
+    self._speed = speed
+    self._loop = loop
+
+  async def serve_forever(self) -> None:
+    async with serve(self._handle, self._host, self._port, max_size=2 ** 20) as server:
+      log.info("[REPLAY] 리플레이 서버 시작 ws://%s:%s (file=%s, speed=%s)",
+               self._host, self._port, self._path, self._speed)
+      await server.serve_forever()
+
+  async def _handle(self, ws: ServerConnection) -> None:
+    subscriptions: set[tuple[str, str]] = set()
+    subscribed = asyncio.Event()
+    control = asyncio.create_task(self._control_loop(ws, subscriptions, subscribed))
+    try:
+      await subscribed.wait()
+      await self._stream(ws, subscriptions)
+    except ConnectionClosed:
+      pass
+    finally:
+      control.cancel()
+
+  async def _control_loop(self, ws: ServerConnection, subscriptions: set[tuple[str, str]],
+                          subscribed: asyncio.Event) -> None:
+    async for raw in ws:
+      try:
+        message = json.loads(raw)
+      except ValueError:
+        continue
+      header = message.get("header") or {}
+      if header.get("tr_id") == "PINGPONG":
+        continue
+      body_input = (message.get("body") or {}).get("input") or {}
+      key = (body_input.get("tr_id", ""), body_input.get("tr_key", ""))
+      if header.get("tr_type") == "2":
+        subscriptions.discard(key)
+        msg = "UNSUBSCRIBE SUCCESS"
+      else:
+        subscriptions.add(key)
+        subscribed.set()
+        msg = "SUBSCRIBE SUCCESS"
+      await ws.send(json.dumps({
+        "header": { "tr_id": key[0], "tr_key": key[1], "encrypt": "N" },
+        "body": { "rt_cd": "0", "msg_cd": "OPSP0000", "msg1": msg },
+      }))
+
+  async def _stream(self, ws: ServerConnection, subscriptions: set[tuple[str, str]]) -> None:
+    sent = 0
+    begin = time.perf_counter()
+    while True:
+      replay_start = time.perf_counter()
+      for ts_ns, raw in iter_recording(self._path):
+        if self._speed > 0:
+          delay = ts_ns / 1e9 / self._speed - (time.perf_counter() - replay_start)
+          if delay > 0:
+            await asyncio.sleep(delay)
+        if _route_key(raw) not in subscriptions:
+          continue
+        await ws.send(raw, text=True)
+        sent += 1
+        if sent % 1000 == 0:
+          await asyncio.sleep(0)  # 제어 메시지 처리 기회
+      if not self._loop:
+        break
+    log.info("[REPLAY] 송신 완료 frames=%s, %.0f frames/s", sent, sent / max(time.perf_counter() - begin, 1e-9))
+
+
+async def _bench(url: str, tickers: list[str], seconds: float) -> None:
+  """리플레이 서버에 RealtimeHub 를 붙여 수신/분배 처리량 측정"""
+  from infrastructure.kis.websocket.hub import RealtimeHub
+
+  async def _approval_key() -> str:
+    return "replay"
+
+  counts = { "ticks": 0 }
+
+  def _count(_tick) -> None:
+    counts["ticks"] += 1
+
+  hub = RealtimeHub(url=url, approval_key_provider=_approval_key)
+  for ticker in tickers:
+    await hub.subscribe(EXECUTION_TR_ID, ticker, _count)
+    await hub.subscribe(QUOTE_TR_ID, ticker, _count)
+  await hub.start()
+  begin = time.perf_counter()
+  await asyncio.sleep(seconds)
+  elapsed = time.perf_counter() - begin
+  await hub.stop()
+  print(json.dumps({ "ticks": counts["ticks"], "seconds": round(elapsed, 3),
+                     "ticks_per_second": round(counts["ticks"] / elapsed, 1), **hub.stats() }, indent=2))
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+  parser = argparse.ArgumentParser(description="KIS 실시간 시세 리플레이")
+  sub = parser.add_subparsers(dest="command", required=True)
+
+  gen = sub.add_parser("generate", help="합성 녹화 파일 생성")
+  gen.add_argument("--out", required=True)
+  gen.add_argument("--tickers", default="005930,000660,035420")
+  gen.add_argument("--frames", type=int, default=100_000)
+  gen.add_argument("--rate", type=float, default=1000.0)
+
+  srv = sub.add_parser("serve", help="리플레이 서버 실행")
+  srv.add_argument("--file", required=True)
+  srv.add_argument("--host", default="127.0.0.1")
+  srv.add_argument("--port", type=int, default=8765)
+  srv.add_argument("--speed", type=float, default=1.0, help="배속 (0 이면 최대 속도)")
+  srv.add_argument("--loop", action="store_true")
+
+  bench = sub.add_parser("bench", help="리플레이 서버 수신 처리량 측정")
+  bench.add_argument("--url", default="ws://127.0.0.1:8765")
+  bench.add_argument("--tickers", default="005930,000660,035420")
+  bench.add_argument("--seconds", type=float, default=10.0)
+
+  args = parser.parse_args(argv)
+  logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s - %(message)s")
+  if args.command == "generate":
+    n = generate_synthetic_recording(args.out, tickers=args.tickers.split(","), frames=args.frames, rate=args.rate)
+    print(f"generated {n} frames -> {args.out}")
+  elif args.command == "serve":
+    server = ReplayServer(args.file, host=args.host, port=args.port, speed=args.speed, loop=args.loop)
+    asyncio.run(server.serve_forever())
+  else:
+    asyncio.run(_bench(args.url, args.tickers.split(","), args.seconds))
+
+
+if __name__ == "__main__":
+  main()
@@ -25,6 +25,20 @@ def _default_market_seeds() -> List[dict[str, Any]]:
       },
       "description": "코스피",
     },
+    # KOSDAQ
+    {
+      "market_code": MarketType.KOSDAQ,
+      "market_name": "KOSDAQ",
+      "country_code": CountryCode.KOR,
+      "currency": CurrencyType.KRW,
+      "timezone": "Asia/Seoul",
+      "trading_hours": {
+        "regular": { "open": "09:00", "close": "15:30" },
+        "pre_open": { "open": "08:30", "close": "09:00" },
+        "after": { "open": "15:40", "close": "18:00" },
+      },
+      "description": "코스닥",
+    },
   ]
 
 
@@ -0,0 +1,64 @@
+# src/infrastructure/metrics/instruments.py
+"""
+애플리케이션 공용 메트릭 정의
+"""
+from infrastructure.metrics.registry import registry, Counter, Gauge, Histogram
+
+# ===================== KIS =====================
+KIS_REQUEST_SECONDS = registry.register(Histogram(
+    "kis_request_duration_seconds", "KIS API 요청 지연시간(초)", ["tr_id"],
+))
+KIS_REQUEST_ERRORS = registry.register(Counter(
+    "kis_request_errors_total", "KIS API 요청 오류 수", ["tr_id", "reason"],
+))
+KIS_CACHE_REQUESTS = registry.register(Counter(
+    "kis_cache_requests_total", "KIS 응답 캐시 조회 수 (memory/redis/coalesced/miss)", ["tr_id", "result"],
+))
+
+# ===================== DB 커넥션 풀 =====================
+DB_POOL_CHECKOUT_WAIT_SECONDS = registry.register(Histogram(
+    "db_pool_checkout_wait_seconds", "커넥션 풀 checkout 대기시간(초)",
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+))
+DB_POOL_CHECKOUT_ERRORS = registry.register(Counter(
+    "db_pool_checkout_errors_total", "커넥션 풀 checkout 실패 수 (timeout 등)", ["reason"],
+))
+
+# ===================== Redis =====================
+REDIS_COMMAND_SECONDS = registry.register(Histogram(
+    "redis_command_duration_seconds", "Redis 명령 지연시간(초)", ["command"],
+    buckets=(0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0, 5.0),
+))
+REDIS_COMMAND_ERRORS = registry.register(Counter(
+    "redis_command_errors_total", "Redis 명령 오류 수", ["command"],
+))
+
+# ===================== 스케줄러 =====================
+SCHEDULER_JOB_SECONDS = registry.register(Histogram(
+    "scheduler_job_duration_seconds", "스케줄러 Job 실행시간(초)", ["job_id", "status"],
+    buckets=(0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 600.0, 1800.0, 3600.0),
+))
+SCHEDULER_JOB_RUNNING = registry.register(Gauge(
+    "scheduler_job_running", "실행 중인 Job 인스턴스 수", ["job_id"],
+))
+SCHEDULER_JOB_OVERLAPS = registry.register(Counter(
+    "scheduler_job_overlap_total", "이전 실행이 끝나기 전에 다시 시작된 Job 실행 수", ["job_id"],
+))
+
+# ===================== 실시간 시세 (WebSocket) =====================
+REALTIME_MESSAGES = registry.register(Counter(
+    "realtime_messages_total", "실시간 수신 레코드 수", ["tr_id"],
+))
+REALTIME_QUEUE_DEPTH = registry.register(Gauge(
+    "realtime_queue_depth", "연결별 수신 큐 적재 건수", ["connection"],
+))
+REALTIME_BACKPRESSURE_SECONDS = registry.register(Histogram(
+    "realtime_backpressure_wait_seconds", "수신 큐가 가득 차 소켓 읽기가 대기한 시간(초)",
+    buckets=(0.0001, 0.001, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0),
+))
+REALTIME_DROPPED = registry.register(Counter(
+    "realtime_dropped_total", "drop_oldest 정책으로 버려진 실시간 레코드 수", ["connection"],
+))
+REALTIME_RECONNECTS = registry.register(Counter(
+    "realtime_reconnects_total", "실시간 연결 재접속 수", ["connection"],
+))
@@ -0,0 +1,207 @@
+# src/infrastructure/metrics/registry.py
+"""
+Prometheus 텍스트 포맷(0.0.4) 호환 인프로세스 메트릭
+- 외부 의존성 없이 Counter / Gauge / Histogram / 콜백 Gauge 제공
+- 라벨 조합별 값은 dict 한 번 조회 + 숫자 덧셈 수준의 비용
+"""
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+LabelValues = Tuple[str, ...]
+
+# 기본 지연시간 버킷 (초)
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+  0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+
+def _escape(value: str) -> str:
+  return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+  pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+  if extra is not None:
+    pairs.append(f'{extra[0]}="{extra[1]}"')
+  return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+  if value == float("inf"):
+    return "+Inf"
+  if value == int(value) and abs(value) < 1e15:
+    return str(int(value))
+  return repr(value)
+
+
+class _Metric:
+  type_name = ""
+
+  def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+    self.name = name
+    self.documentation = documentation
+    self.labelnames = tuple(labelnames)
+    self._lock = threading.Lock()
+
+  def _key(self, labels: Dict[str, str]) -> LabelValues:
+    return tuple(str(labels.get(n, "")) for n in self.labelnames)
+
+  def header(self) -> List[str]:
+    return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+
+  def collect(self) -> List[str]:
+    raise NotImplementedError
+
+
+class Counter(_Metric):
+  """단조 증가 카운터"""
+  type_name = "counter"
+
+  def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+    super().__init__(name, documentation, labelnames)
+    self._values: Dict[LabelValues, float] = { }
+
+  def inc(self, amount: float = 1.0, **labels: str) -> None:
+    key = self._key(labels)
+    with self._lock:
+      self._values[key] = self._values.get(key, 0.0) + amount
+
+  def collect(self) -> List[str]:
+    with self._lock:
+      items = list(self._values.items())
+    return [f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}" for k, v in items]
+
+
+class Gauge(_Metric):
+  """증감 가능한 게이지"""
+  type_name = "gauge"
+
+  def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+    super().__init__(name, documentation, labelnames)
+    self._values: Dict[LabelValues, float] = { }
+
+  def set(self, value: float, **labels: str) -> None:
+    key = self._key(labels)
+    with self._lock:
+      self._values[key] = value
+
+  def inc(self, amount: float = 1.0, **labels: str) -> float:
+    """증가 후 현재 값 반환"""
+    key = self._key(labels)
+    with self._lock:
+      value = self._values.get(key, 0.0) + amount
+      self._values[key] = value
+      return value
+
+  def dec(self, amount: float = 1.0, **labels: str) -> float:
+    return self.inc(-amount, **labels)
+
+  def collect(self) -> List[str]:
+    with self._lock:
+      items = list(self._values.items())
+    return [f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}" for k, v in items]
+
+
+class CallbackGauge(_Metric):
+  """스크레이프 시점에 콜백으로 값을 읽는 게이지 (커넥션 풀 상태 등)"""
+  type_name = "gauge"
+
+  def __init__(
+      self,
+      name: str,
+      documentation: str,
+      callback: Callable[[], Iterable[Tuple[LabelValues, float]]],
+      labelnames: Sequence[str] = (),
+  ) -> None:
+    super().__init__(name, documentation, labelnames)
+    self._callback = callback
+
+  def collect(self) -> List[str]:
+    try:
+      items = list(self._callback())
+    except Exception:
+      return []
+    return [f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}" for k, v in items]
+
+
+class Histogram(_Metric):
+  """누적 버킷 히스토그램"""
+  type_name = "histogram"
+
+  def __init__(
+      self,
+      name: str,
+      documentation: str,
+      labelnames: Sequence[str] = (),
+      buckets: Sequence[float] = DEFAULT_BUCKETS,
+  ) -> None:
+    super().__init__(name, documentation, labelnames)
+    self._upper = tuple(sorted(buckets))
+    # 라벨 조합별 [버킷별 개수..., +Inf 개수], 합계
+    self._counts: Dict[LabelValues, List[int]] = { }
+    self._sums: Dict[LabelValues, float] = { }
+
+  def observe(self, value: float, **labels: str) -> None:
+    key = self._key(labels)
+    idx = bisect_left(self._upper, value)
+    with self._lock:
+      counts = self._counts.get(key)
+      if counts is None:
+        counts = self._counts[key] = [0] * (len(self._upper) + 1)
+        self._sums[key] = 0.0
+      counts[idx] += 1
+      self._sums[key] += value
+
+  @contextmanager
+  def time(self, **labels: str) -> Iterator[None]:
+    """블록 실행 시간(초) 기록"""
+    begin = time.perf_counter()
+    try:
+      yield
+    finally:
+      self.observe(time.perf_counter() - begin, **labels)
+
+  def collect(self) -> List[str]:
+    with self._lock:
+      snapshot = [(k, list(c), self._sums[k]) for k, c in self._counts.items()]
+    lines: List[str] = []
+    for key, counts, total in snapshot:
+      cumulative = 0
+      for upper, count in zip((*self._upper, float("inf")), counts):
+        cumulative += count
+        le = ("le", _format_value(upper))
+        lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+      lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(total)}")
+      lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {cumulative}")
+    return lines
+
+
+M = TypeVar("M", bound=_Metric)
+
+
+class MetricsRegistry:
+  """메트릭 등록/노출"""
+
+  def __init__(self) -> None:
+    self._metrics: Dict[str, _Metric] = { }
+
+  def register(self, metric: M) -> M:
+    if metric.name in self._metrics:
+      raise ValueError(f"이미 등록된 메트릭입니다: {metric.name}")
+    self._metrics[metric.name] = metric
+    return metric
+
+  def render(self) -> str:
+    """텍스트 exposition 포맷 렌더링"""
+    lines: List[str] = []
+    for metric in self._metrics.values():
+      lines.extend(metric.header())
+      lines.extend(metric.collect())
+    return "\n".join(lines) + "\n"
+
+
+# 외부에서 바로 import 가능하도록 싱글톤 인스턴스 노출
+registry = MetricsRegistry()
@@ -0,0 +1,50 @@
+# src/infrastructure/price/dto/adjustment_dto.py
+from dataclasses import dataclass
+from datetime import date
+from typing import List, Optional
+
+from infrastructure.price.dto.daily_price_dto import DailyPriceDTO
+
+# 수정비율 변화 판정 허용오차 (KIS 수정주가 반올림 오차 흡수)
+_RATIO_TOLERANCE = 5e-3
+
+
+@dataclass(frozen=True)
+class AdjustmentEventDTO:
+  """
+  수정주가 이벤트 (price_adjustment_factor 1행)
+    ex_date: 새 기준 가격이 시작되는 거래일
+    ratio: ex_date 이전 원주가에 곱할 계수 (1:5 액면분할 → 0.2)
+  """
+  ticker: str
+  ex_date: date
+  ratio: float
+  reason: Optional[str] = None
+
+
+def to_adjustment_events(
+    ticker: str,
+    raw: List[DailyPriceDTO],
+    adjusted: List[DailyPriceDTO],
+) -> List[AdjustmentEventDTO]:
+  """
+  동일 구간 원주가/수정주가 비교 → 수정주가 이벤트 목록
+  - 일자별 수정비율 r(t) = 수정종가 / 원종가
+  - 연속 거래일 사이 r 이 바뀌면 뒤쪽 날짜가 ex_date, 계수 = r(이전일) / r(ex_date)
+  - 구간 마지막 이후 이벤트는 수정비율에 반영돼 있지 않으므로 구간 내 이벤트만 산출
+  """
+  adjusted_close = { d.trade_date: d.close_price for d in adjusted if d.close_price }
+  reasons = { d.trade_date: d.revl_issu_reas for d in raw if d.mod_yn }
+
+  ratios: list[tuple[date, float]] = []
+  for dto in sorted(raw, key=lambda x: x.trade_date):
+    adj = adjusted_close.get(dto.trade_date)
+    if adj and dto.close_price:
+      ratios.append((dto.trade_date, adj / dto.close_price))
+
+  events: List[AdjustmentEventDTO] = []
+  for (_, prev_ratio), (cur_date, cur_ratio) in zip(ratios, ratios[1:]):
+    factor = prev_ratio / cur_ratio
+    if abs(factor - 1.0) > _RATIO_TOLERANCE:
+      events.append(AdjustmentEventDTO(ticker=ticker, ex_date=cur_date, ratio=factor, reason=reasons.get(cur_date)))
+  return events
@@ -5,8 +5,23 @@ from typing import Optional, List
 
 from pydantic import BaseModel, Field
 
+from infrastructure.tracing.tracer import span
 from utils.decimal_util import to_date8, to_float, to_int
 
+# 전일 대비 부호 (1: 상한, 2: 상승, 3: 보합, 4: 하한, 5: 하락)
+_CHANGE_SIGN: dict[str, int] = { "1": 1, "2": 1, "3": 0, "4": -1, "5": -1 }
+
+
+def signed_change(amount: Optional[str], sign_code: Optional[str]) -> Optional[float]:
+  """prdy_vrss(절대값/부호 혼재) + prdy_vrss_sign → 부호 있는 등락금액"""
+  value = to_float(amount)
+  if value is None:
+    return None
+  sign = _CHANGE_SIGN.get((sign_code or "").strip())
+  if sign is None:
+    return value
+  return abs(value) * sign
+
 
 class ResponseHeader(BaseModel):
   # content-type → 파이썬 속성명은 content_type로, 입력 alias는 'content-type' 사용
@@ -67,6 +82,9 @@ class DailyPriceDTO:
   change_amount: Optional[float] = None
   market_cap: Optional[float] = None
   shares_outstanding: Optional[int] = None
+  # 수정주가 이벤트 신호 (액면분할/병합, 증자 등 발생일에 mod_yn="Y")
+  mod_yn: bool = False
+  revl_issu_reas: Optional[str] = None
 
 
 # ------------------------- DTO 변환기 -------------------------
@@ -77,28 +95,31 @@ def to_daily_price_dtos(ticker: str, payload: dict) -> List[DailyPriceDTO]:
   KIS 원시 payload(dict) → 파싱 → DailyPriceDTO 리스트로 변환
   - output2 배열(일자별)을 순회하며 DTO 작성
   """
-  parsed = KISDomesticDailyResponse.model_validate(payload)
-
-  out: List[DailyPriceDTO] = []
-  for row in parsed.output2:
-    d = to_date8(row.stck_bsop_date)
-    out.append(
-        DailyPriceDTO(
-            ticker=ticker,
-            trade_date=d,
-            open_price=to_float(row.stck_oprc) or 0.0,
-            high_price=to_float(row.stck_hgpr) or 0.0,
-            low_price=to_float(row.stck_lwpr) or 0.0,
-            close_price=to_float(row.stck_clpr) or 0.0,
-            volume=to_int(row.acml_vol) or 0,
-            trading_value=to_float(row.acml_tr_pbmn),
-            # output2에는 등락률이 없고 등락금액(prdy_vrss)/부호만 있음 → 등락률은 None 처리
-            adjusted_close=None,
-            change_rate=None,
-            # 부호 반영하여 등락금액 계산(부호: 1/2/3 ? API 문서 기준으로 맵핑 필요 시 보정)
-            change_amount=to_float(row.prdy_vrss),
-            market_cap=None,
-            shares_outstanding=None,
-        )
-    )
+  with span("parse.daily_price", ticker=ticker) as trace:
+    parsed = KISDomesticDailyResponse.model_validate(payload)
+
+    out: List[DailyPriceDTO] = []
+    for row in parsed.output2:
+      d = to_date8(row.stck_bsop_date)
+      out.append(
+          DailyPriceDTO(
+              ticker=ticker,
+              trade_date=d,
+              open_price=to_float(row.stck_oprc) or 0.0,
+              high_price=to_float(row.stck_hgpr) or 0.0,
+              low_price=to_float(row.stck_lwpr) or 0.0,
+              close_price=to_float(row.stck_clpr) or 0.0,
+              volume=to_int(row.acml_vol) or 0,
+              trading_value=to_float(row.acml_tr_pbmn),
+              # 등락률/시가총액/발행주식수는 적재 후 enrich_daily_prices 에서 SQL 로 계산
+              adjusted_close=None,
+              change_rate=None,
+              change_amount=signed_change(row.prdy_vrss, row.prdy_vrss_sign),
+              market_cap=None,
+              shares_outstanding=None,
+              mod_yn=row.mod_yn.strip().upper() == "Y",
+              revl_issu_reas=row.revl_issu_reas.strip() or None,
+          )
+      )
+    trace.set_attribute("rows", len(out))
   return out
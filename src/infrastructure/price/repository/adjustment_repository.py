@@ -0,0 +1,92 @@
+# src/infrastructure/price/repository/adjustment_repository.py
+from datetime import date
+from decimal import Decimal
+from typing import List, Optional, Sequence, Tuple
+
+import pandas as pd
+from sqlalchemy import select, func, Float, cast
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models import DailyPrice, PriceAdjustmentFactor
+from infrastructure.price.dto.adjustment_dto import AdjustmentEventDTO
+
+PRICE_COLUMNS: list[str] = ["open_price", "high_price", "low_price", "close_price"]
+
+
+async def upsert_adjustment_factors(
+    session: AsyncSession,
+    rows: List[Tuple[int, AdjustmentEventDTO]],
+    *,
+    source: str = "kis_compare",
+) -> int:
+  """PriceAdjustmentFactor upsert (동일 이벤트 재산출 시 계수 갱신)"""
+  if not rows:
+    return 0
+
+  payload = [
+    dict(
+        stock_id=stock_id,
+        ex_date=event.ex_date,
+        ratio=Decimal(str(round(event.ratio, 10))),
+        reason=event.reason,
+        source=source,
+    )
+    for stock_id, event in rows
+  ]
+  stmt = pg_insert(PriceAdjustmentFactor).values(payload)
+  stmt = stmt.on_conflict_do_update(
+      index_elements=[PriceAdjustmentFactor.stock_id, PriceAdjustmentFactor.ex_date],
+      set_={
+        "ratio": stmt.excluded.ratio,
+        "reason": func.coalesce(stmt.excluded.reason, PriceAdjustmentFactor.reason),
+        "source": stmt.excluded.source,
+        "updated_at": func.now(),
+      },
+  )
+  await session.execute(stmt)
+  return len(payload)
+
+
+async def load_adjustment_factor_frame(
+    session: AsyncSession,
+    *,
+    stock_ids: Optional[Sequence[int]] = None,
+) -> pd.DataFrame:
+  """수정주가 계수 조회 → DataFrame[stock_id, ex_date, ratio]"""
+  query = select(
+      PriceAdjustmentFactor.stock_id,
+      PriceAdjustmentFactor.ex_date,
+      cast(PriceAdjustmentFactor.ratio, Float).label("ratio"),
+  )
+  if stock_ids is not None:
+    query = query.where(PriceAdjustmentFactor.stock_id.in_(list(stock_ids)))
+  rows = (await session.execute(query)).all()
+  return pd.DataFrame(rows, columns=["stock_id", "ex_date", "ratio"])
+
+
+async def load_price_frame(
+    session: AsyncSession,
+    *,
+    start: date,
+    end: date,
+    stock_ids: Optional[Sequence[int]] = None,
+) -> pd.DataFrame:
+  """
+  daily_price 원주가 OHLCV 조회 → DataFrame[stock_id, trade_date, open/high/low/close_price, volume]
+  - Decimal 변환 비용을 피하기 위해 DB 에서 float8 로 캐스팅
+  """
+  query = (
+    select(
+        DailyPrice.stock_id,
+        DailyPrice.trade_date,
+        *[cast(getattr(DailyPrice, c), Float).label(c) for c in PRICE_COLUMNS],
+        DailyPrice.volume,
+    )
+    .where(DailyPrice.trade_date.between(start, end))
+    .order_by(DailyPrice.stock_id, DailyPrice.trade_date)
+  )
+  if stock_ids is not None:
+    query = query.where(DailyPrice.stock_id.in_(list(stock_ids)))
+  rows = (await session.execute(query)).all()
+  return pd.DataFrame(rows, columns=["stock_id", "trade_date", *PRICE_COLUMNS, "volume"])
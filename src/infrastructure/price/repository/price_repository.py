@@ -1,12 +1,70 @@
 # src/infrastructure/price/repository/price_repository.py
-from typing import List, Dict, Tuple
+from datetime import date, timedelta
+from typing import List, Dict, Optional, Sequence, Tuple
 
-from sqlalchemy import select, func
+from sqlalchemy import select, func, text
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.models import MarketType, Stock, Market, DailyPrice
 from infrastructure.price.dto.daily_price_dto import DailyPriceDTO
+from infrastructure.tracing.tracer import span
+
+# 적재 후 파생 컬럼 (enrich_daily_prices 가 계산, upsert 시 NULL 로 덮어쓰지 않음)
+ENRICHED_COLUMNS: tuple[str, ...] = ("change_rate", "market_cap", "shares_outstanding")
+# LAG 로 직전 거래일을 찾기 위한 조회 여유 구간 (연휴/거래정지 포함)
+_ENRICH_LOOKBACK_DAYS = 31
+
+# 직전 거래일 종가(수정계수 반영) 대비 등락률/등락금액 + 상장주식수 기반 시가총액
+# - trade_date 범위 조건으로 파티션 pruning, 변경분만 UPDATE (IS DISTINCT FROM) → 재실행해도 no-op
+# - stock.listing_shares 는 최근 적재 값 하나뿐이고 stock.updated_at 이 그 적재 시점
+#   (save_stocks 는 주식수가 바뀔 때만 updated_at 갱신)
+#   적재일(KST) 이후 거래일: 현재 주식수로 시가총액/발행주식수 기록
+#   이전 거래일: 기존 값이 있으면 유지 (분할/유상증자/소각 이전 값을 현재 주식수로 덮어쓰지 않도록),
+#               비어 있으면 현재 주식수로 근사해 채움 (당시 주식수 이력이 없으므로 주식수 변동 이전 행은 근사치)
+_ENRICH_SQL = """
+WITH ranged AS (
+  SELECT dp.stock_id,
+         dp.trade_date,
+         dp.close_price,
+         LAG(dp.close_price) OVER (PARTITION BY dp.stock_id ORDER BY dp.trade_date) AS prev_close
+  FROM daily_price dp
+  WHERE dp.trade_date BETWEEN :lookback AND :end
+    AND (CAST(:stock_ids AS integer[]) IS NULL OR dp.stock_id = ANY(CAST(:stock_ids AS integer[])))
+),
+calc AS (
+  SELECT r.stock_id,
+         r.trade_date,
+         r.close_price - r.prev_close * COALESCE(f.ratio, 1) AS change_amount,
+         CASE WHEN r.prev_close IS NULL OR r.prev_close = 0 THEN NULL
+              ELSE ROUND((r.close_price / (r.prev_close * COALESCE(f.ratio, 1)) - 1) * 100, 4)
+         END AS change_rate,
+         s.listing_shares AS shares_outstanding,
+         ROUND(r.close_price * s.listing_shares, 2) AS market_cap,
+         r.trade_date >= CAST(s.updated_at AT TIME ZONE 'Asia/Seoul' AS date) AS shares_current
+  FROM ranged r
+  JOIN stock s ON s.stock_id = r.stock_id
+  LEFT JOIN price_adjustment_factor f ON f.stock_id = r.stock_id AND f.ex_date = r.trade_date
+  WHERE r.trade_date BETWEEN :start AND :end
+)
+UPDATE daily_price dp
+SET change_rate = c.change_rate,
+    change_amount = COALESCE(dp.change_amount, c.change_amount),
+    market_cap = CASE WHEN c.shares_current THEN c.market_cap ELSE COALESCE(dp.market_cap, c.market_cap) END,
+    shares_outstanding = CASE WHEN c.shares_current THEN c.shares_outstanding
+                              ELSE COALESCE(dp.shares_outstanding, c.shares_outstanding) END,
+    updated_at = now()
+FROM calc c
+WHERE dp.stock_id = c.stock_id
+  AND dp.trade_date = c.trade_date
+  AND dp.trade_date BETWEEN :start AND :end
+  AND (dp.change_rate IS DISTINCT FROM c.change_rate
+       OR (c.shares_current AND (dp.market_cap IS DISTINCT FROM c.market_cap
+                                 OR dp.shares_outstanding IS DISTINCT FROM c.shares_outstanding))
+       OR (dp.market_cap IS NULL AND c.market_cap IS NOT NULL)
+       OR (dp.shares_outstanding IS NULL AND c.shares_outstanding IS NOT NULL)
+       OR (dp.change_amount IS NULL AND c.change_amount IS NOT NULL))
+"""
 
 
 async def get_stock_id_map_by_market(
@@ -29,6 +87,12 @@ async def get_stock_id_map_by_market(
   return { t: sid for (t, sid) in rows }
 
 
+async def get_stock_id_by_ticker(session: AsyncSession, ticker: str) -> Optional[int]:
+  """ticker -> stock_id (없으면 None)"""
+  query = select(Stock.stock_id).where(Stock.ticker == ticker)
+  return (await session.execute(query)).scalar_one_or_none()
+
+
 async def upsert_daily_prices(
     session: AsyncSession,
     rows: List[Tuple[int, DailyPriceDTO]]
@@ -66,6 +130,9 @@ async def upsert_daily_prices(
     for c in DailyPrice.__table__.columns
     if c.name not in ("stock_id", "trade_date", "created_at")
   }
+  # 파생 컬럼은 enrich_daily_prices 에서 채우므로 기존 값 유지
+  for name in ENRICHED_COLUMNS:
+    update_cols[name] = func.coalesce(getattr(stmt.excluded, name), getattr(DailyPrice, name))
   update_cols["updated_at"] = func.now()
 
   stmt = stmt.on_conflict_do_update(
@@ -73,5 +140,33 @@ async def upsert_daily_prices(
       set_=update_cols,
   )
 
-  await session.execute(stmt)
+  with span("db.upsert_daily_prices", rows=len(payload), stocks=len({ r["stock_id"] for r in payload })):
+    await session.execute(stmt)
   return len(payload)
+
+
+async def enrich_daily_prices(
+    session: AsyncSession,
+    *,
+    start: date,
+    end: date,
+    stock_ids: Optional[Sequence[int]] = None,
+) -> int:
+  """
+  적재된 (stock_id, trade_date) 구간의 등락률/등락금액/시가총액/발행주식수를 SQL 한 번으로 계산
+  - stock_ids 미지정 시 구간 내 전체 종목
+  - 시가총액/발행주식수는 종목 마스터의 상장주식수 적재일 이후 거래일만 갱신
+    (이전 거래일은 기존 값 유지, 비어 있으면 현재 주식수 기준 근사치로 채움)
+  - 멱등: 값이 바뀐 행만 UPDATE
+  :return: UPDATE 된 행 수
+  """
+  result = await session.execute(
+      text(_ENRICH_SQL),
+      {
+        "lookback": start - timedelta(days=_ENRICH_LOOKBACK_DAYS),
+        "start": start,
+        "end": end,
+        "stock_ids": list(stock_ids) if stock_ids is not None else None,
+      },
+  )
+  return result.rowcount or 0
@@ -0,0 +1,143 @@
+# src/infrastructure/price/repository/rollup_repository.py
+from datetime import date, timedelta
+from typing import Optional, Sequence
+
+import pandas as pd
+from sqlalchemy import select, text, Float, cast
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models import PriceRollup
+from infrastructure.price.repository.adjustment_repository import PRICE_COLUMNS
+
+ROLLUP_RESOLUTIONS: tuple[str, ...] = ("week", "month", "year")
+
+ROLLUP_FRAME_COLUMNS: list[str] = [
+  "stock_id", "trade_date", *PRICE_COLUMNS, "volume", "first_trade_date", "last_trade_date", "bar_count",
+]
+
+# 건드린 (종목, 구간) 만 daily_price 에서 다시 집계해 UPSERT
+# - :lo ~ :hi 는 배치 날짜 범위를 구간 경계로 넓힌 상수 → daily_price 파티션 pruning
+# - 값이 같으면 UPDATE 하지 않음 (IS DISTINCT FROM) → 재실행해도 no-op
+_ROLLUP_SQL = """
+INSERT INTO price_rollup (
+  stock_id, resolution, bucket_start,
+  open_price, high_price, low_price, close_price, volume, trading_value,
+  first_trade_date, last_trade_date, bar_count, created_at, updated_at
+)
+SELECT dp.stock_id,
+       CAST(:resolution AS text),
+       CAST(date_trunc(CAST(:resolution AS text), CAST(dp.trade_date AS timestamp)) AS date) AS bucket_start,
+       (array_agg(dp.open_price ORDER BY dp.trade_date))[1],
+       MAX(dp.high_price),
+       MIN(dp.low_price),
+       (array_agg(dp.close_price ORDER BY dp.trade_date DESC))[1],
+       SUM(dp.volume),
+       SUM(dp.trading_value),
+       MIN(dp.trade_date),
+       MAX(dp.trade_date),
+       COUNT(*),
+       now(),
+       now()
+FROM daily_price dp
+WHERE dp.trade_date >= :lo AND dp.trade_date < :hi
+  AND (CAST(:stock_ids AS integer[]) IS NULL OR dp.stock_id = ANY(CAST(:stock_ids AS integer[])))
+GROUP BY dp.stock_id, CAST(date_trunc(CAST(:resolution AS text), CAST(dp.trade_date AS timestamp)) AS date)
+ON CONFLICT (stock_id, resolution, bucket_start) DO UPDATE
+SET open_price = EXCLUDED.open_price,
+    high_price = EXCLUDED.high_price,
+    low_price = EXCLUDED.low_price,
+    close_price = EXCLUDED.close_price,
+    volume = EXCLUDED.volume,
+    trading_value = EXCLUDED.trading_value,
+    first_trade_date = EXCLUDED.first_trade_date,
+    last_trade_date = EXCLUDED.last_trade_date,
+    bar_count = EXCLUDED.bar_count,
+    updated_at = now()
+WHERE (price_rollup.open_price, price_rollup.high_price, price_rollup.low_price, price_rollup.close_price,
+       price_rollup.volume, price_rollup.trading_value, price_rollup.bar_count)
+      IS DISTINCT FROM
+      (EXCLUDED.open_price, EXCLUDED.high_price, EXCLUDED.low_price, EXCLUDED.close_price,
+       EXCLUDED.volume, EXCLUDED.trading_value, EXCLUDED.bar_count)
+"""
+
+
+def bucket_start(d: date, resolution: str) -> date:
+  """d 가 속한 구간 시작일 (Postgres date_trunc 와 동일: 주는 월요일 시작)"""
+  if resolution == "week":
+    return d - timedelta(days=d.weekday())
+  if resolution == "month":
+    return d.replace(day=1)
+  if resolution == "year":
+    return d.replace(month=1, day=1)
+  raise ValueError(f"지원하지 않는 롤업 단위입니다: {resolution}")
+
+
+def next_bucket_start(d: date, resolution: str) -> date:
+  """d 가 속한 구간 다음 구간 시작일"""
+  start = bucket_start(d, resolution)
+  if resolution == "week":
+    return start + timedelta(days=7)
+  if resolution == "month":
+    return date(start.year + start.month // 12, start.month % 12 + 1, 1)
+  return date(start.year + 1, 1, 1)
+
+
+async def refresh_price_rollups(
+    session: AsyncSession,
+    *,
+    start: date,
+    end: date,
+    stock_ids: Optional[Sequence[int]] = None,
+    resolutions: Sequence[str] = ROLLUP_RESOLUTIONS,
+) -> int:
+  """
+  [start, end] 에 걸친 구간만 주/월/연 롤업 재집계 (단위별 INSERT ... SELECT 1회)
+  - stock_ids 미지정 시 전 종목 (백필용)
+  :return: 삽입/변경된 롤업 행 수
+  """
+  changed = 0
+  for resolution in resolutions:
+    result = await session.execute(
+        text(_ROLLUP_SQL),
+        {
+          "resolution": resolution,
+          "lo": bucket_start(start, resolution),
+          "hi": next_bucket_start(end, resolution),
+          "stock_ids": list(stock_ids) if stock_ids is not None else None,
+        },
+    )
+    changed += result.rowcount or 0
+  return changed
+
+
+async def load_rollup_frame(
+    session: AsyncSession,
+    *,
+    resolution: str,
+    start: date,
+    end: date,
+    stock_ids: Optional[Sequence[int]] = None,
+) -> pd.DataFrame:
+  """
+  롤업 봉 조회 (구간 시작일이 [start, end] 구간 경계 안에 드는 봉)
+  → DataFrame[stock_id, trade_date(=bucket_start), open/high/low/close_price, volume,
+              first_trade_date, last_trade_date, bar_count]
+  """
+  query = (
+    select(
+        PriceRollup.stock_id,
+        PriceRollup.bucket_start,
+        *[cast(getattr(PriceRollup, c), Float).label(c) for c in PRICE_COLUMNS],
+        PriceRollup.volume,
+        PriceRollup.first_trade_date,
+        PriceRollup.last_trade_date,
+        PriceRollup.bar_count,
+    )
+    .where(PriceRollup.resolution == resolution)
+    .where(PriceRollup.bucket_start.between(bucket_start(start, resolution), end))
+    .order_by(PriceRollup.stock_id, PriceRollup.bucket_start)
+  )
+  if stock_ids is not None:
+    query = query.where(PriceRollup.stock_id.in_(list(stock_ids)))
+  rows = (await session.execute(query)).all()
+  return pd.DataFrame(rows, columns=ROLLUP_FRAME_COLUMNS)
@@ -1,23 +1,47 @@
 # src/infrastructure/price/service/price_api.py
-from datetime import date
-from typing import List
+from datetime import date, datetime
+from typing import List, Optional
+from zoneinfo import ZoneInfo
 
+from config.settings import settings
 from infrastructure.kis.http.http_client import KISClient
+from infrastructure.kis.service.response_cache import KISResponseCache, kis_response_cache
 from infrastructure.price.dto.daily_price_dto import to_daily_price_dtos, DailyPriceDTO
 
+_TIMEZONE = ZoneInfo("Asia/Seoul")
+
+
+def cache_ttl(end: date, *, today: Optional[date] = None) -> int:
+  """
+  조회 구간 신선도별 캐시 TTL(초)
+  - 종료일이 오늘 이전: 마감된 과거 일봉 → 길게
+  - 오늘 포함: 장중 변동/장 마감 후 확정 전 → 몇 분
+  """
+  today = today or datetime.now(_TIMEZONE).date()
+  if end < today:
+    return settings.kis_cache_closed_ttl_seconds
+  return settings.kis_cache_open_ttl_seconds
+
 
 class KISPriceAPI:
   """
   KIS API 래퍼
+  - 조회 응답은 KISResponseCache 경유 (동일 종목/구간 중복 호출 제거, cache=None 이면 기본 싱글톤)
   """
 
-  def __init__(self, client: KISClient) -> None:
+  def __init__(self, client: KISClient, cache: Optional[KISResponseCache] = None) -> None:
     self._client = client
+    self._cache = cache or (kis_response_cache if settings.kis_cache_enabled else None)
 
   async def fetch_domestic_daily(
-      self, *, ticker: str, start: date, end: date
+      self, *, ticker: str, start: date, end: date, adjusted: bool = False
   ) -> List[DailyPriceDTO]:
-    """국내 일봉(일자 구간)조회 -> DailyPriceDTO 리스트 변환"""
+    """
+    국내 일봉(일자 구간)조회 -> DailyPriceDTO 리스트 변환
+    - adjusted=False(기본): 원주가 (FID_ORG_ADJ_PRC=1) → daily_price 에는 원주가만 저장
+    - adjusted=True: 수정주가 (FID_ORG_ADJ_PRC=0) → 수정계수 산출 비교용
+    수정주가는 price_adjustment_factor 를 읽기 시점에 곱해서 구함 (이력 재작성 없음)
+    """
     path = "/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice"
     tr_id = "FHKST03010100"
 
@@ -27,9 +51,15 @@ class KISPriceAPI:
       "FID_INPUT_DATE_1": start.strftime("%Y%m%d"),
       "FID_INPUT_DATE_2": end.strftime("%Y%m%d"),
       "FID_PERIOD_DIV_CODE": "D",
-      "FID_ORG_ADJ_PRC": "0"
+      "FID_ORG_ADJ_PRC": "0" if adjusted else "1"
     }
 
-    response = await self._client.get(path, tr_id=tr_id, auth=True, params=params)
+    async def fetch() -> dict:
+      return await self._client.get(path, tr_id=tr_id, auth=True, params=params)
+
+    if self._cache is None:
+      response = await fetch()
+    else:
+      response = await self._cache.get_or_fetch(tr_id=tr_id, params=params, ttl=cache_ttl(end), fetch=fetch)
 
     return to_daily_price_dtos(ticker, response)
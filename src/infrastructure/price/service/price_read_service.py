@@ -0,0 +1,237 @@
+# src/infrastructure/price/service/price_read_service.py
+"""
+수정주가 읽기 서비스
+- daily_price 는 원주가만 저장, 수정주가는 읽는 시점에 price_adjustment_factor 를 곱해서 계산
+- 계수 테이블은 (stock_id, ex_date) 복합키로 정렬한 배열 + 로그 누적합으로 보관하여
+  임의 (종목, 일자) 행 묶음의 누적 계수를 searchsorted 한 번으로 조회
+- 주/월/연 봉은 price_rollup 에서 읽고, 조회 구간 길이에 따라 해상도를 자동 선택
+"""
+import asyncio
+import logging
+from datetime import date
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from infrastructure.db.session import get_session
+from infrastructure.price.repository.adjustment_repository import (
+  PRICE_COLUMNS, load_adjustment_factor_frame, load_price_frame
+)
+from infrastructure.price.repository.rollup_repository import (
+  ROLLUP_FRAME_COLUMNS, ROLLUP_RESOLUTIONS, bucket_start, load_rollup_frame
+)
+from infrastructure.redis.shared_version import SharedVersion
+
+log = logging.getLogger(__name__)
+
+# 해상도별 달력 1일당 봉 수 (자동 해상도 선택용 추정치)
+_BARS_PER_DAY: dict[str, float] = { "day": 250 / 365, "week": 1 / 7, "month": 12 / 365, "year": 1 / 365 }
+BAR_RESOLUTIONS: tuple[str, ...] = ("day", *ROLLUP_RESOLUTIONS)
+
+# 복합키 = stock_id * _KEY_STRIDE + epoch 일수 (2243년까지 충분)
+_KEY_STRIDE = np.int64(100_000)
+
+
+def _composite_keys(stock_ids: np.ndarray, dates: np.ndarray) -> np.ndarray:
+  days = np.asarray(dates, dtype="datetime64[D]").astype(np.int64)
+  return np.asarray(stock_ids, dtype=np.int64) * _KEY_STRIDE + days
+
+
+class AdjustmentFactorTable:
+  """
+  종목별 누적 수정계수 조회 테이블
+  factor(s, d) = Π ratio(s, e) for ex_date e > d   (d 이후 이벤트가 없으면 1.0)
+  """
+
+  def __init__(self, factors: pd.DataFrame) -> None:
+    frame = factors.sort_values(["stock_id", "ex_date"])
+    self._keys = _composite_keys(frame["stock_id"].to_numpy(), frame["ex_date"].to_numpy())
+    # 곱 대신 로그 누적합 → 구간 곱 = exp(구간 합)
+    self._cum_log = np.concatenate(([0.0], np.cumsum(np.log(frame["ratio"].to_numpy(dtype=np.float64)))))
+    self._stocks = np.unique(frame["stock_id"].to_numpy(dtype=np.int64))
+
+  def __len__(self) -> int:
+    return int(self._keys.shape[0])
+
+  @property
+  def stock_ids(self) -> np.ndarray:
+    return self._stocks
+
+  def factors(self, stock_ids: np.ndarray, dates: np.ndarray) -> np.ndarray:
+    """(종목, 일자) 배열 → 누적 수정계수 배열"""
+    stock_ids = np.asarray(stock_ids, dtype=np.int64)
+    if len(self) == 0 or stock_ids.shape[0] == 0:
+      return np.ones(stock_ids.shape[0], dtype=np.float64)
+    # d 이후(d 제외) 이벤트 시작 위치 ~ 해당 종목 이벤트 끝 위치
+    lo = np.searchsorted(self._keys, _composite_keys(stock_ids, dates), side="right")
+    hi = np.searchsorted(self._keys, (stock_ids + 1) * _KEY_STRIDE, side="left")
+    return np.exp(self._cum_log[hi] - self._cum_log[np.minimum(lo, hi)])
+
+  def adjust(self, prices: pd.DataFrame, *, price_columns: Sequence[str] = PRICE_COLUMNS,
+             volume_column: Optional[str] = "volume") -> pd.DataFrame:
+    """
+    원주가 DataFrame[stock_id, trade_date, ...] → 수정주가 DataFrame (가격 x 계수, 거래량 / 계수)
+    """
+    if prices.empty:
+      return prices
+    factor = self.factors(prices["stock_id"].to_numpy(), prices["trade_date"].to_numpy())
+    out = prices.copy()
+    for col in price_columns:
+      if col in out.columns:
+        out[col] = out[col].to_numpy(dtype=np.float64) * factor
+    if volume_column and volume_column in out.columns:
+      out[volume_column] = np.rint(out[volume_column].to_numpy(dtype=np.float64) / factor).astype(np.int64)
+    out["adjustment_factor"] = factor
+    return out
+
+
+class AdjustmentFactorCache:
+  """
+  수정계수 테이블 인메모리 캐시 (계수 UPSERT 후 invalidate)
+  - invalidate 시 Redis 버전(`price:adjustment:version`) 증가 → 다른 워커는 get() 에서 버전이 바뀌었으면 다시 적재
+  """
+
+  def __init__(self) -> None:
+    self._table: Optional[AdjustmentFactorTable] = None
+    self._lock = asyncio.Lock()
+    self._version = SharedVersion("price:adjustment:version")
+
+  async def invalidate(self) -> None:
+    self._table = None
+    await self._version.bump()
+
+  async def get(self) -> AdjustmentFactorTable:
+    if await self._version.changed():
+      self._table = None
+    table = self._table
+    if table is not None:
+      return table
+    async with self._lock:
+      if self._table is None:
+        async with get_session() as session:
+          frame = await load_adjustment_factor_frame(session)
+        self._table = AdjustmentFactorTable(frame)
+        log.info("[PRICE READ] 수정계수 캐시 적재 events=%s, stocks=%s", len(self._table), len(self._table.stock_ids))
+      return self._table
+
+
+adjustment_factor_cache = AdjustmentFactorCache()
+
+
+async def adjust_price_frame(prices: pd.DataFrame, **kwargs) -> pd.DataFrame:
+  """원주가 DataFrame 에 수정계수 적용 (피처/백테스트 빌드용)"""
+  table = await adjustment_factor_cache.get()
+  return table.adjust(prices, **kwargs)
+
+
+async def load_daily_prices(
+    *,
+    start: date,
+    end: date,
+    stock_ids: Optional[Sequence[int]] = None,
+    adjusted: bool = True,
+) -> pd.DataFrame:
+  """
+  일봉 OHLCV 조회 (adjusted=True 면 수정주가)
+  → DataFrame[stock_id, trade_date, open/high/low/close_price, volume(, adjustment_factor)]
+  """
+  async with get_session() as session:
+    prices = await load_price_frame(session, start=start, end=end, stock_ids=stock_ids)
+  if not adjusted:
+    return prices
+  return await adjust_price_frame(prices)
+
+
+def select_resolution(start: date, end: date, *, max_bars: int) -> str:
+  """조회 구간에서 종목당 봉 수가 max_bars 이하가 되는 가장 세밀한 해상도"""
+  days = (end - start).days + 1
+  for resolution in BAR_RESOLUTIONS:
+    if days * _BARS_PER_DAY[resolution] <= max_bars:
+      return resolution
+  return BAR_RESOLUTIONS[-1]
+
+
+def aggregate_bars(daily: pd.DataFrame, resolution: str) -> pd.DataFrame:
+  """일봉 DataFrame → 주/월/연 봉 (price_rollup 과 같은 컬럼, 수정주가 혼합 구간 재계산용)"""
+  if daily.empty:
+    return pd.DataFrame(columns=ROLLUP_FRAME_COLUMNS)
+  frame = daily.sort_values(["stock_id", "trade_date"])
+  buckets = frame["trade_date"].map(lambda d: bucket_start(d, resolution))
+  grouped = frame.assign(bucket=buckets.to_numpy()).groupby(["stock_id", "bucket"], sort=True)
+  bars = grouped.agg(
+      open_price=("open_price", "first"),
+      high_price=("high_price", "max"),
+      low_price=("low_price", "min"),
+      close_price=("close_price", "last"),
+      volume=("volume", "sum"),
+      first_trade_date=("trade_date", "min"),
+      last_trade_date=("trade_date", "max"),
+      bar_count=("trade_date", "size"),
+  ).reset_index().rename(columns={ "bucket": "trade_date" })
+  return bars[ROLLUP_FRAME_COLUMNS]
+
+
+async def _adjust_rollup_frame(bars: pd.DataFrame, *, resolution: str) -> pd.DataFrame:
+  """
+  롤업 봉 수정주가 적용
+  - 구간 안에 권리락이 없으면 마지막 거래일 기준 계수를 그대로 곱함
+  - 구간 안에 권리락이 있는 봉만 수정 일봉에서 다시 집계 (시가/고가/저가가 기준이 섞이지 않도록)
+  """
+  table = await adjustment_factor_cache.get()
+  stock_ids = bars["stock_id"].to_numpy()
+  first = table.factors(stock_ids, bars["first_trade_date"].to_numpy())
+  last = table.factors(stock_ids, bars["last_trade_date"].to_numpy())
+  out = bars.copy()
+  for col in PRICE_COLUMNS:
+    out[col] = out[col].to_numpy(dtype=np.float64) * last
+  out["volume"] = np.rint(out["volume"].to_numpy(dtype=np.float64) / last).astype(np.int64)
+  out["adjustment_factor"] = last
+
+  mixed = ~np.isclose(first, last)
+  if not mixed.any():
+    return out
+  targets = out.loc[mixed]
+  async with get_session() as session:
+    daily = await load_price_frame(
+        session,
+        start=targets["first_trade_date"].min(),
+        end=targets["last_trade_date"].max(),
+        stock_ids=sorted(set(targets["stock_id"].tolist())),
+    )
+  rebuilt = aggregate_bars(table.adjust(daily), resolution)
+  rebuilt["adjustment_factor"] = np.nan  # 구간 내 계수가 달라 단일 값 없음
+  keys = pd.MultiIndex.from_frame(targets[["stock_id", "trade_date"]])
+  rebuilt = rebuilt.set_index(["stock_id", "trade_date"]).reindex(keys).reset_index()
+  out = pd.concat([out.loc[~mixed], rebuilt], ignore_index=True)
+  log.debug("[PRICE READ] 권리락 포함 봉 재집계 resolution=%s, bars=%s", resolution, int(mixed.sum()))
+  return out.sort_values(["stock_id", "trade_date"], ignore_index=True)
+
+
+async def load_price_bars(
+    *,
+    start: date,
+    end: date,
+    stock_ids: Optional[Sequence[int]] = None,
+    resolution: str = "auto",
+    adjusted: bool = True,
+    max_bars: int = 500,
+) -> tuple[str, pd.DataFrame]:
+  """
+  OHLCV 봉 조회 (일/주/월/연)
+  - resolution="auto": 종목당 봉 수가 max_bars 이하가 되는 가장 세밀한 해상도 선택
+  - 일봉은 daily_price, 주/월/연 봉은 price_rollup 에서 조회 (trade_date = 구간 시작일)
+  → (해상도, DataFrame)
+  """
+  if resolution == "auto":
+    resolution = select_resolution(start, end, max_bars=max_bars)
+  if resolution not in BAR_RESOLUTIONS:
+    raise ValueError(f"지원하지 않는 해상도입니다: {resolution} (가능: auto, {', '.join(BAR_RESOLUTIONS)})")
+  if resolution == "day":
+    return resolution, await load_daily_prices(start=start, end=end, stock_ids=stock_ids, adjusted=adjusted)
+
+  async with get_session() as session:
+    bars = await load_rollup_frame(session, resolution=resolution, start=start, end=end, stock_ids=stock_ids)
+  if not adjusted or bars.empty:
+    return resolution, bars
+  return resolution, await _adjust_rollup_frame(bars, resolution=resolution)
@@ -0,0 +1,204 @@
+# src/infrastructure/price/service/price_replay_service.py
+"""
+KIS 원본 응답 보관소 → daily_price 재적재 (API 호출 없음)
+- 보관된 FHKST03010100 원주가 응답(FID_ORG_ADJ_PRC=1)을 종목 단위로 프로세스 풀에서 압축 해제/파싱
+- 같은 거래일이 여러 응답에 있으면 가장 나중에 수집된 값 사용
+- 파싱 완료된 청크부터 배치 UPSERT → 구간 파생 컬럼/롤업 재계산 (한 트랜잭션)
+- 수정주가 계수(price_adjustment_factor)는 다시 산출하지 않음 (기존 값 유지)
+
+사용 예 (src 디렉토리 기준):
+  python -m infrastructure.price.service.price_replay_service --start 2024-01-01 --end 2024-12-31 --workers 8
+"""
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Awaitable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models import MarketType
+from infrastructure.collection.service.collection_tracker import track_collection
+from infrastructure.db.session import get_session
+from infrastructure.kis.archive.raw_archive import archived_tickers, default_archive_root, iter_index, read_object
+from infrastructure.price.dto.daily_price_dto import DailyPriceDTO, to_daily_price_dtos
+from infrastructure.price.repository.price_repository import (
+  get_stock_id_map_by_market, upsert_daily_prices, enrich_daily_prices
+)
+from infrastructure.price.repository.rollup_repository import refresh_price_rollups
+from infrastructure.screener.service.screener_service import screen_frame_cache
+from infrastructure.snapshot.service.snapshot_cache import snapshot_cache
+from utils.partition import ensure_daily_price_partitions
+
+log = logging.getLogger(__name__)
+
+DAILY_PRICE_TR_ID = "FHKST03010100"
+
+# 12 컬럼 x 행 수 ≤ 바인딩 파라미터 한도(32767)
+_UPSERT_BATCH = 2000
+# 워커당 청크 수 (청크가 끝나는 대로 적재하므로 적당히 잘게 나눔)
+_CHUNKS_PER_WORKER = 4
+
+
+@dataclass
+class PriceReplayResult:
+  """보관소 재적재 결과 (missing_tickers: 구간 내 보관 응답이 없는 활성 종목)"""
+  tickers: int = 0
+  upserted: int = 0
+  enriched: int = 0
+  rolled_up: int = 0
+  missing_tickers: List[str] = field(default_factory=list)
+
+
+def _overlaps(entry: dict, start8: str, end8: str) -> bool:
+  begin, finish = entry.get("start"), entry.get("end")
+  return (not finish or finish >= start8) and (not begin or begin <= end8)
+
+
+def load_archived_daily_prices(root: str, ticker: str, *, start: date, end: date) -> List[DailyPriceDTO]:
+  """종목 보관 응답 → 구간 내 일봉 DTO (거래일 오름차순, 거래일 중복 시 최신 수집 우선)"""
+  start8, end8 = start.strftime("%Y%m%d"), end.strftime("%Y%m%d")
+  entries = [
+    e for e in iter_index(root, DAILY_PRICE_TR_ID, ticker)
+    if e.get("params", {}).get("FID_ORG_ADJ_PRC", "1") == "1" and _overlaps(e, start8, end8)
+  ]
+  entries.sort(key=lambda e: e.get("fetched_at") or "")
+
+  by_date: Dict[date, DailyPriceDTO] = {}
+  parsed: Dict[str, List[DailyPriceDTO]] = {}
+  for entry in entries:
+    sha256 = entry["sha256"]
+    if sha256 not in parsed:
+      try:
+        parsed[sha256] = to_daily_price_dtos(ticker, json.loads(read_object(root, sha256)))
+      except FileNotFoundError:
+        log.warning("[PRICE REPLAY] 보관 객체 없음 ticker=%s, sha256=%s", ticker, sha256)
+        parsed[sha256] = []
+    for dto in parsed[sha256]:
+      if start <= dto.trade_date <= end:
+        by_date[dto.trade_date] = dto
+  return [by_date[d] for d in sorted(by_date)]
+
+
+def _load_chunk(root: str, tickers: List[str], start: date, end: date) -> List[Tuple[str, List[DailyPriceDTO]]]:
+  """워커 프로세스 진입점 (종목 묶음 압축 해제/파싱)"""
+  return [(ticker, load_archived_daily_prices(root, ticker, start=start, end=end)) for ticker in tickers]
+
+
+async def replay_daily_prices(
+    *,
+    start: date,
+    end: date,
+    market_codes: Optional[List[MarketType]] = None,
+    stock_ids: Optional[Sequence[int]] = None,
+    workers: Optional[int] = None,
+    root: Optional[str] = None,
+) -> PriceReplayResult:
+  """
+  보관된 원본 응답으로 daily_price 구간 재적재 (KIS 호출 없음, 멱등)
+  :param stock_ids: 지정 시 해당 종목만
+  :param workers: 파싱 프로세스 수 (None 이면 CPU 코어 수, 1 이면 현재 프로세스의 스레드에서 처리)
+  """
+  root = root or default_archive_root()
+  market_codes = market_codes or [MarketType.KOSPI, MarketType.KOSDAQ]
+  result = PriceReplayResult()
+  async with track_collection("daily_price_replay", source_api=DAILY_PRICE_TR_ID, collection_date=end) as run:
+    async with get_session() as session:
+      ticker_to_id = await get_stock_id_map_by_market(session, market_codes=market_codes)
+      if stock_ids is not None:
+        targets = set(stock_ids)
+        ticker_to_id = { t: sid for t, sid in ticker_to_id.items() if sid in targets }
+      await ensure_daily_price_partitions(session, start=start, end=end)
+      await session.commit()
+
+    archived = set(archived_tickers(root, DAILY_PRICE_TR_ID))
+    tickers = [t for t in ticker_to_id if t in archived]
+    result.missing_tickers = [t for t in ticker_to_id if t not in archived]
+    if not tickers:
+      log.warning("[PRICE REPLAY] 보관된 응답이 없습니다. root=%s, 기간=%s~%s", root, start, end)
+      return result
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(tickers)))
+    chunk_size = -(-len(tickers) // (workers * _CHUNKS_PER_WORKER))
+    chunks = [tickers[i:i + chunk_size] for i in range(0, len(tickers), chunk_size)]
+    log.info("[PRICE REPLAY] 시작 기간=%s~%s, tickers=%s, chunks=%s, workers=%s",
+             start, end, len(tickers), len(chunks), workers)
+
+    loaded_stock_ids: List[int] = []
+    async with get_session() as session:
+      try:
+        if workers == 1:
+          pending = [asyncio.to_thread(_load_chunk, root, chunk, start, end) for chunk in chunks]
+          result.upserted = await _upsert_chunks(session, pending, ticker_to_id, loaded_stock_ids)
+        else:
+          loop = asyncio.get_running_loop()
+          with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            pending = [loop.run_in_executor(pool, _load_chunk, root, chunk, start, end) for chunk in chunks]
+            result.upserted = await _upsert_chunks(session, pending, ticker_to_id, loaded_stock_ids)
+
+        if loaded_stock_ids:
+          loaded_stock_ids.sort()
+          result.enriched = await enrich_daily_prices(session, start=start, end=end, stock_ids=loaded_stock_ids)
+          result.rolled_up = await refresh_price_rollups(session, start=start, end=end, stock_ids=loaded_stock_ids)
+        await session.commit()
+      except Exception:
+        await session.rollback()
+        log.exception("[PRICE REPLAY] 재적재 트랜잭션 실패 (rollback) 기간=%s~%s", start, end)
+        raise
+    run.add_records(result.upserted)
+    result.tickers = len(loaded_stock_ids)
+
+  if loaded_stock_ids:
+    await snapshot_cache.refresh(loaded_stock_ids, sections=["price"], since=start)
+    await screen_frame_cache.invalidate()
+  log.info("[PRICE REPLAY] 완료 기간=%s~%s, tickers=%s, upserted=%s, enriched=%s, rolled_up=%s, missing=%s",
+           start, end, result.tickers, result.upserted, result.enriched, result.rolled_up,
+           len(result.missing_tickers))
+  return result
+
+
+async def _upsert_chunks(
+    session: AsyncSession,
+    pending: List[Awaitable[List[Tuple[str, List[DailyPriceDTO]]]]],
+    ticker_to_id: Dict[str, int],
+    loaded_stock_ids: List[int],
+) -> int:
+  """파싱이 끝난 청크부터 배치 UPSERT (적재된 종목은 loaded_stock_ids 에 추가)"""
+  upserted = 0
+  for future in asyncio.as_completed(pending):
+    rows: List[Tuple[int, DailyPriceDTO]] = []
+    for ticker, dtos in await future:
+      if not dtos:
+        continue
+      stock_id = ticker_to_id[ticker]
+      loaded_stock_ids.append(stock_id)
+      rows.extend((stock_id, dto) for dto in dtos)
+    for i in range(0, len(rows), _UPSERT_BATCH):
+      upserted += await upsert_daily_prices(session, rows[i:i + _UPSERT_BATCH])
+  return upserted
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description="KIS 원본 응답 보관소 → daily_price 재적재")
+  parser.add_argument("--start", type=date.fromisoformat, required=True)
+  parser.add_argument("--end", type=date.fromisoformat, required=True)
+  parser.add_argument("--stock-ids", default=None, help="콤마 구분 stock_id (미지정 시 활성 종목 전체)")
+  parser.add_argument("--workers", type=int, default=None, help="파싱 프로세스 수 (기본 CPU 코어 수)")
+  parser.add_argument("--root", default=None, help="보관소 경로 (기본 storage_root/kis_raw)")
+  args = parser.parse_args()
+  logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s - %(message)s")
+
+  stock_ids = [int(s) for s in args.stock_ids.split(",")] if args.stock_ids else None
+  result = asyncio.run(replay_daily_prices(
+      start=args.start, end=args.end, stock_ids=stock_ids, workers=args.workers, root=args.root,
+  ))
+  print(json.dumps({ **result.__dict__, "missing_tickers": len(result.missing_tickers) }, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+  main()
@@ -1,19 +1,67 @@
 # src/infrastructure/price/service/price_service.py
 import logging
-from datetime import date
-from typing import List, Tuple
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import List, Optional, Sequence, Tuple
 
 from core.models import MarketType
+from infrastructure.collection.service.collection_tracker import track_collection
 from infrastructure.db.session import get_session
 from infrastructure.kis.http.http_client import KISClient
 from infrastructure.kis.service.token_service import KISTokenService
+from infrastructure.price.dto.adjustment_dto import AdjustmentEventDTO, to_adjustment_events
 from infrastructure.price.dto.daily_price_dto import DailyPriceDTO
-from infrastructure.price.repository.price_repository import get_stock_id_map_by_market, upsert_daily_prices
+from infrastructure.price.repository.adjustment_repository import upsert_adjustment_factors
+from infrastructure.price.repository.price_repository import (
+  get_stock_id_map_by_market, upsert_daily_prices, enrich_daily_prices
+)
+from infrastructure.price.repository.rollup_repository import refresh_price_rollups
 from infrastructure.price.service.price_api import KISPriceAPI
+from infrastructure.price.service.price_read_service import adjustment_factor_cache
+from infrastructure.screener.service.screener_service import screen_frame_cache
+from infrastructure.snapshot.service.snapshot_cache import snapshot_cache
 from utils.partition import ensure_daily_price_partitions
 
 log = logging.getLogger(__name__)
 
+# 수정주가 이벤트 발생 시 원주가/수정주가 비교 구간 (이벤트 전일 비율 확보용)
+_ADJUSTMENT_LOOKBACK_DAYS = 30
+
+
+@dataclass
+class PriceCollectionResult:
+  """일봉 수집 결과 (실패 종목은 파이프라인 부분 재실행 대상)"""
+  upserted: int = 0
+  failed_stock_ids: List[int] = field(default_factory=list)
+  adjustment_events: int = 0
+  enriched: int = 0
+  rolled_up: int = 0
+
+
+async def _detect_adjustment_events(
+    kis_price_api: KISPriceAPI,
+    *,
+    ticker: str,
+    raw: List[DailyPriceDTO],
+    start: date,
+    end: date,
+) -> List[AdjustmentEventDTO]:
+  """
+  mod_yn="Y" 행이 있으면 원주가/수정주가를 같은 구간으로 다시 받아 비교 → 수정주가 이벤트 산출
+  (수정주가 이벤트가 없는 날은 추가 호출 없음)
+  """
+  flagged = [d.trade_date for d in raw if d.mod_yn]
+  if not flagged:
+    return []
+  window_start = min(start, min(flagged) - timedelta(days=_ADJUSTMENT_LOOKBACK_DAYS))
+  if window_start < start:
+    raw = await kis_price_api.fetch_domestic_daily(ticker=ticker, start=window_start, end=end)
+  adjusted = await kis_price_api.fetch_domestic_daily(ticker=ticker, start=window_start, end=end, adjusted=True)
+  events = to_adjustment_events(ticker, raw, adjusted)
+  log.info("[PRICE SERVICE] 수정주가 이벤트 감지 ticker=%s, flagged=%s, events=%s",
+           ticker, flagged, [(e.ex_date, round(e.ratio, 6)) for e in events])
+  return events
+
 
 async def save_daily_prices(
     *,
@@ -22,47 +70,140 @@ async def save_daily_prices(
     end: date,
 ) -> int:
   """daily_price UPSERT"""
-  kis_token_service = KISTokenService()
-  kis_client = KISClient(token_provider=kis_token_service.get_token)
-  kis_price_api = KISPriceAPI(kis_client)
+  result = await collect_daily_prices(market_codes=market_codes, start=start, end=end)
+  return result.upserted
 
-  async with get_session() as session:
-    ticker_to_id = await get_stock_id_map_by_market(session, market_codes=market_codes)
-    # 파티션 미리 생성 (존재하면 skip)
-    await ensure_daily_price_partitions(session, start=start, end=end)
-    await session.commit()
 
-  if not ticker_to_id:
-    log.warning("[PRICE SERVICE] 활성화된 종목이 없습니다. market_codes=%s", [m.value for m in market_codes])
-    return 0
+async def collect_daily_prices(
+    *,
+    market_codes: List[MarketType],
+    start: date,
+    end: date,
+    stock_ids: Optional[Sequence[int]] = None,
+) -> PriceCollectionResult:
+  """
+  daily_price 수집 + UPSERT
+  - stock_ids 지정 시 해당 종목만 수집 (실패 종목 재실행)
+  - KIS 조회에 실패한 종목은 failed_stock_ids 로 반환
+  """
+  result = PriceCollectionResult()
+  async with track_collection("daily_price", source_api="FHKST03010100", collection_date=end) as run:
+    kis_token_service = KISTokenService()
+    kis_client = KISClient(token_provider=kis_token_service.get_token)
+    kis_price_api = KISPriceAPI(kis_client)
 
-  rows: List[Tuple[int, DailyPriceDTO]] = []  # (stock_id, dto) 누적 버퍼
-  for ticker, stock_id in ticker_to_id.items():
-    try:
-      dtos = await kis_price_api.fetch_domestic_daily(ticker=ticker, start=start, end=end)
-      if not dtos:
-        log.info("[PRICE SERVICE] 데이터 없음 ticker=%s (%s~%s)", ticker, start, end)
+    async with get_session() as session:
+      ticker_to_id = await get_stock_id_map_by_market(session, market_codes=market_codes)
+      if stock_ids is not None:
+        targets = set(stock_ids)
+        ticker_to_id = { t: sid for t, sid in ticker_to_id.items() if sid in targets }
+      # 파티션 미리 생성 (존재하면 skip)
+      await ensure_daily_price_partitions(session, start=start, end=end)
+      await session.commit()
+
+    if not ticker_to_id:
+      log.warning("[PRICE SERVICE] 활성화된 종목이 없습니다. market_codes=%s", [m.value for m in market_codes])
+      return result
+
+    rows: List[Tuple[int, DailyPriceDTO]] = []  # (stock_id, dto) 누적 버퍼
+    events: List[Tuple[int, AdjustmentEventDTO]] = []  # (stock_id, 수정주가 이벤트)
+    for ticker, stock_id in ticker_to_id.items():
+      try:
+        with run.track_item(ticker) as item:
+          dtos = await kis_price_api.fetch_domestic_daily(ticker=ticker, start=start, end=end)
+          item.records = len(dtos)
+          for event in await _detect_adjustment_events(kis_price_api, ticker=ticker, raw=dtos, start=start, end=end):
+            events.append((stock_id, event))
+        if not dtos:
+          log.info("[PRICE SERVICE] 데이터 없음 ticker=%s (%s~%s)", ticker, start, end)
+          continue
+        for dto in dtos:
+          rows.append((stock_id, dto))
+      except Exception:
+        log.exception("[PRICE SERVICE] KIS fetch 실패 ticker=%s", ticker)
+        result.failed_stock_ids.append(stock_id)
         continue
-      for dto in dtos:
-        rows.append((stock_id, dto))
-    except Exception:
-      log.exception("[PRICE SERVICE] KIS fetch 실패 ticker=%s", ticker)
-      continue
 
-  if not rows:
-    log.info("[PRICE SERVICE] 저장할 데이터가 없습니다. market=%s, 기간=%s~%s",
-             [m.value for m in market_codes], start, end)
-    return 0
+    if not rows:
+      log.info("[PRICE SERVICE] 저장할 데이터가 없습니다. market=%s, 기간=%s~%s",
+               [m.value for m in market_codes], start, end)
+      return result
 
+    async with get_session() as session:
+      try:
+        upserted = await upsert_daily_prices(session, rows)
+        result.adjustment_events = await upsert_adjustment_factors(session, events)
+        # 방금 적재한 종목/구간만 파생 컬럼 계산 + 주/월/연 롤업 재집계 (같은 트랜잭션)
+        batch_start = min(dto.trade_date for _, dto in rows)
+        batch_end = max(dto.trade_date for _, dto in rows)
+        batch_stock_ids = sorted({ sid for sid, _ in rows })
+        result.enriched = await enrich_daily_prices(
+            session, start=batch_start, end=batch_end, stock_ids=batch_stock_ids
+        )
+        result.rolled_up = await refresh_price_rollups(
+            session, start=batch_start, end=batch_end, stock_ids=batch_stock_ids
+        )
+        await session.commit()
+        run.add_records(upserted)
+        result.upserted = upserted
+      except Exception:
+        await session.rollback()
+        log.exception("[PRICE SERVICE] upsert 트랜잭션 실패 (rollback)")
+        raise
+
+    if result.adjustment_events:
+      await adjustment_factor_cache.invalidate()
+    # 최신 일봉 스냅샷 갱신 (방금 적재한 종목만)
+    await snapshot_cache.refresh(batch_stock_ids, sections=["price"], since=batch_start)
+    await screen_frame_cache.invalidate()
+    log.info("[PRICE SERVICE] 완료 market=%s, upserted=%s, enriched=%s, rolled_up=%s, adjustment_events=%s, failed=%s",
+             [m.value for m in market_codes], upserted, result.enriched, result.rolled_up, result.adjustment_events,
+             len(result.failed_stock_ids))
+    return result
+
+
+async def enrich_daily_price_range(
+    *,
+    start: date,
+    end: date,
+    stock_ids: Optional[Sequence[int]] = None,
+) -> int:
+  """
+  기존 daily_price 구간 파생 컬럼 재계산 (백필/상장주식수 변경 시, 멱등)
+  - 등락률/등락금액은 구간 전체, 시가총액/발행주식수는 상장주식수 적재일 이후 거래일만 재계산
+    (이전 거래일은 빈 값만 현재 주식수 기준 근사치로 채움)
+  """
   async with get_session() as session:
     try:
-      upserted = await upsert_daily_prices(session, rows)
+      updated = await enrich_daily_prices(session, start=start, end=end, stock_ids=stock_ids)
       await session.commit()
     except Exception:
       await session.rollback()
-      log.exception("[PRICE SERVICE] upsert 트랜잭션 실패 (rollback)")
+      log.exception("[PRICE SERVICE] 파생 컬럼 계산 실패 (rollback) 기간=%s~%s", start, end)
       raise
+  if updated:
+    await snapshot_cache.refresh(
+        stock_ids if stock_ids is not None else snapshot_cache.stock_ids(), sections=["price"], since=start
+    )
+    await screen_frame_cache.invalidate()
+  log.info("[PRICE SERVICE] 파생 컬럼 계산 완료 기간=%s~%s, updated=%s", start, end, updated)
+  return updated
 
-  log.info("[PRICE SERVICE] 완료 market=%s, upserted=%s",
-           [m.value for m in market_codes], upserted)
-  return upserted
+
+async def rebuild_price_rollup_range(
+    *,
+    start: date,
+    end: date,
+    stock_ids: Optional[Sequence[int]] = None,
+) -> int:
+  """기존 daily_price 구간 주/월/연 롤업 재집계 (백필용, 멱등)"""
+  async with get_session() as session:
+    try:
+      changed = await refresh_price_rollups(session, start=start, end=end, stock_ids=stock_ids)
+      await session.commit()
+    except Exception:
+      await session.rollback()
+      log.exception("[PRICE SERVICE] 롤업 재집계 실패 (rollback) 기간=%s~%s", start, end)
+      raise
+  log.info("[PRICE SERVICE] 롤업 재집계 완료 기간=%s~%s, changed=%s", start, end, changed)
+  return changed
@@ -0,0 +1,322 @@
+# src/infrastructure/profiling/profiler.py
+"""
+온디맨드 프로파일러 (요청/스케줄러 Job 단위, 외부 의존성 없음)
+- CPU: 별도 스레드가 interval 마다 대상 스레드 스택을 샘플링 → collapsed stack (flamegraph.pl / speedscope 입력)
+  이벤트 루프 스레드를 샘플링하므로 같은 시간대에 실행된 다른 코루틴도 함께 잡힐 수 있음
+- 메모리: tracemalloc 시작/종료 스냅샷 비교 (줄 단위 증가량 상위) + 구간 peak
+  all_threads 모드(요청)는 스레드 풀/to_thread 로 넘긴 작업 스레드도 함께 기록
+- 결과: {log_dir}/profiles/{profile_id}/profile.json, stacks.folded (최근 profiling_keep 개만 보관)
+settings.profiling_enabled 가 false 면 profile_session 은 아무것도 하지 않음
+"""
+import json
+import logging
+import os
+import re
+import shutil
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from types import CodeType, FrameType
+from typing import Any, Callable, Iterator, List, Optional
+
+from config.settings import settings
+
+log = logging.getLogger(__name__)
+
+_TOP = 30
+_SUMMARY_FILE = "profile.json"
+_STACKS_FILE = "stacks.folded"
+# 최상단 프레임이 이 모듈이면 대기 중인 스레드로 보고 all_threads 샘플에서 제외
+_IDLE_MODULES = ("threading.py", "selectors.py", "queue.py", os.path.join("concurrent", "futures", "thread.py"))
+
+# tracemalloc 은 프로세스 전역이므로 동시 세션 수를 세어 마지막 세션이 끝날 때만 중지
+_trace_lock = threading.Lock()
+_trace_users = 0
+_trace_owned = False
+
+
+def profile_root() -> str:
+  return os.path.join(settings.log_dir, "profiles")
+
+
+class ProfileHandle:
+  """진행 중인 프로파일 식별자 (세션 종료 후 path 에 결과 저장)"""
+
+  def __init__(self, kind: str, name: str) -> None:
+    slug = re.sub(r"[^0-9A-Za-z._-]+", "_", name).strip("_")[:60] or "unnamed"
+    self.id = f"{time.strftime('%Y%m%d_%H%M%S')}_{kind}_{slug}_{uuid.uuid4().hex[:6]}"
+    self.kind = kind
+    self.name = name
+    self.path = os.path.join(profile_root(), self.id)
+
+
+class StackSampler:
+  """
+  대상 스레드 스택 주기 샘플링 (sys._current_frames, 대상 스레드는 멈추지 않음)
+  all_threads=True 면 다른 스레드(스레드 풀/to_thread 작업)도 대기 중이 아닐 때 '스레드명;' 접두로 함께 기록
+  """
+
+  def __init__(self, thread_id: int, *, interval: float, all_threads: bool = False) -> None:
+    self._thread_id = thread_id
+    self._interval = interval
+    self._all_threads = all_threads
+    self._halt = threading.Event()
+    self._thread = threading.Thread(target=self._run, name="profiler-sampler", daemon=True)
+    self._labels: dict[CodeType, str] = {}
+    self._thread_names: dict[int, str] = {}
+    self.stacks: Counter[str] = Counter()
+    self.samples = 0
+
+  def start(self) -> None:
+    self._thread.start()
+
+  def stop(self) -> None:
+    self._halt.set()
+    self._thread.join()
+
+  def _label(self, code: CodeType) -> str:
+    label = self._labels.get(code)
+    if label is None:
+      qualname = getattr(code, "co_qualname", code.co_name)
+      label = f"{qualname} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ",")
+      self._labels[code] = label
+    return label
+
+  def _collapse(self, frame: Optional[FrameType]) -> str:
+    names: List[str] = []
+    while frame is not None:
+      names.append(self._label(frame.f_code))
+      frame = frame.f_back
+    return ";".join(reversed(names))
+
+  def _thread_name(self, ident: int) -> str:
+    name = self._thread_names.get(ident)
+    if name is None:
+      self._thread_names = { t.ident: t.name for t in threading.enumerate() if t.ident is not None }
+      name = self._thread_names.get(ident, str(ident))
+    return name
+
+  def _run(self) -> None:
+    own = threading.get_ident()
+    while not self._halt.wait(self._interval):
+      frames = sys._current_frames()
+      frame = frames.get(self._thread_id)
+      if frame is not None:
+        stack = self._collapse(frame)
+        self.stacks[f"{self._thread_name(self._thread_id)};{stack}" if self._all_threads else stack] += 1
+      if self._all_threads:
+        for ident, other in frames.items():
+          if ident in (own, self._thread_id) or other.f_code.co_filename.endswith(_IDLE_MODULES):
+            continue
+          self.stacks[f"{self._thread_name(ident)};{self._collapse(other)}"] += 1
+      self.samples += 1
+      del frame, frames
+
+
+def _summarize_stacks(stacks: Counter[str], samples: int) -> dict[str, Any]:
+  """함수별 self(스택 최상단) / total(스택 포함) 샘플 비율 상위"""
+  own: Counter[str] = Counter()
+  total: Counter[str] = Counter()
+  for stack, count in stacks.items():
+    frames = stack.split(";")
+    own[frames[-1]] += count
+    for name in set(frames):
+      total[name] += count
+
+  def top(counter: Counter[str]) -> List[dict[str, Any]]:
+    return [
+      { "function": name, "samples": count, "ratio": round(count / samples, 4) if samples else 0.0 }
+      for name, count in counter.most_common(_TOP)
+    ]
+
+  return { "self": top(own), "total": top(total) }
+
+
+def _trace_start() -> None:
+  global _trace_users, _trace_owned
+  with _trace_lock:
+    if _trace_users == 0 and not tracemalloc.is_tracing():
+      tracemalloc.start(settings.profiling_traceback_depth)
+      _trace_owned = True
+    _trace_users += 1
+    tracemalloc.reset_peak()
+
+
+def _trace_stop() -> None:
+  global _trace_users, _trace_owned
+  with _trace_lock:
+    _trace_users -= 1
+    if _trace_users == 0 and _trace_owned:
+      tracemalloc.stop()
+      _trace_owned = False
+
+
+def _take_snapshot() -> tracemalloc.Snapshot:
+  return tracemalloc.take_snapshot().filter_traces((
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+  ))
+
+
+def _summarize_memory(before: tracemalloc.Snapshot, after: tracemalloc.Snapshot, peak: int) -> dict[str, Any]:
+  """구간 할당 증가량 상위 줄 (크기 증가순)"""
+  diffs = [d for d in after.compare_to(before, "lineno") if d.size_diff > 0][:_TOP]
+  return {
+    "peak_kib": round(peak / 1024, 1),
+    "top_growth": [
+      {
+        "location": str(d.traceback[0]) if d.traceback else "?",
+        "size_diff_kib": round(d.size_diff / 1024, 1),
+        "count_diff": d.count_diff,
+        "size_kib": round(d.size / 1024, 1),
+      }
+      for d in diffs
+    ],
+  }
+
+
+def _prune(keep: int) -> None:
+  root = profile_root()
+  try:
+    names = sorted(os.listdir(root))
+  except FileNotFoundError:
+    return
+  for name in names[:max(len(names) - keep, 0)]:
+    shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+
+
+def _save(handle: ProfileHandle, summary: dict[str, Any], stacks: Counter[str]) -> None:
+  os.makedirs(handle.path, exist_ok=True)
+  with open(os.path.join(handle.path, _STACKS_FILE), "w", encoding="utf-8") as fh:
+    for stack, count in stacks.most_common():
+      fh.write(f"{stack} {count}\n")
+  with open(os.path.join(handle.path, _SUMMARY_FILE), "w", encoding="utf-8") as fh:
+    json.dump(summary, fh, ensure_ascii=False, indent=2)
+  _prune(settings.profiling_keep)
+
+
+@contextmanager
+def profile_session(
+    kind: str,
+    name: str,
+    *,
+    thread_id: Optional[int] = None,
+    all_threads: bool = False,
+) -> Iterator[Optional[ProfileHandle]]:
+  """
+  작업 단위 프로파일링 컨텍스트 (비활성화 시 None 을 돌려주고 바로 실행)
+  사용 예:
+      with profile_session("job", "pipeline.daily") as handle:
+        await run_pipeline(today)
+  :param kind: request / job 등 분류
+  :param thread_id: 샘플링 대상 스레드 (기본 현재 스레드)
+  :param all_threads: 작업 중인 다른 스레드도 함께 샘플링 (요청 처리 중 스레드 풀로 넘긴 작업 포함)
+  """
+  if not settings.profiling_enabled:
+    yield None
+    return
+
+  handle = ProfileHandle(kind, name)
+  sampler = StackSampler(
+      thread_id or threading.get_ident(), interval=settings.profiling_interval_ms / 1000, all_threads=all_threads,
+  )
+  started_at = datetime.now(timezone.utc)
+  _trace_start()
+  before = _take_snapshot()
+  begin = time.perf_counter()
+  sampler.start()
+  error: Optional[str] = None
+  try:
+    yield handle
+  except BaseException as e:
+    error = type(e).__name__
+    raise
+  finally:
+    sampler.stop()
+    seconds = time.perf_counter() - begin
+    try:
+      _, peak = tracemalloc.get_traced_memory()
+      memory = _summarize_memory(before, _take_snapshot(), peak)
+    finally:
+      _trace_stop()
+    summary = {
+      "id": handle.id,
+      "kind": kind,
+      "name": name,
+      "pid": os.getpid(),
+      "started_at": started_at.isoformat(timespec="milliseconds"),
+      "seconds": round(seconds, 4),
+      "error": error,
+      "interval_ms": settings.profiling_interval_ms,
+      "samples": sampler.samples,
+      "cpu": _summarize_stacks(sampler.stacks, sampler.samples),
+      "memory": memory,
+    }
+    try:
+      _save(handle, summary, sampler.stacks)
+      log.info("[PROFILE] 저장 id=%s, seconds=%.3f, samples=%s", handle.id, seconds, sampler.samples)
+    except OSError:
+      log.exception("[PROFILE] 결과 저장 실패 id=%s", handle.id)
+
+
+def run_profiled(kind: str, name: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+  """동기 함수 프로파일 실행 (스레드/프로세스 풀 Job 용, 모듈 최상위 함수라 pickle 가능)"""
+  with profile_session(kind, name):
+    return func(*args, **kwargs)
+
+
+def list_profiles(*, kind: Optional[str] = None, limit: int = 50) -> List[dict[str, Any]]:
+  """저장된 프로파일 요약 (최신순, cpu/memory 상세 제외)"""
+  root = profile_root()
+  try:
+    names = sorted(os.listdir(root), reverse=True)
+  except FileNotFoundError:
+    return []
+  out: List[dict[str, Any]] = []
+  for name in names:
+    summary = load_profile(name)
+    if summary is None or (kind is not None and summary.get("kind") != kind):
+      continue
+    out.append({ k: v for k, v in summary.items() if k not in ("cpu", "memory") }
+               | { "peak_kib": summary.get("memory", {}).get("peak_kib") })
+    if len(out) >= limit:
+      break
+  return out
+
+
+def _profile_dir(profile_id: str) -> Optional[str]:
+  # 경로 조작 방지 (id 는 파일명 문자만 허용, '.'/'..' 등 점으로 시작하는 id 거부)
+  # + 실제 경로가 profiles 디렉토리 바로 아래인지 확인
+  if not re.fullmatch(r"[0-9A-Za-z_-][0-9A-Za-z._-]*", profile_id):
+    return None
+  root = os.path.realpath(profile_root())
+  path = os.path.realpath(os.path.join(root, profile_id))
+  if os.path.dirname(path) != root:
+    return None
+  return path if os.path.isdir(path) else None
+
+
+def load_profile(profile_id: str) -> Optional[dict[str, Any]]:
+  """프로파일 요약 (없으면 None)"""
+  path = _profile_dir(profile_id)
+  if path is None:
+    return None
+  try:
+    with open(os.path.join(path, _SUMMARY_FILE), encoding="utf-8") as fh:
+      return json.load(fh)
+  except (OSError, ValueError):
+    return None
+
+
+def profile_stacks_path(profile_id: str) -> Optional[str]:
+  """collapsed stack 파일 경로 (없으면 None)"""
+  path = _profile_dir(profile_id)
+  if path is None:
+    return None
+  stacks = os.path.join(path, _STACKS_FILE)
+  return stacks if os.path.exists(stacks) else None
@@ -0,0 +1,35 @@
+# src/infrastructure/realtime/repository/minute_price_repository.py
+from datetime import datetime, timezone
+from typing import Any, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models import MinutePrice
+from infrastructure.db.bulk import copy_upsert
+from infrastructure.realtime.service.minute_bar_aggregator import MinuteBarBatch
+
+MINUTE_PRICE_COLUMNS: list[str] = [
+  "stock_id", "datetime", "open_price", "high_price", "low_price", "close_price", "volume", "trading_value",
+]
+
+
+def to_minute_price_records(batch: MinuteBarBatch) -> list[tuple[Any, ...]]:
+  """MinuteBarBatch → minute_price COPY 레코드 (MINUTE_PRICE_COLUMNS 순서)"""
+  return [
+    (sid, datetime.fromtimestamp(minute * 60, tz=timezone.utc), o, h, low, c, v, val)
+    for sid, minute, o, h, low, c, v, val in zip(
+        batch.stock_id.tolist(), batch.minute.tolist(), batch.open.tolist(), batch.high.tolist(),
+        batch.low.tolist(), batch.close.tolist(), batch.volume.tolist(), batch.value.tolist(),
+    )
+  ]
+
+
+async def upsert_minute_prices(session: AsyncSession, records: Sequence[tuple[Any, ...]]) -> int:
+  """minute_price COPY UPSERT (같은 분 재적재 시 덮어씀)"""
+  return await copy_upsert(
+      session,
+      table=MinutePrice.__table__,
+      columns=MINUTE_PRICE_COLUMNS,
+      records=list(records),
+      conflict_columns=["stock_id", "datetime"],
+  )
@@ -0,0 +1,169 @@
+# src/infrastructure/realtime/service/minute_bar_aggregator.py
+"""
+체결 → 1분봉 집계기
+- 종목별 현재 분 OHLCV 상태를 stock_id 로 인덱싱되는 미리 할당된 배열에 보관
+- 체결 1건당 배열 원소 갱신만 수행 (O(1), 봉/상태 객체 생성 없음)
+- 분이 바뀐 종목의 완성 봉은 미리 할당된 emit 버퍼(구조화 배열)로 복사, drain() 시 배열 묶음으로 반환
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+_GROWTH = 2
+
+# 완성 봉 버퍼 레코드 (emit 버퍼는 이 dtype 의 구조화 배열 하나)
+_BAR_DTYPE = np.dtype([
+  ("stock_id", np.int64), ("minute", np.int64),
+  ("open", np.float64), ("high", np.float64), ("low", np.float64), ("close", np.float64),
+  ("volume", np.int64), ("value", np.float64),
+])
+
+
+def _resized(arr: np.ndarray, capacity: int, fill: float) -> np.ndarray:
+  """기존 값을 보존한 capacity 길이 배열 (늘어난 칸은 fill)"""
+  out = np.full(capacity, fill, dtype=arr.dtype)
+  n = min(arr.shape[0], capacity)
+  out[:n] = arr[:n]
+  return out
+
+
+@dataclass(frozen=True)
+class MinuteBarBatch:
+  """완성된 1분봉 묶음 (모두 길이 n 배열, minute 은 UTC epoch 분)"""
+  stock_id: np.ndarray
+  minute: np.ndarray
+  open: np.ndarray
+  high: np.ndarray
+  low: np.ndarray
+  close: np.ndarray
+  volume: np.ndarray
+  value: np.ndarray
+
+  def __len__(self) -> int:
+    return int(self.stock_id.shape[0])
+
+
+class MinuteBarAggregator:
+  """stock_id 인덱스 배열 기반 1분봉 집계기 (단일 이벤트 루프에서 사용, 스레드 안전하지 않음)"""
+
+  def __init__(self, capacity: int = 4096) -> None:
+    capacity = max(capacity, 1)
+    self._watermark = -1  # 이 분 이전 체결은 이미 닫힌 봉 → 무시
+    # 종목 상태 (stock_id 인덱스, minute = -1 이면 진행 중 봉 없음)
+    self._capacity = capacity
+    self._minute = np.full(capacity, -1, dtype=np.int64)
+    self._open = np.zeros(capacity, dtype=np.float64)
+    self._high = np.zeros(capacity, dtype=np.float64)
+    self._low = np.zeros(capacity, dtype=np.float64)
+    self._close = np.zeros(capacity, dtype=np.float64)
+    self._volume = np.zeros(capacity, dtype=np.int64)
+    self._value = np.zeros(capacity, dtype=np.float64)
+    # 완성 봉 버퍼 (앞 _emit_size 개가 유효)
+    self._emit = np.empty(capacity * 2, dtype=_BAR_DTYPE)
+    self._emit_size = 0
+
+  def _grow_state(self, capacity: int) -> None:
+    """종목 상태 배열 확장 (기존 값 보존)"""
+    self._minute = _resized(self._minute, capacity, -1)
+    self._open = _resized(self._open, capacity, 0.0)
+    self._high = _resized(self._high, capacity, 0.0)
+    self._low = _resized(self._low, capacity, 0.0)
+    self._close = _resized(self._close, capacity, 0.0)
+    self._volume = _resized(self._volume, capacity, 0)
+    self._value = _resized(self._value, capacity, 0.0)
+    self._capacity = capacity
+
+  def _grow_emit(self, capacity: int) -> None:
+    """완성 봉 버퍼 확장 (유효 구간 보존)"""
+    emit = np.empty(capacity, dtype=_BAR_DTYPE)
+    emit[:self._emit_size] = self._emit[:self._emit_size]
+    self._emit = emit
+
+  @property
+  def pending(self) -> int:
+    """drain 대기 중인 완성 봉 수"""
+    return self._emit_size
+
+  def on_tick(self, stock_id: int, minute: int, price: float, volume: int) -> None:
+    """
+    체결 1건 반영
+    :param stock_id: 종목 id (배열 인덱스)
+    :param minute: 체결 시각 UTC epoch 분
+    :param price: 체결가
+    :param volume: 체결량
+    """
+    if minute < self._watermark:
+      return  # close_until 로 이미 닫힌 분의 지연 체결
+    if stock_id >= self._capacity:
+      self._grow_state(max(stock_id + 1, self._capacity * _GROWTH))
+    current = self._minute[stock_id]
+    if current != minute:
+      if current >= 0:
+        if minute < current:
+          return  # 이미 닫힌 분의 지연 체결은 무시
+        self._emit_one(stock_id)
+      self._minute[stock_id] = minute
+      self._open[stock_id] = price
+      self._high[stock_id] = price
+      self._low[stock_id] = price
+      self._close[stock_id] = price
+      self._volume[stock_id] = volume
+      self._value[stock_id] = price * volume
+      return
+    if price > self._high[stock_id]:
+      self._high[stock_id] = price
+    if price < self._low[stock_id]:
+      self._low[stock_id] = price
+    self._close[stock_id] = price
+    self._volume[stock_id] += volume
+    self._value[stock_id] += price * volume
+
+  def _emit_one(self, stock_id: int) -> None:
+    if self._emit_size >= self._emit.shape[0]:
+      self._grow_emit(self._emit.shape[0] * _GROWTH)
+    self._emit[self._emit_size] = (
+      stock_id, self._minute[stock_id], self._open[stock_id], self._high[stock_id],
+      self._low[stock_id], self._close[stock_id], self._volume[stock_id], self._value[stock_id],
+    )
+    self._emit_size += 1
+
+  def close_until(self, minute: int) -> int:
+    """
+    minute 이전(미포함) 분의 진행 중 봉을 모두 닫음 (체결이 끊긴 종목 포함, 벡터 연산)
+    :return: 닫은 봉 수
+    """
+    self._watermark = max(self._watermark, minute)
+    ids = np.flatnonzero((self._minute >= 0) & (self._minute < minute))
+    n = int(ids.shape[0])
+    if n == 0:
+      return 0
+    needed = self._emit_size + n
+    if needed > self._emit.shape[0]:
+      self._grow_emit(max(needed, self._emit.shape[0] * _GROWTH))
+    out = self._emit[self._emit_size:needed]
+    out["stock_id"] = ids
+    out["minute"] = self._minute[ids]
+    out["open"] = self._open[ids]
+    out["high"] = self._high[ids]
+    out["low"] = self._low[ids]
+    out["close"] = self._close[ids]
+    out["volume"] = self._volume[ids]
+    out["value"] = self._value[ids]
+    self._emit_size = needed
+    self._minute[ids] = -1
+    return n
+
+  def drain(self) -> MinuteBarBatch:
+    """완성 봉을 복사해 반환하고 버퍼 비움"""
+    bars = self._emit[:self._emit_size].copy()
+    self._emit_size = 0
+    return MinuteBarBatch(
+        stock_id=bars["stock_id"],
+        minute=bars["minute"],
+        open=bars["open"],
+        high=bars["high"],
+        low=bars["low"],
+        close=bars["close"],
+        volume=bars["volume"],
+        value=bars["value"],
+    )
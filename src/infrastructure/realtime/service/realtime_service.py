@@ -0,0 +1,237 @@
+# src/infrastructure/realtime/service/realtime_service.py
+"""
+실시간 체결 → 1분봉 적재 서비스
+- RealtimeHub 로 관심 종목(settings.realtime_watchlist) 체결(H0STCNT0) 구독 → MinuteBarAggregator 반영
+  KIS 실시간 등록 한도(realtime_max_subscriptions_per_connection)는 연결이 아니라 앱키 단위이므로 종목 수를 한도로 제한
+- 매 분 경계(+유예)마다 닫힌 봉을 minute_price 에 COPY UPSERT 1회 + Redis Stream 발행
+- run_as_leader: 스케줄러 리더 인스턴스에서만 수집 (리더 변경 시 시작/중지)
+"""
+import asyncio
+import logging
+import time
+from datetime import date, datetime
+from typing import Any, Callable, Optional
+from zoneinfo import ZoneInfo
+
+from config.settings import settings
+from core.models import MarketType
+from infrastructure.db.session import get_session
+from infrastructure.kis.websocket.hub import RealtimeHub
+from infrastructure.kis.websocket.parser import EXECUTION_TR_ID, ExecutionTick, Tick
+from infrastructure.price.repository.price_repository import get_stock_id_map_by_market
+from infrastructure.realtime.repository.minute_price_repository import to_minute_price_records, upsert_minute_prices
+from infrastructure.realtime.service.minute_bar_aggregator import MinuteBarAggregator
+from infrastructure.redis.redis_client import RedisClient
+from utils.partition import ensure_minute_price_partitions
+
+log = logging.getLogger(__name__)
+
+MINUTE_BAR_STREAM = "realtime:minute_bars"
+_KST = ZoneInfo("Asia/Seoul")
+# 분 경계 후 늦게 도착하는 체결을 기다리는 유예 시간(초)
+_FLUSH_GRACE_SECONDS = 2.0
+# DB 적재 실패 시 다음 분에 재시도할 최대 봉 수
+_MAX_RETRY_RECORDS = 200_000
+# 리더 여부 확인 주기(초)
+_LEADER_CHECK_SECONDS = 5.0
+
+
+def watchlist_tickers() -> list[str]:
+  """settings.realtime_watchlist (콤마 구분 종목코드) → 중복 제거된 순서 유지 목록"""
+  return list(dict.fromkeys(t.strip() for t in settings.realtime_watchlist.split(",") if t.strip()))
+
+
+async def _wait(event: asyncio.Event, timeout: float) -> bool:
+  """timeout 동안 event 대기 (설정되면 True)"""
+  try:
+    await asyncio.wait_for(event.wait(), timeout=timeout)
+    return True
+  except asyncio.TimeoutError:
+    return False
+
+
+class RealtimeMinuteBarService:
+  """실시간 1분봉 집계/적재 서비스"""
+
+  def __init__(self, *, markets: Optional[list[MarketType]] = None) -> None:
+    self._markets = markets or [MarketType.KOSPI, MarketType.KOSDAQ]
+    self._aggregator = MinuteBarAggregator()
+    self._redis = RedisClient()
+    self._hub: Optional[RealtimeHub] = None
+    self._flush_task: Optional[asyncio.Task[None]] = None
+    self._leader_task: Optional[asyncio.Task[None]] = None
+    # 취소 대신 종료 신호 (적재 중인 배치가 취소로 유실되지 않도록)
+    self._stopping = asyncio.Event()
+    self._closing = asyncio.Event()
+    self._ticker_to_id: dict[str, int] = {}
+    self._id_to_ticker: dict[int, str] = {}
+    self._day: Optional[date] = None
+    self._day_base_minute = 0
+    self._partition_days: set[date] = set()
+    self._retry: list[tuple[Any, ...]] = []
+    self.bars_written = 0
+
+  @property
+  def running(self) -> bool:
+    return self._flush_task is not None
+
+  async def start(self) -> None:
+    """관심 종목 체결 구독 + 분 단위 flush 시작"""
+    if self._flush_task is not None:
+      return
+    watchlist = watchlist_tickers()
+    if not watchlist:
+      log.warning("[REALTIME SERVICE] 관심 종목(realtime_watchlist)이 비어 있어 구독하지 않습니다.")
+      return
+    limit = settings.realtime_max_subscriptions_per_connection
+    if len(watchlist) > limit:
+      log.warning("[REALTIME SERVICE] 관심 종목 %s 개 중 앱키 등록 한도 %s 개만 구독합니다.", len(watchlist), limit)
+      watchlist = watchlist[:limit]
+
+    async with get_session() as session:
+      active = await get_stock_id_map_by_market(session, market_codes=self._markets)
+    self._ticker_to_id = { t: active[t] for t in watchlist if t in active }
+    self._id_to_ticker = { sid: t for t, sid in self._ticker_to_id.items() }
+    unknown = [t for t in watchlist if t not in active]
+    if unknown:
+      log.warning("[REALTIME SERVICE] 활성 종목이 아니어서 제외: %s", unknown)
+    if not self._ticker_to_id:
+      log.warning("[REALTIME SERVICE] 구독할 활성 종목이 없습니다. markets=%s", [m.value for m in self._markets])
+      return
+
+    self._hub = RealtimeHub()
+    for ticker in self._ticker_to_id:
+      await self._hub.subscribe(EXECUTION_TR_ID, ticker, self._on_tick)
+    await self._hub.start()
+    self._stopping.clear()
+    self._flush_task = asyncio.create_task(self._flush_loop(), name="realtime-minute-bar-flush")
+    log.info("[REALTIME SERVICE] 시작 tickers=%s", len(self._ticker_to_id))
+
+  async def stop(self) -> None:
+    """구독 종료 후 진행 중 봉까지 모두 적재"""
+    if self._flush_task is None:
+      return
+    # 진행 중인 flush 는 끝까지 적재한 뒤 루프 종료
+    self._stopping.set()
+    await self._flush_task
+    self._flush_task = None
+    if self._hub is not None:
+      await self._hub.stop()
+      self._hub = None
+    await self.flush(until_minute=int(time.time() // 60) + 1)
+    log.info("[REALTIME SERVICE] 종료 bars_written=%s", self.bars_written)
+
+  def run_as_leader(self, is_leader: Callable[[], bool]) -> None:
+    """리더일 때만 수집하도록 감시 시작 (레플리카마다 같은 종목을 중복 적재하지 않도록)"""
+    if self._leader_task is None or self._leader_task.done():
+      self._closing.clear()
+      self._leader_task = asyncio.create_task(self._leader_loop(is_leader), name="realtime-leader-watch")
+
+  async def shutdown(self) -> None:
+    """리더 감시 중지 + 수집 종료 (애플리케이션 종료 시)"""
+    if self._leader_task is not None:
+      self._closing.set()
+      await self._leader_task
+      self._leader_task = None
+    await self.stop()
+
+  async def _leader_loop(self, is_leader: Callable[[], bool]) -> None:
+    while not self._closing.is_set():
+      try:
+        if is_leader() and not self.running:
+          log.info("[REALTIME SERVICE] 리더 인스턴스 → 실시간 수집 시작")
+          await self.start()
+        elif not is_leader() and self.running:
+          log.info("[REALTIME SERVICE] 리더 아님 → 실시간 수집 중지")
+          await self.stop()
+      except Exception:
+        log.exception("[REALTIME SERVICE] 리더 전환 처리 실패")
+      await _wait(self._closing, _LEADER_CHECK_SECONDS)
+
+  def stats(self) -> dict[str, Any]:
+    return {
+      "running": self.running,
+      "leader_watch": self._leader_task is not None,
+      "tickers": len(self._ticker_to_id),
+      "pending_bars": self._aggregator.pending,
+      "retry_bars": len(self._retry),
+      "bars_written": self.bars_written,
+      "hub": self._hub.stats() if self._hub else None,
+    }
+
+  def _minute_of(self, hhmmss: str) -> int:
+    """체결시각(KST HHMMSS) → UTC epoch 분"""
+    today = datetime.now(_KST).date()
+    if today != self._day:
+      midnight = datetime(today.year, today.month, today.day, tzinfo=_KST)
+      self._day = today
+      self._day_base_minute = int(midnight.timestamp()) // 60
+    return self._day_base_minute + int(hhmmss[0:2]) * 60 + int(hhmmss[2:4])
+
+  def _on_tick(self, tick: Tick) -> None:
+    if not isinstance(tick, ExecutionTick):
+      return
+    stock_id = self._ticker_to_id.get(tick.ticker)
+    if stock_id is None or tick.volume <= 0:
+      return
+    self._aggregator.on_tick(stock_id, self._minute_of(tick.hhmmss), tick.price, tick.volume)
+
+  async def _flush_loop(self) -> None:
+    while True:
+      now = time.time()
+      if await _wait(self._stopping, (now // 60 + 1) * 60 + _FLUSH_GRACE_SECONDS - now):
+        return
+      try:
+        await self.flush(until_minute=int(time.time() // 60))
+      except Exception:
+        log.exception("[REALTIME SERVICE] 1분봉 flush 실패")
+
+  async def flush(self, *, until_minute: int) -> int:
+    """until_minute 이전 분 봉을 닫아 DB 적재 + Stream 발행"""
+    self._aggregator.close_until(until_minute)
+    batch = self._aggregator.drain()
+    records = self._retry + to_minute_price_records(batch)
+    self._retry = []
+    if not records:
+      return 0
+
+    try:
+      async with get_session() as session:
+        days = { r[1].astimezone(_KST).date() for r in records } - self._partition_days
+        if days:
+          await ensure_minute_price_partitions(session, start=min(days), end=max(days))
+          await session.commit()
+          self._partition_days |= days
+        written = await upsert_minute_prices(session, records)
+        await session.commit()
+    except Exception:
+      log.exception("[REALTIME SERVICE] minute_price 적재 실패 (다음 분 재시도) bars=%s", len(records))
+      self._retry = records[-_MAX_RETRY_RECORDS:]
+      return 0
+
+    self.bars_written += written
+    # 재시도분 포함 이번에 적재된 봉 전체 발행
+    await self._publish(records)
+    log.debug("[REALTIME SERVICE] 1분봉 적재 bars=%s", written)
+    return written
+
+  async def _publish(self, records: list[tuple[Any, ...]]) -> None:
+    """적재 완료 봉 Redis Stream 발행 (실시간 소비자용, records 는 MINUTE_PRICE_COLUMNS 순서)"""
+    if not records:
+      return
+    entries = [
+      {
+        "stock_id": str(sid),
+        "ticker": self._id_to_ticker.get(sid, ""),
+        "datetime": dt.isoformat(),
+        "open": repr(o), "high": repr(h), "low": repr(lo), "close": repr(c),
+        "volume": str(v), "value": repr(val),
+      }
+      for sid, dt, o, h, lo, c, v, val in records
+    ]
+    await self._redis.add_stream_entries(
+        MINUTE_BAR_STREAM, entries, maxlen=settings.realtime_minute_bar_stream_maxlen
+    )
+
+
+realtime_minute_bar_service = RealtimeMinuteBarService()
@@ -1,13 +1,45 @@
 # src/infrastructure/redis/redis_client.py
 import logging
-from typing import Optional
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
 
 import redis.asyncio as redis
 
 from config.settings import settings
+from infrastructure.metrics.instruments import REDIS_COMMAND_SECONDS, REDIS_COMMAND_ERRORS
 
 log = logging.getLogger(__name__)
 
+# 소유자(value)가 일치할 때만 TTL 연장
+_RENEW_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+  return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# 소유자(value)가 일치할 때만 삭제
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+  return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+@contextmanager
+def _observe(command: str) -> Iterator[None]:
+  """Redis 명령 지연시간/오류 메트릭 기록"""
+  begin = time.perf_counter()
+  try:
+    yield
+  except Exception:
+    REDIS_COMMAND_ERRORS.inc(command=command)
+    raise
+  finally:
+    REDIS_COMMAND_SECONDS.observe(time.perf_counter() - begin, command=command)
+
 
 class RedisClient:
   def __init__(self):
@@ -24,7 +56,8 @@ class RedisClient:
   async def ping(self) -> bool:
     """연결 테스트(비동기)"""
     try:
-      await self.client.ping()
+      with _observe("ping"):
+        await self.client.ping()
       log.debug("Redis 연결 성공")
       return True
     except Exception:
@@ -34,7 +67,8 @@ class RedisClient:
   async def get_value(self, key: str) -> Optional[str]:
     """Redis에 저장된 값 조회(비동기)"""
     try:
-      return await self.client.get(key)
+      with _observe("get"):
+        return await self.client.get(key)
     except Exception as e:
       log.error("Key: %s 에 해당하는 값 조회 실패: %s", key, e)
       return None
@@ -44,10 +78,12 @@ class RedisClient:
     try:
       if ttl:
         log.debug("Redis TTL 저장 key:%s, ttl:%s", key, ttl)
-        return bool(await self.client.setex(key, ttl, value))
+        with _observe("setex"):
+          return bool(await self.client.setex(key, ttl, value))
       else:
         log.debug("Redis 저장 (TTL 미설정) key:%s", key)
-        return bool(await self.client.set(key, value))
+        with _observe("set"):
+          return bool(await self.client.set(key, value))
     except Exception as e:
       log.error("Redis TTL 저장 실패 key:%s, ttl:%s, 오류:%s", key, ttl, e)
       return False
@@ -55,7 +91,8 @@ class RedisClient:
   async def delete_value(self, key: str) -> bool:
     """Redis 데이터 삭제(비동기)"""
     try:
-      return bool(await self.client.delete(key))
+      with _observe("delete"):
+        return bool(await self.client.delete(key))
     except Exception as e:
       log.error("Key: %s 에 해당하는 데이터 삭제 실패: %s", key, e)
       return False
@@ -63,10 +100,116 @@ class RedisClient:
   async def get_ttl(self, key: str) -> Optional[int]:
     """TTL 조회(초). 없으면 -2, 무제한이면 -1"""
     try:
-      return await self.client.ttl(key)
+      with _observe("ttl"):
+        return await self.client.ttl(key)
     except Exception:
       return None
 
+  async def set_hash(self, key: str, mapping: dict[str, str], ttl: Optional[int] = None) -> bool:
+    """Redis Hash 필드 일괄 저장(비동기). ttl 지정 시 키 만료 갱신"""
+    try:
+      with _observe("hset"):
+        async with self.client.pipeline(transaction=True) as pipe:
+          pipe.hset(key, mapping=mapping)
+          if ttl:
+            pipe.expire(key, ttl)
+          await pipe.execute()
+      return True
+    except Exception as e:
+      log.error("Redis Hash 저장 실패 key:%s, 오류:%s", key, e)
+      return False
+
+  async def get_hash(self, key: str) -> dict[str, str]:
+    """Redis Hash 전체 필드 조회(비동기). 실패/없음이면 빈 dict"""
+    try:
+      with _observe("hgetall"):
+        return await self.client.hgetall(key)
+    except Exception as e:
+      log.error("Redis Hash 조회 실패 key:%s, 오류:%s", key, e)
+      return {}
+
+  async def set_hashes(self, hashes: dict[str, dict[str, str]], *, replace: bool = False) -> bool:
+    """여러 Redis Hash 일괄 저장(비동기, 트랜잭션 1회 왕복). replace=True 면 기존 필드 삭제 후 저장"""
+    try:
+      with _observe("hset_many"):
+        async with self.client.pipeline(transaction=True) as pipe:
+          for key, mapping in hashes.items():
+            if replace:
+              pipe.delete(key)
+            if mapping:
+              pipe.hset(key, mapping=mapping)
+          await pipe.execute()
+      return True
+    except Exception as e:
+      log.error("Redis Hash 일괄 저장 실패 keys:%s, 오류:%s", list(hashes), e)
+      return False
+
+  async def get_hashes(self, keys: list[str]) -> dict[str, dict[str, str]]:
+    """여러 Redis Hash 전체 필드 일괄 조회(비동기, 파이프라인 1회 왕복). 실패 시 빈 dict"""
+    try:
+      with _observe("hgetall_many"):
+        async with self.client.pipeline(transaction=False) as pipe:
+          for key in keys:
+            pipe.hgetall(key)
+          values = await pipe.execute()
+      return dict(zip(keys, values))
+    except Exception as e:
+      log.error("Redis Hash 일괄 조회 실패 keys:%s, 오류:%s", keys, e)
+      return {}
+
+  async def incr_value(self, key: str) -> Optional[int]:
+    """정수 값 1 증가(비동기). 실패 시 None"""
+    try:
+      with _observe("incr"):
+        return await self.client.incr(key)
+    except Exception as e:
+      log.error("Redis INCR 실패 key:%s, 오류:%s", key, e)
+      return None
+
+  async def add_stream_entries(
+      self, stream: str, entries: list[dict[str, str]], *, maxlen: Optional[int] = None
+  ) -> int:
+    """Redis Stream XADD 일괄 적재(비동기, 파이프라인 1회 왕복). maxlen 지정 시 근사 trim"""
+    if not entries:
+      return 0
+    try:
+      with _observe("xadd"):
+        async with self.client.pipeline(transaction=False) as pipe:
+          for fields in entries:
+            pipe.xadd(stream, fields, maxlen=maxlen, approximate=True)
+          await pipe.execute()
+      return len(entries)
+    except Exception as e:
+      log.error("Redis Stream 적재 실패 stream:%s, 건수:%s, 오류:%s", stream, len(entries), e)
+      return 0
+
+  async def acquire_lock(self, key: str, owner: str, ttl_ms: int) -> bool:
+    """분산 락 획득 (SET NX PX). 이미 다른 소유자가 있으면 False"""
+    try:
+      with _observe("set_nx"):
+        return bool(await self.client.set(key, owner, nx=True, px=ttl_ms))
+    except Exception as e:
+      log.error("Redis 락 획득 실패 key:%s, 오류:%s", key, e)
+      return False
+
+  async def renew_lock(self, key: str, owner: str, ttl_ms: int) -> bool:
+    """분산 락 TTL 연장 (소유자 일치 시)"""
+    try:
+      with _observe("renew_lock"):
+        return bool(await self.client.eval(_RENEW_LOCK_SCRIPT, 1, key, owner, ttl_ms))
+    except Exception as e:
+      log.error("Redis 락 연장 실패 key:%s, 오류:%s", key, e)
+      return False
+
+  async def release_lock(self, key: str, owner: str) -> bool:
+    """분산 락 해제 (소유자 일치 시)"""
+    try:
+      with _observe("release_lock"):
+        return bool(await self.client.eval(_RELEASE_LOCK_SCRIPT, 1, key, owner))
+    except Exception as e:
+      log.error("Redis 락 해제 실패 key:%s, 오류:%s", key, e)
+      return False
+
   async def close(self) -> None:
     """Redis 연결 종료"""
     try:
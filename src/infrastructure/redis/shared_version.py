@@ -0,0 +1,43 @@
+# src/infrastructure/redis/shared_version.py
+import logging
+import time
+
+from infrastructure.redis.redis_client import RedisClient
+
+log = logging.getLogger(__name__)
+
+# 다른 워커 갱신 여부(버전) 확인 최소 간격(초)
+_CHECK_INTERVAL_SECONDS = 1.0
+
+
+class SharedVersion:
+  """
+  워커 간 공유 캐시 버전 (Redis INCR 카운터)
+  - 캐시를 무효화한 워커가 bump() 로 버전 증가
+  - 다른 워커는 조회 시 changed() 로 버전을 비교해 바뀌었으면 자기 캐시를 비움 (최소 간격 내 재호출은 Redis 왕복 없음)
+  - Redis 장애 시에는 변경 없음으로 취급 (로컬 캐시 유지)
+  """
+
+  def __init__(self, key: str, *, check_interval: float = _CHECK_INTERVAL_SECONDS) -> None:
+    self._key = key
+    self._check_interval = check_interval
+    self._redis = RedisClient()
+    self._version = 0
+    self._checked_at = 0.0
+
+  async def bump(self) -> None:
+    version = await self._redis.incr_value(self._key)
+    if version is not None:
+      self._version = version
+    self._checked_at = time.monotonic()
+
+  async def changed(self) -> bool:
+    if time.monotonic() - self._checked_at < self._check_interval:
+      return False
+    self._checked_at = time.monotonic()
+    raw = await self._redis.get_value(self._key)
+    if raw is None or int(raw) == self._version:
+      return False
+    self._version = int(raw)
+    log.debug("[CACHE] 공유 버전 변경 key=%s, version=%s", self._key, self._version)
+    return True
@@ -0,0 +1,153 @@
+# src/infrastructure/scheduler/leader.py
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from typing import Optional
+
+from infrastructure.redis.redis_client import RedisClient
+
+log = logging.getLogger(__name__)
+
+# Redis 리더 lease Key
+LEADER_REDIS_KEY = "scheduler:leader"
+# Job 단위 분산 락 Key prefix
+JOB_LOCK_KEY_PREFIX = "scheduler:job_lock:"
+
+# 리더 lease 연장 재시도 (총 대기 0.5+1.0초, 연장 주기 ttl/3 보다 충분히 짧게)
+_RENEW_ATTEMPTS = 3
+_RENEW_BACKOFF_SECONDS = 0.5
+
+
+def _instance_id() -> str:
+  """워커 프로세스 고유 식별자 (host:pid:random)"""
+  return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class LeaderElector:
+  """
+  Redis lease 기반 리더 선출
+  - SET NX PX 로 lease 획득, ttl/3 주기로 소유자 확인 후 연장
+  - 연장 실패 시 짧게 재시도, 그래도 실패하면 리더 지위 포기
+  - 리더가 아닐 때도 lease 값이 자기 instance_id 면(일시 오류로 지위를 놓친 경우) TTL 만료를 기다리지 않고 다시 채택
+  - 리더가 죽으면 lease 만료 후 다른 인스턴스가 다음 주기에 획득 (failover)
+  """
+
+  def __init__(self, *, ttl_seconds: int = 30, key: str = LEADER_REDIS_KEY) -> None:
+    self._redis = RedisClient()
+    self._key = key
+    self._ttl_ms = ttl_seconds * 1000
+    self._interval = max(ttl_seconds / 3, 1.0)
+    self.instance_id = _instance_id()
+    self._is_leader = False
+    self._task: Optional[asyncio.Task[None]] = None
+
+  @property
+  def is_leader(self) -> bool:
+    return self._is_leader
+
+  def job_lock(self, job_id: str, run_key: str, *, hold_seconds: int = 0) -> "JobLock":
+    """리더 lease 와 같은 Redis 연결을 쓰는 Job 락 생성 (run_key: 예정 실행 시각 등 실행 회차 식별자)"""
+    return JobLock(self._redis, job_id, run_key, self.instance_id,
+                   ttl_seconds=self._ttl_ms // 1000, hold_seconds=hold_seconds)
+
+  def start(self) -> None:
+    """lease 유지 루프 시작 (이벤트 루프 안에서 호출)"""
+    if self._task is None or self._task.done():
+      self._task = asyncio.get_running_loop().create_task(self._run(), name="scheduler-leader-elector")
+      log.info("[LEADER] 리더 선출 시작 instance=%s, ttl=%sms", self.instance_id, self._ttl_ms)
+
+  async def stop(self) -> None:
+    """루프 종료 후 lease 반납 (다른 인스턴스가 즉시 승계 가능)"""
+    if self._task is not None:
+      self._task.cancel()
+      try:
+        await self._task
+      except asyncio.CancelledError:
+        pass
+      self._task = None
+    if self._is_leader:
+      await self._redis.release_lock(self._key, self.instance_id)
+      self._is_leader = False
+      log.info("[LEADER] 리더 lease 반납 instance=%s", self.instance_id)
+
+  async def _run(self) -> None:
+    while True:
+      await self._tick()
+      await asyncio.sleep(self._interval)
+
+  async def _tick(self) -> None:
+    if self._is_leader:
+      if not await self._renew():
+        self._is_leader = False
+        log.warning("[LEADER] 리더 lease 연장 실패 → 리더 지위 포기 instance=%s", self.instance_id)
+      return
+    # lease 가 아직 자기 것이면 소유자 확인 연장으로 재채택 (SET NX 는 자기 lease 에도 실패)
+    if await self._redis.renew_lock(self._key, self.instance_id, self._ttl_ms):
+      self._is_leader = True
+      log.info("[LEADER] 기존 lease 재채택 instance=%s", self.instance_id)
+      return
+    if await self._redis.acquire_lock(self._key, self.instance_id, self._ttl_ms):
+      self._is_leader = True
+      log.info("[LEADER] 리더 선출됨 instance=%s", self.instance_id)
+
+  async def _renew(self) -> bool:
+    """소유자 확인 연장 (일시적 Redis 오류 대비 재시도, lease 만료 전까지만)"""
+    for attempt in range(_RENEW_ATTEMPTS):
+      if await self._redis.renew_lock(self._key, self.instance_id, self._ttl_ms):
+        return True
+      if attempt + 1 < _RENEW_ATTEMPTS:
+        await asyncio.sleep(_RENEW_BACKOFF_SECONDS * (attempt + 1))
+    return False
+
+
+class JobLock:
+  """
+  Job 실행 회차 단위 분산 락 (key = job_id + 예정 실행 시각)
+  - 리더 교체 직후처럼 두 인스턴스가 동시에 리더라고 믿는 구간에서도 같은 회차 중복 실행 방지
+  - 실행 중에는 주기적으로 TTL 연장, 종료 후에도 삭제하지 않고 hold_seconds(misfire 허용 지연) 동안 유지
+    → 늦게 도착한 다른 인스턴스의 같은 회차 트리거가 재실행하지 못함
+  """
+
+  def __init__(
+      self,
+      redis: RedisClient,
+      job_id: str,
+      run_key: str,
+      owner: str,
+      *,
+      ttl_seconds: int = 30,
+      hold_seconds: int = 0,
+  ) -> None:
+    self._redis = redis
+    self._key = f"{JOB_LOCK_KEY_PREFIX}{job_id}:{run_key}"
+    self._owner = f"{owner}:{uuid.uuid4().hex[:8]}"
+    self._ttl_ms = ttl_seconds * 1000
+    self._hold_ms = max(hold_seconds * 1000, self._ttl_ms)
+    self._interval = max(ttl_seconds / 3, 1.0)
+    self._renew_task: Optional[asyncio.Task[None]] = None
+
+  async def acquire(self) -> bool:
+    if not await self._redis.acquire_lock(self._key, self._owner, self._hold_ms):
+      return False
+    self._renew_task = asyncio.get_running_loop().create_task(self._renew())
+    return True
+
+  async def release(self) -> None:
+    """연장 중지 후 hold 기간으로 TTL 재설정 (삭제하지 않음, 만료로 정리)"""
+    if self._renew_task is not None:
+      self._renew_task.cancel()
+      try:
+        await self._renew_task
+      except asyncio.CancelledError:
+        pass
+      self._renew_task = None
+    await self._redis.renew_lock(self._key, self._owner, self._hold_ms)
+
+  async def _renew(self) -> None:
+    while True:
+      await asyncio.sleep(self._interval)
+      if not await self._redis.renew_lock(self._key, self._owner, self._hold_ms):
+        log.warning("[LEADER] Job 락 연장 실패 key=%s", self._key)
+        return
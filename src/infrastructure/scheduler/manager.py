@@ -1,17 +1,52 @@
 # src/infrastructure/scheduler/manager.py
 import asyncio
+import functools
 import inspect
 import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Callable, Optional, Coroutine
+from datetime import datetime, timedelta
+from typing import Any, Callable, Literal, Optional, Coroutine
 from zoneinfo import ZoneInfo
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
+from config.settings import settings
+from infrastructure.metrics.instruments import SCHEDULER_JOB_SECONDS, SCHEDULER_JOB_RUNNING, SCHEDULER_JOB_OVERLAPS
+from infrastructure.profiling.profiler import profile_session, run_profiled
+from infrastructure.scheduler.leader import LeaderElector
+from infrastructure.scheduler.process_runner import run_process_job, ensure_picklable
+
 log = logging.getLogger(__name__)
 
+# Job 실행 방식
+# - async: 이벤트 루프에서 실행 (I/O 위주 async 함수)
+# - thread: 스레드 풀에서 실행 (블로킹 I/O, GIL 을 놓는 연산)
+# - process: 프로세스 풀에서 실행 (CPU 위주 연산, API 이벤트 루프와 GIL 경쟁 없음)
+ExecutorType = Literal["async", "thread", "process"]
+
+
+def scheduled_run_key(trigger: Any, now: datetime, *, lookback_seconds: int) -> str:
+  """
+  트리거 발생 회차 식별자 (인스턴스 간 동일해야 함)
+  - IntervalTrigger: 인스턴스마다 시작 시각이 달라 epoch 기준 간격 구간 번호 사용
+  - 그 외(Cron 등): now 이전 lookback 구간 안의 마지막 예정 실행 시각 (coalesce 기준과 동일)
+  """
+  if isinstance(trigger, IntervalTrigger):
+    interval = max(int(trigger.interval.total_seconds()), 1)
+    return str(int(now.timestamp()) // interval * interval)
+  latest: Optional[datetime] = None
+  fire = trigger.get_next_fire_time(None, now - timedelta(seconds=lookback_seconds))
+  while fire is not None and fire <= now:
+    latest = fire
+    fire = trigger.get_next_fire_time(fire, fire + timedelta(seconds=1))
+  return (latest or now.replace(second=0, microsecond=0)).strftime("%Y%m%dT%H%M%S")
+
 
 @dataclass(frozen=True)
 class JobSpec:
@@ -23,25 +58,59 @@ class JobSpec:
     func: 실행할 콜러블(동기/비동기 모두 가능)
     trigger: APScheduler 트리거 (CronTrigger, IntervalTrigger 등)
     kwargs: add_job 시 전달할 부가 옵션들 (ex. max_instances, misfire_grace_time)
+    executor: 실행 방식 (None 이면 async 함수는 "async", 동기 함수는 "thread")
+    profile: 실행마다 프로파일 기록 여부 (settings.profiling_enabled 일 때만)
   """
   id: str
   func: Callable[..., Any]
   trigger: Any
   kwargs: dict[str, Any]
+  executor: Optional[ExecutorType] = None
+  profile: bool = False
 
 
 class SchedulerManager:
   """스케줄러 수명주기/등록 메니저"""
 
-  def __init__(self, tz: str = "Asia/Seoul") -> None:
+  def __init__(
+      self,
+      tz: str = "Asia/Seoul",
+      *,
+      leader_election: bool = True,
+      lease_ttl_seconds: int = 30,
+      thread_pool_size: int = 4,
+      process_pool_size: int = 0,
+      result_dir: Optional[str] = None,
+      result_keep: int = 10,
+  ) -> None:
     self._tz = ZoneInfo(tz)
     self._scheduler: Optional[AsyncIOScheduler] = None
+    self._thread_pool_size = thread_pool_size
+    self._process_pool_size = process_pool_size or (os.cpu_count() or 1)
+    self._result_dir = result_dir or os.path.join(os.getcwd(), "job_results")
+    self._result_keep = max(result_keep, 1)
+    self._thread_pool: Optional[ThreadPoolExecutor] = None
+    self._process_pool: Optional[ProcessPoolExecutor] = None
+    # 다중 워커/레플리카에서 리더 인스턴스만 Job 실행
+    self._elector: Optional[LeaderElector] = (
+      LeaderElector(ttl_seconds=lease_ttl_seconds) if leader_election else None
+    )
 
   @property
   def timezone(self) -> ZoneInfo:
     """타임존 반환"""
     return self._tz
 
+  @property
+  def is_leader(self) -> bool:
+    """현재 인스턴스가 Job 을 실행하는지 여부 (리더 선출 비활성화 시 항상 True)"""
+    return self._elector is None or self._elector.is_leader
+
+  @property
+  def instance_id(self) -> Optional[str]:
+    """리더 선출에 사용하는 인스턴스 식별자"""
+    return self._elector.instance_id if self._elector else None
+
   def get_schedule(self) -> AsyncIOScheduler:
     """싱글톤 AsyncIOScheduler 인스턴스 획득 (없으면 생성)"""
     if self._scheduler is None:
@@ -52,6 +121,8 @@ class SchedulerManager:
     """스케줄러 시작"""
     schedule = self.get_schedule()
     if not schedule.running:
+      if self._elector is not None:
+        self._elector.start()
       schedule.start()
       log.info("스케줄러 시작 (time-zone=%s)", self._tz)
 
@@ -61,6 +132,17 @@ class SchedulerManager:
     if schedule.running:
       schedule.shutdown(wait=False)
       log.info("작동중인 스케줄러 정지")
+    if self._thread_pool is not None:
+      self._thread_pool.shutdown(wait=False, cancel_futures=True)
+      self._thread_pool = None
+    if self._process_pool is not None:
+      self._process_pool.shutdown(wait=False, cancel_futures=True)
+      self._process_pool = None
+
+  async def release_leadership(self) -> None:
+    """리더 lease 반납 (애플리케이션 종료 시 호출)"""
+    if self._elector is not None:
+      await self._elector.stop()
 
   def add_cron(
       self,
@@ -76,6 +158,7 @@ class SchedulerManager:
       replace_existing: bool = True,
       max_instances: int = 1,
       misfire_grace_time: int = 600,
+      executor: Optional[ExecutorType] = None,
       **kwargs: Any,
   ) -> None:
     """
@@ -85,6 +168,7 @@ class SchedulerManager:
     :param replace_existing: 이미 동일 id가 있다면 교체 여부
     :param max_instances: 동시에 실행 가능한 인스턴스 수 (중복 실행 방지)
     :param misfire_grace_time: 누락된 트리거 발생 시 허용 지연 (초)
+    :param executor: 실행 방식 (async/thread/process, None 이면 함수 종류로 결정)
     :param kwargs: apscheduler.add_job 에 전달할 추가 옵션
     """
     trigger = CronTrigger(
@@ -92,7 +176,7 @@ class SchedulerManager:
         day=day, day_of_week=day_of_week, month=month,
         timezone=self._tz,
     )
-    self._add_job(func, id=id, trigger=trigger,
+    self._add_job(func, id=id, trigger=trigger, executor=executor,
                   replace_existing=replace_existing,
                   max_instances=max_instances,
                   misfire_grace_time=misfire_grace_time,
@@ -109,6 +193,7 @@ class SchedulerManager:
       replace_existing: bool = True,
       max_instances: int = 1,
       misfire_grace_time: int = 600,
+      executor: Optional[ExecutorType] = None,
       **kwargs: Any,
   ) -> None:
     """
@@ -118,41 +203,202 @@ class SchedulerManager:
     :param replace_existing: 이미 동일 id가 있다면 교체 여부
     :param max_instances: 동시에 실행 가능한 인스턴스 수 (중복 실행 방지)
     :param misfire_grace_time: 누락된 트리거 발생 시 허용 지연 (초)
+    :param executor: 실행 방식 (async/thread/process, None 이면 함수 종류로 결정)
     :param kwargs: apscheduler.add_job 에 전달할 추가 옵션
     """
     trigger = IntervalTrigger(
         seconds=seconds, minutes=minutes, hours=hours, timezone=self._tz
     )
-    self._add_job(func, id=id, trigger=trigger,
+    self._add_job(func, id=id, trigger=trigger, executor=executor,
                   replace_existing=replace_existing,
                   max_instances=max_instances,
                   misfire_grace_time=misfire_grace_time,
                   **kwargs)
 
-  def _wrap(self, func: Callable[..., Any]) -> Callable[..., Coroutine[Any, Any, Any]]:
+  def _wrap(
+      self,
+      func: Callable[..., Any],
+      *,
+      job_id: str | None = None,
+      executor: Optional[ExecutorType] = None,
+      args: tuple[Any, ...] = (),
+      kwargs: Optional[dict[str, Any]] = None,
+      profile: bool = False,
+      trigger: Any = None,
+      misfire_grace_time: int = 0,
+  ) -> Callable[..., Coroutine[Any, Any, Any]]:
     """
-    sync 함수도 event loop를 막지 않도록 thread로 돌려주는 헬퍼
+    Job 실행 방식(executor)에 맞춰 awaitable 함수로 감싸는 헬퍼
     :param func: 실행할 함수 (동기/비동기)
+    :param job_id: 메트릭 라벨로 사용할 Job 식별자 (없으면 함수명)
+    :param executor: async/thread/process (None 이면 async 함수는 async, 동기 함수는 thread)
+    :param args: process Job 에 전달할 인자 (등록 시점에 pickle 가능 여부 검증)
+    :param kwargs: process Job 에 전달할 키워드 인자
+    :param profile: True 면 Job 이 실행되는 스레드/프로세스에서 프로파일 기록
+    :param trigger: 실행 회차별 Job 락 key 계산용 트리거 (None 이면 호출 시각 기준)
+    :param misfire_grace_time: 같은 회차 중복 실행 방지를 위해 Job 락을 유지할 시간 (초)
     :return: 비동기(awaitable) 함수로 감싼 Callable
     """
-    if inspect.iscoroutinefunction(func):
+    job_id = job_id or func.__name__
+    is_async = inspect.iscoroutinefunction(func)
+    executor = executor or ("async" if is_async else "thread")
+    if executor != "async" and is_async:
+      raise ValueError(f"async 함수는 {executor} executor 로 실행할 수 없습니다. id={job_id}")
+    if executor == "async" and not is_async:
+      raise ValueError(f"동기 함수는 async executor 로 실행할 수 없습니다. id={job_id}")
+
+    if executor == "async" and profile:
+      async def runner(*a: Any, **kw: Any) -> Any:
+        # 이벤트 루프 스레드 샘플링 (Job 실행 구간)
+        with profile_session("job", job_id):
+          return await func(*a, **kw)
+    elif executor == "async":
       # 이미 async 함수면 그대로 사용
-      return func
+      runner = func
+    elif executor == "thread":
+      target = functools.partial(run_profiled, "job", job_id, func) if profile else func
+
+      async def runner(*a: Any, **kw: Any) -> Any:
+        # 동기 함수는 전용 스레드 풀에서 실행하여 event loop 블로킹 방지
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_thread_pool(), functools.partial(target, *a, **kw))
+    elif executor == "process":
+      job_kwargs = dict(kwargs or {})
+      ensure_picklable(job_id, func, args, job_kwargs)
+      result_dir, result_keep = self._result_dir, self._result_keep
 
-    async def _runner(*args: Any, **kwargs: Any) -> Any:
-      # 동기 함수는 별도 스레드에서 실행하여 event loop 블로킹 방지
-      return await asyncio.to_thread(func, *args, **kwargs)
+      async def runner(*a: Any, **kw: Any) -> Any:
+        # CPU 위주 Job 은 별도 프로세스에서 실행 (결과는 파일로 저장, 경로만 수신)
+        # 인자는 등록 시 고정 (APScheduler 는 인자 없이 호출)
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+          self._get_process_pool(),
+          functools.partial(run_process_job, func, job_id, result_dir, args, job_kwargs, profile, result_keep),
+        )
+        log.info("process Job 완료. id=%s, seconds=%.2f, result=%s", job_id, result.seconds, result.path)
+        return result
+    else:
+      raise ValueError(f"알 수 없는 executor 입니다. id={job_id}, executor={executor}")
 
-    return _runner
+    guarded = self._guard(runner, job_id=job_id, trigger=trigger, misfire_grace_time=misfire_grace_time)
+    return self._instrument(guarded, job_id=job_id)
 
-  def _add_job(self, func: Callable[..., Any], *, id: str, trigger: Any, **options: Any) -> None:
+  def _get_thread_pool(self) -> ThreadPoolExecutor:
+    """thread executor 용 스레드 풀 (지연 생성)"""
+    if self._thread_pool is None:
+      self._thread_pool = ThreadPoolExecutor(max_workers=self._thread_pool_size, thread_name_prefix="scheduler-job")
+    return self._thread_pool
+
+  def _get_process_pool(self) -> ProcessPoolExecutor:
+    """
+    process executor 용 프로세스 풀 (지연 생성, fork 시 이벤트 루프/커넥션 복제를 피하기 위해 spawn 사용)
+    - Job 마다 새 워커 프로세스 (asyncio.run 으로 만든 DB 엔진/Redis 커넥션/캐시가 다음 Job 으로 넘어가지 않도록)
+    """
+    if self._process_pool is None:
+      self._process_pool = ProcessPoolExecutor(
+        max_workers=self._process_pool_size,
+        mp_context=multiprocessing.get_context("spawn"),
+        max_tasks_per_child=1,
+      )
+    return self._process_pool
+
+  def _guard(
+      self,
+      runner: Callable[..., Coroutine[Any, Any, Any]],
+      *,
+      job_id: str,
+      trigger: Any = None,
+      misfire_grace_time: int = 0,
+  ) -> Callable[..., Coroutine[Any, Any, Any]]:
+    """
+    클러스터 단위 회차당 1회 실행 보장
+    - 리더가 아니면 skip
+    - 리더라도 같은 회차(job_id + 예정 실행 시각) Job 락을 못 잡으면(다른 인스턴스가 실행 중/실행 완료) skip
+    - 락은 종료 후에도 misfire_grace_time 동안 유지 (늦게 도착한 같은 회차 트리거 차단)
+    """
+    elector = self._elector
+    if elector is None:
+      return runner
+
+    @functools.wraps(runner)
+    async def _guarded(*args: Any, **kwargs: Any) -> Any:
+      if not elector.is_leader:
+        log.debug("리더가 아니므로 Job skip. id=%s", job_id)
+        return None
+      now = datetime.now(self._tz)
+      run_key = (
+        scheduled_run_key(trigger, now, lookback_seconds=misfire_grace_time)
+        if trigger is not None else now.strftime("%Y%m%dT%H%M%S")
+      )
+      lock = elector.job_lock(job_id, run_key, hold_seconds=misfire_grace_time)
+      if not await lock.acquire():
+        log.info("다른 인스턴스가 이미 실행한 회차이므로 Job skip. id=%s, run=%s", job_id, run_key)
+        return None
+      try:
+        return await runner(*args, **kwargs)
+      finally:
+        await lock.release()
+
+    return _guarded
+
+  @staticmethod
+  def _instrument(
+      runner: Callable[..., Coroutine[Any, Any, Any]], *, job_id: str
+  ) -> Callable[..., Coroutine[Any, Any, Any]]:
+    """Job 실행시간/동시 실행(overlap) 메트릭 기록"""
+
+    @functools.wraps(runner)
+    async def _instrumented(*args: Any, **kwargs: Any) -> Any:
+      if SCHEDULER_JOB_RUNNING.inc(job_id=job_id) > 1:
+        SCHEDULER_JOB_OVERLAPS.inc(job_id=job_id)
+      begin = time.perf_counter()
+      status = "success"
+      try:
+        return await runner(*args, **kwargs)
+      except BaseException:
+        status = "error"
+        raise
+      finally:
+        SCHEDULER_JOB_SECONDS.observe(time.perf_counter() - begin, job_id=job_id, status=status)
+        SCHEDULER_JOB_RUNNING.dec(job_id=job_id)
+
+    return _instrumented
+
+  def _add_job(
+      self,
+      func: Callable[..., Any],
+      *,
+      id: str,
+      trigger: Any,
+      executor: Optional[ExecutorType] = None,
+      profile: bool = False,
+      **options: Any,
+  ) -> None:
     """Job 추가 메서드"""
     schedule = self.get_schedule()
-    wrapped = self._wrap(func)
+    job_args = options.pop("args", ())
+    job_kwargs = options.pop("kwargs", None)
+    grace = options.get("misfire_grace_time") or 0
+    if executor == "process":
+      # process Job 인자는 래퍼에 고정 (APScheduler 는 인자 없이 호출)
+      wrapped = self._wrap(func, job_id=id, executor=executor, args=tuple(job_args), kwargs=job_kwargs,
+                           profile=profile, trigger=trigger, misfire_grace_time=grace)
+    else:
+      wrapped = self._wrap(func, job_id=id, executor=executor, profile=profile,
+                           trigger=trigger, misfire_grace_time=grace)
+      options.update(args=job_args, kwargs=job_kwargs)
     schedule.add_job(wrapped, trigger=trigger, id=id, **options)
-    log.info("스케줄러 Job 등록 성공. id=%s, trigger=%s, options=%s",
-             id, trigger, { k: v for k, v in options.items() if k in ("max_instances", "misfire_grace_time",) })
+    logged = { k: v for k, v in options.items() if k in ("max_instances", "misfire_grace_time") }
+    log.info("스케줄러 Job 등록 성공. id=%s, trigger=%s, executor=%s, options=%s", id, trigger, executor, logged)
 
 
 # 외부에서 바로 import 가능하도록 싱글톤 인스턴스 노출
-manager = SchedulerManager(tz="Asia/Seoul")
+manager = SchedulerManager(
+    tz="Asia/Seoul",
+    leader_election=settings.scheduler_leader_election,
+    lease_ttl_seconds=settings.scheduler_lease_ttl_seconds,
+    thread_pool_size=settings.scheduler_thread_pool_size,
+    process_pool_size=settings.scheduler_process_pool_size,
+    result_dir=os.path.join(settings.analytics_dir, "job_results"),
+    result_keep=settings.scheduler_job_results_keep,
+)
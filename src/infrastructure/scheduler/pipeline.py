@@ -0,0 +1,271 @@
+# src/infrastructure/scheduler/pipeline.py
+"""
+장 마감 후 데이터 파이프라인 DAG 실행기
+- @pipeline_stage 로 스테이지와 의존관계(depends_on)를 등록
+- 선행 스테이지가 끝난 스테이지부터 즉시 시작하므로 독립 스테이지는 동시 실행
+  (전체 소요시간 = 스테이지 합이 아니라 critical path)
+- 스테이지 실행 기록(상태/레코드 수/실패 종목/출력값)은 거래일 단위 Redis Hash 에 저장
+- 재실행(rerun) 시 성공한 스테이지는 건너뛰고, 실패/부분실패 스테이지와 그 하위 스테이지만
+  영향받은 종목(failed_stock_ids)으로 다시 실행
+"""
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass, field, asdict
+from datetime import date, datetime
+from typing import Any, Awaitable, Callable, Optional, Sequence
+
+from infrastructure.redis.redis_client import RedisClient
+
+log = logging.getLogger(__name__)
+
+_STATE_KEY_PREFIX = "pipeline:daily"
+_STATE_TTL_SECONDS = 60 * 60 * 24 * 30  # 30일 보관
+
+# 스테이지 상태
+STATUS_SUCCESS = "success"
+STATUS_PARTIAL = "partial"  # 일부 종목 실패
+STATUS_FAILED = "failed"
+STATUS_SKIPPED = "skipped"  # 선행 스테이지 실패로 미실행
+_RERUN_STATUSES = (STATUS_PARTIAL, STATUS_FAILED, STATUS_SKIPPED)
+
+
+@dataclass
+class StageResult:
+  """
+  스테이지 실행 결과
+    records: 적재/계산한 레코드 수
+    failed_stock_ids: 실패한 종목 (있으면 partial, 재실행 대상)
+    outputs: 하위 스테이지에 넘길 JSON 직렬화 가능한 출력값
+  """
+  records: int = 0
+  failed_stock_ids: list[int] = field(default_factory=list)
+  outputs: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class StageContext:
+  """
+  스테이지 실행 컨텍스트
+    trade_date: 대상 거래일
+    stock_ids: 처리 대상 종목 (None 이면 전체, 재실행 시 영향받은 종목만)
+    upstream: 선행 스테이지 이름 -> 결과
+  """
+  trade_date: date
+  stock_ids: Optional[list[int]]
+  upstream: dict[str, StageResult]
+
+
+StageFunc = Callable[[StageContext], Awaitable[StageResult]]
+
+
+@dataclass(frozen=True)
+class StageSpec:
+  """파이프라인 스테이지 정의"""
+  name: str
+  func: StageFunc
+  depends_on: tuple[str, ...]
+
+
+@dataclass
+class StageRecord:
+  """스테이지 실행 기록 (Redis Hash 필드 값)"""
+  status: str
+  started_at: Optional[str] = None
+  finished_at: Optional[str] = None
+  seconds: float = 0.0
+  records: int = 0
+  stock_ids: Optional[list[int]] = None
+  failed_stock_ids: list[int] = field(default_factory=list)
+  outputs: dict[str, Any] = field(default_factory=dict)
+  error: Optional[str] = None
+
+  def to_result(self) -> StageResult:
+    return StageResult(records=self.records, failed_stock_ids=list(self.failed_stock_ids), outputs=dict(self.outputs))
+
+
+_STAGES: dict[str, StageSpec] = {}
+
+
+def pipeline_stage(
+    name: str, *, depends_on: Sequence[str] = ()
+) -> Callable[[StageFunc], StageFunc]:
+  """
+  파이프라인 스테이지 데코레이터
+  사용 예:
+      @pipeline_stage("investment_indicator", depends_on=("daily_price",))
+      async def investment_indicator_stage(ctx: StageContext) -> StageResult: ...
+  """
+
+  def _decorator(func: StageFunc) -> StageFunc:
+    if name in _STAGES:
+      raise ValueError(f"이미 등록된 파이프라인 스테이지입니다. name={name}")
+    _STAGES[name] = StageSpec(name=name, func=func, depends_on=tuple(depends_on))
+    return func
+
+  return _decorator
+
+
+def stage_graph() -> dict[str, list[str]]:
+  """스테이지 이름 -> 선행 스테이지 목록"""
+  return { name: list(spec.depends_on) for name, spec in _STAGES.items() }
+
+
+def _topological_order() -> list[str]:
+  """등록된 스테이지 위상 정렬 (미등록 의존/순환 의존 검증)"""
+  order: list[str] = []
+  state: dict[str, int] = {}  # 1: 방문 중, 2: 완료
+
+  def _visit(name: str, path: tuple[str, ...]) -> None:
+    if state.get(name) == 2:
+      return
+    if state.get(name) == 1:
+      raise ValueError(f"파이프라인 순환 의존이 있습니다. path={' -> '.join(path + (name,))}")
+    spec = _STAGES.get(name)
+    if spec is None:
+      raise ValueError(f"등록되지 않은 스테이지에 의존합니다. stage={path[-1] if path else None}, depends_on={name}")
+    state[name] = 1
+    for dep in spec.depends_on:
+      _visit(dep, path + (name,))
+    state[name] = 2
+    order.append(name)
+
+  for stage_name in _STAGES:
+    _visit(stage_name, ())
+  return order
+
+
+def _state_key(trade_date: date) -> str:
+  return f"{_STATE_KEY_PREFIX}:{trade_date.isoformat()}"
+
+
+async def load_pipeline_state(trade_date: date) -> dict[str, StageRecord]:
+  """거래일 파이프라인 스테이지 실행 기록 조회"""
+  raw = await RedisClient().get_hash(_state_key(trade_date))
+  state: dict[str, StageRecord] = {}
+  for name, value in raw.items():
+    try:
+      state[name] = StageRecord(**json.loads(value))
+    except (TypeError, ValueError):
+      log.warning("[PIPELINE] 스테이지 기록 파싱 실패 trade_date=%s, stage=%s", trade_date, name)
+  return state
+
+
+async def _save_record(trade_date: date, name: str, record: StageRecord) -> None:
+  await RedisClient().set_hash(
+    _state_key(trade_date), { name: json.dumps(asdict(record), default=str) }, ttl=_STATE_TTL_SECONDS
+  )
+
+
+def _plan(
+    order: list[str],
+    state: dict[str, StageRecord],
+    *,
+    rerun: bool,
+    stages: Optional[Sequence[str]],
+    stock_ids: Optional[Sequence[int]],
+) -> dict[str, Optional[list[int]]]:
+  """
+  실행할 스테이지 -> 대상 종목(None 이면 전체) 계획
+  - rerun: 기록이 없거나 실패/부분실패/skip 된 스테이지만 선택,
+           partial 은 실패 종목만, 하위 스테이지는 선행 재실행 종목 합집합으로 전파
+  - stages: 지정 스테이지(+하위 스테이지)만 실행
+  """
+  base = list(stock_ids) if stock_ids is not None else None
+  plan: dict[str, Optional[list[int]]] = {}
+  for name in order:
+    spec = _STAGES[name]
+    record = state.get(name)
+    upstream = [plan[d] for d in spec.depends_on if d in plan]
+
+    if stages is not None and name not in stages and not upstream:
+      continue
+    if rerun and not upstream and record is not None and record.status not in _RERUN_STATUSES:
+      continue
+
+    if upstream and any(u is None for u in upstream):
+      targets = base
+    elif upstream:
+      targets = sorted({ sid for u in upstream for sid in u })
+    elif rerun and record is not None and record.status == STATUS_PARTIAL and record.failed_stock_ids:
+      targets = list(record.failed_stock_ids)
+    else:
+      targets = base
+    plan[name] = targets
+  return plan
+
+
+async def run_pipeline(
+    trade_date: date,
+    *,
+    rerun: bool = False,
+    stages: Optional[Sequence[str]] = None,
+    stock_ids: Optional[Sequence[int]] = None,
+) -> dict[str, StageRecord]:
+  """
+  파이프라인 실행
+  :param trade_date: 대상 거래일
+  :param rerun: True 면 실패/부분실패 스테이지와 하위 스테이지만 영향받은 종목으로 재실행
+  :param stages: 특정 스테이지(+하위 스테이지)만 실행
+  :param stock_ids: 처리 대상 종목 제한 (None 이면 전체)
+  :return: 스테이지 이름 -> 이번 실행 기록
+  """
+  order = _topological_order()
+  state = await load_pipeline_state(trade_date)
+  plan = _plan(order, state, rerun=rerun, stages=stages, stock_ids=stock_ids)
+  if not plan:
+    log.info("[PIPELINE] 실행할 스테이지가 없습니다. trade_date=%s, rerun=%s", trade_date, rerun)
+    return {}
+
+  log.info("[PIPELINE] 시작 trade_date=%s, rerun=%s, stages=%s", trade_date, rerun, list(plan))
+  begin = time.perf_counter()
+  done: dict[str, asyncio.Future[StageRecord]] = {
+    name: asyncio.get_running_loop().create_future() for name in plan
+  }
+
+  async def _run_stage(name: str) -> StageRecord:
+    spec = _STAGES[name]
+    upstream: dict[str, StageResult] = {}
+    for dep in spec.depends_on:
+      if dep in done:
+        dep_record = await done[dep]
+      elif dep in state:
+        dep_record = state[dep]  # 이전 실행 결과 재사용
+      else:
+        dep_record = StageRecord(status=STATUS_SKIPPED, error="선행 스테이지 미실행")
+      if dep_record.status in (STATUS_FAILED, STATUS_SKIPPED):
+        return StageRecord(status=STATUS_SKIPPED, stock_ids=plan[name], error=f"선행 스테이지 실패: {dep}")
+      upstream[dep] = dep_record.to_result()
+
+    ctx = StageContext(trade_date=trade_date, stock_ids=plan[name], upstream=upstream)
+    record = StageRecord(status=STATUS_SUCCESS, started_at=datetime.now().isoformat(), stock_ids=plan[name])
+    stage_begin = time.perf_counter()
+    try:
+      result = await spec.func(ctx)
+      record.records = result.records
+      record.failed_stock_ids = sorted(set(result.failed_stock_ids))
+      record.outputs = result.outputs
+      if record.failed_stock_ids:
+        record.status = STATUS_PARTIAL
+    except Exception as e:
+      log.exception("[PIPELINE] 스테이지 실패 trade_date=%s, stage=%s", trade_date, name)
+      record.status = STATUS_FAILED
+      record.error = repr(e)
+    record.seconds = round(time.perf_counter() - stage_begin, 3)
+    record.finished_at = datetime.now().isoformat()
+    return record
+
+  async def _runner(name: str) -> None:
+    record = await _run_stage(name)
+    await _save_record(trade_date, name, record)
+    log.info("[PIPELINE] 스테이지 종료 stage=%s, status=%s, records=%s, failed=%s, seconds=%s",
+             name, record.status, record.records, len(record.failed_stock_ids), record.seconds)
+    done[name].set_result(record)
+
+  await asyncio.gather(*(_runner(name) for name in plan))
+
+  results = { name: fut.result() for name, fut in done.items() }
+  log.info("[PIPELINE] 완료 trade_date=%s, seconds=%.2f, status=%s", trade_date, time.perf_counter() - begin,
+           { name: r.status for name, r in results.items() })
+  return results
@@ -0,0 +1,81 @@
+# src/infrastructure/scheduler/process_runner.py
+"""
+프로세스 풀 Job 실행기
+- 워커 프로세스에서 실행되므로 모듈 최상위 함수만 사용 (pickle 가능)
+- 결과는 파이프로 직접 돌려보내지 않고 파일로 저장한 뒤 경로만 반환
+  (대용량 배열/DataFrame 결과도 부모 프로세스 메모리 복사 없이 필요할 때 로드)
+- Job 별로 최근 keep 개 결과 파일만 보관
+"""
+import os
+import pickle
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from infrastructure.profiling.profiler import run_profiled
+
+
+@dataclass(frozen=True)
+class ProcessJobResult:
+  """프로세스 Job 실행 결과 (결과가 None 이면 path 도 None)"""
+  job_id: str
+  path: Optional[str]
+  seconds: float
+
+  def load(self) -> Any:
+    """저장된 결과 로드"""
+    return load_process_result(self.path) if self.path else None
+
+
+def run_process_job(
+    func: Callable[..., Any],
+    job_id: str,
+    result_dir: str,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    profile: bool = False,
+    keep: int = 10,
+) -> ProcessJobResult:
+  """
+  워커 프로세스 진입점: func 실행 후 결과를 {result_dir}/{job_id}/{ts}_{pid}.pkl 로 저장
+  profile=True 면 워커 프로세스 안에서 프로파일 기록
+  keep: 보관할 최근 결과 파일 수 (이전 파일은 저장 직후 삭제)
+  """
+  begin = time.perf_counter()
+  result = run_profiled("job", job_id, func, *args, **kwargs) if profile else func(*args, **kwargs)
+  path: Optional[str] = None
+  if result is not None:
+    out_dir = Path(result_dir) / job_id
+    out_dir.mkdir(parents=True, exist_ok=True)
+    target = out_dir / f"{time.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}.pkl"
+    tmp = target.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+      # protocol 5 (buffer_callback 미사용 → 배열 버퍼도 in-band 로 파일에 그대로 기록)
+      pickle.dump(result, f, protocol=5)
+    tmp.replace(target)
+    path = str(target)
+    _prune(out_dir, keep)
+  return ProcessJobResult(job_id=job_id, path=path, seconds=time.perf_counter() - begin)
+
+
+def _prune(out_dir: Path, keep: int) -> None:
+  """최근 keep 개 결과 파일만 남김 (파일명이 실행 시각으로 시작하므로 이름순 = 시간순)"""
+  files = sorted(out_dir.glob("*.pkl"))
+  for old in files[:max(len(files) - keep, 0)]:
+    old.unlink(missing_ok=True)
+
+
+def load_process_result(path: str) -> Any:
+  """프로세스 Job 결과 파일 로드"""
+  with open(path, "rb") as f:
+    return pickle.load(f)
+
+
+def ensure_picklable(job_id: str, *objs: Any) -> None:
+  """프로세스 풀로 넘길 함수/인자가 pickle 가능한지 등록 시점에 확인"""
+  for obj in objs:
+    try:
+      pickle.dumps(obj)
+    except Exception as e:
+      raise ValueError(f"process executor Job 은 pickle 가능한 함수/인자만 허용합니다. id={job_id}, obj={obj!r}") from e
@@ -4,7 +4,7 @@ from typing import Any, Callable
 
 from apscheduler.triggers.cron import CronTrigger
 
-from infrastructure.scheduler.manager import JobSpec, manager
+from infrastructure.scheduler.manager import ExecutorType, JobSpec, manager
 
 log = logging.getLogger(__name__)
 
@@ -20,6 +20,8 @@ def scheduled_cron(
     day: int | str | None = None,
     day_of_week: int | str | None = None,
     month: int | str | None = None,
+    executor: ExecutorType | None = None,
+    profile: bool = False,
     **add_job_options: Any,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
   """
@@ -33,6 +35,13 @@ def scheduled_cron(
       id: 잡 식별자(고유 문자열)
       second, minute, hour, day, day_of_week, month:
           Cron 필드 값(정수 또는 문자열 표현 '*', '*/5' 등)
+      executor:
+          실행 방식. None 이면 async 함수는 "async", 동기 함수는 "thread"
+          CPU 위주 동기 함수는 "process" 로 지정 (모듈 최상위 함수, pickle 가능한 args/kwargs 만 허용,
+          반환값은 {analytics_dir}/job_results/{id}/ 아래 파일로 저장)
+      profile:
+          True 면 실행마다 CPU 샘플링/tracemalloc 프로파일을 {log_dir}/profiles 에 기록
+          (settings.profiling_enabled 일 때만 동작)
       **add_job_opts:
           APScheduler add_job 옵션 (replace_existing, max_instances, 등)
           예) replace_existing=True, max_instances=1, misfire_grace_time=600
@@ -40,6 +49,9 @@ def scheduled_cron(
       원본 함수를 그대로 반환(장식만 함).
   """
 
+  if executor is not None and executor not in ("async", "thread", "process"):
+    raise ValueError(f"알 수 없는 executor 입니다. id={id}, executor={executor}")
+
   def _decorator(func: Callable[..., Any]) -> Callable[..., Any]:
     trigger = CronTrigger(
         second=second, minute=minute, hour=hour,
@@ -47,7 +59,9 @@ def scheduled_cron(
         timezone=manager.timezone,  # 매니저의 타임존 사용
     )
     # 나중에 일괄 등록할 수 있도록 레지스트리에 스펙 추가
-    _REGISTRY.append(JobSpec(id=id, func=func, trigger=trigger, kwargs=add_job_options))
+    _REGISTRY.append(JobSpec(
+        id=id, func=func, trigger=trigger, kwargs=add_job_options, executor=executor, profile=profile,
+    ))
     return func
 
   return _decorator
@@ -70,6 +84,7 @@ def schedule_registered_jobs() -> None:
   데코레이터로 등록된 모든 잡(JobSpec)을 스케줄러에 실제로 add_job 한다.
   """
   for spec in _REGISTRY:
-    manager.get_schedule().add_job(manager._wrap(spec.func), trigger=spec.trigger,
-                                   id=spec.id, **spec.kwargs)
+    # pickle 검증은 모듈 import 가 끝난 뒤(함수가 모듈 속성으로 바인딩된 뒤) 여기서 수행됨
+    manager._add_job(spec.func, id=spec.id, trigger=spec.trigger, executor=spec.executor, profile=spec.profile,
+                     **spec.kwargs)
     log.info("Job 스케줄링 등록 id=%s", spec.id)
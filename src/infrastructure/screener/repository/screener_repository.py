@@ -0,0 +1,61 @@
+# src/infrastructure/screener/repository/screener_repository.py
+from datetime import date
+from typing import Optional
+
+import pandas as pd
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models import DailyPrice
+from infrastructure.snapshot.repository.snapshot_repository import (
+  PRICE_SECTION, TECHNICAL_SECTION, VALUATION_SECTION
+)
+
+SCREEN_TEXT_COLUMNS: list[str] = ["ticker", "stock_name", "market_code"]
+SCREEN_NUMERIC_COLUMNS: list[str] = [
+  *PRICE_SECTION.numeric_columns, *TECHNICAL_SECTION.numeric_columns, *VALUATION_SECTION.numeric_columns,
+]
+
+
+def _float_columns(alias: str, columns: tuple[str, ...]) -> str:
+  return ",\n       ".join(f"CAST({alias}.{c} AS float8) AS {c}" for c in columns)
+
+
+# 거래일 기준 전 종목 1행: 당일 일봉 + 당일 기술적 지표 + 기준일 이전 최신 투자지표 (LATERAL)
+# - daily_price/technical_indicator 는 trade_date 등호 조건 → 해당 월 파티션만 조회
+_SCREEN_SQL = f"""
+SELECT s.stock_id,
+       s.ticker,
+       s.stock_name,
+       CAST(m.market_code AS text) AS market_code,
+       {_float_columns("dp", PRICE_SECTION.numeric_columns)},
+       {_float_columns("ti", TECHNICAL_SECTION.numeric_columns)},
+       {_float_columns("ii", VALUATION_SECTION.numeric_columns)}
+FROM stock s
+JOIN market m ON m.market_id = s.market_id
+LEFT JOIN daily_price dp ON dp.stock_id = s.stock_id AND dp.trade_date = :trade_date
+LEFT JOIN technical_indicator ti ON ti.stock_id = s.stock_id AND ti.trade_date = :trade_date
+LEFT JOIN LATERAL (
+  SELECT *
+  FROM investment_indicator i
+  WHERE i.stock_id = s.stock_id AND i.report_date <= :trade_date
+  ORDER BY i.report_date DESC
+  LIMIT 1
+) ii ON true
+WHERE s.is_active
+ORDER BY s.stock_id
+"""
+
+
+async def load_screen_frame(session: AsyncSession, *, trade_date: date) -> pd.DataFrame:
+  """
+  스크리너 원본 조회 (거래일 1회)
+  → DataFrame[stock_id, ticker, stock_name, market_code, 일봉/기술적 지표/투자지표 숫자 컬럼(float)]
+  """
+  rows = (await session.execute(text(_SCREEN_SQL), { "trade_date": trade_date })).all()
+  return pd.DataFrame(rows, columns=["stock_id", *SCREEN_TEXT_COLUMNS, *SCREEN_NUMERIC_COLUMNS])
+
+
+async def find_latest_trade_date(session: AsyncSession) -> Optional[date]:
+  """daily_price 최신 거래일"""
+  return (await session.execute(select(func.max(DailyPrice.trade_date)))).scalar_one_or_none()
@@ -0,0 +1,218 @@
+# src/infrastructure/screener/service/screener_service.py
+"""
+횡단면 스크리너
+- 거래일별 전 종목 지표를 컬럼 배열(ScreenFrame)로 1회 적재 후 LRU 보관
+- 적재 시 컬럼별 백분위 순위(0~1)를 미리 계산 → pct_ 접두 컬럼으로 필터/정렬
+- 필터는 NumPy boolean mask 곱, 상위 N 은 argpartition 후 N 개만 정렬
+"""
+import asyncio
+import logging
+import operator
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from config.settings import settings
+from infrastructure.db.session import get_session
+from infrastructure.redis.shared_version import SharedVersion
+from infrastructure.screener.repository.screener_repository import (
+  SCREEN_NUMERIC_COLUMNS, SCREEN_TEXT_COLUMNS, find_latest_trade_date, load_screen_frame
+)
+from utils.numeric import percentile_ranks
+
+log = logging.getLogger(__name__)
+
+RANK_PREFIX = "pct_"
+
+_OPERATORS: dict[str, Callable[[np.ndarray, float], np.ndarray]] = {
+  "<=": operator.le, ">=": operator.ge, "!=": operator.ne, "<": operator.lt, ">": operator.gt, "=": operator.eq,
+}
+_CONDITION_PATTERN = re.compile(r"^\s*([a-z0-9_]+)\s*(<=|>=|!=|<|>|=)\s*(-?[0-9.]+(?:e-?[0-9]+)?)\s*$")
+
+
+@dataclass(frozen=True)
+class ScreenCondition:
+  """필터 조건 1개 (column op value)"""
+  column: str
+  op: str
+  value: float
+
+
+@dataclass(frozen=True)
+class ScreenFrame:
+  """거래일 전 종목 컬럼 배열 (같은 위치 = 같은 종목)"""
+  trade_date: date
+  stock_ids: np.ndarray
+  text: dict[str, np.ndarray]
+  numeric: dict[str, np.ndarray]
+  ranks: dict[str, np.ndarray]
+
+  def __len__(self) -> int:
+    return int(self.stock_ids.shape[0])
+
+  @classmethod
+  def from_frame(cls, trade_date: date, frame: pd.DataFrame) -> "ScreenFrame":
+    numeric = { c: frame[c].to_numpy(dtype=np.float64, na_value=np.nan) for c in SCREEN_NUMERIC_COLUMNS }
+    return cls(
+        trade_date=trade_date,
+        stock_ids=frame["stock_id"].to_numpy(dtype=np.int64),
+        text={ c: frame[c].to_numpy(dtype=object) for c in SCREEN_TEXT_COLUMNS },
+        numeric=numeric,
+        ranks={ c: percentile_ranks(v) for c, v in numeric.items() },
+    )
+
+  def column(self, name: str) -> np.ndarray:
+    """숫자 컬럼 또는 pct_ 백분위 컬럼"""
+    if name.startswith(RANK_PREFIX) and name[len(RANK_PREFIX):] in self.ranks:
+      return self.ranks[name[len(RANK_PREFIX):]]
+    if name in self.numeric:
+      return self.numeric[name]
+    raise ValueError(f"지원하지 않는 컬럼입니다: {name}")
+
+
+def parse_filters(expr: Optional[str]) -> list[ScreenCondition]:
+  """'rsi_14<30,pbr<1,pct_volume_ratio>=0.9' → 조건 목록"""
+  if not expr:
+    return []
+  conditions = []
+  for part in expr.split(","):
+    if not part.strip():
+      continue
+    match = _CONDITION_PATTERN.match(part)
+    if match is None:
+      raise ValueError(f"필터 형식이 올바르지 않습니다: {part!r} (예: rsi_14<30)")
+    column, op, value = match.groups()
+    conditions.append(ScreenCondition(column=column, op=op, value=float(value)))
+  return conditions
+
+
+def run_screen(
+    frame: ScreenFrame,
+    conditions: list[ScreenCondition],
+    *,
+    order_by: Optional[str] = None,
+    descending: bool = True,
+    limit: int = 50,
+    market: Optional[str] = None,
+) -> tuple[np.ndarray, int]:
+  """
+  조건을 모두 만족하는 종목 위치 (order_by 기준 상위 limit 개, 정렬됨)
+  - NaN 은 어떤 비교도 만족하지 않으므로 자동 제외
+  → (위치 배열, 조건 만족 종목 수)
+  """
+  mask = np.ones(len(frame), dtype=bool)
+  if market is not None:
+    mask &= frame.text["market_code"] == market
+  with np.errstate(invalid="ignore"):
+    for cond in conditions:
+      mask &= _OPERATORS[cond.op](frame.column(cond.column), cond.value)
+  matched = np.flatnonzero(mask)
+  total = int(matched.shape[0])
+  if order_by is None:
+    return matched[:limit], total
+
+  keys = frame.column(order_by)[matched]
+  keep = ~np.isnan(keys)
+  matched, keys = matched[keep], keys[keep]
+  if descending:
+    keys = -keys
+  if matched.shape[0] > limit:
+    top = np.argpartition(keys, limit - 1)[:limit]
+    matched, keys = matched[top], keys[top]
+  return matched[np.argsort(keys, kind="stable")], total
+
+
+class ScreenFrameCache:
+  """
+  거래일별 ScreenFrame LRU 캐시 (프로세스 단위 싱글톤)
+  - invalidate 시 Redis 버전(`screener:version`) 증가 → 다른 워커는 get() 에서 버전이 바뀌었으면 LRU 를 비움
+  """
+
+  def __init__(self, capacity: int) -> None:
+    self._capacity = max(capacity, 1)
+    self._frames: OrderedDict[date, ScreenFrame] = OrderedDict()
+    self._lock = asyncio.Lock()
+    self._version = SharedVersion("screener:version")
+
+  async def invalidate(self) -> None:
+    """지표/일봉 재적재 후 호출 (모든 워커가 다음 조회 때 다시 적재)"""
+    self._frames.clear()
+    await self._version.bump()
+
+  async def get(self, trade_date: date) -> ScreenFrame:
+    if await self._version.changed():
+      self._frames.clear()
+    frame = self._frames.get(trade_date)
+    if frame is not None:
+      self._frames.move_to_end(trade_date)
+      return frame
+    async with self._lock:
+      frame = self._frames.get(trade_date)
+      if frame is None:
+        async with get_session() as session:
+          raw = await load_screen_frame(session, trade_date=trade_date)
+        # 백분위 계산은 이벤트 루프 밖에서
+        frame = await asyncio.to_thread(ScreenFrame.from_frame, trade_date, raw)
+        self._frames[trade_date] = frame
+        while len(self._frames) > self._capacity:
+          self._frames.popitem(last=False)
+        log.info("[SCREENER] 스냅샷 적재 trade_date=%s, stocks=%s", trade_date, len(frame))
+      return frame
+
+
+screen_frame_cache = ScreenFrameCache(settings.screener_cache_size)
+
+
+async def screen(
+    *,
+    trade_date: Optional[date] = None,
+    filters: Optional[str] = None,
+    order_by: Optional[str] = None,
+    ascending: bool = False,
+    limit: int = 50,
+    market: Optional[str] = None,
+) -> dict[str, Any]:
+  """
+  스크리너 실행
+  - filters: 'rsi_14<30,pbr<1' (pct_ 접두 시 백분위 0~1 기준)
+  - order_by: 정렬 컬럼 (기본 내림차순, ascending=True 면 오름차순)
+  """
+  if trade_date is None:
+    async with get_session() as session:
+      trade_date = await find_latest_trade_date(session)
+    if trade_date is None:
+      return { "trade_date": None, "total": 0, "count": 0, "items": [] }
+
+  conditions = parse_filters(filters)
+  for name in [c.column for c in conditions] + ([order_by] if order_by else []):
+    if name.removeprefix(RANK_PREFIX) not in SCREEN_NUMERIC_COLUMNS:
+      raise ValueError(f"지원하지 않는 컬럼입니다: {name}")
+
+  frame = await screen_frame_cache.get(trade_date)
+  positions, total = run_screen(
+      frame, conditions, order_by=order_by, descending=not ascending, limit=limit, market=market
+  )
+
+  columns = list(dict.fromkeys(["close_price", "change_rate", *(c.column for c in conditions),
+                                *([order_by] if order_by else [])]))
+  values = { name: frame.column(name)[positions] for name in columns }
+  items = []
+  for i, pos in enumerate(positions.tolist()):
+    item: dict[str, Any] = { "stock_id": int(frame.stock_ids[pos]) }
+    for name in SCREEN_TEXT_COLUMNS:
+      item[name] = frame.text[name][pos]
+    for name in columns:
+      v = float(values[name][i])
+      item[name] = None if np.isnan(v) else v
+    items.append(item)
+  return {
+    "trade_date": trade_date.isoformat(),
+    "total": total,
+    "count": len(items),
+    "items": items,
+  }
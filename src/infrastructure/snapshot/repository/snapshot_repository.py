@@ -0,0 +1,121 @@
+# src/infrastructure/snapshot/repository/snapshot_repository.py
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import Column, Float, Integer, Numeric, Table, cast, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models import DailyPrice, InvestmentIndicator, Market, MLRecommendation, Stock, TechnicalIndicator
+
+_META_COLUMNS = ("stock_id", "created_at", "updated_at", "investment_id", "recommendation_id")
+
+
+def _numeric_columns(table: Table) -> tuple[str, ...]:
+  """숫자(DECIMAL/정수) 지표 컬럼명 (키/메타 컬럼 제외)"""
+  return tuple(
+      c.name for c in table.columns
+      if c.name not in _META_COLUMNS and isinstance(c.type, (Numeric, Integer))
+  )
+
+
+@dataclass(frozen=True)
+class SnapshotSection:
+  """스냅샷 구성 단위 (테이블별 종목당 최신 1행)"""
+  name: str
+  table: Table
+  date_column: str
+  numeric_columns: tuple[str, ...]
+  text_columns: tuple[str, ...] = ()
+  # 같은 날짜에 여러 행이 있을 때 우선순위 (DESC)
+  tie_breaker: Optional[str] = None
+
+
+PRICE_SECTION = SnapshotSection(
+    name="price",
+    table=DailyPrice.__table__,
+    date_column="trade_date",
+    numeric_columns=(
+      "open_price", "high_price", "low_price", "close_price", "volume", "trading_value",
+      "change_rate", "change_amount", "market_cap",
+    ),
+)
+TECHNICAL_SECTION = SnapshotSection(
+    name="technical",
+    table=TechnicalIndicator.__table__,
+    date_column="trade_date",
+    numeric_columns=_numeric_columns(TechnicalIndicator.__table__),
+)
+VALUATION_SECTION = SnapshotSection(
+    name="valuation",
+    table=InvestmentIndicator.__table__,
+    date_column="report_date",
+    numeric_columns=_numeric_columns(InvestmentIndicator.__table__),
+)
+RECOMMENDATION_SECTION = SnapshotSection(
+    name="recommendation",
+    table=MLRecommendation.__table__,
+    date_column="recommendation_date",
+    numeric_columns=("confidence_score", "expected_return", "risk_score"),
+    text_columns=("model_name", "model_version", "prediction_type"),
+    tie_breaker="confidence_score",
+)
+
+SNAPSHOT_SECTIONS: tuple[SnapshotSection, ...] = (
+  PRICE_SECTION, TECHNICAL_SECTION, VALUATION_SECTION, RECOMMENDATION_SECTION,
+)
+
+
+async def load_stock_meta(session: AsyncSession) -> dict[int, dict[str, Any]]:
+  """활성 종목 메타 (stock_id → ticker/stock_name/market_code)"""
+  query = (
+    select(Stock.stock_id, Stock.ticker, Stock.stock_name, Market.market_code)
+    .join(Market, Stock.market_id == Market.market_id)
+    .where(Stock.is_active.is_(True))
+  )
+  rows = (await session.execute(query)).all()
+  return {
+    sid: { "ticker": ticker, "stock_name": name, "market_code": getattr(market, "value", market) }
+    for sid, ticker, name, market in rows
+  }
+
+
+async def load_latest_rows(
+    session: AsyncSession,
+    section: SnapshotSection,
+    *,
+    stock_ids: Optional[Sequence[int]] = None,
+    since: Optional[date] = None,
+) -> dict[int, dict[str, Any]]:
+  """
+  종목별 최신 1행 일괄 조회 (SELECT DISTINCT ON (stock_id) ... ORDER BY stock_id, 날짜 DESC)
+  - since 지정 시 날짜 하한 조건으로 파티션 pruning (적재 직후 부분 갱신용)
+  - 숫자 컬럼은 float, 날짜는 ISO 문자열, Enum 은 value 로 변환
+  """
+  table = section.table
+  stock_col: Column = table.c.stock_id
+  date_col: Column = table.c[section.date_column]
+  query = select(
+      stock_col,
+      date_col,
+      *(cast(table.c[name], Float).label(name) for name in section.numeric_columns),
+      *(table.c[name] for name in section.text_columns),
+  ).distinct(stock_col)
+  if stock_ids is not None:
+    query = query.where(stock_col.in_(list(stock_ids)))
+  if since is not None:
+    query = query.where(date_col >= since)
+  order_by = [stock_col, date_col.desc()]
+  if section.tie_breaker is not None:
+    order_by.append(table.c[section.tie_breaker].desc())
+  query = query.order_by(*order_by)
+
+  result: dict[int, dict[str, Any]] = {}
+  for row in (await session.execute(query)).mappings():
+    record = { "date": row[section.date_column].isoformat() }
+    for name in section.numeric_columns:
+      record[name] = row[name]
+    for name in section.text_columns:
+      record[name] = getattr(row[name], "value", row[name])
+    result[row["stock_id"]] = record
+  return result
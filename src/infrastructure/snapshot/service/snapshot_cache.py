@@ -0,0 +1,179 @@
+# src/infrastructure/snapshot/service/snapshot_cache.py
+"""
+종목별 최신 스냅샷 캐시 (최신 일봉 / 기술적 지표 / 투자지표 / ML 추천)
+- Redis Hash `snapshot:{section}` (field=stock_id, value=JSON) 가 워커 간 공유 원본
+- 프로세스 내 dict 미러 → 조회 시 SQL/Redis 왕복 없음
+- 기동 시 DISTINCT ON (stock_id) 일괄 조회로 전체 재구성, 적재 직후 해당 종목만 부분 갱신
+- 갱신마다 `snapshot:version` 증가 → 다른 워커는 버전이 바뀌었을 때만 Redis 에서 다시 읽음
+"""
+import asyncio
+import json
+import logging
+import time
+from datetime import date
+from typing import Any, Iterable, Optional, Sequence
+
+from infrastructure.db.session import get_session
+from infrastructure.redis.redis_client import RedisClient
+from infrastructure.snapshot.repository.snapshot_repository import (
+  SNAPSHOT_SECTIONS, SnapshotSection, load_latest_rows, load_stock_meta
+)
+
+log = logging.getLogger(__name__)
+
+_META_KEY = "snapshot:meta"
+_VERSION_KEY = "snapshot:version"
+# 다른 워커 갱신 여부(버전) 확인 최소 간격(초)
+_SYNC_INTERVAL_SECONDS = 1.0
+_SECTIONS: dict[str, SnapshotSection] = { s.name: s for s in SNAPSHOT_SECTIONS }
+
+
+def _section_key(name: str) -> str:
+  return f"snapshot:{name}"
+
+
+class SnapshotCache:
+  """최신 스냅샷 캐시 (프로세스 단위 싱글톤)"""
+
+  def __init__(self) -> None:
+    self._redis = RedisClient()
+    self._meta: dict[int, dict[str, Any]] = {}
+    self._rows: dict[str, dict[int, dict[str, Any]]] = { name: {} for name in _SECTIONS }
+    self._ticker_index: dict[str, int] = {}
+    self._version = 0
+    self._checked_at = 0.0
+    self._lock = asyncio.Lock()
+
+  @property
+  def version(self) -> int:
+    return self._version
+
+  # ---------------------------------------------------------------- 쓰기
+
+  async def rebuild(self) -> int:
+    """DB 에서 전 종목 최신 행을 섹션별 1회씩 조회해 전체 재구성 (기동 시)"""
+    async with self._lock:
+      async with get_session() as session:
+        meta = await load_stock_meta(session)
+        rows = { name: await load_latest_rows(session, section) for name, section in _SECTIONS.items() }
+      self._replace(meta, rows)
+      await self._publish(meta=meta, rows=rows, replace=True)
+    log.info("[SNAPSHOT] 재구성 완료 stocks=%s, %s",
+             len(self._meta), { name: len(r) for name, r in self._rows.items() })
+    return len(self._meta)
+
+  async def refresh(
+      self,
+      stock_ids: Iterable[int],
+      *,
+      sections: Sequence[str],
+      since: Optional[date] = None,
+  ) -> int:
+    """
+    적재 직후 해당 종목/섹션만 DB 에서 다시 읽어 반영 (실패해도 적재 흐름은 막지 않음)
+    - since: 이번 적재의 최소 날짜 (그 이후만 조회 → 파티션 pruning)
+    """
+    ids = sorted(set(stock_ids))
+    if not ids:
+      return 0
+    try:
+      async with self._lock:
+        async with get_session() as session:
+          rows = {
+            name: await load_latest_rows(session, _SECTIONS[name], stock_ids=ids, since=since)
+            for name in sections
+          }
+        await self._sync_locked(force=True)
+        for name, updates in rows.items():
+          self._rows[name].update(updates)
+        await self._publish(meta=None, rows=rows, replace=False)
+      updated = sum(len(r) for r in rows.values())
+      log.debug("[SNAPSHOT] 부분 갱신 sections=%s, stocks=%s, rows=%s", list(sections), len(ids), updated)
+      return updated
+    except Exception:
+      log.exception("[SNAPSHOT] 부분 갱신 실패 sections=%s, stocks=%s", list(sections), len(ids))
+      return 0
+
+  async def _publish(
+      self,
+      *,
+      meta: Optional[dict[int, dict[str, Any]]],
+      rows: dict[str, dict[int, dict[str, Any]]],
+      replace: bool,
+  ) -> None:
+    hashes = {
+      _section_key(name): { str(sid): json.dumps(record, separators=(",", ":")) for sid, record in section.items() }
+      for name, section in rows.items()
+    }
+    if meta is not None:
+      hashes[_META_KEY] = {
+        str(sid): json.dumps(m, ensure_ascii=False, separators=(",", ":")) for sid, m in meta.items()
+      }
+    if await self._redis.set_hashes(hashes, replace=replace):
+      version = await self._redis.incr_value(_VERSION_KEY)
+      # 그 사이 다른 워커 갱신이 끼었으면 버전을 올리지 않아 다음 sync 에서 전체 재적재
+      if version is not None and (replace or version == self._version + 1):
+        self._version = version
+
+  # ---------------------------------------------------------------- 읽기
+
+  async def sync(self) -> None:
+    """다른 워커의 갱신 반영 (버전 비교, 최소 간격 내 재호출은 no-op)"""
+    if time.monotonic() - self._checked_at < _SYNC_INTERVAL_SECONDS:
+      return
+    async with self._lock:
+      await self._sync_locked(force=False)
+
+  async def _sync_locked(self, *, force: bool) -> None:
+    if not force and time.monotonic() - self._checked_at < _SYNC_INTERVAL_SECONDS:
+      return
+    self._checked_at = time.monotonic()
+    raw = await self._redis.get_value(_VERSION_KEY)
+    if raw is None or int(raw) == self._version:
+      return
+    keys = [_META_KEY, *(_section_key(name) for name in _SECTIONS)]
+    hashes = await self._redis.get_hashes(keys)
+    if not hashes:
+      return
+    meta = { int(sid): json.loads(v) for sid, v in hashes.get(_META_KEY, {}).items() }
+    rows = {
+      name: { int(sid): json.loads(v) for sid, v in hashes.get(_section_key(name), {}).items() }
+      for name in _SECTIONS
+    }
+    self._replace(meta, rows)
+    self._version = int(raw)
+    log.debug("[SNAPSHOT] Redis 동기화 version=%s, stocks=%s", self._version, len(self._meta))
+
+  def _replace(self, meta: dict[int, dict[str, Any]], rows: dict[str, dict[int, dict[str, Any]]]) -> None:
+    self._meta = meta
+    self._rows = { name: rows.get(name, {}) for name in _SECTIONS }
+    self._ticker_index = { m["ticker"]: sid for sid, m in meta.items() }
+
+  def stock_ids(self) -> list[int]:
+    """스냅샷 대상(활성) 종목 id 목록"""
+    return sorted(self._meta)
+
+  def stock_id_of(self, ticker: str) -> Optional[int]:
+    return self._ticker_index.get(ticker)
+
+  def get(self, stock_id: int) -> Optional[dict[str, Any]]:
+    """종목 스냅샷 (O(1)), 활성 종목이 아니면 None"""
+    meta = self._meta.get(stock_id)
+    if meta is None:
+      return None
+    snapshot: dict[str, Any] = { "stock_id": stock_id, **meta }
+    for name, section in self._rows.items():
+      snapshot[name] = section.get(stock_id)
+    return snapshot
+
+  def get_by_ticker(self, ticker: str) -> Optional[dict[str, Any]]:
+    stock_id = self._ticker_index.get(ticker)
+    return self.get(stock_id) if stock_id is not None else None
+
+  def all(self) -> list[dict[str, Any]]:
+    """전 종목 스냅샷 (stock_id 오름차순)"""
+    return [self.get(sid) for sid in sorted(self._meta)]
+
+
+# 외부에서 바로 import 가능하도록 싱글톤 인스턴스 노출
+snapshot_cache = SnapshotCache()
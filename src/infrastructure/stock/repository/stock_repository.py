@@ -1,7 +1,7 @@
 # src/infrastructure/stock/repository/stock_repository.py
 from typing import Iterable
 
-from sqlalchemy import select, func
+from sqlalchemy import case, select, func
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -24,7 +24,10 @@ async def save_stocks(
     market_id: int,
     seeds: Iterable[StockSeed],
 ) -> int:
-  """StockSeed 저장 (stock 테이블)"""
+  """
+  StockSeed 저장 (stock 테이블)
+  - listing_shares 가 None 이면 기존 값 유지, updated_at 은 상장주식수가 바뀐 경우에만 갱신
+  """
   payload = []
   for seed in seeds:
     payload.append(
@@ -49,17 +52,24 @@ async def save_stocks(
 
   stmt = pg_insert(Stock).values(payload)
 
+  # 상장주식수 미제공(시드 등)이면 기존 값 유지
+  listing_shares = func.coalesce(stmt.excluded.listing_shares, Stock.listing_shares)
   update_cols = {
     # PK/created_at 제외하고 갱신
     "stock_name": stmt.excluded.stock_name,
     "listing_date": stmt.excluded.listing_date,
-    "listing_shares": stmt.excluded.listing_shares,
+    "listing_shares": listing_shares,
     "face_value": stmt.excluded.face_value,
     "is_active": stmt.excluded.is_active,
     "delisting_date": stmt.excluded.delisting_date,
     "description": stmt.excluded.description,
     "website": stmt.excluded.website,
-    "updated_at": func.now(),  # ✅ 항상 갱신
+    # updated_at = 상장주식수 적재 시점 (enrich_daily_prices 가 시가총액 기준일로 사용)
+    # → 상장주식수가 실제로 바뀐 경우에만 갱신 (재기동 시 시드 UPSERT 로 기준일이 밀리지 않도록)
+    "updated_at": case(
+        (listing_shares.is_distinct_from(Stock.listing_shares), func.now()),
+        else_=Stock.updated_at,
+    ),
   }
 
   stmt = stmt.on_conflict_do_update(
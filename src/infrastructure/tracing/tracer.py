@@ -0,0 +1,277 @@
+# src/infrastructure/tracing/tracer.py
+"""
+경량 span 트레이싱 (OpenTelemetry 데이터 모델 호환, 외부 의존성 없음)
+- span(name, **attributes): ContextVar 로 부모/자식 연결 (asyncio 태스크/to_thread 로 자동 전파)
+- 종료된 span 은 버퍼에 모았다가 백그라운드 스레드가 {log_dir}/traces/traces-YYYYMMDD.jsonl 에 기록
+  한 줄 = OTLP/JSON ExportTraceServiceRequest (OpenTelemetry Collector otlpjsonfile 리시버로 바로 적재 가능)
+  최근 tracing_keep_days 일 파일만 보관 (날짜가 바뀌어 새 파일을 열 때 오래된 파일 삭제)
+- StageBreakdown: 수집 작업 안에서 끝난 span 을 이름별 횟수/누적/최대 시간으로 집계
+  (span 시간은 자식 포함이므로 단계 합계가 전체 시간보다 클 수 있음)
+settings.tracing_enabled 가 false 면 span() 은 공유 no-op span 을 돌려줌
+"""
+import atexit
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional
+
+import orjson
+
+from config.settings import settings
+
+log = logging.getLogger(__name__)
+
+_SERVICE_NAME = os.getenv("APP_NAME", "stock-ml-platform")
+_SCOPE_NAME = "stock-ml-platform.tracing"
+
+# OTLP span status code
+_STATUS_OK = 1
+_STATUS_ERROR = 2
+
+
+class Span:
+  """진행 중/종료된 span (OTLP span 필드와 1:1 대응)"""
+  __slots__ = ("trace_id", "span_id", "parent_span_id", "name", "start_ns", "end_ns", "attributes", "error")
+
+  def __init__(self, name: str, parent: Optional["Span"], attributes: Dict[str, Any]) -> None:
+    self.trace_id = parent.trace_id if parent is not None else f"{random.getrandbits(128):032x}"
+    self.span_id = f"{random.getrandbits(64):016x}"
+    self.parent_span_id = parent.span_id if parent is not None else None
+    self.name = name
+    self.start_ns = time.time_ns()
+    self.end_ns = 0
+    self.attributes = attributes
+    self.error: Optional[str] = None
+
+  @property
+  def seconds(self) -> float:
+    return (self.end_ns - self.start_ns) / 1e9
+
+  def set_attribute(self, key: str, value: Any) -> None:
+    if value is not None:
+      self.attributes[key] = value
+
+  def to_otlp(self) -> Dict[str, Any]:
+    out: Dict[str, Any] = {
+      "traceId": self.trace_id,
+      "spanId": self.span_id,
+      "name": self.name,
+      "kind": 1,  # SPAN_KIND_INTERNAL
+      "startTimeUnixNano": str(self.start_ns),
+      "endTimeUnixNano": str(self.end_ns),
+      "attributes": [{ "key": k, "value": _otlp_value(v) } for k, v in self.attributes.items()],
+      "status": { "code": _STATUS_ERROR, "message": self.error } if self.error else { "code": _STATUS_OK },
+    }
+    if self.parent_span_id:
+      out["parentSpanId"] = self.parent_span_id
+    return out
+
+
+class _NoopSpan:
+  """트레이싱 비활성화 시 공유 span (기록 없음)"""
+  __slots__ = ()
+  trace_id = None
+  span_id = None
+
+  def set_attribute(self, key: str, value: Any) -> None:
+    pass
+
+
+_NOOP = _NoopSpan()
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+  if isinstance(value, bool):
+    return { "boolValue": value }
+  if isinstance(value, int):
+    return { "intValue": str(value) }
+  if isinstance(value, float):
+    return { "doubleValue": value }
+  return { "stringValue": str(value) }
+
+
+class StageBreakdown:
+  """span 이름별 횟수/누적/최대 시간 (수집 작업 1회 단위)"""
+
+  def __init__(self) -> None:
+    self._lock = threading.Lock()
+    # name → [count, total_seconds, max_seconds]
+    self._stages: Dict[str, List[float]] = {}
+
+  def add(self, name: str, seconds: float) -> None:
+    with self._lock:
+      stage = self._stages.get(name)
+      if stage is None:
+        self._stages[name] = [1, seconds, seconds]
+      else:
+        stage[0] += 1
+        stage[1] += seconds
+        stage[2] = max(stage[2], seconds)
+
+  def summary(self, total_seconds: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+    """{ name: { count, seconds, avg_ms, max_ms, share } } (누적 시간 내림차순, share 는 전체 실행 시간 대비)"""
+    out: Dict[str, Dict[str, Any]] = {}
+    for name, (count, total, peak) in sorted(self._stages.items(), key=lambda kv: kv[1][1], reverse=True):
+      out[name] = {
+        "count": int(count),
+        "seconds": round(total, 4),
+        "avg_ms": round(total / count * 1000, 3),
+        "max_ms": round(peak * 1000, 3),
+        "share": round(total / total_seconds, 4) if total_seconds else None,
+      }
+    return out
+
+
+class JsonlSpanExporter:
+  """
+  종료 span 버퍼 → 일자별 JSONL 파일
+  - batch_size 도달/flush 시 배치를 큐에 넘기고 파일 쓰기는 전용 데몬 스레드가 처리 (이벤트 루프 블로킹 없음)
+  - flush(wait=True) 는 큐에 넘긴 배치가 모두 기록될 때까지 대기 (종료 시)
+  """
+
+  def __init__(self, *, batch_size: int = 512) -> None:
+    self._batch_size = batch_size
+    self._buffer: List[Span] = []
+    self._lock = threading.Lock()
+    self._queue: "queue.Queue[List[Span]]" = queue.Queue()
+    self._thread: Optional[threading.Thread] = None
+    self._day: Optional[str] = None
+
+  def export(self, span: Span) -> None:
+    with self._lock:
+      self._buffer.append(span)
+      if len(self._buffer) < self._batch_size:
+        return
+      batch, self._buffer = self._buffer, []
+    self._submit(batch)
+
+  def flush(self, *, wait: bool = False) -> int:
+    with self._lock:
+      batch, self._buffer = self._buffer, []
+    if batch:
+      self._submit(batch)
+    if wait and self._thread is not None:
+      self._queue.join()
+    return len(batch)
+
+  def _submit(self, batch: List[Span]) -> None:
+    with self._lock:
+      if self._thread is None or not self._thread.is_alive():
+        self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+        self._thread.start()
+    self._queue.put(batch)
+
+  def _run(self) -> None:
+    while True:
+      batch = self._queue.get()
+      try:
+        self._write(batch)
+      except Exception:
+        log.exception("[TRACE] span 기록 실패 (%s 건 유실)", len(batch))
+      finally:
+        self._queue.task_done()
+
+  def _write(self, batch: List[Span]) -> None:
+    request = {
+      "resourceSpans": [{
+        "resource": { "attributes": [
+          { "key": "service.name", "value": { "stringValue": _SERVICE_NAME } },
+          { "key": "process.pid", "value": { "intValue": str(os.getpid()) } },
+        ] },
+        "scopeSpans": [{ "scope": { "name": _SCOPE_NAME }, "spans": [s.to_otlp() for s in batch] }],
+      }],
+    }
+    directory = os.path.join(settings.log_dir, "traces")
+    today = datetime.now()
+    day = today.strftime("%Y%m%d")
+    try:
+      os.makedirs(directory, exist_ok=True)
+      with open(os.path.join(directory, f"traces-{day}.jsonl"), "ab") as fh:
+        fh.write(orjson.dumps(request) + b"\n")
+    except OSError:
+      log.exception("[TRACE] span 기록 실패 (%s 건 유실)", len(batch))
+    if day != self._day:
+      self._day = day
+      _prune(directory, today, settings.tracing_keep_days)
+
+
+def _prune(directory: str, today: datetime, keep_days: int) -> None:
+  """traces-YYYYMMDD.jsonl 중 최근 keep_days 일(오늘 포함) 이전 파일 삭제 (0 이하면 보관 제한 없음)"""
+  if keep_days <= 0:
+    return
+  oldest = f"traces-{(today - timedelta(days=keep_days - 1)).strftime('%Y%m%d')}.jsonl"
+  try:
+    names = os.listdir(directory)
+  except FileNotFoundError:
+    return
+  for name in names:
+    if name.startswith("traces-") and name.endswith(".jsonl") and name < oldest:
+      try:
+        os.remove(os.path.join(directory, name))
+      except OSError:
+        log.warning("[TRACE] 오래된 trace 파일 삭제 실패: %s", name)
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("trace_span", default=None)
+_current_breakdown: ContextVar[Optional[StageBreakdown]] = ContextVar("trace_breakdown", default=None)
+_exporter = JsonlSpanExporter()
+# 워커 프로세스(프로세스 풀) 종료 시 남은 span 기록 (데몬 스레드이므로 기록 완료까지 대기)
+atexit.register(_exporter.flush, wait=True)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Any]:
+  """
+  span 컨텍스트 (예외 발생 시 ERROR 상태로 기록 후 그대로 전파)
+  사용 예:
+      with span("kis.request", tr_id=tr_id, ticker=ticker) as s:
+        response = await client.request(...)
+        s.set_attribute("response.bytes", len(response.content))
+  """
+  if not settings.tracing_enabled:
+    yield _NOOP
+    return
+
+  current = Span(name, _current_span.get(), { k: v for k, v in attributes.items() if v is not None })
+  token = _current_span.set(current)
+  try:
+    yield current
+  except BaseException as e:
+    current.error = f"{type(e).__name__}: {e}"[:200]
+    raise
+  finally:
+    current.end_ns = time.time_ns()
+    _current_span.reset(token)
+    breakdown = _current_breakdown.get()
+    if breakdown is not None:
+      breakdown.add(name, current.seconds)
+    _exporter.export(current)
+
+
+def current_span() -> Optional[Span]:
+  """현재 활성 span (없으면 None)"""
+  return _current_span.get()
+
+
+@contextmanager
+def record_breakdown(breakdown: StageBreakdown) -> Iterator[StageBreakdown]:
+  """컨텍스트 안에서 종료되는 span 을 breakdown 에 집계"""
+  token = _current_breakdown.set(breakdown)
+  try:
+    yield breakdown
+  finally:
+    _current_breakdown.reset(token)
+
+
+def flush_spans(*, wait: bool = False) -> int:
+  """
+  버퍼에 남은 span 기록 요청 (수집 작업 종료/애플리케이션 종료 시)
+  - wait=True 면 백그라운드 스레드가 파일에 다 쓸 때까지 대기 (애플리케이션 종료 시)
+  """
+  return _exporter.flush(wait=wait)
@@ -0,0 +1,43 @@
+# src/job/backtest_scheduler.py
+"""
+주간 백테스트 파라미터 스윕 (보유기간 x 최소 신뢰도 x 손절 비율)
+- CPU 위주 평가이므로 process executor 로 실행 (API 이벤트 루프와 GIL 경쟁 없음)
+- 결과(변형별 성과 목록)는 {analytics_dir}/job_results/backtest.sweep/ 아래 파일로 저장
+"""
+import asyncio
+import logging
+from typing import Any
+
+from infrastructure.scheduler.registry import scheduled_cron
+from ml.backtest.engine import DEFAULT_HORIZONS
+from ml.backtest.service import run_backtest_sweep
+from ml.backtest.sweep import variant_grid
+
+log = logging.getLogger(__name__)
+
+_MIN_CONFIDENCES = (0.0, 0.6, 0.8)
+_STOP_LOSSES = (0.0, 0.05, 0.1)
+
+
+@scheduled_cron(
+    id="backtest.sweep",
+    hour=7, minute=0, second=0,  # 매주 토요일 07:00:00
+    day_of_week="sat",
+    executor="process",
+    replace_existing=True,
+    max_instances=1,
+    misfire_grace_time=3600
+)
+def run_backtest_sweep_job() -> list[dict[str, Any]]:
+  """
+  전체 추천 이력 파라미터 스윕 (스케줄러 워커 프로세스에서 실행)
+  이미 API 프로세스 밖이므로 평가는 같은 프로세스에서 수행 (workers=1)
+  """
+  variants = variant_grid(horizons=DEFAULT_HORIZONS, min_confidences=_MIN_CONFIDENCES, stop_losses=_STOP_LOSSES)
+  try:
+    rows = asyncio.run(run_backtest_sweep(variants, workers=1))
+    log.info("[BACKTEST] 파라미터 스윕 스케줄러 실행 (variants=%s, rows=%s)", len(variants), len(rows))
+    return rows
+  except Exception:
+    log.exception("[BACKTEST] 파라미터 스윕 실패")
+    return []
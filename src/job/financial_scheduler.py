@@ -0,0 +1,26 @@
+# src/job/financial_scheduler.py
+import logging
+
+from infrastructure.financial.service.financial_statement_loader import load_financial_statements
+from infrastructure.scheduler.registry import scheduled_cron
+
+log = logging.getLogger(__name__)
+
+
+@scheduled_cron(
+    id="financial_statement.load",
+    hour=6, minute=0, second=0,  # 매일 06:00:00
+    replace_existing=True,
+    max_instances=1,
+    misfire_grace_time=3600
+)
+async def load_financial_statements_job() -> None:
+  """
+  {storage_root}/filings 에 새로 들어온 공시 일괄 파일 적재
+  이미 적재한 파일은 manifest 기준으로 skip
+  """
+  try:
+    upserted = await load_financial_statements()
+    log.info("[FINANCIAL] 재무제표 적재 스케줄러 실행 (upserted=%s)", upserted)
+  except Exception:
+    log.exception("[FINANCIAL] 재무제표 적재 실패")
@@ -1,7 +1,10 @@
 # src/job/kis_scheduler.py
 import logging
+from datetime import datetime
 
+from infrastructure.collection.service.collection_tracker import track_collection
 from infrastructure.kis.service.token_service import KISTokenService
+from infrastructure.scheduler.manager import manager
 from infrastructure.scheduler.registry import scheduled_cron
 
 log = logging.getLogger(__name__)
@@ -21,7 +24,10 @@ async def refresh_kis_token_job() -> None:
   """
   kis_token_service = KISTokenService()
   try:
-    await kis_token_service.issue_and_save_token()
+    async with track_collection("kis_token", source_api="oauth2/tokenP",
+                                collection_date=datetime.now(manager.timezone).date()) as run:
+      await kis_token_service.issue_and_save_token()
+      run.add_records(1)
     ttl = await kis_token_service.get_ttl()
     log.info("[KIS] 토큰 재발급 스케줄러 실행 (ttl=%s)", ttl)
   except Exception as e:
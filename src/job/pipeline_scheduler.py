@@ -0,0 +1,104 @@
+# src/job/pipeline_scheduler.py
+"""
+장 마감 후 데이터 파이프라인 스테이지 정의 + 스케줄
+    daily_price ──> investment_indicator
+               ├──> backtest
+               └──> risk (수익률 공분산/상관 + risk_score)
+    daily_index_price (독립, daily_price 와 동시 실행)
+기술지표/피처/추론 스테이지는 해당 모듈이 추가되면 depends_on 으로 연결
+"""
+import logging
+from datetime import datetime, timedelta
+
+from core.models import MarketType
+from infrastructure.financial.service.investment_indicator_service import calculate_investment_indicators
+from infrastructure.index.service.index_service import save_daily_index_prices
+from infrastructure.price.service.price_service import collect_daily_prices
+from infrastructure.scheduler.manager import manager
+from infrastructure.scheduler.pipeline import StageContext, StageResult, pipeline_stage, run_pipeline
+from infrastructure.scheduler.registry import scheduled_cron
+from ml.backtest.service import run_recommendation_backtest
+from ml.risk.service import run_risk_update
+
+log = logging.getLogger(__name__)
+
+_PRICE_MARKETS = [MarketType.KOSPI, MarketType.KOSDAQ]
+_INDEX_LOOKBACK_DAYS = 7
+
+
+@pipeline_stage("daily_price")
+async def daily_price_stage(ctx: StageContext) -> StageResult:
+  """거래일 종목 일봉 적재 (KIS 조회 실패 종목은 부분 재실행 대상)"""
+  result = await collect_daily_prices(
+      market_codes=_PRICE_MARKETS, start=ctx.trade_date, end=ctx.trade_date, stock_ids=ctx.stock_ids
+  )
+  return StageResult(records=result.upserted, failed_stock_ids=result.failed_stock_ids)
+
+
+@pipeline_stage("daily_index_price")
+async def daily_index_price_stage(ctx: StageContext) -> StageResult:
+  """KOSPI/KOSDAQ/KOSPI200 일봉 적재 (최근 7일 구간을 다시 받아 누락/정정분까지 UPSERT)"""
+  upserted = await save_daily_index_prices(
+      start=ctx.trade_date - timedelta(days=_INDEX_LOOKBACK_DAYS), end=ctx.trade_date
+  )
+  return StageResult(records=upserted)
+
+
+@pipeline_stage("investment_indicator", depends_on=("daily_price",))
+async def investment_indicator_stage(ctx: StageContext) -> StageResult:
+  """거래일 투자지표 계산 (일봉 적재 완료 후, 재실행 시 영향받은 종목만)"""
+  upserted = await calculate_investment_indicators(
+      start=ctx.trade_date, end=ctx.trade_date, stock_ids=ctx.stock_ids
+  )
+  return StageResult(records=upserted)
+
+
+@pipeline_stage("backtest", depends_on=("daily_price",))
+async def backtest_stage(ctx: StageContext) -> StageResult:
+  """추천 이력 전체 백테스트 후 backtest_accuracy / sharpe_ratio 갱신 (새 종가로 결과가 확정된 추천 반영)"""
+  result = await run_recommendation_backtest()
+  return StageResult(records=result.get("updated", 0), outputs={ "recommendations": result["recommendations"] })
+
+
+@pipeline_stage("risk", depends_on=("daily_price",))
+async def risk_stage(ctx: StageContext) -> StageResult:
+  """거래일 수익률 공분산/상관 행렬 증분 갱신 후 당일 추천 risk_score 기록"""
+  result = await run_risk_update(ctx.trade_date)
+  return StageResult(records=result["updated"], outputs={ "stocks": result["stocks"] })
+
+
+@scheduled_cron(
+    id="pipeline.daily",
+    hour=16, minute=10, second=0,  # 평일 16:10:00 (장 마감 후)
+    day_of_week="mon-fri",
+    profile=True,  # settings.profiling_enabled 일 때 실행마다 프로파일 기록
+    replace_existing=True,
+    max_instances=1,
+    misfire_grace_time=1800
+)
+async def run_daily_pipeline_job() -> None:
+  """평일 장 마감 후 데이터 파이프라인 전체 실행"""
+  today = datetime.now(manager.timezone).date()
+  try:
+    records = await run_pipeline(today)
+    log.info("[PIPELINE] 일일 파이프라인 스케줄러 실행 (status=%s)", { k: v.status for k, v in records.items() })
+  except Exception:
+    log.exception("[PIPELINE] 일일 파이프라인 실행 실패")
+
+
+@scheduled_cron(
+    id="pipeline.daily.rerun",
+    hour=18, minute=30, second=0,  # 평일 18:30:00
+    day_of_week="mon-fri",
+    replace_existing=True,
+    max_instances=1,
+    misfire_grace_time=1800
+)
+async def rerun_daily_pipeline_job() -> None:
+  """실패/부분실패 스테이지만 영향받은 종목으로 재실행 (모두 성공이면 no-op)"""
+  today = datetime.now(manager.timezone).date()
+  try:
+    records = await run_pipeline(today, rerun=True)
+    log.info("[PIPELINE] 일일 파이프라인 재실행 (status=%s)", { k: v.status for k, v in records.items() })
+  except Exception:
+    log.exception("[PIPELINE] 일일 파이프라인 재실행 실패")
@@ -0,0 +1,228 @@
+# src/ml/backtest/engine.py
+"""
+벡터화 백테스트 엔진
+- 추천 R 건 x 보유기간 K 개를 [R, K] 배열 연산 한 번으로 평가 (건별 Python 루프 없음)
+- 보유 경로는 [R, H+1] 행렬로 gather 한 뒤 누적 max/min 으로 낙폭 계산
+- 그룹(모델/종목/보유기간) 집계는 np.bincount 로 처리
+"""
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ml.backtest.panel import BacktestPanel
+
+TRADING_DAYS = 252
+# HOLD 추천 적중 판정: 보유기간 수익률 절대값이 band 미만
+HOLD_BAND = 0.02
+DEFAULT_HORIZONS: tuple[int, ...] = (1, 5, 20, 60)
+
+
+@dataclass(frozen=True)
+class BacktestResult:
+  """
+  추천별 백테스트 결과 ([R, K], 미실현 구간은 NaN)
+    horizons: 보유기간(거래일)
+    forward_returns: 종목 수익률 (방향 미반영)
+    strategy_returns: 포지션 수익률 (매수 +, 매도 -, HOLD 0)
+    hits: 적중 여부 (1.0/0.0)
+    max_drawdowns: 보유기간 중 최대 낙폭 (음수)
+  """
+  horizons: np.ndarray
+  forward_returns: np.ndarray
+  strategy_returns: np.ndarray
+  hits: np.ndarray
+  max_drawdowns: np.ndarray
+
+
+def _ffill_rows(matrix: np.ndarray) -> np.ndarray:
+  """행 방향 forward-fill (거래정지일 NaN 을 직전 종가로)"""
+  cols = np.arange(matrix.shape[1])
+  idx = np.where(np.isnan(matrix), 0, cols)
+  np.maximum.accumulate(idx, axis=1, out=idx)
+  return matrix[np.arange(matrix.shape[0])[:, None], idx]
+
+
+def equity_paths(panel: BacktestPanel, max_horizon: int) -> np.ndarray:
+  """
+  추천별 진입일 기준 포지션 가치 경로 [R, max_horizon + 1] (진입 시 1.0, 패널 밖은 NaN)
+  HOLD 는 매수 포지션 경로로 계산 (낙폭 참고용)
+  """
+  n_dates = panel.closes.shape[0]
+  rows = panel.rec_date_idx[:, None] + np.arange(max_horizon + 1)
+  in_range = rows < n_dates
+  path = panel.closes[np.minimum(rows, n_dates - 1), panel.rec_stock_idx[:, None]]
+  path = _ffill_rows(path)
+  path[~in_range] = np.nan
+  with np.errstate(invalid="ignore", divide="ignore"):
+    relative = path / path[:, :1] - 1.0
+  sign = np.where(panel.direction == 0, 1, panel.direction).astype(np.float64)
+  equity: np.ndarray = 1.0 + sign[:, None] * relative
+  return equity
+
+
+def max_drawdown_paths(equity: np.ndarray) -> np.ndarray:
+  """경로별 누적 최대 낙폭 [R, H+1] (열 h = 진입~h 일까지의 MDD)"""
+  running_max = np.fmax.accumulate(equity, axis=1)
+  with np.errstate(invalid="ignore", divide="ignore"):
+    drawdown = equity / running_max - 1.0
+  drawdown = np.where(np.isnan(equity), np.nan, drawdown)
+  return np.fmin.accumulate(drawdown, axis=1)
+
+
+def run_backtest(panel: BacktestPanel, horizons: Sequence[int] = DEFAULT_HORIZONS) -> BacktestResult:
+  """전체 추천 x 보유기간 백테스트 (단일 벡터 연산)"""
+  horizon_arr = np.asarray(sorted(set(int(h) for h in horizons)), dtype=np.int64)
+  equity = equity_paths(panel, int(horizon_arr.max()))
+  drawdowns = max_drawdown_paths(equity)
+
+  sign = np.where(panel.direction == 0, 1, panel.direction).astype(np.float64)
+  position_returns = equity[:, horizon_arr] - 1.0
+  forward_returns = position_returns * sign[:, None]
+  is_hold = (panel.direction == 0)[:, None]
+  strategy_returns = np.where(is_hold, 0.0, position_returns)
+  strategy_returns = np.where(np.isnan(position_returns), np.nan, strategy_returns)
+
+  hits = np.where(is_hold, np.abs(forward_returns) < HOLD_BAND, position_returns > 0).astype(np.float64)
+  hits[np.isnan(position_returns)] = np.nan
+
+  return BacktestResult(
+      horizons=horizon_arr,
+      forward_returns=forward_returns,
+      strategy_returns=strategy_returns,
+      hits=hits,
+      max_drawdowns=drawdowns[:, horizon_arr],
+  )
+
+
+def _grouped(keys: np.ndarray, values: np.ndarray, n_groups: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+  """[R, K] 값을 그룹 키별로 (count, sum, sumsq) 집계 → 각각 [n_groups, K]"""
+  n_horizons = values.shape[1]
+  flat_keys = (keys[:, None] * n_horizons + np.arange(n_horizons)).ravel()
+  flat_values = values.ravel()
+  valid = ~np.isnan(flat_values)
+  size = n_groups * n_horizons
+  count = np.bincount(flat_keys[valid], minlength=size)
+  total = np.bincount(flat_keys[valid], weights=flat_values[valid], minlength=size)
+  total_sq = np.bincount(flat_keys[valid], weights=flat_values[valid] ** 2, minlength=size)
+  shape = (n_groups, n_horizons)
+  return count.reshape(shape), total.reshape(shape), total_sq.reshape(shape)
+
+
+def _sharpe(count: np.ndarray, total: np.ndarray, total_sq: np.ndarray, horizons: np.ndarray) -> np.ndarray:
+  """건별 수익률 기준 연환산 샤프 비율 (표본 표준편차, 2건 미만 NaN)"""
+  with np.errstate(invalid="ignore", divide="ignore"):
+    mean = total / count
+    var = (total_sq - count * mean ** 2) / (count - 1)
+    std = np.sqrt(np.where(var > 0, var, np.nan))
+    sharpe = mean / std * np.sqrt(TRADING_DAYS / horizons)
+  return np.where(count >= 2, sharpe, np.nan)
+
+
+def summarize(panel: BacktestPanel, result: BacktestResult, *, by_stock: bool = False) -> pd.DataFrame:
+  """
+  모델(또는 모델 x 종목) x 보유기간 성과 요약
+  → DataFrame[model_name, (stock_id), horizon, trades, hit_rate, mean_return, sharpe_ratio,
+              mean_max_drawdown, worst_drawdown]
+  """
+  n_stocks = panel.stock_ids.shape[0]
+  if by_stock:
+    keys = panel.rec_model_idx * n_stocks + panel.rec_stock_idx
+    n_groups = panel.model_names.shape[0] * n_stocks
+  else:
+    keys = panel.rec_model_idx
+    n_groups = panel.model_names.shape[0]
+
+  hit_n, hit_sum, _ = _grouped(keys, result.hits, n_groups)
+  active = np.where(panel.direction[:, None] == 0, np.nan, result.strategy_returns)
+  ret_n, ret_sum, ret_sq = _grouped(keys, active, n_groups)
+  dd_n, dd_sum, _ = _grouped(keys, result.max_drawdowns, n_groups)
+
+  worst = np.full(n_groups * result.horizons.shape[0], np.inf)
+  flat_keys = (keys[:, None] * result.horizons.shape[0] + np.arange(result.horizons.shape[0])).ravel()
+  flat_dd = result.max_drawdowns.ravel()
+  valid = ~np.isnan(flat_dd)
+  np.minimum.at(worst, flat_keys[valid], flat_dd[valid])
+  worst = np.where(np.isinf(worst), np.nan, worst).reshape(n_groups, -1)
+
+  with np.errstate(invalid="ignore", divide="ignore"):
+    frame = {
+      "trades": hit_n,
+      "hit_rate": hit_sum / hit_n,
+      "mean_return": ret_sum / ret_n,
+      "sharpe_ratio": _sharpe(ret_n, ret_sum, ret_sq, result.horizons),
+      "mean_max_drawdown": dd_sum / dd_n,
+      "worst_drawdown": worst,
+    }
+  group_idx, horizon_idx = np.nonzero(hit_n > 0)
+  out = pd.DataFrame({ k: v[group_idx, horizon_idx] for k, v in frame.items() })
+  out.insert(0, "horizon", result.horizons[horizon_idx])
+  if by_stock:
+    out.insert(0, "stock_id", panel.stock_ids[group_idx % n_stocks])
+    out.insert(0, "model_name", panel.model_names[group_idx // n_stocks])
+  else:
+    out.insert(0, "model_name", panel.model_names[group_idx])
+  return out
+
+
+def point_in_time_metrics(
+    panel: BacktestPanel,
+    result: BacktestResult,
+    *,
+    horizon: int,
+    min_history: int = 20,
+) -> tuple[np.ndarray, np.ndarray]:
+  """
+  추천 시점에 이미 결과가 확정된(진입일 + horizon <= 추천 진입일) 동일 모델 추천만으로 계산한
+  추천별 적중률/샤프 비율 (look-ahead 없음)
+  - 모델별 실현일 정렬 + 누적합 + searchsorted 로 벡터화
+  - 이력이 min_history 건 미만이면 NaN
+  :return: (accuracy[R], sharpe[R])
+  """
+  col = int(np.searchsorted(result.horizons, horizon))
+  if col >= result.horizons.shape[0] or result.horizons[col] != horizon:
+    raise ValueError(f"백테스트 결과에 없는 보유기간입니다. horizon={horizon}")
+
+  hits = result.hits[:, col]
+  returns = np.where(panel.direction == 0, np.nan, result.strategy_returns[:, col])
+  realized = ~np.isnan(hits)
+
+  # 모델 단위로 정렬하기 위한 복합 키 (model, 실현일)
+  stride = np.int64(panel.closes.shape[0] + horizon + 1)
+  realized_key = panel.rec_model_idx * stride + panel.rec_date_idx + horizon
+  order = np.argsort(np.where(realized, realized_key, np.iinfo(np.int64).max), kind="stable")
+  sorted_keys = realized_key[order][realized[order]]
+  hit_sorted = hits[order][realized[order]]
+  ret_sorted = returns[order][realized[order]]
+  ret_valid = ~np.isnan(ret_sorted)
+
+  def _cum(values: np.ndarray) -> np.ndarray:
+    return np.concatenate(([0.0], np.cumsum(values)))
+
+  cum_hit_n = _cum(np.ones_like(hit_sorted))
+  cum_hit = _cum(hit_sorted)
+  cum_ret_n = _cum(ret_valid.astype(np.float64))
+  cum_ret = _cum(np.where(ret_valid, ret_sorted, 0.0))
+  cum_ret_sq = _cum(np.where(ret_valid, ret_sorted ** 2, 0.0))
+
+  query_key = panel.rec_model_idx * stride + panel.rec_date_idx
+  hi = np.searchsorted(sorted_keys, query_key, side="right")
+  lo = np.searchsorted(sorted_keys, panel.rec_model_idx * stride, side="left")
+
+  hit_n = cum_hit_n[hi] - cum_hit_n[lo]
+  ret_n = cum_ret_n[hi] - cum_ret_n[lo]
+  with np.errstate(invalid="ignore", divide="ignore"):
+    accuracy = (cum_hit[hi] - cum_hit[lo]) / hit_n
+  sharpe = _sharpe(
+      ret_n, cum_ret[hi] - cum_ret[lo], cum_ret_sq[hi] - cum_ret_sq[lo], np.asarray(horizon, dtype=np.float64)
+  )
+  accuracy = np.where(hit_n >= min_history, accuracy, np.nan)
+  sharpe = np.where(ret_n >= min_history, sharpe, np.nan)
+  return accuracy, sharpe
+
+
+def clip_decimal(values: np.ndarray, limit: float = 9999.9999) -> list[Optional[float]]:
+  """DECIMAL(8, 4) 범위로 자르고 NaN 은 None 으로"""
+  clipped = np.clip(values, -limit, limit)
+  return [None if np.isnan(v) else float(v) for v in clipped]
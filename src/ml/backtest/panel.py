@@ -0,0 +1,110 @@
+# src/ml/backtest/panel.py
+"""
+백테스트 입력 패널
+- 종가: [거래일 T, 종목 N] float64 행렬 (결측 NaN)
+- 추천: 추천 1건 = 1행인 정수/실수 배열 (패널 좌표로 변환된 인덱스)
+DataFrame → NumPy 변환은 여기서 한 번만 수행하고, 엔진은 배열만 다룸
+"""
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+# 추천 유형 → 포지션 방향 (HOLD 는 0: 수익률 크기로 적중 판정)
+DIRECTION_MAP: dict[str, int] = {
+  "STRONG_BUY": 1,
+  "BUY": 1,
+  "HOLD": 0,
+  "SELL": -1,
+  "STRONG_SELL": -1,
+}
+
+_ARRAY_FIELDS = ("closes", "rec_ids", "rec_date_idx", "rec_stock_idx", "rec_model_idx", "direction", "confidence")
+
+
+@dataclass(frozen=True)
+class BacktestPanel:
+  """
+  정렬된 백테스트 패널
+    dates: 거래일 축 (datetime64[D])
+    stock_ids: 종목 축
+    model_names: 모델 축
+    closes: [T, N] 종가
+    rec_*: 추천별 패널 인덱스 (rec_date_idx 는 추천일 이후 첫 거래일 = 진입일)
+    direction: +1 매수 / -1 매도 / 0 보유
+    confidence: 신뢰도 (0~1)
+  """
+  dates: np.ndarray
+  stock_ids: np.ndarray
+  model_names: np.ndarray
+  closes: np.ndarray
+  rec_ids: np.ndarray
+  rec_date_idx: np.ndarray
+  rec_stock_idx: np.ndarray
+  rec_model_idx: np.ndarray
+  direction: np.ndarray
+  confidence: np.ndarray
+
+  @property
+  def size(self) -> int:
+    return int(self.rec_ids.shape[0])
+
+  def save(self, directory: str) -> str:
+    """패널을 .npy 파일로 저장 (워커 프로세스에서 mmap 으로 공유)"""
+    os.makedirs(directory, exist_ok=True)
+    for name in _ARRAY_FIELDS:
+      np.save(os.path.join(directory, f"{name}.npy"), getattr(self, name))
+    np.save(os.path.join(directory, "dates.npy"), self.dates.astype("datetime64[D]"))
+    np.save(os.path.join(directory, "stock_ids.npy"), self.stock_ids)
+    np.save(os.path.join(directory, "model_names.npy"), self.model_names.astype(str))
+    return directory
+
+  @classmethod
+  def load(cls, directory: str, *, mmap: bool = True) -> "BacktestPanel":
+    """저장된 패널 로드 (mmap=True 면 페이지 캐시 공유, 프로세스별 복사 없음)"""
+    mode: Optional[str] = "r" if mmap else None
+    arrays = { name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode=mode) for name in _ARRAY_FIELDS }
+    return cls(
+        dates=np.load(os.path.join(directory, "dates.npy")),
+        stock_ids=np.load(os.path.join(directory, "stock_ids.npy")),
+        model_names=np.load(os.path.join(directory, "model_names.npy")),
+        **arrays,
+    )
+
+
+def build_panel(closes: pd.DataFrame, recommendations: pd.DataFrame) -> BacktestPanel:
+  """
+  종가/추천 DataFrame → BacktestPanel
+  :param closes: DataFrame[stock_id, trade_date, close_price]
+  :param recommendations: DataFrame[recommendation_id, recommendation_date, stock_id, model_name,
+                                     prediction_type, confidence_score]
+  """
+  wide = closes.pivot_table(index="trade_date", columns="stock_id", values="close_price", aggfunc="last").sort_index()
+  dates = wide.index.to_numpy(dtype="datetime64[D]")
+  stock_ids = wide.columns.to_numpy(dtype=np.int64)
+  close_matrix = np.ascontiguousarray(wide.to_numpy(dtype=np.float64))
+
+  recs = recommendations[recommendations["stock_id"].isin(stock_ids)]
+  model_names, model_idx = np.unique(recs["model_name"].to_numpy(dtype=str), return_inverse=True)
+  # 추천일 당일 종가 진입 (추천일이 휴장일이면 다음 거래일)
+  date_idx = np.searchsorted(dates, recs["recommendation_date"].to_numpy(dtype="datetime64[D]"), side="left")
+  stock_idx = np.searchsorted(stock_ids, recs["stock_id"].to_numpy(dtype=np.int64))
+  direction = recs["prediction_type"].map(DIRECTION_MAP).fillna(0).to_numpy(dtype=np.int8)
+  confidence = recs["confidence_score"].to_numpy(dtype=np.float64)
+
+  # 진입일이 패널 밖인 추천 제외
+  valid = date_idx < dates.shape[0]
+  return BacktestPanel(
+      dates=dates,
+      stock_ids=stock_ids,
+      model_names=model_names,
+      closes=close_matrix,
+      rec_ids=recs["recommendation_id"].to_numpy(dtype=np.int64)[valid],
+      rec_date_idx=date_idx[valid].astype(np.int64),
+      rec_stock_idx=stock_idx[valid].astype(np.int64),
+      rec_model_idx=model_idx[valid].astype(np.int64),
+      direction=direction[valid],
+      confidence=confidence[valid],
+  )
@@ -0,0 +1,63 @@
+# src/ml/backtest/repository.py
+from datetime import date
+from decimal import Decimal
+from typing import Any, Optional, Sequence
+
+import pandas as pd
+from sqlalchemy import select, update, Float, cast
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models import MLRecommendation
+
+
+async def load_recommendation_frame(
+    session: AsyncSession,
+    *,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    model_names: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+  """
+  추천 이력 조회
+  → DataFrame[recommendation_id, recommendation_date, stock_id, model_name, prediction_type, confidence_score]
+  """
+  query = select(
+      MLRecommendation.recommendation_id,
+      MLRecommendation.recommendation_date,
+      MLRecommendation.stock_id,
+      MLRecommendation.model_name,
+      MLRecommendation.prediction_type,
+      cast(MLRecommendation.confidence_score, Float).label("confidence_score"),
+  )
+  if start is not None:
+    query = query.where(MLRecommendation.recommendation_date >= start)
+  if end is not None:
+    query = query.where(MLRecommendation.recommendation_date <= end)
+  if model_names is not None:
+    query = query.where(MLRecommendation.model_name.in_(list(model_names)))
+  rows = (await session.execute(query)).all()
+  frame = pd.DataFrame(rows, columns=[
+    "recommendation_id", "recommendation_date", "stock_id", "model_name", "prediction_type", "confidence_score",
+  ])
+  # Enum → 문자열 ("BUY".."STRONG_SELL")
+  frame["prediction_type"] = frame["prediction_type"].map(lambda p: getattr(p, "value", p))
+  return frame
+
+
+async def update_backtest_metrics(session: AsyncSession, records: list[dict[str, Any]]) -> int:
+  """
+  ml_recommendation.backtest_accuracy / sharpe_ratio 일괄 UPDATE (PK 기준 executemany)
+  records: [{recommendation_id, backtest_accuracy, sharpe_ratio}, ...]
+  """
+  if not records:
+    return 0
+  payload = [
+    {
+      "recommendation_id": r["recommendation_id"],
+      "backtest_accuracy": None if r["backtest_accuracy"] is None else Decimal(str(round(r["backtest_accuracy"], 4))),
+      "sharpe_ratio": None if r["sharpe_ratio"] is None else Decimal(str(round(r["sharpe_ratio"], 4))),
+    }
+    for r in records
+  ]
+  await session.execute(update(MLRecommendation), payload)
+  return len(payload)
@@ -0,0 +1,168 @@
+# src/ml/backtest/service.py
+"""
+추천 이력 백테스트
+- run_recommendation_backtest: 파이프라인 backtest 단계 (ml_recommendation 지표 갱신)
+- run_backtest_sweep: 파라미터 변형 대량 평가 (연구용 CLI)
+
+파라미터 스윕 사용 예 (src 디렉토리 기준):
+  python -m ml.backtest.service --horizons 5,10,20,60 --min-confidences 0,0.6,0.8 --stop-losses 0,0.05,0.1
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+from typing import Any, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from config.settings import settings
+from infrastructure.collection.service.collection_tracker import track_collection
+from infrastructure.db.session import get_session
+from infrastructure.financial.repository.investment_indicator_repository import load_close_frame
+from infrastructure.price.service.price_read_service import adjust_price_frame
+from ml.backtest.engine import DEFAULT_HORIZONS, clip_decimal, point_in_time_metrics, run_backtest, summarize
+from ml.backtest.panel import BacktestPanel, build_panel
+from ml.backtest.repository import load_recommendation_frame, update_backtest_metrics
+from ml.backtest.sweep import BacktestVariant, run_parameter_sweep, variant_grid
+
+log = logging.getLogger(__name__)
+
+# backtest_accuracy / sharpe_ratio 기준 보유기간(거래일)
+PRIMARY_HORIZON = 20
+# 종가 패널 여유 구간 (마지막 추천 이후 보유기간 + 휴장일)
+_CALENDAR_PADDING_DAYS = 120
+_UPDATE_BATCH = 5000
+
+
+async def load_backtest_panel(
+    *,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    model_names: Optional[Sequence[str]] = None,
+) -> Optional[BacktestPanel]:
+  """추천 이력 + 해당 종목 종가 → BacktestPanel (추천이 없으면 None)"""
+  async with get_session() as session:
+    recs = await load_recommendation_frame(session, start=start, end=end, model_names=model_names)
+    if recs.empty:
+      return None
+    first = recs["recommendation_date"].min()
+    last = recs["recommendation_date"].max() + timedelta(days=_CALENDAR_PADDING_DAYS)
+    closes = await load_close_frame(session, start=first, end=last, stock_ids=recs["stock_id"].unique().tolist())
+  if closes.empty:
+    return None
+  # 액면분할/병합 구간 수익률 왜곡 방지를 위해 수정종가 사용
+  closes = await adjust_price_frame(closes, price_columns=["close_price"], volume_column=None)
+  return await asyncio.to_thread(build_panel, closes, recs)
+
+
+async def run_recommendation_backtest(
+    *,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    model_names: Optional[Sequence[str]] = None,
+    horizons: Sequence[int] = DEFAULT_HORIZONS,
+) -> dict[str, Any]:
+  """
+  전체 모델/종목/보유기간 백테스트 후 ml_recommendation.backtest_accuracy / sharpe_ratio 갱신
+  - 추천별 값은 추천 시점에 결과가 확정된 동일 모델 추천만으로 계산 (look-ahead 없음)
+  :return: 모델 x 보유기간 성과 요약
+  """
+  horizons = tuple(sorted(set(horizons) | { PRIMARY_HORIZON }))
+  async with track_collection("backtest", collection_date=end) as run:
+    panel = await load_backtest_panel(start=start, end=end, model_names=model_names)
+    if panel is None or panel.size == 0:
+      log.info("[BACKTEST] 백테스트 대상 추천이 없습니다. 기간=%s~%s", start, end)
+      return { "recommendations": 0, "summary": [] }
+
+    begin = time.perf_counter()
+
+    def _compute() -> tuple[pd.DataFrame, list[dict[str, Any]]]:
+      result = run_backtest(panel, horizons)
+      accuracy, sharpe = point_in_time_metrics(panel, result, horizon=PRIMARY_HORIZON)
+      records = [
+        { "recommendation_id": int(rid), "backtest_accuracy": acc, "sharpe_ratio": sr }
+        for rid, acc, sr in zip(panel.rec_ids, clip_decimal(accuracy), clip_decimal(sharpe))
+      ]
+      return summarize(panel, result), records
+
+    # CPU 연산은 이벤트 루프 밖에서 수행
+    summary, records = await asyncio.to_thread(_compute)
+    log.info("[BACKTEST] 계산 완료 recommendations=%s, seconds=%.2f", panel.size, time.perf_counter() - begin)
+
+    updated = 0
+    async with get_session() as session:
+      try:
+        for i in range(0, len(records), _UPDATE_BATCH):
+          updated += await update_backtest_metrics(session, records[i:i + _UPDATE_BATCH])
+        await session.commit()
+        run.add_records(updated)
+      except Exception:
+        await session.rollback()
+        log.exception("[BACKTEST] 백테스트 지표 UPDATE 실패 (rollback)")
+        raise
+
+  log.info("[BACKTEST] 완료 recommendations=%s, updated=%s", panel.size, updated)
+  return {
+    "recommendations": panel.size,
+    "updated": updated,
+    "summary": summary.replace({ np.nan: None }).to_dict(orient="records"),
+  }
+
+
+async def run_backtest_sweep(
+    variants: Sequence[BacktestVariant],
+    *,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    model_names: Optional[Sequence[str]] = None,
+    workers: Optional[int] = None,
+) -> list[dict[str, Any]]:
+  """파라미터 변형 대량 평가 (프로세스 병렬, 패널은 analytics_dir/backtest 아래 임시 디렉토리에 mmap 공유 후 삭제)"""
+  panel = await load_backtest_panel(start=start, end=end, model_names=model_names)
+  if panel is None or panel.size == 0:
+    return []
+  root = os.path.join(settings.analytics_dir, "backtest")
+  os.makedirs(root, exist_ok=True)
+  with tempfile.TemporaryDirectory(prefix="sweep_", dir=root) as work_dir:
+    rows = await asyncio.to_thread(run_parameter_sweep, panel, variants, work_dir=work_dir, workers=workers)
+  for row in rows:
+    if row["model_idx"] is not None:
+      row["model_name"] = str(panel.model_names[row["model_idx"]])
+  return rows
+
+
+def _floats(value: str) -> list[float]:
+  return [float(v) for v in value.split(",") if v.strip()]
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description="추천 백테스트 파라미터 스윕 (보유기간 x 최소 신뢰도 x 손절 비율)")
+  parser.add_argument("--horizons", default=",".join(map(str, DEFAULT_HORIZONS)), help="콤마 구분 보유기간(거래일)")
+  parser.add_argument("--min-confidences", default="0", help="콤마 구분 최소 신뢰도")
+  parser.add_argument("--stop-losses", default="0", help="콤마 구분 손절 비율 (0 이면 미사용)")
+  parser.add_argument("--models", default=None, help="콤마 구분 모델명 (미지정 시 전체)")
+  parser.add_argument("--start", type=date.fromisoformat, default=None)
+  parser.add_argument("--end", type=date.fromisoformat, default=None)
+  parser.add_argument("--workers", type=int, default=None, help="평가 프로세스 수 (기본 CPU 코어 수)")
+  args = parser.parse_args()
+  logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s - %(message)s")
+
+  variants = variant_grid(
+      horizons=[int(h) for h in args.horizons.split(",") if h.strip()],
+      min_confidences=_floats(args.min_confidences),
+      stop_losses=_floats(args.stop_losses),
+  )
+  rows = asyncio.run(run_backtest_sweep(
+      variants, start=args.start, end=args.end,
+      model_names=args.models.split(",") if args.models else None, workers=args.workers,
+  ))
+  print(json.dumps(rows, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+  main()
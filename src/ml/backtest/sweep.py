@@ -0,0 +1,135 @@
+# src/ml/backtest/sweep.py
+"""
+백테스트 파라미터 스윕 (프로세스 병렬)
+- 패널을 .npy 로 한 번 저장하고 워커는 mmap 으로 열어 페이지 캐시를 공유 (프로세스별 복사/pickle 없음)
+- 워커는 보유 경로 행렬을 한 번만 만들고 변형(variant)마다 마스크/인덱싱만 수행
+"""
+import itertools
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Any, Iterable, Optional, Sequence
+
+import numpy as np
+
+from ml.backtest.engine import TRADING_DAYS, equity_paths
+from ml.backtest.panel import BacktestPanel
+
+log = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 256
+
+
+@dataclass(frozen=True)
+class BacktestVariant:
+  """
+  백테스트 파라미터 조합
+    horizon: 보유기간(거래일)
+    min_confidence: 최소 신뢰도 (미만 추천 제외)
+    stop_loss: 손절 비율 (0 이면 미사용, 0.05 → -5% 도달 시 청산)
+    model_idx: 대상 모델 인덱스 (None 이면 전체 모델)
+  """
+  horizon: int
+  min_confidence: float = 0.0
+  stop_loss: float = 0.0
+  model_idx: Optional[int] = None
+
+
+def variant_grid(
+    *,
+    horizons: Sequence[int],
+    min_confidences: Sequence[float] = (0.0,),
+    stop_losses: Sequence[float] = (0.0,),
+    model_indices: Sequence[Optional[int]] = (None,),
+) -> list[BacktestVariant]:
+  """파라미터 격자 → 변형 목록"""
+  return [
+    BacktestVariant(horizon=h, min_confidence=c, stop_loss=s, model_idx=m)
+    for h, c, s, m in itertools.product(horizons, min_confidences, stop_losses, model_indices)
+  ]
+
+
+def evaluate_variants(
+    panel: BacktestPanel,
+    equity: np.ndarray,
+    variants: Iterable[BacktestVariant],
+) -> list[dict[str, Any]]:
+  """
+  변형별 성과 평가 (변형 내부는 벡터 연산)
+  equity: equity_paths(panel, max_horizon) 결과 [R, H+1]
+  """
+  direction = np.asarray(panel.direction)
+  confidence = np.asarray(panel.confidence)
+  model_idx = np.asarray(panel.rec_model_idx)
+  active = direction != 0
+  out: list[dict[str, Any]] = []
+  for variant in variants:
+    h = variant.horizon
+    mask = active & (confidence >= variant.min_confidence) & ~np.isnan(equity[:, h])
+    if variant.model_idx is not None:
+      mask &= model_idx == variant.model_idx
+    path = equity[mask, :h + 1]
+    final = path[:, h] - 1.0
+    if variant.stop_loss > 0 and path.shape[0]:
+      # 첫 손절 도달 시점 청산
+      stopped = path <= 1.0 - variant.stop_loss
+      any_stop = stopped.any(axis=1)
+      first = stopped.argmax(axis=1)
+      final = np.where(any_stop, path[np.arange(path.shape[0]), first] - 1.0, final)
+      path = np.where(np.arange(h + 1) > np.where(any_stop, first, h)[:, None], np.nan, path)
+
+    trades = int(final.shape[0])
+    row = asdict(variant) | { "trades": trades, "hit_rate": None, "mean_return": None,
+                               "sharpe_ratio": None, "mean_max_drawdown": None }
+    if trades:
+      running_max = np.fmax.accumulate(path, axis=1)
+      max_dd = np.nanmin(path / running_max - 1.0, axis=1)
+      std = final.std(ddof=1) if trades > 1 else 0.0
+      row.update(
+        hit_rate=float((final > 0).mean()),
+        mean_return=float(final.mean()),
+        sharpe_ratio=float(final.mean() / std * np.sqrt(TRADING_DAYS / h)) if std > 0 else None,
+        mean_max_drawdown=float(max_dd.mean()),
+      )
+    out.append(row)
+  return out
+
+
+def _evaluate_chunk(panel_dir: str, max_horizon: int, variants: list[BacktestVariant]) -> list[dict[str, Any]]:
+  """워커 프로세스 진입점 (mmap 패널 로드 후 평가)"""
+  panel = BacktestPanel.load(panel_dir, mmap=True)
+  equity = equity_paths(panel, max_horizon)
+  return evaluate_variants(panel, equity, variants)
+
+
+def run_parameter_sweep(
+    panel: BacktestPanel,
+    variants: Sequence[BacktestVariant],
+    *,
+    work_dir: str,
+    workers: Optional[int] = None,
+    chunk_size: int = _CHUNK_SIZE,
+) -> list[dict[str, Any]]:
+  """
+  변형 목록을 청크로 나눠 프로세스 풀에서 병렬 평가
+  :param work_dir: 패널 .npy 저장 디렉토리 (워커 공유)
+  :param workers: 워커 프로세스 수 (None 이면 CPU 코어 수)
+  :return: 변형별 성과 dict 목록 (입력 순서 유지)
+  """
+  if not variants:
+    return []
+  max_horizon = max(v.horizon for v in variants)
+  workers = workers or os.cpu_count() or 1
+  chunks = [list(variants[i:i + chunk_size]) for i in range(0, len(variants), chunk_size)]
+
+  if workers <= 1 or len(chunks) == 1:
+    return evaluate_variants(panel, equity_paths(panel, max_horizon), variants)
+
+  panel_dir = panel.save(work_dir)
+  log.info("[BACKTEST] 파라미터 스윕 시작 variants=%s, chunks=%s, workers=%s", len(variants), len(chunks), workers)
+  with ProcessPoolExecutor(max_workers=min(workers, len(chunks)),
+                           mp_context=multiprocessing.get_context("spawn")) as pool:
+    results = pool.map(_evaluate_chunk, itertools.repeat(panel_dir), itertools.repeat(max_horizon), chunks)
+    return [row for chunk in results for row in chunk]
@@ -0,0 +1,212 @@
+# src/ml/risk/engine.py
+"""
+롤링 공분산/상관 엔진
+- 윈도우 수익률 X[W, N] 의 합 s = X'1, 교차곱 C = X'X 를 유지 (최초 1회 BLAS 행렬곱)
+- 새 거래일 k 개가 들어오면 C += X_new'X_new - X_old'X_old (rank-k 갱신, 거래일당 O(N^2))
+  → 윈도우 전체를 다시 곱하는 O(W·N^2) 대신 증분으로 이동
+- 표본 공분산은 Ledoit-Wolf 축소 (목표: 평균 분산 x 단위행렬) 로 안정화
+- 상태는 .npy 로 저장하고 조회 시 mmap 으로 열어 프로세스 간 페이지 캐시 공유
+"""
+import json
+import os
+import shutil
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+import numpy as np
+
+from ml.risk.panel import ReturnsPanel
+
+TRADING_DAYS = 252
+
+_ARRAY_FIELDS = ("dates", "stock_ids", "returns", "sums", "cross", "covariance", "correlation")
+
+
+@dataclass(frozen=True)
+class RiskState:
+  """
+  (윈도우, 기준일) 리스크 행렬
+    window: 윈도우 거래일 수
+    as_of: 기준일 (윈도우 마지막 거래일)
+    dates: [W] 윈도우 거래일
+    stock_ids: [N] 종목 축
+    returns: [W, N] 윈도우 로그수익률 (결측 0, 오래된 순)
+    sums: [N] 수익률 합
+    cross: [N, N] 교차곱 X'X
+    covariance: [N, N] 축소 공분산 (일간)
+    correlation: [N, N] 축소 공분산 기반 상관계수
+    shrinkage: Ledoit-Wolf 축소 강도 (0~1)
+    updates: 마지막 전체 재계산 이후 증분 갱신 횟수
+  """
+  window: int
+  as_of: date
+  dates: np.ndarray
+  stock_ids: np.ndarray
+  returns: np.ndarray
+  sums: np.ndarray
+  cross: np.ndarray
+  covariance: np.ndarray
+  correlation: np.ndarray
+  shrinkage: float
+  updates: int
+
+  @property
+  def size(self) -> int:
+    return int(self.stock_ids.shape[0])
+
+  def position(self, stock_id: int) -> Optional[int]:
+    """종목 축 위치 (stock_ids 는 오름차순)"""
+    pos = int(np.searchsorted(self.stock_ids, stock_id))
+    if pos < self.size and int(self.stock_ids[pos]) == stock_id:
+      return pos
+    return None
+
+  def save(self, directory: str) -> str:
+    """상태를 .npy + meta.json 으로 저장 (임시 디렉터리에 쓴 뒤 rename → 읽는 쪽은 완성본만 봄)"""
+    parent = os.path.dirname(directory)
+    os.makedirs(parent, exist_ok=True)
+    staging = f"{directory}.tmp{os.getpid()}"
+    os.makedirs(staging, exist_ok=True)
+    for name in _ARRAY_FIELDS:
+      np.save(os.path.join(staging, f"{name}.npy"), getattr(self, name))
+    with open(os.path.join(staging, "meta.json"), "w", encoding="utf-8") as fh:
+      json.dump({
+        "window": self.window, "as_of": self.as_of.isoformat(),
+        "shrinkage": self.shrinkage, "updates": self.updates,
+      }, fh)
+    if os.path.isdir(directory):
+      # 같은 (윈도우, 기준일) 재계산 → 기존 본 교체 (열려 있는 mmap 은 unlink 후에도 유효)
+      shutil.rmtree(directory)
+    os.replace(staging, directory)
+    return directory
+
+  @classmethod
+  def load(cls, directory: str, *, mmap: bool = True) -> "RiskState":
+    """저장된 상태 로드 (mmap=True 면 N x N 행렬을 복사 없이 열기)"""
+    with open(os.path.join(directory, "meta.json"), encoding="utf-8") as fh:
+      meta = json.load(fh)
+    mode: Optional[str] = "r" if mmap else None
+    arrays = { name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode=mode) for name in _ARRAY_FIELDS }
+    return cls(
+        window=int(meta["window"]),
+        as_of=date.fromisoformat(meta["as_of"]),
+        shrinkage=float(meta["shrinkage"]),
+        updates=int(meta["updates"]),
+        **arrays,
+    )
+
+
+def ledoit_wolf(returns: np.ndarray, sums: np.ndarray, cross: np.ndarray) -> tuple[np.ndarray, float]:
+  """
+  Ledoit-Wolf 축소 공분산 (목표 F = mu·I, mu = 평균 분산)
+  - 표본 공분산 S = C/W - m m' (m = s/W)
+  - 축소 강도 = min(b², d²) / d²
+      d² = ||S - mu·I||², b² = (1/W²) Σ_t ||x_t x_t' - S||² = ((1/W) Σ_t ||x_t||⁴ - ||S||²) / W
+  → (축소 공분산, 축소 강도)
+  """
+  n_obs, n_assets = returns.shape
+  mean = sums / n_obs
+  sample = cross / n_obs - np.outer(mean, mean)
+  mu = float(np.trace(sample)) / n_assets
+  sample_sq = float(np.einsum("ij,ij->", sample, sample))
+  d2 = sample_sq - 2.0 * mu * float(np.trace(sample)) + mu * mu * n_assets
+  centered_norms = np.einsum("ij,ij->i", returns - mean, returns - mean)
+  b2_bar = (float(np.mean(centered_norms ** 2)) - sample_sq) / n_obs
+  shrinkage = 1.0 if d2 <= 0.0 else min(max(b2_bar, 0.0), d2) / d2
+  covariance = (1.0 - shrinkage) * sample
+  covariance[np.diag_indices(n_assets)] += shrinkage * mu
+  return covariance, shrinkage
+
+
+def correlation_from_covariance(covariance: np.ndarray) -> np.ndarray:
+  """공분산 → 상관계수 (분산 0 인 종목은 상관 0)"""
+  std = np.sqrt(np.clip(np.diag(covariance), 0.0, None))
+  with np.errstate(invalid="ignore", divide="ignore"):
+    inv = np.where(std > 0, 1.0 / std, 0.0)
+  correlation = covariance * inv[:, None] * inv[None, :]
+  np.clip(correlation, -1.0, 1.0, out=correlation)
+  correlation[np.diag_indices(correlation.shape[0])] = 1.0
+  return correlation
+
+
+def _finalize(
+    window: int,
+    dates: np.ndarray,
+    stock_ids: np.ndarray,
+    returns: np.ndarray,
+    sums: np.ndarray,
+    cross: np.ndarray,
+    updates: int,
+) -> RiskState:
+  covariance, shrinkage = ledoit_wolf(returns, sums, cross)
+  return RiskState(
+      window=window,
+      as_of=dates[-1].astype(object),
+      dates=dates,
+      stock_ids=stock_ids,
+      returns=returns,
+      sums=sums,
+      cross=cross,
+      covariance=covariance,
+      correlation=correlation_from_covariance(covariance),
+      shrinkage=shrinkage,
+      updates=updates,
+  )
+
+
+def build_state(panel: ReturnsPanel, window: int) -> RiskState:
+  """패널 최근 window 거래일로 전체 계산 (교차곱 1회 X'X)"""
+  if panel.returns.shape[0] < window:
+    raise ValueError(f"수익률 거래일 수가 윈도우보다 적습니다. rows={panel.returns.shape[0]}, window={window}")
+  returns = np.ascontiguousarray(panel.returns[-window:])
+  return _finalize(
+      window, panel.dates[-window:], panel.stock_ids, returns,
+      returns.sum(axis=0), returns.T @ returns, updates=0,
+  )
+
+
+def advance_state(state: RiskState, dates: np.ndarray, rows: np.ndarray) -> RiskState:
+  """
+  새 거래일 수익률 rows[k, N] (종목 축은 state.stock_ids) 만큼 윈도우 이동
+  - 가장 오래된 k 행을 빼고 새 k 행을 더하는 rank-k 갱신 (k < window)
+  """
+  k = rows.shape[0]
+  if k == 0:
+    return state
+  if k >= state.window:
+    raise ValueError(f"증분 갱신 거래일 수가 윈도우 이상입니다. rows={k}, window={state.window}")
+  old = np.asarray(state.returns[:k])
+  cross = np.array(state.cross)
+  cross += rows.T @ rows
+  cross -= old.T @ old
+  sums = np.asarray(state.sums) + rows.sum(axis=0) - old.sum(axis=0)
+  returns = np.concatenate([np.asarray(state.returns[k:]), rows])
+  all_dates = np.concatenate([np.asarray(state.dates[k:]), dates])
+  return _finalize(state.window, all_dates, np.asarray(state.stock_ids), returns, sums, cross, state.updates + k)
+
+
+def top_correlated(state: RiskState, position: int, k: int) -> tuple[np.ndarray, np.ndarray]:
+  """position 종목과 상관계수 상위 k 개 (자기 자신 제외, 내림차순) → (위치 배열, 상관계수)"""
+  row = np.array(state.correlation[position], dtype=np.float64)
+  row[position] = -np.inf
+  k = min(k, row.shape[0] - 1)
+  if k <= 0:
+    return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+  top = np.argpartition(-row, k - 1)[:k]
+  top = top[np.argsort(-row[top], kind="stable")]
+  return top, row[top]
+
+
+def annualized_volatility(state: RiskState) -> np.ndarray:
+  """종목별 연율화 변동성 (축소 공분산 대각)"""
+  return np.sqrt(np.clip(np.diag(state.covariance), 0.0, None) * TRADING_DAYS)
+
+
+def universe_betas(state: RiskState) -> np.ndarray:
+  """동일가중 유니버스 포트폴리오 대비 베타 (Σw)_i / w'Σw"""
+  covariance = np.asarray(state.covariance)
+  weights = np.full(state.size, 1.0 / state.size)
+  exposure = covariance @ weights
+  variance = float(weights @ exposure)
+  return exposure / variance if variance > 0 else np.zeros(state.size)
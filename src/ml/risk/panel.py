@@ -0,0 +1,68 @@
+# src/ml/risk/panel.py
+"""
+리스크 입력 패널
+- 수정종가 → 일간 로그수익률 [거래일 T, 종목 N] float64 행렬
+- 결측(거래정지/상장 전) 수익률은 0 으로 채움 → 공분산 누적합을 행 단위로 더하고 뺄 수 있음
+"""
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class ReturnsPanel:
+  """
+  정렬된 수익률 패널
+    dates: 거래일 축 (datetime64[D], 첫 종가일은 수익률 계산에만 쓰이므로 제외)
+    stock_ids: 종목 축
+    returns: [T, N] 로그수익률 (결측 0)
+    observed: [T, N] 실제 수익률 여부
+  """
+  dates: np.ndarray
+  stock_ids: np.ndarray
+  returns: np.ndarray
+  observed: np.ndarray
+
+  @property
+  def coverage(self) -> np.ndarray:
+    """종목별 실제 수익률이 있는 거래일 비율"""
+    if self.observed.shape[0] == 0:
+      return np.zeros(self.stock_ids.shape[0])
+    return self.observed.mean(axis=0)
+
+  def tail(self, rows: int) -> "ReturnsPanel":
+    """최근 rows 거래일 구간"""
+    return ReturnsPanel(
+        dates=self.dates[-rows:], stock_ids=self.stock_ids,
+        returns=self.returns[-rows:], observed=self.observed[-rows:],
+    )
+
+  def select(self, mask: np.ndarray) -> "ReturnsPanel":
+    """종목 축 부분집합"""
+    return ReturnsPanel(
+        dates=self.dates, stock_ids=self.stock_ids[mask],
+        returns=np.ascontiguousarray(self.returns[:, mask]), observed=self.observed[:, mask],
+    )
+
+
+def build_returns_panel(closes: pd.DataFrame, *, stock_ids: Optional[Sequence[int]] = None) -> ReturnsPanel:
+  """
+  종가 DataFrame → ReturnsPanel
+  :param closes: DataFrame[stock_id, trade_date, close_price] (수정종가)
+  :param stock_ids: 종목 축 고정 (증분 갱신 시 기존 행렬과 같은 순서, 없는 종목은 수익률 0)
+  """
+  wide = closes.pivot_table(index="trade_date", columns="stock_id", values="close_price", aggfunc="last").sort_index()
+  if stock_ids is not None:
+    wide = wide.reindex(columns=list(stock_ids))
+  prices = wide.to_numpy(dtype=np.float64)
+  with np.errstate(invalid="ignore", divide="ignore"):
+    log_returns = np.diff(np.log(prices), axis=0)
+  observed = np.isfinite(log_returns)
+  return ReturnsPanel(
+      dates=wide.index.to_numpy(dtype="datetime64[D]")[1:],
+      stock_ids=wide.columns.to_numpy(dtype=np.int64),
+      returns=np.ascontiguousarray(np.where(observed, log_returns, 0.0)),
+      observed=observed,
+  )
@@ -0,0 +1,36 @@
+# src/ml/risk/repository.py
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models import MLRecommendation
+
+
+async def load_recommendation_stocks(session: AsyncSession, *, recommendation_date: date) -> list[tuple[int, int]]:
+  """추천일의 추천 → [(recommendation_id, stock_id), ...]"""
+  query = (
+    select(MLRecommendation.recommendation_id, MLRecommendation.stock_id)
+    .where(MLRecommendation.recommendation_date == recommendation_date)
+  )
+  return [(int(rid), int(sid)) for rid, sid in (await session.execute(query)).all()]
+
+
+async def update_risk_scores(session: AsyncSession, records: list[dict[str, Any]]) -> int:
+  """
+  ml_recommendation.risk_score 일괄 UPDATE (PK 기준 executemany)
+  records: [{recommendation_id, risk_score}, ...]
+  """
+  if not records:
+    return 0
+  payload = [
+    {
+      "recommendation_id": r["recommendation_id"],
+      "risk_score": None if r["risk_score"] is None else Decimal(str(round(r["risk_score"], 4))),
+    }
+    for r in records
+  ]
+  await session.execute(update(MLRecommendation), payload)
+  return len(payload)
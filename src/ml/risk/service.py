@@ -0,0 +1,245 @@
+# src/ml/risk/service.py
+"""
+수익률 공분산/상관 리스크 서비스
+- 거래일마다 직전 기준일 상태에서 rank-k 증분 갱신 (종목 구성 변경 반영/누적 오차 제거를 위해 주기적 전체 재계산)
+- 상태는 analytics_dir/risk/w{window}/{as_of}/ 아래 .npy 로 저장, 조회는 mmap
+- ml_recommendation.risk_score = 0.5 x 변동성 백분위 + 0.5 x 유니버스 베타 백분위
+"""
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Any, Optional
+
+import numpy as np
+
+from config.settings import settings
+from infrastructure.collection.service.collection_tracker import track_collection
+from infrastructure.db.session import get_session
+from infrastructure.financial.repository.investment_indicator_repository import load_close_frame
+from infrastructure.price.service.price_read_service import adjust_price_frame
+from infrastructure.snapshot.repository.snapshot_repository import RECOMMENDATION_SECTION
+from infrastructure.snapshot.service.snapshot_cache import snapshot_cache
+from ml.risk.engine import (
+  TRADING_DAYS, RiskState, advance_state, annualized_volatility, build_state, top_correlated, universe_betas
+)
+from ml.risk.panel import build_returns_panel
+from ml.risk.repository import load_recommendation_stocks, update_risk_scores
+from utils.numeric import percentile_ranks
+
+log = logging.getLogger(__name__)
+
+# 전체 재계산 유니버스 기준: 윈도우 내 실제 수익률 비율
+_MIN_COVERAGE = 0.8
+# 증분 갱신 누적 거래일이 이 값을 넘으면 전체 재계산 (신규 상장 반영 + 부동소수 누적 오차 제거)
+_FULL_REBUILD_UPDATES = 20
+# 증분 갱신 시 직전 종가 확보용 여유 구간 (휴장일)
+_ADVANCE_PADDING_DAYS = 10
+_MMAP_CACHE_SIZE = 4
+
+
+class RiskMatrixCache:
+  """(윈도우, 기준일) 리스크 상태 디렉터리 + mmap LRU (프로세스 단위 싱글톤)"""
+
+  def __init__(self, root: str, capacity: int = _MMAP_CACHE_SIZE) -> None:
+    self._root = root
+    self._capacity = capacity
+    self._states: OrderedDict[tuple[int, date], RiskState] = OrderedDict()
+
+  def directory(self, window: int, as_of: date) -> str:
+    return os.path.join(self._root, f"w{window}", as_of.isoformat())
+
+  def available(self, window: int) -> list[date]:
+    """저장된 기준일 (오름차순, 저장 중인 임시 디렉터리 제외)"""
+    base = os.path.join(self._root, f"w{window}")
+    if not os.path.isdir(base):
+      return []
+    dates = []
+    for name in os.listdir(base):
+      try:
+        dates.append(date.fromisoformat(name))
+      except ValueError:
+        continue
+    return sorted(dates)
+
+  def get(self, window: int, *, as_of: Optional[date] = None) -> Optional[RiskState]:
+    """as_of 이전(포함) 최신 기준일 상태 (없으면 None)"""
+    dates = [d for d in self.available(window) if as_of is None or d <= as_of]
+    if not dates:
+      return None
+    key = (window, dates[-1])
+    state = self._states.get(key)
+    if state is None:
+      state = RiskState.load(self.directory(*key), mmap=True)
+      self._states[key] = state
+      while len(self._states) > self._capacity:
+        self._states.popitem(last=False)
+    else:
+      self._states.move_to_end(key)
+    return state
+
+  def store(self, state: RiskState, *, keep: int) -> str:
+    """상태 저장 후 오래된 기준일 정리 (최근 keep 개 보관)"""
+    directory = state.save(self.directory(state.window, state.as_of))
+    self._states.pop((state.window, state.as_of), None)
+    for old in self.available(state.window)[:-keep]:
+      self._states.pop((state.window, old), None)
+      path = self.directory(state.window, old)
+      for name in os.listdir(path):
+        os.remove(os.path.join(path, name))
+      os.rmdir(path)
+    return directory
+
+
+risk_matrix_cache = RiskMatrixCache(os.path.join(settings.analytics_dir, "risk"))
+
+
+async def _load_adjusted_closes(*, start: date, end: date, stock_ids: Optional[list[int]] = None):
+  async with get_session() as session:
+    closes = await load_close_frame(session, start=start, end=end, stock_ids=stock_ids)
+  if closes.empty:
+    return closes
+  return await adjust_price_frame(closes, price_columns=["close_price"], volume_column=None)
+
+
+async def _rebuild(as_of: date, window: int) -> Optional[RiskState]:
+  """윈도우 전체 재계산 (유니버스: 윈도우 내 수익률 비율 _MIN_COVERAGE 이상 종목)"""
+  # 거래일 window+1 개를 덮는 달력 구간 (연 252 거래일 / 365 일 + 휴장 여유)
+  start = as_of - timedelta(days=int(window * 1.5) + 20)
+  closes = await _load_adjusted_closes(start=start, end=as_of)
+  if closes.empty:
+    return None
+
+  def _compute() -> Optional[RiskState]:
+    panel = build_returns_panel(closes)
+    if panel.returns.shape[0] < window:
+      log.warning("[RISK] 수익률 거래일이 부족합니다. rows=%s, window=%s", panel.returns.shape[0], window)
+      return None
+    panel = panel.tail(window)
+    panel = panel.select(panel.coverage >= _MIN_COVERAGE)
+    if panel.stock_ids.shape[0] < 2:
+      return None
+    return build_state(panel, window)
+
+  return await asyncio.to_thread(_compute)
+
+
+async def _advance(previous: RiskState, as_of: date) -> Optional[RiskState]:
+  """직전 상태 이후 거래일 수익률만 rank-k 갱신 (윈도우 이상 밀렸으면 None → 전체 재계산)"""
+  stock_ids = np.asarray(previous.stock_ids).tolist()
+  closes = await _load_adjusted_closes(
+      start=previous.as_of - timedelta(days=_ADVANCE_PADDING_DAYS), end=as_of, stock_ids=stock_ids
+  )
+  if closes.empty:
+    return previous
+
+  def _compute() -> Optional[RiskState]:
+    panel = build_returns_panel(closes, stock_ids=stock_ids)
+    new = panel.dates > np.datetime64(previous.as_of, "D")
+    if int(new.sum()) >= previous.window:
+      return None
+    return advance_state(previous, panel.dates[new], np.ascontiguousarray(panel.returns[new]))
+
+  return await asyncio.to_thread(_compute)
+
+
+async def update_risk_matrices(as_of: date, *, window: Optional[int] = None) -> Optional[RiskState]:
+  """
+  기준일 리스크 행렬 갱신 (직전 상태가 있으면 증분, 없거나 오래됐으면 전체 재계산)
+  → 갱신된 상태 (종가가 부족하면 None)
+  """
+  window = window or settings.risk_window
+  begin = time.perf_counter()
+  previous = risk_matrix_cache.get(window, as_of=as_of - timedelta(days=1))
+  state: Optional[RiskState] = None
+  mode = "advance"
+  if previous is not None and previous.updates < _FULL_REBUILD_UPDATES:
+    state = await _advance(previous, as_of)
+  if state is None:
+    mode = "rebuild"
+    state = await _rebuild(as_of, window)
+  if state is None:
+    log.info("[RISK] 리스크 행렬 계산 대상이 없습니다. as_of=%s, window=%s", as_of, window)
+    return None
+  if state is not previous:
+    await asyncio.to_thread(risk_matrix_cache.store, state, keep=settings.risk_keep_snapshots)
+  log.info("[RISK] 리스크 행렬 갱신 mode=%s, as_of=%s, window=%s, stocks=%s, shrinkage=%.3f, seconds=%.2f",
+           mode, state.as_of, window, state.size, state.shrinkage, time.perf_counter() - begin)
+  return state
+
+
+def risk_scores(state: RiskState) -> np.ndarray:
+  """종목별 위험점수 (0~1): 변동성 백분위와 동일가중 유니버스 베타 백분위의 평균"""
+  return 0.5 * percentile_ranks(annualized_volatility(state)) + 0.5 * percentile_ranks(universe_betas(state))
+
+
+async def run_risk_update(trade_date: date, *, window: Optional[int] = None) -> dict[str, Any]:
+  """
+  리스크 행렬 갱신 후 해당 거래일 추천의 risk_score 기록
+  - 리스크 유니버스 밖(수익률 부족) 종목 추천은 NULL 유지
+  """
+  async with track_collection("risk", collection_date=trade_date) as run:
+    state = await update_risk_matrices(trade_date, window=window)
+    if state is None:
+      return { "stocks": 0, "updated": 0 }
+
+    scores = risk_scores(state)
+    async with get_session() as session:
+      try:
+        targets = await load_recommendation_stocks(session, recommendation_date=trade_date)
+        records = []
+        for rid, sid in targets:
+          pos = state.position(sid)
+          if pos is not None:
+            records.append({ "recommendation_id": rid, "risk_score": float(scores[pos]) })
+        updated = await update_risk_scores(session, records)
+        await session.commit()
+        run.add_records(updated)
+      except Exception:
+        await session.rollback()
+        log.exception("[RISK] risk_score UPDATE 실패 (rollback)")
+        raise
+
+  if records:
+    await snapshot_cache.refresh(
+        [sid for _, sid in targets], sections=[RECOMMENDATION_SECTION.name], since=trade_date
+    )
+  return {
+    "as_of": state.as_of.isoformat(),
+    "stocks": state.size,
+    "shrinkage": state.shrinkage,
+    "updated": updated,
+  }
+
+
+def correlated_stocks(
+    stock_id: int,
+    *,
+    k: int = 10,
+    window: Optional[int] = None,
+    as_of: Optional[date] = None,
+) -> Optional[dict[str, Any]]:
+  """
+  종목과 상관계수 상위 k 개 종목 (mmap 상태에서 한 행만 읽고 argpartition)
+  → None: 해당 윈도우/기준일 상태가 없거나 종목이 리스크 유니버스 밖
+  """
+  window = window or settings.risk_window
+  state = risk_matrix_cache.get(window, as_of=as_of)
+  if state is None:
+    return None
+  pos = state.position(stock_id)
+  if pos is None:
+    return None
+  positions, values = top_correlated(state, pos, k)
+  volatility = np.sqrt(np.clip(np.diagonal(state.covariance)[positions], 0.0, None) * TRADING_DAYS)
+  return {
+    "as_of": state.as_of.isoformat(),
+    "window": state.window,
+    "shrinkage": state.shrinkage,
+    "items": [
+      { "stock_id": int(state.stock_ids[p]), "correlation": float(v), "volatility": float(vol) }
+      for p, v, vol in zip(positions.tolist(), values.tolist(), volatility.tolist())
+    ],
+  }
@@ -1,5 +1,5 @@
 # src/utils/partition.py
-from datetime import date
+from datetime import date, timedelta
 from typing import Iterable
 
 from sqlalchemy import text
@@ -31,39 +31,39 @@ def _month_iter(start: date, end: date) -> Iterable[tuple[date, date]]:
     cur = nxt
 
 
-async def ensure_daily_price_partitions(
+async def _ensure_monthly_partitions(
     session: AsyncSession,
     *,
+    table: str,
+    key_column: str,
+    key_alias: str,
     start: date,
     end: date,
 ) -> int:
   """
-  daily_price 파티션(월별)을 [start, end] 구간에 대해 생성 (존재하면 skip)
-  - 테이블명: daily_price_YYYY_MM
-  - 인덱스: (stock_id, trade_date DESC), (trade_date DESC)
-
-  Returns:
-      생성(또는 이미 존재로 skip 포함)한 파티션 개수
+  RANGE 파티셔닝 테이블의 월별 파티션을 [start, end] 구간에 대해 생성 (존재하면 skip)
+  - 테이블명: {table}_YYYY_MM
+  - 인덱스: ({key_column}, trade_date DESC), (trade_date DESC)
   """
   created = 0
 
   for month_start, next_month_start in _month_iter(start, end):
-    part_name = f"daily_price_{month_start.year}_{month_start.month:02d}"
+    part_name = f"{table}_{month_start.year}_{month_start.month:02d}"
     from_str = month_start.isoformat()
     to_str = next_month_start.isoformat()
 
     # ★ 파티션 테이블 생성
     create_sql = f"""
         CREATE TABLE IF NOT EXISTS {part_name}
-        PARTITION OF daily_price
+        PARTITION OF {table}
         FOR VALUES FROM ('{from_str}') TO ('{to_str}');
         """
     await session.execute(text(create_sql))
 
     # ★ 파티션 인덱스 생성
     idx1_sql = f"""
-        CREATE INDEX IF NOT EXISTS idx_{part_name}_sid_date
-        ON {part_name} (stock_id, trade_date DESC);
+        CREATE INDEX IF NOT EXISTS idx_{part_name}_{key_alias}_date
+        ON {part_name} ({key_column}, trade_date DESC);
         """
     idx2_sql = f"""
         CREATE INDEX IF NOT EXISTS idx_{part_name}_date
@@ -74,4 +74,87 @@ async def ensure_daily_price_partitions(
 
     created += 1
 
-  return created
\ No newline at end of file
+  return created
+
+
+async def ensure_daily_price_partitions(
+    session: AsyncSession,
+    *,
+    start: date,
+    end: date,
+) -> int:
+  """
+  daily_price 파티션(월별)을 [start, end] 구간에 대해 생성 (존재하면 skip)
+  - 테이블명: daily_price_YYYY_MM
+  - 인덱스: (stock_id, trade_date DESC), (trade_date DESC)
+
+  Returns:
+      생성(또는 이미 존재로 skip 포함)한 파티션 개수
+  """
+  return await _ensure_monthly_partitions(
+      session, table="daily_price", key_column="stock_id", key_alias="sid", start=start, end=end
+  )
+
+
+async def ensure_daily_index_price_partitions(
+    session: AsyncSession,
+    *,
+    start: date,
+    end: date,
+) -> int:
+  """
+  daily_index_price 파티션(월별)을 [start, end] 구간에 대해 생성 (존재하면 skip)
+  - 테이블명: daily_index_price_YYYY_MM
+  - 인덱스: (index_id, trade_date DESC), (trade_date DESC)
+
+  Returns:
+      생성(또는 이미 존재로 skip 포함)한 파티션 개수
+  """
+  return await _ensure_monthly_partitions(
+      session, table="daily_index_price", key_column="index_id", key_alias="iid", start=start, end=end
+  )
+
+
+async def ensure_minute_price_partitions(
+    session: AsyncSession,
+    *,
+    start: date,
+    end: date,
+) -> int:
+  """
+  minute_price 파티션(일별)을 [start, end] 구간에 대해 생성 (존재하면 skip)
+  - 테이블명: minute_price_YYYY_MM_DD
+  - 범위: 해당 일자 00:00 ~ 다음날 00:00 (Asia/Seoul)
+  - 인덱스: (stock_id, datetime DESC), (datetime DESC)
+
+  Returns:
+      생성(또는 이미 존재로 skip 포함)한 파티션 개수
+  """
+  created = 0
+  cur = start
+  while cur <= end:
+    nxt = cur + timedelta(days=1)
+    part_name = f"minute_price_{cur.year}_{cur.month:02d}_{cur.day:02d}"
+
+    create_sql = f"""
+        CREATE TABLE IF NOT EXISTS {part_name}
+        PARTITION OF minute_price
+        FOR VALUES FROM ('{cur.isoformat()} 00:00:00+09') TO ('{nxt.isoformat()} 00:00:00+09');
+        """
+    await session.execute(text(create_sql))
+
+    idx1_sql = f"""
+        CREATE INDEX IF NOT EXISTS idx_{part_name}_sid_datetime
+        ON {part_name} (stock_id, datetime DESC);
+        """
+    idx2_sql = f"""
+        CREATE INDEX IF NOT EXISTS idx_{part_name}_datetime
+        ON {part_name} (datetime DESC);
+        """
+    await session.execute(text(idx1_sql))
+    await session.execute(text(idx2_sql))
+
+    created += 1
+    cur = nxt
+
+  return created
@@ -0,0 +1,36 @@
+# tests/conftest.py
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# 애플리케이션과 동일하게 src 기준 import (core.models 는 저장소 루트 기준 src.* 도 사용)
+_ROOT = Path(__file__).resolve().parents[1]
+for path in (_ROOT, _ROOT / "src"):
+  if str(path) not in sys.path:
+    sys.path.insert(0, str(path))
+
+# .env 없는 환경에서도 config.settings 가 로드되도록 필수 설정에 더미 값 지정 (이미 설정된 값은 유지)
+_STORAGE = os.path.join(tempfile.gettempdir(), "stock-ml-platform-tests")
+_DEFAULT_ENV = {
+  "STORAGE_ROOT": _STORAGE,
+  "ANALYTICS_DIR": os.path.join(_STORAGE, "analytics"),
+  "LOG_DIR": os.path.join(_STORAGE, "logs"),
+  "MODEL_DIR": os.path.join(_STORAGE, "models"),
+  "MST_DIR": os.path.join(_STORAGE, "mst"),
+  "LOG_LEVEL": "INFO",
+  "DB_HOST": "localhost",
+  "DB_PORT": "5432",
+  "DB_NAME": "test",
+  "DB_USER": "test",
+  "DB_PASSWORD": "test",
+  "REDIS_HOST": "localhost",
+  "REDIS_PORT": "6379",
+  "REDIS_PASSWORD": "",
+  "REDIS_DB": "0",
+  "KIS_APP_KEY": "test",
+  "KIS_APP_SECRET": "test",
+  "KIS_BASE_URL": "http://localhost",
+}
+for key, value in _DEFAULT_ENV.items():
+  os.environ.setdefault(key, value)
@@ -0,0 +1,65 @@
+# tests/infrastructure/financial/test_filing_parser.py
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+from core.models import PeriodType
+from infrastructure.financial.service.filing_parser import parse_filing_file
+
+# DART 재무정보 일괄다운로드 반기 현금흐름표 (연결) 형식: 당기 금액 컬럼은 "당기 반기" 하나 (기초부터 누적)
+_CF_HALF_YEAR = "\n".join([
+  "\t".join(["재무제표종류", "종목코드", "회사명", "시장구분", "업종", "업종명", "결산월", "결산기준일",
+             "보고서종류", "통화", "항목코드", "항목명", "당기 반기", "전기 반기", "전기", "전전기"]),
+  "\t".join(["현금흐름표, 간접법 - 연결재무제표", "[005930]", "삼성전자", "유가증권시장상장법인", "264",
+             "통신 및 방송 장비 제조업", "12", "2024-06-30", "반기보고서", "KRW",
+             "ifrs-full_CashFlowsFromUsedInOperatingActivities", "영업활동현금흐름",
+             "33,880,436,000,000", "18,441,316,000,000", "", ""]),
+  "\t".join(["현금흐름표, 간접법 - 연결재무제표", "[005930]", "삼성전자", "유가증권시장상장법인", "264",
+             "통신 및 방송 장비 제조업", "12", "2024-06-30", "반기보고서", "KRW",
+             "ifrs-full_PurchaseOfPropertyPlantAndEquipment", "유형자산의 취득",
+             "-25,398,563,000,000", "-25,291,236,000,000", "", ""]),
+  "\t".join(["현금흐름표, 간접법 - 연결재무제표", "[005930]", "삼성전자", "유가증권시장상장법인", "264",
+             "통신 및 방송 장비 제조업", "12", "2024-06-30", "반기보고서", "KRW",
+             "ifrs-full_AdjustmentsForDepreciationAndAmortisationExpense", "감가상각비",
+             "19,158,203,000,000", "19,162,771,000,000", "", ""]),
+]) + "\n"
+
+# 반기 손익계산서: "당기 반기 3개월" 이 "당기 반기 누적" 보다 앞 → 분기 단독 값
+_IS_HALF_YEAR = "\n".join([
+  "\t".join(["재무제표종류", "종목코드", "회사명", "시장구분", "업종", "업종명", "결산월", "결산기준일",
+             "보고서종류", "통화", "항목코드", "항목명", "당기 반기 3개월", "당기 반기 누적",
+             "전기 반기 3개월", "전기 반기 누적", "전기", "전전기"]),
+  "\t".join(["손익계산서 - 연결재무제표", "[005930]", "삼성전자", "유가증권시장상장법인", "264",
+             "통신 및 방송 장비 제조업", "12", "2024-06-30", "반기보고서", "KRW",
+             "dart_OperatingIncomeLoss", "영업이익", "10,443,937,000,000", "17,050,716,000,000",
+             "668,539,000,000", "1,308,516,000,000", "", ""]),
+]) + "\n"
+
+
+def _write(tmp_path: Path, name: str, content: str) -> str:
+  path = tmp_path / name
+  path.write_bytes(content.encode("cp949"))
+  return str(path)
+
+
+def test_half_year_cash_flow_is_kept_cumulative(tmp_path: Path) -> None:
+  dtos = parse_filing_file(_write(tmp_path, "2024_2Q_CF.txt", _CF_HALF_YEAR))
+
+  assert len(dtos) == 1
+  dto = dtos[0]
+  assert (dto.ticker, dto.report_date, dto.period_type, dto.fiscal_year) == (
+    "005930", date(2024, 6, 30), PeriodType.Q2, 2024,
+  )
+  # 누적(1~6월) 값 그대로 저장, 분기 환산은 지표 계산에서 수행
+  assert dto.values["operating_cash_flow"] == Decimal("33880436000000")
+  assert dto.values["free_cash_flow"] == Decimal("33880436000000") - Decimal("25398563000000")
+  # 누적 감가상각비로는 분기 EBITDA 를 만들지 않음
+  assert "_depreciation_amortisation" not in dto.values
+  assert "ebitda" not in dto.values
+
+
+def test_half_year_income_statement_uses_three_month_column(tmp_path: Path) -> None:
+  dtos = parse_filing_file(_write(tmp_path, "2024_2Q_PL.txt", _IS_HALF_YEAR))
+
+  assert len(dtos) == 1
+  assert dtos[0].values["operating_income"] == Decimal("10443937000000")
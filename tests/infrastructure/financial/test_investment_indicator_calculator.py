@@ -0,0 +1,44 @@
+# tests/infrastructure/financial/test_investment_indicator_calculator.py
+import numpy as np
+import pandas as pd
+
+from infrastructure.financial.repository.investment_indicator_repository import STATEMENT_VALUE_COLUMNS
+from infrastructure.financial.service.investment_indicator_calculator import _derive_q4, annualize_statements
+
+
+def _statement(period_type: str, report_date: str, operating_cash_flow: float, **values: float) -> dict:
+  row = { c: np.nan for c in STATEMENT_VALUE_COLUMNS }
+  row.update(stock_id=1, report_date=report_date, period_type=period_type, fiscal_year=2024,
+             revenue=100.0, net_income=10.0, operating_cash_flow=operating_cash_flow)
+  row.update(values)
+  return row
+
+
+def test_cumulative_cash_flow_is_not_double_counted_in_ttm() -> None:
+  # 현금흐름 누적값: Q1 10, 반기 25, 3분기 45, 연간 70 → 분기 10/15/20/25
+  statements = pd.DataFrame([
+    _statement("Q1", "2024-03-31", 10.0),
+    _statement("Q2", "2024-06-30", 25.0),
+    _statement("Q3", "2024-09-30", 45.0),
+    _statement("FY", "2024-12-31", 70.0),
+  ])
+
+  annual = annualize_statements(statements)
+
+  assert annual["operating_cash_flow"].tolist() == [70.0]
+
+
+def test_derived_q4_is_nan_when_a_quarter_value_is_missing() -> None:
+  # 반기 EBITDA 누락 → FY - (Q1 + Q3) 는 Q4 를 부풀리므로 Q4 EBITDA 는 NaN
+  statements = pd.DataFrame([
+    _statement("Q1", "2024-03-31", 10.0, ebitda=20.0),
+    _statement("Q2", "2024-06-30", 25.0),
+    _statement("Q3", "2024-09-30", 45.0, ebitda=20.0),
+    _statement("FY", "2024-12-31", 70.0, ebitda=80.0, revenue=400.0),
+  ])
+
+  q4 = _derive_q4(statements)
+
+  assert len(q4) == 1
+  assert np.isnan(q4["ebitda"].iloc[0])
+  assert q4["revenue"].iloc[0] == 100.0